@@ -0,0 +1,59 @@
+"""Add data quality columns to metrics_snapshot
+
+Revision ID: metrics_snapshot_quality_001
+Revises: model_jobs_nullable_model_id_001
+Create Date: 2026-10-18 22:10:00.000000
+
+MetricsSnapshot now uses DataQualityMixin: data_quality_score (lowered
+for fields carried over from an earlier snapshot) and data_source.
+Existing rows get the mixin defaults.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'metrics_snapshot_quality_001'
+down_revision: Union[str, None] = 'model_jobs_nullable_model_id_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_columns():
+    inspector = sa.inspect(op.get_bind())
+    if 'metrics_snapshot' not in inspector.get_table_names():
+        return None
+    return {column['name'] for column in inspector.get_columns('metrics_snapshot')}
+
+
+def upgrade() -> None:
+    columns = _existing_columns()
+    # Fresh databases get the columns from create_all
+    if columns is None:
+        return
+
+    if 'data_quality_score' not in columns:
+        op.add_column('metrics_snapshot', sa.Column(
+            'data_quality_score', sa.Integer(), nullable=False, server_default='100'
+        ))
+    if 'data_source' not in columns:
+        op.add_column('metrics_snapshot', sa.Column(
+            'data_source', sa.String(50), nullable=False, server_default='internal'
+        ))
+    op.create_index(
+        'idx_metrics_quality_score', 'metrics_snapshot', ['data_quality_score'], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    columns = _existing_columns()
+    if columns is None:
+        return
+
+    op.drop_index('idx_metrics_quality_score', table_name='metrics_snapshot', if_exists=True)
+    if 'data_source' in columns:
+        op.drop_column('metrics_snapshot', 'data_source')
+    if 'data_quality_score' in columns:
+        op.drop_column('metrics_snapshot', 'data_quality_score')
@@ -0,0 +1,52 @@
+"""Allow model_jobs.model_id to be NULL for training jobs
+
+Revision ID: model_jobs_nullable_model_id_001
+Revises: 5185c6f29122
+Create Date: 2026-10-18 22:00:00.000000
+
+Training jobs started from the API are created before their model
+exists, so the job row has no model_id until training finishes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'model_jobs_nullable_model_id_001'
+down_revision: Union[str, None] = '5185c6f29122'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _model_id_column():
+    inspector = sa.inspect(op.get_bind())
+    if 'model_jobs' not in inspector.get_table_names():
+        return None
+    return next((c for c in inspector.get_columns('model_jobs') if c['name'] == 'model_id'), None)
+
+
+def upgrade() -> None:
+    column = _model_id_column()
+    # Fresh databases get the nullable column from create_all
+    if column is not None and not column['nullable']:
+        op.alter_column(
+            'model_jobs', 'model_id',
+            existing_type=sa.Integer(),
+            nullable=True,
+            comment="Null for training jobs whose model does not exist yet"
+        )
+
+
+def downgrade() -> None:
+    column = _model_id_column()
+    if column is not None and column['nullable']:
+        # Jobs without a model can't satisfy NOT NULL
+        op.execute("DELETE FROM model_jobs WHERE model_id IS NULL")
+        op.alter_column(
+            'model_jobs', 'model_id',
+            existing_type=sa.Integer(),
+            nullable=False,
+            comment=None
+        )
@@ -2,7 +2,7 @@
 # System health monitoring API endpoints
 
 from typing import Any, Dict
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 import psutil
 import time
@@ -10,7 +10,8 @@ from datetime import datetime, timezone
 
 from app.core.database import get_db, get_redis, check_db_connection, check_redis_connection
 from app.core.config import settings
-from app.core.deps import get_current_active_user, get_optional_current_user
+from app.core.deps import get_current_active_user, get_optional_current_user, get_current_admin_user
+from app.utils.query_monitor import query_monitor
 from app.repositories.user.user_repository import UserRepository
 from app.repositories.backup.cryptocurrency import cryptocurrency_repository
 from app.repositories.backup.price_data import price_data_repository
@@ -190,6 +191,34 @@ def database_health_check(
         )
 
 
+@router.get("/query-profile")
+def query_profile_snapshot(
+    top: int = Query(20, ge=1, le=200, description="Number of fingerprints, slow queries and N+1 bursts"),
+    order_by: str = Query("total", description="Fingerprint ordering: total, mean, max or count"),
+    current_user: User = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Query profiler snapshot
+    
+    Requires admin authentication.
+    Returns per-fingerprint latency histograms, recent slow queries and N+1 bursts.
+    """
+    return query_monitor.snapshot(top=top, order_by=order_by)
+
+
+@router.post("/query-profile/reset")
+def reset_query_profile(
+    current_user: User = Depends(get_current_admin_user)
+) -> Any:
+    """
+    Clear collected query profiler statistics
+    
+    Requires admin authentication.
+    """
+    query_monitor.reset()
+    return {"status": "reset", "timestamp": datetime.now(timezone.utc).isoformat()}
+
+
 @router.get("/redis")
 def redis_health_check(
     current_user: User = Depends(get_current_active_user)
@@ -384,10 +413,17 @@ def readiness_check() -> Any:
         "debug_mode": settings.DEBUG
     }
     
+    # ML model warm-up - not ready to serve predictions until warm
+    ml_check = _get_model_warmup_check()
+    checks["checks"]["ml_models"] = ml_check
+    
     # Set overall status
     if config_issues:
         checks["status"] = "warning"
     
+    if ml_check["status"] == "not_ready":
+        checks["status"] = "not_ready"
+    
     return checks
 
 
@@ -461,4 +497,35 @@ def startup_check() -> Any:
             "message": f"Redis check failed: {str(e)}"
         }
     
-    return startup_status
\ No newline at end of file
+    # Check ML model warm-up
+    ml_check = _get_model_warmup_check()
+    startup_status["initialization"]["ml_models"] = ml_check
+    if ml_check["status"] == "not_ready":
+        startup_status["status"] = "not_ready"
+    
+    return startup_status
+
+
+def _get_model_warmup_check() -> Dict[str, Any]:
+    """Summarize model warm-up state for readiness probes"""
+    if not settings.ML_WARMUP_ON_STARTUP:
+        return {"status": "disabled", "message": "Model warm-up disabled"}
+    
+    try:
+        from app.ml.prediction.model_warmup import get_warmup_status
+        warmup = get_warmup_status()
+    except Exception as e:
+        return {"status": "error", "message": f"Model warm-up status unavailable: {str(e)}"}
+    
+    if warmup["state"] == "warming":
+        return {"status": "not_ready", "message": "Models are warming up", "warmup": warmup}
+    
+    if warmup["state"] == "failed":
+        # Predictions still work through fallbacks, so this doesn't block traffic
+        return {"status": "warning", "message": "Model warm-up failed", "warmup": warmup}
+    
+    return {
+        "status": "ready",
+        "message": "Models warm" if warmup["ready"] else "No warm-up run",
+        "warmup": warmup
+    }
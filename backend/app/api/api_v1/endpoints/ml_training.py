@@ -2,19 +2,22 @@
 # ML Training API endpoints - Complete fixed version
 
 import asyncio
+import json
 import uuid
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # Import existing services and components
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.core.deps import get_current_active_user, get_optional_current_user
-from app.ml.training.training_service import training_service
+from app.ml.training.training_executor import training_executor, TrainingCapacityError
 from app.ml.config.ml_config import model_registry, ml_config
-from app.repositories import cryptocurrency_repository
-from app.models import User
+from app.repositories import cryptocurrency_repository, ModelJobRepository
+from app.models import User, ModelJob
+from app.models.enums import JobCategory
 
 # Import the schemas we just created
 from app.schemas.ml_training import (
@@ -31,116 +34,125 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory storage for training jobs (in production, use Redis or database)
-training_jobs: Dict[str, Dict[str, Any]] = {}
+# Job status messages by ModelJob status
+_STATUS_MESSAGES = {
+    TrainingStatus.PENDING: "Training job queued",
+    TrainingStatus.COMPLETED: "Training completed successfully",
+    TrainingStatus.CANCELLED: "Training cancelled"
+}
 
+# ModelJob.job_status values the training API has no status for
+_JOB_STATUS_FALLBACKS = {
+    'paused': (TrainingStatus.PENDING, "Training paused"),
+}
 
-def generate_job_id(crypto_symbol: str, model_type: str) -> str:
-    """Generate unique training job ID"""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    return f"train_{crypto_symbol.lower()}_{model_type}_{timestamp}"
+
+def parse_job_id(job_id: str) -> int:
+    """Training job ids are ModelJob ids"""
+    try:
+        return int(job_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Training job {job_id} not found"
+        )
 
 
-def create_safe_training_status_response(job_id: str, job: Dict[str, Any]) -> TrainingStatusResponse:
-    """Create a safe TrainingStatusResponse without problematic metrics"""
+def get_training_job_for_user(db: Session, job_id: str, current_user: User) -> ModelJob:
+    """Load a training job and check the user may see it"""
+    job = ModelJobRepository(db).get(parse_job_id(job_id))
+    if not job or job.job_category != JobCategory.TRAINING.value:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Training job {job_id} not found"
+        )
+    
+    # Check if user has access to this job
+    if job.created_by != current_user.id and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this training job"
+        )
+    
+    return job
+
+
+def create_safe_training_status_response(job: ModelJob) -> TrainingStatusResponse:
+    """Build a TrainingStatusResponse from a training ModelJob (float metrics only)"""
+    status_message = None
+    try:
+        job_status = TrainingStatus(job.job_status)
+    except ValueError:
+        job_status, status_message = _JOB_STATUS_FALLBACKS.get(
+            job.job_status, (TrainingStatus.PENDING, f"Training job status: {job.job_status}")
+        )
+        if job.job_status not in _JOB_STATUS_FALLBACKS:
+            logger.warning(f"Training job {job.id} has unknown status {job.job_status!r}")
+    started_at = job.started_at or job.queued_at or job.created_at
+    job_metrics = job.job_metrics or {}
+    outputs = job.job_outputs or {}
+    
     # Calculate duration
     duration_seconds = None
-    if job.get("completed_at"):
-        duration_seconds = int((job["completed_at"] - job["started_at"]).total_seconds())
-    elif job["status"] == TrainingStatus.RUNNING:
-        duration_seconds = int((datetime.now(timezone.utc) - job["started_at"]).total_seconds())
+    if job.completed_at and job.started_at:
+        duration_seconds = int((job.completed_at - job.started_at).total_seconds())
+    elif job_status == TrainingStatus.RUNNING and job.started_at:
+        duration_seconds = int((datetime.now(timezone.utc) - job.started_at).total_seconds())
+    
+    if status_message:
+        message = status_message
+    elif job_status == TrainingStatus.RUNNING:
+        if job.current_phase == 'training' and job.total_steps:
+            message = f"Training epoch {job.completed_steps or 0}/{job.total_steps}"
+        else:
+            message = f"Training running ({job.current_phase or 'starting'})"
+    elif job_status == TrainingStatus.FAILED:
+        message = f"Training failed: {job.error_message or 'Unknown error'}"
+    else:
+        message = _STATUS_MESSAGES[job_status]
     
     return TrainingStatusResponse(
-        job_id=job_id,
-        crypto_symbol=job["crypto_symbol"],
-        model_type=job["model_type"],
-        status=job["status"],
-        progress_percentage=job.get("progress_percentage"),
-        current_epoch=job.get("current_epoch"),
-        total_epochs=job.get("training_config", {}).get("epochs") if job.get("training_config") else None,
-        started_at=job["started_at"],
-        completed_at=job.get("completed_at"),
+        job_id=str(job.id),
+        crypto_symbol=job.job_config.get("crypto_symbol"),
+        model_type=job.job_config.get("model_type"),
+        status=job_status,
+        progress_percentage=float(job.progress_pct) if job.progress_pct is not None else None,
+        current_epoch=job.completed_steps,
+        total_epochs=job.total_steps,
+        started_at=started_at,
+        completed_at=job.completed_at,
         duration_seconds=duration_seconds,
-        message=job["message"],
-        error_details=job.get("error_details"),
-        # FIXED: Set to None to avoid validation errors
-        training_metrics=None,
+        message=message,
+        error_details=job.error_message,
+        training_metrics=job_metrics.get("final") or job_metrics.get("last_epoch") or None,
         validation_metrics=None,
-        model_performance=None
+        model_performance=outputs.get("evaluation_metrics") or None
     )
 
 
-async def run_training_job(
-    job_id: str,
-    crypto_symbol: str,
-    training_config: Optional[Dict[str, Any]] = None
-):
-    """
-    Background task to run the actual training
-    Updates job status in training_jobs dictionary
-    """
+def load_training_status(job_id: int) -> Optional[Dict[str, Any]]:
+    """Fresh status snapshot in its own session (used by the progress stream)"""
+    db = SessionLocal()
     try:
-        # Update job status to running
-        if job_id in training_jobs:
-            training_jobs[job_id].update({
-                "status": TrainingStatus.RUNNING,
-                "message": "Training started",
-                "current_epoch": 0
-            })
-        
-        logger.info(f"Starting training job {job_id} for {crypto_symbol}")
-        
-        # FIXED: Call existing training service with correct parameters
-        result = await training_service.train_model_for_crypto(
-            crypto_symbol=crypto_symbol,
-            training_config=training_config
-        )
-        
-        # Update job status based on result
-        if job_id in training_jobs:
-            if result.get("success", False):
-                training_jobs[job_id].update({
-                    "status": TrainingStatus.COMPLETED,
-                    "message": "Training completed successfully",
-                    "completed_at": datetime.now(timezone.utc),
-                    "training_metrics": result.get("training_metrics", {}),
-                    "validation_metrics": result.get("validation_metrics", {}),
-                    "model_performance": result.get("evaluation_metrics", {}),
-                    "model_path": result.get("model_path"),
-                    "progress_percentage": 100.0
-                })
-                logger.info(f"Training job {job_id} completed successfully")
-            else:
-                training_jobs[job_id].update({
-                    "status": TrainingStatus.FAILED,
-                    "message": f"Training failed: {result.get('error', 'Unknown error')}",
-                    "completed_at": datetime.now(timezone.utc),
-                    "error_details": result.get("error", "Unknown error")
-                })
-                logger.error(f"Training job {job_id} failed: {result.get('error')}")
-        
-    except Exception as e:
-        logger.error(f"Training job {job_id} failed with exception: {str(e)}")
-        if job_id in training_jobs:
-            training_jobs[job_id].update({
-                "status": TrainingStatus.FAILED,
-                "message": f"Training failed: {str(e)}",
-                "completed_at": datetime.now(timezone.utc),
-                "error_details": str(e)
-            })
+        job = ModelJobRepository(db).get(job_id)
+        return create_safe_training_status_response(job).model_dump(mode="json") if job else None
+    finally:
+        db.close()
 
 
 @router.post("/training/start", response_model=TrainingResponse)
 async def start_training(
     request: TrainingRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """
     Start training a new ML model for cryptocurrency prediction
     
-    Requires authentication. Starts a background training job.
+    Requires authentication. The job runs on the training executor's
+    process pool, not in the API worker; follow it with
+    /training/{job_id}/status or /training/{job_id}/events.
+    Returns 429 when every training slot is busy or the host is short of memory.
     """
     try:
         # Validate cryptocurrency exists
@@ -151,47 +163,39 @@ async def start_training(
                 detail=f"Cryptocurrency {request.crypto_symbol} not found"
             )
         
-        # Check if there's already a recent training job running
+        # Check if there's already a training job running
         if not request.force_retrain:
-            active_jobs = [
-                job for job in training_jobs.values()
-                if (job["crypto_symbol"] == request.crypto_symbol and 
-                    job["status"] in [TrainingStatus.PENDING, TrainingStatus.RUNNING])
-            ]
+            active_jobs = ModelJobRepository(db).get_training_jobs(
+                crypto_symbol=request.crypto_symbol, active_only=True, limit=1
+            )
             if active_jobs:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
                     detail=f"Training job already running for {request.crypto_symbol}. Use force_retrain=true to override."
                 )
         
-        # Generate job ID
-        job_id = generate_job_id(request.crypto_symbol, request.model_type.value)
-        
         # FIXED: Prepare training configuration
         training_config = None
         if request.training_config:
             training_config = request.training_config.model_dump()
         
-        # Store job information
-        training_jobs[job_id] = {
-            "job_id": job_id,
-            "crypto_symbol": request.crypto_symbol,
-            "model_type": request.model_type.value,
-            "status": TrainingStatus.PENDING,
-            "message": "Training job queued",
-            "started_at": datetime.now(timezone.utc),
-            "user_id": current_user.id,
-            "training_config": training_config,
-            "progress_percentage": 0.0
-        }
-        
-        # FIXED: Start background training task
-        background_tasks.add_task(
-            run_training_job,
-            job_id,
-            request.crypto_symbol,
-            training_config
-        )
+        # Admission control, job record and dispatch to the process pool
+        try:
+            job = await asyncio.to_thread(
+                training_executor.submit,
+                db,
+                request.crypto_symbol,
+                request.model_type.value,
+                training_config,
+                current_user.id,
+                request.force_retrain
+            )
+        except TrainingCapacityError as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": "60"}
+            )
         
         # Estimate duration based on configuration
         estimated_duration = 15  # Default 15 minutes
@@ -199,12 +203,12 @@ async def start_training(
             estimated_duration = max(5, min(60, training_config["epochs"] // 4))
         
         return TrainingResponse(
-            job_id=job_id,
+            job_id=str(job.id),
             crypto_symbol=request.crypto_symbol,
             model_type=request.model_type.value,
             status=TrainingStatus.PENDING,
             message="Training job started successfully",
-            started_at=datetime.now(timezone.utc),
+            started_at=job.queued_at,
             estimated_duration_minutes=estimated_duration
         )
         
@@ -218,9 +222,23 @@ async def start_training(
         )
 
 
+@router.get("/training/capacity")
+async def get_training_capacity(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """
+    Training executor admission state
+    
+    Requires authentication. Returns CPU slots, active jobs and free memory.
+    """
+    return await asyncio.to_thread(training_executor.get_admission, db)
+
+
 @router.get("/training/{job_id}/status", response_model=TrainingStatusResponse)
 async def get_training_status(
     job_id: str,
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """
@@ -228,22 +246,51 @@ async def get_training_status(
     
     Requires authentication. Returns detailed training status.
     """
-    if job_id not in training_jobs:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Training job {job_id} not found"
-        )
+    job = get_training_job_for_user(db, job_id, current_user)
+    return create_safe_training_status_response(job)
+
+
+@router.get("/training/{job_id}/events")
+async def stream_training_events(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Any:
+    """
+    Stream training progress as Server-Sent Events
     
-    job = training_jobs[job_id]
+    Requires authentication. Sends a "progress" event whenever the job
+    record changes (one per epoch while training) and an "end" event
+    once the job completes, fails or is cancelled.
+    """
+    job_pk = get_training_job_for_user(db, job_id, current_user).id
+    poll_seconds = ml_config.training_poll_seconds
+    terminal = {TrainingStatus.COMPLETED.value, TrainingStatus.FAILED.value, TrainingStatus.CANCELLED.value}
     
-    # Check if user has access to this job
-    if job.get("user_id") != current_user.id and not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied to this training job"
-        )
+    async def events():
+        last_state = None
+        while True:
+            snapshot = await asyncio.to_thread(load_training_status, job_pk)
+            if snapshot is None:
+                return
+            
+            # duration_seconds ticks every poll; only real changes are sent
+            state = {key: value for key, value in snapshot.items() if key != "duration_seconds"}
+            if state != last_state:
+                last_state = state
+                yield f"event: progress\ndata: {json.dumps(snapshot)}\n\n"
+            
+            if snapshot["status"] in terminal:
+                yield f"event: end\ndata: {json.dumps({'status': snapshot['status']})}\n\n"
+                return
+            
+            await asyncio.sleep(poll_seconds)
     
-    return create_safe_training_status_response(job_id, job)
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/models/list", response_model=ModelListResponse)
@@ -419,42 +466,34 @@ async def get_model_performance(
 @router.delete("/training/{job_id}/cancel", response_model=SuccessResponse)
 async def cancel_training(
     job_id: str,
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """
     Cancel a running training job
     
     Requires authentication. Can only cancel pending or running jobs.
+    A queued job never starts; a running one stops at its next epoch
+    end or batch check and its model is not registered.
     """
-    if job_id not in training_jobs:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Training job {job_id} not found"
-        )
-    
-    job = training_jobs[job_id]
+    job = get_training_job_for_user(db, job_id, current_user)
     
-    # Check if user has access to this job
-    if job.get("user_id") != current_user.id and not current_user.is_superuser:
+    # Check if job can be cancelled
+    if not job.is_active:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied to this training job"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot cancel job with status: {job.job_status}"
         )
     
-    # Check if job can be cancelled
-    if job["status"] not in [TrainingStatus.PENDING, TrainingStatus.RUNNING]:
+    job = await asyncio.to_thread(
+        training_executor.cancel, db, job.id, f"Cancelled by user {current_user.id}"
+    )
+    if job.job_status != TrainingStatus.CANCELLED.value:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot cancel job with status: {job['status']}"
+            detail=f"Cannot cancel job with status: {job.job_status}"
         )
     
-    # Update job status
-    training_jobs[job_id].update({
-        "status": TrainingStatus.CANCELLED,
-        "message": "Training cancelled by user",
-        "completed_at": datetime.now(timezone.utc)
-    })
-    
     return SuccessResponse(
         success=True,
         message=f"Training job {job_id} cancelled successfully"
@@ -465,33 +504,26 @@ async def cancel_training(
 async def list_training_jobs(
     crypto_symbol: Optional[str] = None,
     status_filter: Optional[TrainingStatus] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Any:
     """
     List training jobs for the current user
     
     Requires authentication. Can filter by crypto symbol and status.
+    Superusers see every user's jobs.
     """
     try:
-        # Filter user's jobs
-        user_jobs = []
-        for job_id, job in training_jobs.items():
-            # Check if user has access to this job
-            if job.get("user_id") == current_user.id or current_user.is_superuser:
-                # Apply filters
-                if crypto_symbol and job.get("crypto_symbol") != crypto_symbol:
-                    continue
-                if status_filter and job.get("status") != status_filter:
-                    continue
-                
-                # Create safe response
-                job_response = create_safe_training_status_response(job_id, job)
-                user_jobs.append(job_response)
-        
-        # Sort by started_at descending (most recent first)
-        user_jobs.sort(key=lambda x: x.started_at, reverse=True)
+        jobs = ModelJobRepository(db).get_training_jobs(
+            user_id=None if current_user.is_superuser else current_user.id,
+            crypto_symbol=crypto_symbol,
+            status=status_filter.value if status_filter else None,
+            limit=limit
+        )
         
-        return user_jobs
+        # Most recent first
+        return [create_safe_training_status_response(job) for job in jobs]
         
     except Exception as e:
         logger.error(f"Failed to list training jobs: {str(e)}")
@@ -14,6 +14,7 @@ from app.core.database import get_db
 from app.core.deps import get_current_active_user, get_optional_current_user
 from app.ml.prediction.prediction_service import prediction_service
 from app.ml.config.ml_config import model_registry, ml_config
+from app.core.result_store import result_store, PREDICTION_NAMESPACE, PREDICTION_JOB_NAMESPACE
 from app.repositories import cryptocurrency_repository, prediction_repository
 from app.models import User
 
@@ -30,9 +31,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory storage for prediction jobs (in production, use Redis or database)
-prediction_jobs: Dict[str, Dict[str, Any]] = {}
-prediction_cache: Dict[str, Dict[str, Any]] = {}
+# Prediction jobs and endpoint results live in the shared result store so
+# every API worker sees them
+PREDICTION_JOB_TTL = 24 * 3600  # Keep job status for a day
+PREDICTION_RESULT_TTL = 30 * 60  # Cache predictions for 30 minutes
 
 
 # =====================================
@@ -77,12 +79,63 @@ def get_cache_key(crypto_symbol: str, timeframe: str, model_version: Optional[st
     Returns:
         str: Cache key
     """
-    base_key = f"{crypto_symbol}_{timeframe}"
+    # Symbol first, so new-model/new-candle events invalidate it
+    base_key = f"{crypto_symbol.upper()}:{timeframe}"
     if model_version:
-        base_key += f"_{model_version}"
+        base_key += f":{model_version}"
     return base_key
 
 
+async def save_prediction_job(prediction_id: str, job: Dict[str, Any]) -> None:
+    """
+    Store a prediction job record
+    
+    Args:
+        prediction_id: Prediction identifier
+        job: Job data dictionary
+    """
+    await result_store.set(PREDICTION_JOB_NAMESPACE, prediction_id, job, PREDICTION_JOB_TTL)
+
+
+async def get_prediction_job(prediction_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a prediction job record
+    
+    Args:
+        prediction_id: Prediction identifier
+    
+    Returns:
+        dict: Job data, or None if unknown or expired
+    """
+    return await result_store.get(PREDICTION_JOB_NAMESPACE, prediction_id)
+
+
+# Job states a transition may start from (finished jobs are never rewritten)
+ACTIVE_JOB_STATUSES = ("pending", "running")
+
+
+async def update_prediction_job(
+    prediction_id: str,
+    status_in: Optional[tuple] = ACTIVE_JOB_STATUSES,
+    **changes: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Atomically merge changes into a prediction job record
+    
+    Args:
+        prediction_id: Prediction identifier
+        status_in: Only apply while the job is in one of these states
+        **changes: Fields to update
+    
+    Returns:
+        dict: Job data after the update (unchanged if its status did not
+        match), or None if the job does not exist
+    """
+    return await result_store.update(
+        PREDICTION_JOB_NAMESPACE, prediction_id, changes, PREDICTION_JOB_TTL, status_in=status_in
+    )
+
+
 def create_safe_prediction_response(prediction_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a safe prediction response without problematic data
@@ -133,8 +186,12 @@ async def run_prediction_task(
     """
     try:
         # Update job status to running
-        prediction_jobs[prediction_id]["status"] = "running"
-        prediction_jobs[prediction_id]["message"] = "Prediction started"
+        job = await update_prediction_job(
+            prediction_id, status_in=("pending",), status="running", message="Prediction started"
+        )
+        if job is None or job["status"] != "running":
+            logger.info(f"Prediction job {prediction_id} not started: {job['status'] if job else 'expired'}")
+            return
         
         logger.info(f"Starting prediction job {prediction_id} for {crypto_symbol}")
         
@@ -146,24 +203,33 @@ async def run_prediction_task(
         
         # Update job with results
         if result.get("success", False):
-            prediction_jobs[prediction_id]["status"] = "completed"
-            prediction_jobs[prediction_id]["message"] = "Prediction completed successfully"
-            prediction_jobs[prediction_id]["completed_at"] = datetime.now(timezone.utc)
-            prediction_jobs[prediction_id]["prediction_result"] = result
+            job = await update_prediction_job(
+                prediction_id,
+                status="completed",
+                message="Prediction completed successfully",
+                completed_at=datetime.now(timezone.utc),
+                prediction_result=result
+            )
         else:
-            prediction_jobs[prediction_id]["status"] = "failed"
-            prediction_jobs[prediction_id]["message"] = "Prediction failed"
-            prediction_jobs[prediction_id]["error_details"] = result.get("error", "Unknown error")
-            prediction_jobs[prediction_id]["completed_at"] = datetime.now(timezone.utc)
-            
-        logger.info(f"Prediction job {prediction_id} completed with status: {prediction_jobs[prediction_id]['status']}")
+            job = await update_prediction_job(
+                prediction_id,
+                status="failed",
+                message="Prediction failed",
+                error_details=result.get("error", "Unknown error"),
+                completed_at=datetime.now(timezone.utc)
+            )
         
+        logger.info(f"Prediction job {prediction_id} completed with status: {job['status'] if job else 'expired'}")
+    
     except Exception as e:
         logger.error(f"Prediction job {prediction_id} failed with exception: {str(e)}")
-        prediction_jobs[prediction_id]["status"] = "failed"
-        prediction_jobs[prediction_id]["message"] = "Prediction failed with exception"
-        prediction_jobs[prediction_id]["error_details"] = str(e)
-        prediction_jobs[prediction_id]["completed_at"] = datetime.now(timezone.utc)
+        await update_prediction_job(
+            prediction_id,
+            status="failed",
+            message="Prediction failed with exception",
+            error_details=str(e),
+            completed_at=datetime.now(timezone.utc)
+        )
 
 
 # =====================================
@@ -206,30 +272,27 @@ async def make_prediction(
         prediction_id = generate_prediction_id(crypto.symbol, f"{request.days}d")
                 
         # Check cache for recent predictions
-        cache_key = get_cache_key(crypto.symbol, f"{prediction_horizon}h")
-        cache_ttl_minutes = 30  # Cache for 30 minutes
-        
-        if cache_key in prediction_cache:
-            cached_prediction = prediction_cache[cache_key]
-            cached_time = cached_prediction.get("cached_at")
-            if cached_time and (datetime.now(timezone.utc) - cached_time).total_seconds() < cache_ttl_minutes * 60:
-                logger.info(f"Returning cached prediction for {crypto.symbol}")
-                
-                cached_result = cached_prediction["data"]
-                return PredictionResult(
-                    crypto_id=crypto_id,
-                    crypto_symbol=crypto.symbol,
-                    model_name=cached_result["model_name"],
-                    predicted_price=cached_result["predicted_price"],
-                    confidence_score=cached_result["confidence_score"],
-                    target_datetime=cached_result["target_datetime"],
-                    features_used=cached_result.get("features_used", []),
-                    model_accuracy=cached_result.get("model_accuracy"),
-                    prediction_id=None
-                )
+        cache_key = get_cache_key(crypto.symbol, f"{prediction_horizon}h", "endpoint")
+        
+        cached_prediction = await result_store.get(PREDICTION_NAMESPACE, cache_key)
+        if cached_prediction:
+            logger.info(f"Returning cached prediction for {crypto.symbol}")
+            
+            cached_result = cached_prediction["data"]
+            return PredictionResult(
+                crypto_id=crypto_id,
+                crypto_symbol=crypto.symbol,
+                model_name=cached_result["model_name"],
+                predicted_price=cached_result["predicted_price"],
+                confidence_score=cached_result["confidence_score"],
+                target_datetime=cached_result["target_datetime"],
+                features_used=cached_result.get("features_used", []),
+                model_accuracy=cached_result.get("model_accuracy"),
+                prediction_id=None
+            )
         
         # Create prediction job record
-        prediction_jobs[prediction_id] = {
+        await save_prediction_job(prediction_id, {
             "prediction_id": prediction_id,
             "crypto_symbol": crypto.symbol,
             "crypto_id": crypto_id,
@@ -240,7 +303,7 @@ async def make_prediction(
             "prediction_horizon": prediction_horizon,
             "model_type": request.model_type,
             "include_confidence": request.include_confidence
-        }
+        })
         
         # Try immediate prediction first (for quick results)
         try:
@@ -262,15 +325,20 @@ async def make_prediction(
                     "model_accuracy": result.get("model_accuracy")
                 }
                 
-                prediction_cache[cache_key] = {
-                    "data": cached_data,
-                    "cached_at": datetime.now(timezone.utc)
-                }
+                await result_store.set(
+                    PREDICTION_NAMESPACE,
+                    cache_key,
+                    {"data": cached_data, "cached_at": datetime.now(timezone.utc)},
+                    PREDICTION_RESULT_TTL
+                )
                 
                 # Update job status to completed
-                prediction_jobs[prediction_id]["status"] = "completed"
-                prediction_jobs[prediction_id]["prediction_result"] = result
-                prediction_jobs[prediction_id]["completed_at"] = datetime.now(timezone.utc)
+                await update_prediction_job(
+                    prediction_id,
+                    status="completed",
+                    prediction_result=result,
+                    completed_at=datetime.now(timezone.utc)
+                )
                 
                 logger.info(f"Immediate prediction completed for {crypto.symbol}")
                 
@@ -303,8 +371,8 @@ async def make_prediction(
         await asyncio.sleep(0.5)
         
         # Check if completed quickly
-        if prediction_id in prediction_jobs:
-            job = prediction_jobs[prediction_id]
+        job = await get_prediction_job(prediction_id)
+        if job:
             if job["status"] == "completed" and job.get("prediction_result"):
                 result = job["prediction_result"]
                 target_datetime = datetime.now(timezone.utc) + timedelta(hours=prediction_horizon)
@@ -355,14 +423,13 @@ async def get_prediction_status(
     """
     try:
         # Check if job exists
-        if prediction_id not in prediction_jobs:
+        job = await get_prediction_job(prediction_id)
+        if not job:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Prediction job {prediction_id} not found"
             )
         
-        job = prediction_jobs[prediction_id]
-        
         # Create safe response
         response = create_safe_prediction_response(prediction_id, job)
         
@@ -685,14 +752,13 @@ async def cancel_prediction_job(
     """
     try:
         # Check if job exists
-        if prediction_id not in prediction_jobs:
+        job = await get_prediction_job(prediction_id)
+        if not job:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Prediction job {prediction_id} not found"
             )
         
-        job = prediction_jobs[prediction_id]
-        
         # Check if job can be cancelled
         if job["status"] in ["completed", "failed", "cancelled"]:
             raise HTTPException(
@@ -700,10 +766,18 @@ async def cancel_prediction_job(
                 detail=f"Cannot cancel job with status: {job['status']}"
             )
         
-        # Update job status
-        prediction_jobs[prediction_id]["status"] = "cancelled"
-        prediction_jobs[prediction_id]["message"] = f"Job cancelled by user {current_user.email}"
-        prediction_jobs[prediction_id]["completed_at"] = datetime.now(timezone.utc)
+        # Update job status (fails if the job finished in the meantime)
+        job = await update_prediction_job(
+            prediction_id,
+            status="cancelled",
+            message=f"Job cancelled by user {current_user.email}",
+            completed_at=datetime.now(timezone.utc)
+        )
+        if job is None or job["status"] != "cancelled":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot cancel job with status: {job['status'] if job else 'expired'}"
+            )
         
         logger.info(f"User {current_user.id} cancelled prediction job {prediction_id}")
         
@@ -746,8 +820,8 @@ async def get_prediction_stats(
             "requested_at": datetime.now(timezone.utc).isoformat(),
             "system_info": {
                 "prediction_service_active": True,
-                "cache_enabled": prediction_service.redis_client is not None,
-                "model_cache_enabled": len(prediction_service.model_cache) > 0
+                "cache_enabled": result_store.redis_enabled,
+                "model_cache_enabled": stats["model_cache_size"] > 0
             }
         }
         
@@ -779,7 +853,7 @@ async def clear_prediction_cache(
         logger.info(f"User {current_user.id} requesting prediction cache clear")
         
         # Clear cache using prediction service
-        clear_result = prediction_service.clear_cache()
+        clear_result = await prediction_service.clear_cache()
         
         # Create comprehensive response
         response_data = {
@@ -792,7 +866,7 @@ async def clear_prediction_cache(
                 "description": "Prediction cache has been cleared",
                 "temporary_effect": "Next predictions may be slower until cache rebuilds",
                 "memory_freed": True,
-                "redis_cache_cleared": prediction_service.redis_client is not None
+                "redis_cache_cleared": result_store.redis_enabled
             },
             "recommendations": [
                 "Monitor system performance for the next few minutes",
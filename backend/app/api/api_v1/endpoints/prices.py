@@ -1,13 +1,16 @@
 # File: backend/app/api/api_v1/endpoints/prices.py
 # Price data management API endpoints with CRUD operations
 
+import logging
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.deps import get_current_active_user, get_optional_current_user, get_current_admin_user
 from app.schemas.price_data import (
     PriceDataCreate, PriceDataResponse, PriceDataWithCrypto, OHLCV,
@@ -15,13 +18,17 @@ from app.schemas.price_data import (
     MLDataRequest, MLDataResponse, PriceDataBulkInsert
 )
 from app.schemas.common import (
-    SuccessResponse, PaginationParams, PaginatedResponse
+    SuccessResponse, PaginationParams, PaginatedResponse, CursorPaginatedResponse
 )
 from app.repositories import price_data_repository, cryptocurrency_repository
+from app.repositories import AsyncAssetRepository, AsyncPriceDataRepository, AssetRepository, TieredPriceDataRepository
+from app.repositories import ColdFileUnavailableError
+from app.services import price_stream_service
 from app.models import User
 
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 # Helper functions
@@ -82,6 +89,8 @@ def list_price_data(
     
     Public endpoint - no authentication required.
     Supports filtering by cryptocurrency, date range, and timeframe.
+    Offset-paged; use /{crypto_id}/candles (keyset cursor) to page deep
+    into one asset's history.
     """
     try:
         # Validate timeframe if provided
@@ -274,13 +283,14 @@ def get_price_history(
     Public endpoint - no authentication required.
     Returns OHLCV data for specified period and timeframe.
     Supports 1h (hourly), 4h (4-hourly), 1d (daily) timeframes.
+    Candles already moved to the archive and cold tiers are included.
     """
     try:
         # Validate timeframe
         timeframe = validate_timeframe(timeframe)
         
         # Verify cryptocurrency exists
-        crypto = cryptocurrency_repository.get(db, crypto_id)
+        crypto = AssetRepository(db).get(crypto_id)
         if not crypto:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -288,20 +298,19 @@ def get_price_history(
             )
         
         # Calculate date range and expected data points
-        end_date = datetime.utcnow()
+        end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=days)
         expected_points = get_timeframe_limit(timeframe, days)
         
-        # Get price history using your existing repository
-        price_history = price_data_repository.get_price_history(
-            db,
-            crypto_id=crypto_id,
-            start_date=start_date,
-            end_date=end_date,
-            limit=1000  # Limit for performance
+        # Candles in range across hot, archive and cold tiers, oldest first
+        columns = TieredPriceDataRepository(db).get_ohlcv_columns(
+            crypto_id, timeframe, start_time=start_date, end_time=end_date
         )
         
-        if not price_history:
+        # Newest candles only (limit for performance)
+        limit = min(expected_points, 1000)
+        candle_times = columns['candle_time'][-limit:].astype('datetime64[us]').tolist()
+        if not candle_times:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No price history found for this cryptocurrency"
@@ -310,13 +319,20 @@ def get_price_history(
         # Convert to OHLCV format
         ohlcv_data = [
             OHLCV(
-                timestamp=price.timestamp,
-                open=float(price.open_price),
-                high=float(price.high_price),
-                low=float(price.low_price),
-                close=float(price.close_price),
-                volume=float(price.volume) if price.volume else 0.0
-            ) for price in price_history
+                timestamp=candle_time.replace(tzinfo=timezone.utc),
+                open=float(open_price),
+                high=float(high_price),
+                low=float(low_price),
+                close=float(close_price),
+                volume=float(volume)
+            ) for candle_time, open_price, high_price, low_price, close_price, volume in zip(
+                candle_times,
+                columns['open_price'][-limit:],
+                columns['high_price'][-limit:],
+                columns['low_price'][-limit:],
+                columns['close_price'][-limit:],
+                columns['volume'][-limit:]
+            )
         ]
         
         return PriceHistoryResponse(
@@ -332,6 +348,11 @@ def get_price_history(
         
     except HTTPException:
         raise
+    except ColdFileUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Price history for {e.period} is in cold storage that is not available on this server"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -339,6 +360,83 @@ def get_price_history(
         )
 
 
+@router.get("/{crypto_id}/candles", response_model=CursorPaginatedResponse[OHLCV])
+async def get_candles(
+    crypto_id: int,
+    timeframe: str = Query("1h", description="Data timeframe (1h, 4h, 1d)"),
+    start_date: Optional[datetime] = Query(None, description="Start of the time range (inclusive)"),
+    end_date: Optional[datetime] = Query(None, description="End of the time range (inclusive)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(500, ge=1, le=5000, description="Page size (json format only)"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="Order by candle time"),
+    format: str = Query("json", pattern="^(json|ndjson|arrow)$", description="json page, or ndjson/arrow stream"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_optional_current_user)
+) -> Any:
+    """
+    Candle history with keyset pagination or streaming
+    
+    Public endpoint - no authentication required.
+    format=json returns one page and a next_cursor; pages stay fast at any
+    depth (keyset on asset, timeframe, candle time instead of OFFSET).
+    format=ndjson / format=arrow stream the whole range (from the cursor, if
+    given) through a server-side cursor without building it in memory.
+    """
+    timeframe = validate_timeframe(timeframe)
+    descending = order == "desc"
+    
+    crypto = await AsyncAssetRepository(db).get(crypto_id)
+    if not crypto:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cryptocurrency not found"
+        )
+    
+    after = None
+    if cursor:
+        try:
+            after = price_stream_service.decode_cursor(cursor, crypto_id, timeframe)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    filters = {"after": after, "start_time": start_date, "end_time": end_date, "descending": descending}
+    
+    if format == "ndjson":
+        return StreamingResponse(
+            price_stream_service.stream_candles_ndjson(crypto_id, timeframe, **filters),
+            media_type=price_stream_service.NDJSON_MEDIA_TYPE
+        )
+    
+    if format == "arrow":
+        if not price_stream_service.ARROW_AVAILABLE:
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail="Arrow output is not available on this server (pyarrow not installed)"
+            )
+        return StreamingResponse(
+            price_stream_service.stream_candles_arrow(crypto_id, timeframe, **filters),
+            media_type=price_stream_service.ARROW_STREAM_MEDIA_TYPE
+        )
+    
+    try:
+        rows, has_more = await AsyncPriceDataRepository(db).get_candle_page(
+            crypto_id, timeframe, limit=limit, **filters
+        )
+    except Exception as e:
+        logger.error(f"Candle page failed for asset {crypto_id} ({timeframe}): {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve candles"
+        ) from e
+    
+    return CursorPaginatedResponse[OHLCV](
+        items=[price_stream_service.candle_to_dict(row) for row in rows],
+        limit=limit,
+        has_more=has_more,
+        next_cursor=price_stream_service.encode_cursor(crypto_id, timeframe, rows[-1][0]) if has_more else None
+    )
+
+
 @router.get("/{crypto_id}/statistics", response_model=PriceStatistics)
 def get_price_statistics(
     crypto_id: int,
@@ -439,6 +537,8 @@ def get_price_statistics(
 def get_ml_data(
     crypto_id: int,
     ml_request: MLDataRequest,
+    timeframe: str = Query("1h", description="Data timeframe (1h, 4h, 1d)"),
+    format: str = Query("json", pattern="^(json|arrow|parquet)$", description="json, or columnar arrow/parquet"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ) -> Any:
@@ -447,37 +547,69 @@ def get_ml_data(
     
     Requires admin authentication.
     Returns data in format suitable for machine learning models.
+    format=arrow (Arrow IPC stream) and format=parquet return the feature
+    columns as a columnar file, fetched without per-row objects.
     """
     try:
+        timeframe = validate_timeframe(timeframe)
+        
         # Verify cryptocurrency exists
-        crypto = cryptocurrency_repository.get(db, crypto_id)
+        crypto = AssetRepository(db).get(crypto_id)
         if not crypto:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Cryptocurrency not found"
             )
         
-        # Get ML-formatted data using your existing repository
-        ml_data = price_data_repository.get_ml_data(
-            db,
-            crypto_id=crypto_id,
-            start_date=ml_request.start_date,
-            end_date=ml_request.end_date,
-            features=ml_request.features
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=ml_request.days_back)
+        
+        # Columnar fetch (COPY TO on PostgreSQL) straight into NumPy arrays,
+        # including candles already moved to the archive and cold tiers
+        columns = TieredPriceDataRepository(db).get_ohlcv_columns(
+            crypto_id, timeframe, start_time=start_date, end_time=end_date
         )
         
-        if not ml_data:
+        if not len(columns['candle_time']):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No data found for ML training"
             )
         
+        features = price_stream_service.select_ml_features(
+            columns, ml_request.features, normalize=ml_request.normalize
+        )
+        
+        if format != "json":
+            if not price_stream_service.ARROW_AVAILABLE:
+                raise HTTPException(
+                    status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                    detail="Columnar output is not available on this server (pyarrow not installed)"
+                )
+            table = price_stream_service.columns_to_arrow_table(features)
+            if format == "parquet":
+                content = price_stream_service.parquet_bytes(table)
+                media_type, extension = price_stream_service.PARQUET_MEDIA_TYPE, "parquet"
+            else:
+                content = price_stream_service.arrow_ipc_bytes(table)
+                media_type, extension = price_stream_service.ARROW_STREAM_MEDIA_TYPE, "arrows"
+            return Response(
+                content=content,
+                media_type=media_type,
+                headers={
+                    "Content-Disposition": f'attachment; filename="{crypto.symbol}_{timeframe}_ml_data.{extension}"',
+                    "X-Data-Points": str(table.num_rows)
+                }
+            )
+        
+        ml_data = price_stream_service.columns_to_records(features)
+        
         return MLDataResponse(
             crypto_id=crypto_id,
             symbol=crypto.symbol,
             name=crypto.name,
-            start_date=ml_request.start_date,
-            end_date=ml_request.end_date,
+            start_date=start_date,
+            end_date=end_date,
             features=ml_request.features,
             data_points=len(ml_data),
             ml_data=ml_data,
@@ -490,6 +622,11 @@ def get_ml_data(
         
     except HTTPException:
         raise
+    except ColdFileUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Price data for {e.period} is in cold storage that is not available on this server"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -33,6 +33,7 @@ from app.tasks.ml_tasks import (
 # Import scheduler utilities
 from app.tasks.scheduler import task_scheduler, get_next_run_times
 from app.tasks.celery_app import celery_app
+from app.tasks.task_lease import task_lease_manager
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -476,6 +477,35 @@ async def get_task_schedule(
         )
 
 
+@router.get("/leases", operation_id="get_task_leases")
+async def get_task_leases(
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """
+    Get task lease metrics
+    
+    Returns acquired, skipped, coalesced, recovered and lost lease counts
+    per task across all workers, and the leases held right now.
+    """
+    try:
+        metrics = await asyncio.to_thread(task_lease_manager.get_metrics)
+        
+        return {
+            "success": True,
+            "lease_seconds": task_lease_manager.lease_seconds,
+            "enabled": task_lease_manager.enabled,
+            **metrics,
+            "requested_at": datetime.now(timezone.utc).isoformat()
+        }
+    
+    except Exception as e:
+        logger.error(f"Failed to get task leases: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get task leases: {str(e)}"
+        )
+
+
 @router.get("/info", operation_id="get_task_info")
 async def get_task_info(
     current_user: User = Depends(get_current_active_user)
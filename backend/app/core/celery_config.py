@@ -69,6 +69,26 @@ class CeleryConfig:
             "queue": "price_data",
             "priority": 7
         },
+        "app.tasks.price_collector.collect_metrics_snapshot": {
+            "queue": "price_data",
+            "priority": 6
+        },
+        
+        # Per-asset subtasks of fan-out schedules. Each queue gets its own
+        # workers, so "--concurrency" on those workers caps how many assets
+        # run at once (API rate limits for prices, CPU/RAM for ML)
+        "app.tasks.price_collector.fetch_asset_price_data": {
+            "queue": "price_data",
+            "priority": 6
+        },
+        "ml_tasks.generate_asset_prediction": {
+            "queue": "ml_prediction",
+            "priority": 5
+        },
+        "ml_tasks.train_single_model": {
+            "queue": "model_training",
+            "priority": 5
+        },
         
         # Discovery and Maintenance Tasks (Medium Priority)
         "app.tasks.price_collector.discover_new_cryptocurrencies": {
@@ -79,6 +99,14 @@ class CeleryConfig:
             "queue": "scheduling",
             "priority": 2
         },
+        "app.tasks.price_collector.maintain_price_data_partitions": {
+            "queue": "scheduling",
+            "priority": 5
+        },
+        "app.tasks.price_collector.freeze_archived_price_data": {
+            "queue": "scheduling",
+            "priority": 5
+        },
         
         # ML Tasks (Medium Priority) - For future use
         "app.tasks.ml_tasks.*": {
@@ -117,6 +145,25 @@ class CeleryConfig:
             }
         ),
         
+        # Per-asset ML subtasks (see task_routes), one worker pool each
+        Queue(
+            "ml_prediction",
+            Exchange("ml_prediction", type="direct"),
+            routing_key="ml_prediction",
+            queue_arguments={
+                "x-max-priority": 8,
+                "x-message-ttl": 1800000  # 30 minutes TTL
+            }
+        ),
+        Queue(
+            "model_training",
+            Exchange("model_training", type="direct"),
+            routing_key="model_training",
+            queue_arguments={
+                "x-max-priority": 10  # train_single_model sends most stale first
+            }
+        ),
+        
         # Low priority queue for scheduled tasks
         Queue(
             "scheduling", 
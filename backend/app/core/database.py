@@ -3,15 +3,15 @@
 
 import os
 import logging
-from typing import Generator, Optional
-from sqlalchemy import create_engine, MetaData
+from typing import AsyncGenerator, Generator, Optional
+from sqlalchemy import create_engine, MetaData, event
 from sqlalchemy.orm import sessionmaker, Session, declarative_base  # FIXED: Updated import
 from sqlalchemy.pool import NullPool
 import redis
 from redis import Redis
 
 from app.core.config import settings
-from app.utils.query_monitor import setup_query_monitoring
+from app.utils.query_monitor import setup_query_monitoring, query_monitor
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -39,15 +39,37 @@ else:
         pool_recycle=3600,  # Recycle connections every hour
         echo=False  # Set to True for SQL query logging
     )
+    
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        """
+        Session setup, once per physical connection
+        
+        Keeps timestamptz values in UTC. Committed so the pool's
+        reset-on-return rollback does not undo the SET.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SET TIME ZONE 'UTC'")
+            dbapi_connection.commit()
+        except Exception as tz_exc:
+            # Keep non-fatal: warn and continue
+            logger.warning(f"Failed to set DB session time zone to UTC: {tz_exc}")
+            dbapi_connection.rollback()
+        finally:
+            cursor.close()
+        query_monitor.record_connection_setup()
 
 # Setup query monitoring
 setup_query_monitoring(engine)
 
-# Auto-enable query monitoring globally
-from app.utils.query_monitor import query_monitor
-query_monitor.enabled = True
-query_monitor.start_time = __import__('time').time()
-logger.info("🔍 Query monitoring AUTO-ENABLED globally")
+# Sampling query profiler (fingerprint histograms, slow query and N+1 detection)
+query_monitor.configure(
+    enabled=settings.QUERY_PROFILER_ENABLED,
+    sample_rate=settings.QUERY_PROFILER_SAMPLE_RATE,
+    slow_query_ms=settings.QUERY_PROFILER_SLOW_MS,
+    n_plus_one_threshold=settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD
+)
 
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(
@@ -57,6 +79,61 @@ SessionLocal = sessionmaker(
     expire_on_commit=False
 )
 
+
+def get_async_database_url(url: str) -> str:
+    """
+    Map a sync database URL onto its async driver
+    
+    postgresql[+psycopg2]:// -> postgresql+asyncpg://, sqlite:// -> sqlite+aiosqlite://
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    dialect = scheme.split("+", 1)[0]
+    if dialect in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+
+# Async engine for request-path reads. Optional: without asyncpg/aiosqlite
+# installed the app keeps running on the sync engine only.
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+async_engine = None
+AsyncSessionLocal = None
+
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    
+    if "sqlite" in ASYNC_DATABASE_URL:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            poolclass=NullPool
+        )
+    else:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_pre_ping=True,
+            pool_size=settings.ASYNC_DB_POOL_SIZE,
+            max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            pool_recycle=3600,
+            # Session time zone is set once per connection by the server
+            connect_args={"server_settings": {"timezone": "UTC"}},
+            echo=False
+        )
+    
+    # Same query monitoring as the sync engine
+    setup_query_monitoring(async_engine.sync_engine)
+    
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+except ImportError as e:
+    logger.warning(f"Async database driver not available, async sessions disabled: {e}")
+
 # Create declarative base for models - FIXED: Using SQLAlchemy 2.0 import
 Base = declarative_base()
 
@@ -102,6 +179,32 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Dependency function to get an async database session
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database sessions are not available (install asyncpg or aiosqlite)")
+    
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            if "connection" in str(e).lower() or "timeout" in str(e).lower():
+                logger.error(f"🔴 Async database connection issue: {str(e)}")
+            await db.rollback()
+            raise
+
+
+async def close_async_db() -> None:
+    """Dispose the async engine's connection pool"""
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 def get_redis() -> Optional[Redis]:
     """
     Get Redis client instance
@@ -179,6 +282,8 @@ def get_database_info() -> dict:
         "pool_checked_in": getattr(engine.pool, 'checkedin', 'N/A'),
         "pool_checked_out": getattr(engine.pool, 'checkedout', 'N/A'),
         "pool_overflow": getattr(engine.pool, 'overflow', 'N/A'),
+        "async_enabled": async_engine is not None,
+        "async_pool_checked_out": getattr(async_engine.pool, 'checkedout', 'N/A') if async_engine is not None else 'N/A',
     }
 
 
@@ -0,0 +1,672 @@
+# File: backend/app/core/result_store.py
+# Shared result store: async Redis backend with a bounded in-process L1 and pub/sub invalidation
+
+import json
+import time
+import uuid
+import zlib
+import socket
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+import numpy as np
+
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis = None
+    redis_asyncio = None
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Namespaces shared by the API processes and the Celery workers
+PREDICTION_NAMESPACE = "prediction"
+PREDICTION_JOB_NAMESPACE = "prediction_job"
+DASHBOARD_NAMESPACE = "dashboard"
+
+# Dashboard keys covering several symbols (not symbol-first)
+DASHBOARD_SUMMARY_PREFIX = "dashboard_summary"
+
+# Events published when cached results go stale
+MODEL_UPDATED = "model_updated"
+NEW_CANDLE = "new_candle"
+
+
+# =====================================
+# SERIALIZATION
+# =====================================
+
+# Payloads above this size are zlib-compressed
+_COMPRESS_MIN_BYTES = 512
+_RAW_JSON = b"j"
+_ZLIB_JSON = b"z"
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values json can't handle; datetimes are tagged to round-trip"""
+    if isinstance(obj, datetime):
+        return {"$dt": obj.isoformat()}
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and "$dt" in obj:
+        return datetime.fromisoformat(obj["$dt"])
+    return obj
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Compact wire format: one header byte, then minified JSON (zlib for large values)
+
+    Args:
+        value: JSON-compatible value (datetimes, Decimals and numpy scalars allowed)
+
+    Returns:
+        bytes: Encoded payload
+    """
+    payload = json.dumps(value, default=_json_default, separators=(",", ":")).encode("utf-8")
+    if len(payload) >= _COMPRESS_MIN_BYTES:
+        return _ZLIB_JSON + zlib.compress(payload, 1)
+    return _RAW_JSON + payload
+
+
+def decode_value(data: bytes) -> Any:
+    """Decode a payload written by encode_value"""
+    header, payload = data[:1], data[1:]
+    if header == _ZLIB_JSON:
+        payload = zlib.decompress(payload)
+    elif header != _RAW_JSON:
+        raise ValueError(f"Unknown result store payload header: {header!r}")
+    return json.loads(payload, object_hook=_json_object_hook)
+
+
+# =====================================
+# L1 CACHE
+# =====================================
+
+class LocalTTLCache:
+    """
+    Bounded in-process cache with per-entry expiry and LRU eviction
+
+    Values are kept as decoded objects, so hits cost a dict lookup.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =====================================
+# SHARED STORE
+# =====================================
+
+class SharedResultStore:
+    """
+    Prediction/result store shared by every API and worker process
+
+    Features:
+    - Async Redis backend (redis.asyncio), one client per event loop
+    - Bounded L1 per process; L1 entries never outlive their Redis TTL
+    - Compact serialization (minified JSON, zlib above 512 bytes)
+    - Pub/sub invalidation: model_updated / new_candle events drop the
+      dependent namespaces for a symbol in every process
+    - Degrades to L1-only when Redis is unavailable, retrying after a backoff
+    - Namespaces marked with bypass_l1() (job records) are read from Redis
+      only, and update() merges them atomically (WATCH/MULTI)
+
+    Keys are ``<namespace>:<SYMBOL>:...`` so events can invalidate by symbol.
+    Keys spanning several symbols go under a shared prefix registered with
+    register_dependency(); any symbol's event drops all of them.
+    """
+
+    REDIS_RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        redis_url: Optional[str],
+        key_prefix: str = "cp",
+        l1_max_entries: int = 2048,
+        l1_ttl_seconds: float = 60,
+        redis_enabled: bool = True
+    ):
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.channel = f"{key_prefix}:invalidate"
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.redis_enabled = bool(redis_enabled and redis_url and redis_asyncio)
+
+        self.l1 = LocalTTLCache(l1_max_entries)
+        self.origin = uuid.uuid4().hex
+
+        # event -> namespaces invalidated by it, namespace -> multi-symbol
+        # key prefixes, and local callbacks
+        self._dependencies: Dict[str, List[str]] = {}
+        self._shared_prefixes: Dict[str, List[str]] = {}
+        self._listeners: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+        self._l1_bypass: set = set()
+
+        # id(loop) -> (loop, client); a redis.asyncio client only works on its own loop
+        self._clients: Dict[int, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+        self._sync_client = None
+        self._redis_down_until = 0.0
+        self._listener_task: Optional[asyncio.Task] = None
+
+        self.stats = {'redis_hits': 0, 'redis_misses': 0, 'redis_errors': 0, 'events_received': 0}
+
+    # -------------------------------------
+    # Redis plumbing
+    # -------------------------------------
+
+    def _redis_key(self, full_key: str) -> str:
+        return f"{self.key_prefix}:{full_key}"
+
+    def _redis_available(self) -> bool:
+        return self.redis_enabled and time.monotonic() >= self._redis_down_until
+
+    def _mark_redis_down(self, error: Exception) -> None:
+        self.stats['redis_errors'] += 1
+        self._redis_down_until = time.monotonic() + self.REDIS_RETRY_SECONDS
+        logger.warning(f"Result store Redis unavailable, using L1 only for {self.REDIS_RETRY_SECONDS}s: {error}")
+
+    def _client(self):
+        """Async client bound to the running loop (one per worker thread loop)"""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(id(loop))
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        self._evict_closed_loop_clients()
+        client = redis_asyncio.from_url(
+            self.redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+        )
+        self._clients[id(loop)] = (loop, client)
+        return client
+
+    def _evict_closed_loop_clients(self) -> int:
+        """Drop clients whose loop is closed, releasing their pooled connections"""
+        evicted = 0
+        for loop_id, (loop, client) in list(self._clients.items()):
+            if loop.is_closed():
+                del self._clients[loop_id]
+                self._shutdown_connections(client)
+                evicted += 1
+        return evicted
+
+    @staticmethod
+    def _shutdown_connections(client) -> None:
+        """
+        Release a client whose loop is gone
+
+        aclose() can't run without its loop, so the sockets are shut down
+        directly; Redis frees the connections and the descriptors go with
+        the dropped client.
+        """
+        try:
+            pool = client.connection_pool
+            for connection in [*pool._available_connections, *pool._in_use_connections]:
+                writer = getattr(connection, '_writer', None)
+                sock = writer.get_extra_info('socket') if writer is not None else None
+                if sock is not None:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+        except Exception as e:
+            logger.debug(f"Result store could not release a closed loop's client: {str(e)}")
+
+    async def close_client(self) -> None:
+        """Close the running loop's client (call before the loop closes)"""
+        entry = self._clients.pop(id(asyncio.get_running_loop()), None)
+        if entry is not None:
+            try:
+                await entry[1].aclose()
+            except Exception:
+                pass
+        self._evict_closed_loop_clients()
+
+    def _get_sync_client(self):
+        if self._sync_client is None:
+            self._sync_client = redis.from_url(
+                self.redis_url, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+        return self._sync_client
+
+    # -------------------------------------
+    # Key/value API
+    # -------------------------------------
+
+    def bypass_l1(self, namespace: str) -> None:
+        """
+        Serve a namespace from Redis only
+
+        For records other processes change while they are read (job status):
+        L1 is not invalidated on writes, so another worker would keep its
+        stale copy until the L1 TTL. L1 still holds them while Redis is down.
+        """
+        self._l1_bypass.add(namespace)
+
+    def _uses_l1(self, namespace: str) -> bool:
+        return namespace not in self._l1_bypass or not self._redis_available()
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Look up a value: L1 first, then Redis
+
+        Returns:
+            Decoded value, or None on miss
+        """
+        full_key = f"{namespace}:{key}"
+        use_l1 = self._uses_l1(namespace)
+        value = self.l1.get(full_key) if use_l1 else None
+        if value is not None or not self._redis_available():
+            return value
+
+        try:
+            client = self._client()
+            pipe = client.pipeline(transaction=False)
+            pipe.get(self._redis_key(full_key))
+            pipe.pttl(self._redis_key(full_key))
+            data, pttl = await pipe.execute()
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None
+
+        if data is None:
+            self.stats['redis_misses'] += 1
+            return None
+
+        self.stats['redis_hits'] += 1
+        value = decode_value(data)
+        if use_l1:
+            remaining = pttl / 1000 if pttl and pttl > 0 else self.l1_ttl_seconds
+            self.l1.set(full_key, value, min(self.l1_ttl_seconds, remaining))
+        return value
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a value in Redis and L1
+
+        Args:
+            namespace: Value namespace
+            key: Key inside the namespace (``SYMBOL:...``)
+            value: JSON-compatible value
+            ttl: Time to live in seconds
+        """
+        full_key = f"{namespace}:{key}"
+        self.l1.set(full_key, value, min(self.l1_ttl_seconds, ttl))
+
+        if not self._redis_available():
+            return
+
+        try:
+            await self._client().set(self._redis_key(full_key), encode_value(value), ex=int(ttl))
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    async def update(
+        self,
+        namespace: str,
+        key: str,
+        changes: Dict[str, Any],
+        ttl: int,
+        status_in: Optional[Tuple[str, ...]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Merge changes into a stored dict atomically
+
+        The read, check and write run under WATCH/MULTI on the Redis key and
+        are retried if another process writes it in between, so concurrent
+        updates never overwrite each other with a stale copy.
+
+        Args:
+            namespace: Value namespace
+            key: Key inside the namespace
+            changes: Fields to set
+            ttl: Time to live in seconds
+            status_in: Only apply if the stored "status" is one of these
+
+        Returns:
+            The merged dict; the stored dict unchanged if status_in did not
+            match; None if the key does not exist
+        """
+        full_key = f"{namespace}:{key}"
+
+        if self._redis_available():
+            try:
+                merged = await self._update_redis(full_key, changes, ttl, status_in)
+            except Exception as e:
+                self._mark_redis_down(e)
+            else:
+                if merged is None:
+                    self.l1.delete(full_key)
+                else:
+                    self.l1.set(full_key, merged, min(self.l1_ttl_seconds, ttl))
+                return merged
+
+        # L1 only: no await between read and write, so this is atomic per process
+        current = self.l1.get(full_key)
+        if current is None:
+            return None
+        if status_in is not None and current.get("status") not in status_in:
+            return current
+
+        merged = {**current, **changes}
+        self.l1.set(full_key, merged, min(self.l1_ttl_seconds, ttl))
+        return merged
+
+    async def _update_redis(
+        self,
+        full_key: str,
+        changes: Dict[str, Any],
+        ttl: int,
+        status_in: Optional[Tuple[str, ...]]
+    ) -> Optional[Dict[str, Any]]:
+        redis_key = self._redis_key(full_key)
+        async with self._client().pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(redis_key)
+                    data = await pipe.get(redis_key)
+                    if data is None:
+                        return None
+
+                    current = decode_value(data)
+                    if status_in is not None and current.get("status") not in status_in:
+                        return current
+
+                    merged = {**current, **changes}
+                    pipe.multi()
+                    pipe.set(redis_key, encode_value(merged), ex=int(ttl))
+                    await pipe.execute()
+                    return merged
+                except redis.WatchError:
+                    # Written by another process since WATCH; merge into the new value
+                    continue
+
+    async def delete(self, namespace: str, key: str) -> None:
+        full_key = f"{namespace}:{key}"
+        self.l1.delete(full_key)
+
+        if not self._redis_available():
+            return
+
+        try:
+            await self._client().delete(self._redis_key(full_key))
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    async def clear_namespace(self, namespace: str, prefix: str = "") -> int:
+        """
+        Drop a namespace (or part of it) everywhere and notify other processes
+
+        Returns:
+            Number of Redis keys removed
+        """
+        removed = 0
+        if self._redis_available():
+            try:
+                client = self._client()
+                keys = [k async for k in client.scan_iter(match=self._redis_key(f"{namespace}:{prefix}*"), count=500)]
+                if keys:
+                    removed = await client.delete(*keys)
+                await client.publish(self.channel, self._event_message("clear", f"{namespace}:{prefix}"))
+            except Exception as e:
+                self._mark_redis_down(e)
+
+        self.l1.delete_prefix(f"{namespace}:{prefix}")
+        return removed
+
+    # -------------------------------------
+    # Invalidation events
+    # -------------------------------------
+
+    def register_dependency(
+        self,
+        namespace: str,
+        events: List[str],
+        shared_prefixes: Optional[List[str]] = None
+    ) -> None:
+        """
+        Invalidate ``namespace`` for a symbol whenever one of ``events`` fires
+
+        Args:
+            namespace: Namespace whose ``<SYMBOL>:`` keys are dropped
+            events: Events that make the namespace stale
+            shared_prefixes: Key prefixes in the namespace covering several
+                symbols; dropped whichever symbol the event is for
+        """
+        for event in events:
+            namespaces = self._dependencies.setdefault(event, [])
+            if namespace not in namespaces:
+                namespaces.append(namespace)
+
+        prefixes = self._shared_prefixes.setdefault(namespace, [])
+        for prefix in shared_prefixes or []:
+            if prefix not in prefixes:
+                prefixes.append(prefix)
+
+    def add_listener(self, event: str, callback: Callable[[Optional[str]], None]) -> None:
+        """Run ``callback(symbol)`` in this process when ``event`` fires anywhere"""
+        self._listeners.setdefault(event, []).append(callback)
+
+    def _event_prefixes(self, event: str, symbol: Optional[str]) -> List[str]:
+        if not symbol:
+            return [f"{namespace}:" for namespace in self._dependencies.get(event, [])]
+
+        prefixes = []
+        for namespace in self._dependencies.get(event, []):
+            prefixes.append(f"{namespace}:{symbol.upper()}:")
+            prefixes.extend(f"{namespace}:{shared}:" for shared in self._shared_prefixes.get(namespace, []))
+        return prefixes
+
+    def _event_message(self, event: str, symbol: Optional[str]) -> str:
+        return json.dumps({"e": event, "s": symbol, "o": self.origin}, separators=(",", ":"))
+
+    def _apply_event(self, event: str, symbol: Optional[str]) -> None:
+        """Drop local state for an event (runs in every process)"""
+        if event == "clear":
+            self.l1.delete_prefix(symbol or "")
+            return
+
+        for prefix in self._event_prefixes(event, symbol):
+            self.l1.delete_prefix(prefix)
+
+        for callback in self._listeners.get(event, []):
+            try:
+                callback(symbol)
+            except Exception as e:
+                logger.warning(f"Result store listener for {event} failed: {str(e)}")
+
+    async def publish_event(self, event: str, symbol: Optional[str] = None) -> None:
+        """
+        Announce that results for ``symbol`` (all symbols if None) are stale
+
+        Deletes the dependent Redis keys once, then tells every process to
+        drop its L1 entries.
+        """
+        self._apply_event(event, symbol)
+        if not self._redis_available():
+            return
+
+        try:
+            client = self._client()
+            for prefix in self._event_prefixes(event, symbol):
+                keys = [k async for k in client.scan_iter(match=self._redis_key(f"{prefix}*"), count=500)]
+                if keys:
+                    await client.delete(*keys)
+            await client.publish(self.channel, self._event_message(event, symbol))
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    def publish_event_sync(self, event: str, symbol: Optional[str] = None) -> None:
+        """publish_event for synchronous callers (registry, Celery tasks)"""
+        self._apply_event(event, symbol)
+        if not self.redis_enabled or not redis or not self._redis_available():
+            return
+
+        try:
+            client = self._get_sync_client()
+            for prefix in self._event_prefixes(event, symbol):
+                keys = list(client.scan_iter(match=self._redis_key(f"{prefix}*"), count=500))
+                if keys:
+                    client.delete(*keys)
+            client.publish(self.channel, self._event_message(event, symbol))
+        except Exception as e:
+            self._mark_redis_down(e)
+
+    # -------------------------------------
+    # Subscriber lifecycle
+    # -------------------------------------
+
+    async def start(self) -> bool:
+        """Start the invalidation subscriber on the running loop"""
+        if not self.redis_enabled or (self._listener_task and not self._listener_task.done()):
+            return False
+
+        self._listener_task = asyncio.create_task(self._listen())
+        return True
+
+    async def stop(self) -> None:
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        await self.close_client()
+
+    async def _listen(self) -> None:
+        """Subscriber loop; reconnects after Redis outages"""
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._client().pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                logger.info(f"Result store subscribed to {self.channel}")
+
+                async for message in pubsub.listen():
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+
+                    # Our own events were applied when published
+                    if payload.get("o") == self.origin:
+                        continue
+
+                    self.stats['events_received'] += 1
+                    self._apply_event(payload.get("e"), payload.get("s"))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Result store subscriber error, retrying: {str(e)}")
+                # Events may have been missed - drop L1 rather than serve stale data
+                self.l1.clear()
+                await asyncio.sleep(self.REDIS_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'redis_enabled': self.redis_enabled,
+            'redis_available': self._redis_available(),
+            'subscriber_running': bool(self._listener_task and not self._listener_task.done()),
+            'l1_entries': len(self.l1),
+            'l1_max_entries': self.l1.max_entries,
+            'l1': dict(self.l1.stats),
+            **self.stats
+        }
+
+
+# Global store configured from settings
+result_store = SharedResultStore(
+    redis_url=settings.REDIS_URL,
+    l1_max_entries=settings.RESULT_STORE_L1_MAX_ENTRIES,
+    l1_ttl_seconds=settings.RESULT_STORE_L1_TTL_SECONDS,
+    redis_enabled=settings.RESULT_STORE_REDIS_ENABLED
+)
+
+# Job status is written by the worker running the job and read everywhere
+result_store.bypass_l1(PREDICTION_JOB_NAMESPACE)
+
+# Cached predictions and dashboard data go stale with a new model or candle
+result_store.register_dependency(PREDICTION_NAMESPACE, [MODEL_UPDATED, NEW_CANDLE])
+result_store.register_dependency(
+    DASHBOARD_NAMESPACE, [MODEL_UPDATED, NEW_CANDLE], shared_prefixes=[DASHBOARD_SUMMARY_PREFIX]
+)
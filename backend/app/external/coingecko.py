@@ -449,6 +449,32 @@ class CoinGeckoClient:
             return None
 
 
+    async def get_global_market_data(self) -> Dict[str, Any]:
+        """
+        Get market-wide totals: total market cap and dominance per coin
+        
+        Returns:
+            dict: Global market data
+            
+        Example:
+            global_data = await client.get_global_market_data()
+            # Returns: {'total_market_cap_usd': 2.4e12, 'market_cap_percentage': {'btc': 52.1, 'eth': 16.8, ...}, ...}
+        """
+        data = await self._make_request("global")
+        
+        market = data.get("data") if isinstance(data, dict) else None
+        if not isinstance(market, dict):
+            raise CoinGeckoAPIError("Invalid global market data format")
+        
+        return {
+            "total_market_cap_usd": market.get("total_market_cap", {}).get("usd"),
+            "total_volume_usd": market.get("total_volume", {}).get("usd"),
+            "market_cap_percentage": market.get("market_cap_percentage", {}),
+            "market_cap_change_percentage_24h_usd": market.get("market_cap_change_percentage_24h_usd"),
+            "active_cryptocurrencies": market.get("active_cryptocurrencies"),
+            "updated_at": market.get("updated_at")
+        }
+
     async def ping(self) -> bool:
         """
         Test API connectivity
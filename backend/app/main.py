@@ -19,30 +19,54 @@ import asyncio
 
 from app.core.config import settings
 from app.api.api_v1.api import api_router
-from app.core.database import engine, Base
+from app.core.database import engine, Base, SessionLocal
+from app.utils.query_monitor import query_scope
+from app.services.price_data_partitions import PriceDataPartitionManager
 
 # Import models to ensure they're registered with SQLAlchemy
 from app.models import Base, User, Cryptocurrency, PriceData, Prediction
 
-# NEW: Import persistent model registry
+# NEW: Import persistent model registry (lazy: the models directory is
+# scanned on first ML use, TensorFlow is imported on first inference)
 from app.ml.config.ml_config import model_registry, ml_config
 
 logger = logging.getLogger(__name__)
 
-# Create all database tables on startup
-Base.metadata.create_all(bind=engine)
-
 # Development mode check - auto-create tables without Alembic
 from pathlib import Path
 
 dev_mode_file = Path(__file__).parent.parent / ".dev_mode_no_alembic"
-if dev_mode_file.exists():
-    logger.info("🔧 Development Mode: Creating tables directly from models")
+
+
+def ensure_database_schema() -> None:
+    """
+    Create missing tables from the models (explicit startup step)
+    
+    Runs from the startup event rather than at import time, so importing
+    the app (tests, Celery workers, tooling) doesn't touch the database.
+    """
+    if not (settings.CREATE_SCHEMA_ON_STARTUP or dev_mode_file.exists()):
+        return
+    
+    if dev_mode_file.exists():
+        logger.info("🔧 Development Mode: Creating tables directly from models")
     try:
         Base.metadata.create_all(bind=engine)
-        logger.info("✅ Tables created from models (Development Mode)")
+        logger.info("✅ Database schema ensured")
     except Exception as e:
         logger.error(f"❌ Error creating tables: {str(e)}")
+        return
+    
+    # price_data is created partitioned; make sure the current months exist
+    db = SessionLocal()
+    try:
+        result = PriceDataPartitionManager(db).maintain()
+        if result.get("partitions_created"):
+            logger.info(f"✅ price_data partitions created: {result['partitions_created']}")
+    except Exception as e:
+        logger.error(f"❌ Error creating price_data partitions: {str(e)}")
+    finally:
+        db.close()
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -62,6 +86,15 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# Per-request query scope: N+1 detection and the X-DB-Statements header
+@app.middleware("http")
+async def count_db_statements(request: Request, call_next):
+    with query_scope(f"{request.method} {request.url.path}") as scope:
+        response = await call_next(request)
+    response.headers["X-DB-Statements"] = str(scope.statements)
+    return response
+
+
 # Add trusted host middleware
 app.add_middleware(
     TrustedHostMiddleware, 
@@ -145,27 +178,36 @@ async def startup_event():
     """
     logger.info("🚀 Starting CryptoPredict backend...")
     
+    await asyncio.to_thread(ensure_database_schema)
+    
     logger.info(f"Check historical data for {settings.major_cryptos_list}")
     await startup_data_check()
-
-    # Log model registry status
-    total_models = len(model_registry.models)
-    active_models = len(model_registry.active_models)
     
-    logger.info(f"📊 Model Registry Status:")
-    logger.info(f"   Total models: {total_models}")
-    logger.info(f"   Active models: {active_models}")
-    logger.info(f"   Models directory: {ml_config.models_storage_path}")
+    # Listen for cache invalidations (new models/candles) from other processes
+    from app.core.result_store import result_store
+    if await result_store.start():
+        logger.info("📡 Result store invalidation subscriber started")
     
-    if total_models > 0:
-        logger.info("📋 Available models:")
-        for crypto_symbol, model_id in model_registry.active_models.items():
-            model_info = model_registry.get_model_info(model_id)
-            if model_info:
-                model_path = model_info.get('model_path', 'Unknown')
-                logger.info(f"   {crypto_symbol}: {model_id} ({model_path})")
+    # Training jobs left active by a crashed or restarted API stop holding slots
+    try:
+        from app.ml.training.training_executor import training_executor
+        db = SessionLocal()
+        try:
+            await asyncio.to_thread(training_executor.fail_stale_jobs, db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"❌ Failed to check for stale training jobs: {str(e)}")
+
+    # Preload active models in the background so the first prediction
+    # doesn't pay cold-start cost; this is also what first loads the model
+    # registry and TensorFlow, off the startup path
+    if settings.ML_WARMUP_ON_STARTUP:
+        from app.ml.prediction.model_warmup import warm_up_models
+        warm_up_models(background=True)
+        logger.info("🔥 Model warm-up started in background")
     else:
-        logger.info("📝 No models found. Models will be available after training.")
+        logger.info(f"📊 Model registry loads on first ML use ({ml_config.models_storage_path})")
     
     logger.info("✅ Backend startup complete")
 
@@ -186,6 +228,24 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"❌ Failed to save registry on shutdown: {str(e)}")
     
+    try:
+        from app.ml.training.training_executor import training_executor
+        await asyncio.to_thread(training_executor.shutdown)
+    except Exception as e:
+        logger.error(f"❌ Failed to stop training executor: {str(e)}")
+    
+    try:
+        from app.core.result_store import result_store
+        await result_store.stop()
+    except Exception as e:
+        logger.error(f"❌ Failed to stop result store: {str(e)}")
+    
+    try:
+        from app.core.database import close_async_db
+        await close_async_db()
+    except Exception as e:
+        logger.error(f"❌ Failed to close async database pool: {str(e)}")
+    
     # Additional cleanup can be added here
     logger.info("✅ Graceful shutdown complete")
 
@@ -228,6 +288,8 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint with model registry status"""
+    from app.ml.prediction.model_warmup import get_warmup_status
+    
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
@@ -239,7 +301,8 @@ async def health_check():
                 "models_loaded": len(model_registry.models),
                 "active_models": len(model_registry.active_models),
                 "registry_type": "persistent"
-            }
+            },
+            "model_warmup": get_warmup_status()
         }
     }
 
@@ -25,22 +25,27 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "CryptoPredict Team"
 
-# Make commonly used classes available at package level
-try:
-    from .models.lstm_predictor import LSTMPredictor
-    from .preprocessing.data_processor import CryptoPriceDataProcessor
-    from .config.ml_config import ml_config, model_registry
-    from .utils.model_utils import ModelMetrics, DataValidator
+# Commonly used classes are available at package level, but imported on
+# first access (PEP 562) so importing any app.ml submodule doesn't pull in
+# TensorFlow and the rest of the stack
+_LAZY_EXPORTS = {
+    'LSTMPredictor': '.models.lstm_predictor',
+    'CryptoPriceDataProcessor': '.preprocessing.data_processor',
+    'ml_config': '.config.ml_config',
+    'model_registry': '.config.ml_config',
+    'ModelMetrics': '.utils.model_utils',
+    'DataValidator': '.utils.model_utils',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    __all__ = [
-        'LSTMPredictor',
-        'CryptoPriceDataProcessor', 
-        'ml_config',
-        'model_registry',
-        'ModelMetrics',
-        'DataValidator'
-    ]
-except ImportError as e:
-    # Handle import errors gracefully during development
-    print(f"Warning: Some ML components not available: {e}")
-    __all__ = []
\ No newline at end of file
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
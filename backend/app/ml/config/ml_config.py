@@ -31,6 +31,7 @@ class MLConfig(BaseModel):
     add_technical_indicators: bool = Field(default=True)  # Whether to add, not which ones
     add_time_features: bool = Field(default=True)         # Whether to add, not which ones  
     add_price_features: bool = Field(default=True)        # Whether to add, not which ones
+    feature_engineering_mode: str = Field(default="block")  # "block" (single float32 pass) or "pandas"
     outlier_threshold: float = Field(default=4.0)         # Threshold, not columns
     min_data_points: int = Field(default=50)              # Minimum requirement
     
@@ -45,6 +46,39 @@ class MLConfig(BaseModel):
     
     # Storage Configuration
     models_storage_path: str = Field(default="models")
+    feature_store_enabled: bool = Field(default=True)
+    feature_store_path: str = Field(default="models/feature_store")
+    
+    # Model Health Configuration (background checks, not per request)
+    model_health_check_interval: int = Field(default=300)   # Seconds between checks per model
+    model_health_max_failures: int = Field(default=2)       # Failures before quarantine
+    model_health_retry_seconds: int = Field(default=30)     # First re-check after a failure (then doubles)
+    model_quarantine_seconds: int = Field(default=900)      # How long a failing model is skipped
+    
+    # Startup Warm-up Configuration
+    warmup_top_n: int = Field(default=4)            # Active models preloaded at startup
+    warmup_max_workers: int = Field(default=4)      # Parallel model loads
+    warmup_batch_size: int = Field(default=8)       # Dummy batch size for graph tracing
+    
+    # Multi-asset Training Orchestration
+    training_orchestrator_mode: str = Field(default="chord")  # "chord" or "process_pool"
+    training_max_workers: int = Field(default=0)          # Parallel jobs (0 = cores / intra-op threads)
+    training_intra_op_threads: int = Field(default=2)     # Threads inside one op, per job
+    training_inter_op_threads: int = Field(default=1)     # Concurrent ops, per job
+    training_job_timeout: int = Field(default=3600)       # Seconds allowed per asset
+    training_window_seconds: int = Field(default=14400)   # Hard limit for a full retrain run
+    
+    # API Training Executor (/ml/training/start)
+    training_job_memory_mb: int = Field(default=2048)       # Free memory a job needs to be admitted
+    training_poll_seconds: float = Field(default=2.0)       # Cancel checks in the worker, progress stream polling
+    training_stale_job_seconds: int = Field(default=900)    # No heartbeat for this long marks a job failed
+    
+    # Incremental (warm-start) Retraining
+    incremental_retraining_enabled: bool = Field(default=True)  # Routine retrains fine-tune the active model
+    incremental_replay_days: int = Field(default=14)            # Older candles replayed with the new ones
+    incremental_min_new_records: int = Field(default=24)        # New candles needed before fine-tuning
+    incremental_epochs: int = Field(default=10)
+    incremental_learning_rate: float = Field(default=0.0002)
     
     class Config:
         extra = "allow"
@@ -408,9 +442,10 @@ def ensure_models_directory() -> str:
     return models_dir
 
 
-# Create persistent model registry instance
+# Persistent model registry, built on first use (see LazyModelRegistry)
 model_registry = create_persistent_model_registry(
-    models_dir=ml_config.models_storage_path
+    models_dir=ml_config.models_storage_path,
+    lazy=True
 )
 
 
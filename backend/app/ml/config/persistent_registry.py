@@ -5,6 +5,7 @@ import os
 import json
 import glob
 import logging
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -338,10 +339,21 @@ class PersistentModelRegistry:
             # Save to file
             self.save_registry()
             logger.info(f"🎯 Set active model for {crypto_symbol}: {model_id}")
-            
+        
         except Exception as e:
             logger.error(f"❌ Failed to set active model: {str(e)}")
             raise
+        
+        self._publish_model_updated(crypto_symbol)
+    
+    @staticmethod
+    def _publish_model_updated(crypto_symbol: str) -> None:
+        """Invalidate cached predictions and loaded models in every process"""
+        try:
+            from app.core.result_store import result_store, MODEL_UPDATED
+            result_store.publish_event_sync(MODEL_UPDATED, crypto_symbol)
+        except Exception as e:
+            logger.warning(f"Could not publish model update for {crypto_symbol}: {str(e)}")
     
     def get_active_model(self, crypto_symbol: str) -> Optional[Dict[str, Any]]:
         """Get active model info"""
@@ -392,6 +404,53 @@ class PersistentModelRegistry:
             return False
 
 
-def create_persistent_model_registry(models_dir: str = "models") -> PersistentModelRegistry:
+class LazyModelRegistry:
+    """
+    Proxy that builds the PersistentModelRegistry on first attribute access
+    
+    Importing the ML config no longer scans the models directory; processes
+    that never touch a model (most API workers, collection-only Celery
+    workers) never pay for the scan.
+    """
+    
+    def __init__(self, models_dir: str = "models"):
+        object.__setattr__(self, "_lazy_models_dir", models_dir)
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+    
+    def _lazy_load(self) -> PersistentModelRegistry:
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                instance = self._lazy_instance
+                if instance is None:
+                    instance = PersistentModelRegistry(self._lazy_models_dir)
+                    object.__setattr__(self, "_lazy_instance", instance)
+        return instance
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying registry has been built"""
+        return self._lazy_instance is not None
+    
+    def load(self) -> PersistentModelRegistry:
+        """Build the registry now (explicit startup step)"""
+        return self._lazy_load()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_load(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_load(), name, value)
+    
+    def __repr__(self) -> str:
+        if self._lazy_instance is None:
+            return f"<LazyModelRegistry(models_dir='{self._lazy_models_dir}', loaded=False)>"
+        return repr(self._lazy_instance)
+
+
+def create_persistent_model_registry(models_dir: str = "models", lazy: bool = False):
     """Factory function to create a persistent model registry instance"""
+    if lazy:
+        return LazyModelRegistry(models_dir)
     return PersistentModelRegistry(models_dir)
\ No newline at end of file
@@ -1,22 +1,16 @@
 # File: backend/app/ml/models/lstm_predictor.py
 # LSTM Neural Network for cryptocurrency price prediction - CLEAN FIXED VERSION
 
+# Annotations stay unevaluated so tf types in signatures don't import TensorFlow
+from __future__ import annotations
+
 import os
 import warnings
 
-# Suppress TensorFlow C++ messages completely
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # Only FATAL errors
-
 # Suppress all Python warnings including Keras input_shape warnings
 warnings.filterwarnings('ignore')
 
-# Configure TensorFlow logging before importing TensorFlow
 import logging
-logging.getLogger('tensorflow').setLevel(logging.FATAL)
-
-# Now import TensorFlow and suppress its logger
-import tensorflow as tf
-tf.get_logger().setLevel('FATAL')
 
 import numpy as np
 import pandas as pd
@@ -24,13 +18,8 @@ from typing import Tuple, Optional, Dict, Any, List
 from datetime import datetime, timedelta
 import pickle
 
-# TensorFlow and Keras imports
-import tensorflow as tf
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization
-from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau, ModelCheckpoint
-from tensorflow.keras.regularizers import l1_l2
+# TensorFlow is imported on first use (building, training or loading a model)
+from app.ml.utils.lazy_import import tensorflow as tf
 
 # Scikit-learn imports for preprocessing
 from sklearn.preprocessing import MinMaxScaler, RobustScaler
@@ -115,7 +104,7 @@ class LSTMPredictor:
         
         logger.info(f"Initialized LSTM Predictor: {model_name}")
     
-    def build_model(self) -> Sequential:
+    def build_model(self) -> tf.keras.Sequential:
         """
         Build LSTM neural network architecture
         
@@ -127,39 +116,39 @@ class LSTMPredictor:
         Returns:
             Compiled Sequential model
         """
-        model = Sequential(name=self.model_name)
+        model = tf.keras.models.Sequential(name=self.model_name)
         
         # First LSTM layer (returns sequences for next LSTM layers)
-        model.add(LSTM(
+        model.add(tf.keras.layers.LSTM(
             units=self.lstm_units[0],
             return_sequences=len(self.lstm_units) > 1,
             input_shape=(self.sequence_length, self.n_features),
-            kernel_regularizer=l1_l2(l1=0.01, l2=0.01),
+            kernel_regularizer=tf.keras.regularizers.l1_l2(l1=0.01, l2=0.01),
             name='lstm_1'
         ))
-        model.add(Dropout(self.dropout_rate, name='dropout_1'))
-        model.add(BatchNormalization(name='batch_norm_1'))
+        model.add(tf.keras.layers.Dropout(self.dropout_rate, name='dropout_1'))
+        model.add(tf.keras.layers.BatchNormalization(name='batch_norm_1'))
         
         # Additional LSTM layers
         for i, units in enumerate(self.lstm_units[1:], 2):
             return_sequences = i < len(self.lstm_units)  # Last layer doesn't return sequences
             
-            model.add(LSTM(
+            model.add(tf.keras.layers.LSTM(
                 units=units,
                 return_sequences=return_sequences,
-                kernel_regularizer=l1_l2(l1=0.01, l2=0.01),
+                kernel_regularizer=tf.keras.regularizers.l1_l2(l1=0.01, l2=0.01),
                 name=f'lstm_{i}'
             ))
-            model.add(Dropout(self.dropout_rate, name=f'dropout_{i}'))
-            model.add(BatchNormalization(name=f'batch_norm_{i}'))
+            model.add(tf.keras.layers.Dropout(self.dropout_rate, name=f'dropout_{i}'))
+            model.add(tf.keras.layers.BatchNormalization(name=f'batch_norm_{i}'))
         
         # Dense layers for final prediction
-        model.add(Dense(25, activation='relu', name='dense_1'))
-        model.add(Dropout(self.dropout_rate / 2, name='dropout_final'))
-        model.add(Dense(1, activation='linear', name='output'))  # Linear activation for price prediction
+        model.add(tf.keras.layers.Dense(25, activation='relu', name='dense_1'))
+        model.add(tf.keras.layers.Dropout(self.dropout_rate / 2, name='dropout_final'))
+        model.add(tf.keras.layers.Dense(1, activation='linear', name='output'))  # Linear activation for price prediction
         
         # Compile model
-        optimizer = Adam(learning_rate=self.learning_rate)
+        optimizer = tf.keras.optimizers.Adam(learning_rate=self.learning_rate)
         model.compile(
             optimizer=optimizer,
             loss='huber',  # Huber loss is more robust to outliers than MSE
@@ -173,7 +162,8 @@ class LSTMPredictor:
         self, 
         data: pd.DataFrame, 
         target_column: str = 'close_price',
-        feature_columns: Optional[List[str]] = None
+        feature_columns: Optional[List[str]] = None,
+        dtype: Optional[Any] = None
     ) -> Tuple[np.ndarray, np.ndarray, Any, Any]:
         """
         Prepare data for LSTM training - FIXED VERSION
@@ -182,10 +172,46 @@ class LSTMPredictor:
             data: DataFrame with price and indicator data
             target_column: Column name for prediction target
             feature_columns: List of feature column names
+            dtype: Optional dtype for the sequences (e.g. np.float32)
             
         Returns:
             Tuple of (X, y, target_scaler, feature_scaler)
         """
+        features_scaled, target_scaled = self.prepare_features(
+            data, target_column=target_column, feature_columns=feature_columns
+        )
+        
+        # Create sequences for LSTM
+        X, y = self._create_sequences(features_scaled, target_scaled, dtype=dtype)
+        
+        logger.info(f"✅ Data prepared successfully: X shape {X.shape}, y shape {y.shape}")
+        logger.info(f"✅ Scalers fitted: feature_scaler={self.feature_scaler is not None}, target_scaler={self.scaler is not None}")
+        
+        return X, y, self.scaler, self.feature_scaler
+    
+    def prepare_features(
+        self, 
+        data: pd.DataFrame, 
+        target_column: str = 'close_price',
+        feature_columns: Optional[List[str]] = None,
+        fit_scalers: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Select, clean and scale feature and target columns (no windowing)
+        
+        Fits the feature and target scalers as a side effect, unless
+        ``fit_scalers`` is False and scalers are already loaded - then the
+        data is transformed with the existing scalers (warm-start training).
+        
+        Args:
+            data: DataFrame with price and indicator data
+            target_column: Column name for prediction target
+            feature_columns: List of feature column names
+            fit_scalers: Refit scalers on this data (False keeps loaded scalers)
+            
+        Returns:
+            Tuple of (features_scaled [n, n_features], target_scaled [n])
+        """
         if feature_columns is None:
             # Select columns that definitely exist
             available_features = []
@@ -242,54 +268,111 @@ class LSTMPredictor:
         
         logger.info(f"Data shape before scaling: features {features.shape}, target {target.shape}")
         
-        # FIXED: Initialize and fit scalers properly
-        if self.feature_scaler is None:
-            self.feature_scaler = RobustScaler()  # More robust to outliers
-        
-        if self.scaler is None:
-            self.scaler = MinMaxScaler(feature_range=(0, 1))
-        
-        # Fit and transform features
-        features_scaled = self.feature_scaler.fit_transform(features)
-        
-        # Fit and transform target
-        target_scaled = self.scaler.fit_transform(target)
+        if not fit_scalers and self.feature_scaler is not None and self.scaler is not None:
+            # Keep the scale the loaded model was trained on
+            features_scaled = self.feature_scaler.transform(features)
+            target_scaled = self.scaler.transform(target)
+        else:
+            # FIXED: Initialize and fit scalers properly
+            if self.feature_scaler is None:
+                self.feature_scaler = RobustScaler()  # More robust to outliers
+            
+            if self.scaler is None:
+                self.scaler = MinMaxScaler(feature_range=(0, 1))
+            
+            # Fit and transform features
+            features_scaled = self.feature_scaler.fit_transform(features)
+            
+            # Fit and transform target
+            target_scaled = self.scaler.fit_transform(target)
         
         # Update n_features based on actual features used
         self.n_features = features_scaled.shape[1]
+        self.config['feature_columns'] = list(feature_columns)
         
-        # Create sequences for LSTM
-        X, y = self._create_sequences(features_scaled, target_scaled.flatten())
-        
-        logger.info(f"✅ Data prepared successfully: X shape {X.shape}, y shape {y.shape}")
-        logger.info(f"✅ Scalers fitted: feature_scaler={self.feature_scaler is not None}, target_scaler={self.scaler is not None}")
-        
-        return X, y, self.scaler, self.feature_scaler
+        return features_scaled, target_scaled.flatten()
     
     def _create_sequences(
         self, 
         features: np.ndarray, 
-        target: np.ndarray
+        target: np.ndarray,
+        dtype: Optional[Any] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Create sequences for LSTM input
         
+        X is a read-only strided view over ``features`` - no window is
+        copied, so memory stays at the size of the feature matrix no matter
+        how many overlapping sequences there are.
+        
         Args:
             features: Scaled feature array
             target: Scaled target array
+            dtype: Optional dtype to cast to before windowing (e.g. np.float32)
             
         Returns:
             Tuple of (X_sequences, y_sequences)
         """
-        X, y = [], []
+        if dtype is not None:
+            # Cast the base arrays once; windows then view the cast copy
+            features = np.asarray(features, dtype=dtype)
+            target = np.asarray(target, dtype=dtype)
+        
+        if len(features) <= self.sequence_length:
+            return (
+                np.empty((0, self.sequence_length, features.shape[1]), dtype=features.dtype),
+                np.empty((0,), dtype=target.dtype)
+            )
         
-        for i in range(self.sequence_length, len(features)):
-            # Features for past sequence_length time steps
-            X.append(features[i - self.sequence_length:i])
-            # Target for current time step
-            y.append(target[i])
+        # Windows over features[:-1] end just before each target step:
+        # X[j] = features[j:j + sequence_length], y[j] = target[j + sequence_length]
+        windows = np.lib.stride_tricks.sliding_window_view(
+            features[:-1], self.sequence_length, axis=0
+        )
+        X = windows.transpose(0, 2, 1)  # (samples, sequence_length, n_features)
+        y = target[self.sequence_length:]
         
-        return np.array(X), np.array(y)
+        return X, y
+    
+    def create_sequence_dataset(
+        self,
+        features: np.ndarray,
+        target: np.ndarray,
+        batch_size: Optional[int] = None,
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+        dtype: Any = np.float32
+    ) -> tf.data.Dataset:
+        """
+        Create a lazily windowed tf.data pipeline for training
+        
+        Batches of sequences are materialized on the fly during ``fit``, so
+        training memory is bounded by the batch size instead of growing with
+        the history length. Sample order matches ``_create_sequences``.
+        
+        Args:
+            features: Scaled feature array
+            target: Scaled target array
+            batch_size: Batch size (defaults to the predictor's batch size)
+            shuffle: Shuffle windows (use for the training split only)
+            seed: Shuffle seed
+            dtype: dtype of the yielded batches
+            
+        Returns:
+            Dataset yielding (X_batch, y_batch)
+        """
+        features = np.asarray(features, dtype=dtype)
+        target = np.asarray(target, dtype=dtype).reshape(-1)
+        
+        dataset = tf.keras.utils.timeseries_dataset_from_array(
+            data=features[:-1],
+            targets=target[self.sequence_length:],
+            sequence_length=self.sequence_length,
+            batch_size=batch_size or self.batch_size,
+            shuffle=shuffle,
+            seed=seed
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
     
     def train(
         self,
@@ -298,19 +381,26 @@ class LSTMPredictor:
         X_val: Optional[np.ndarray] = None,
         y_val: Optional[np.ndarray] = None,
         save_model: bool = True,
-        model_path: str = None
+        model_path: str = None,
+        extra_callbacks: Optional[List] = None
     ) -> Dict[str, Any]:
         """
         Train LSTM model
         
+        ``X_train`` may also be a tf.data.Dataset yielding (X, y) batches
+        (see ``create_sequence_dataset``); ``y_train`` is then ignored and
+        ``X_val`` may be a validation dataset.
+        
         Args:
-            X_train: Training features
+            X_train: Training features or training dataset
             y_train: Training targets
-            X_val: Validation features (optional)
+            X_val: Validation features or validation dataset (optional)
             y_val: Validation targets (optional)
             save_model: Whether to save the trained model
             model_path: Path to save model (optional)
-            
+            extra_callbacks: Keras callbacks run after the built-in ones
+                (progress reporting, cancellation)
+        
         Returns:
             Dictionary with training metrics and history
         """
@@ -320,6 +410,9 @@ class LSTMPredictor:
         if self.model is None:
             self.model = self.build_model()
         
+        if isinstance(X_train, tf.data.Dataset):
+            return self._train_on_dataset(X_train, X_val, save_model, model_path, extra_callbacks)
+        
         # Prepare validation data
         if X_val is None or y_val is None:
             validation_data = None
@@ -327,7 +420,7 @@ class LSTMPredictor:
             validation_data = (X_val, y_val)
         
         # Setup callbacks
-        callbacks = self._setup_callbacks(model_path)
+        callbacks = self._setup_callbacks(model_path) + list(extra_callbacks or [])
         
         # Record training start time
         training_start = datetime.utcnow()
@@ -374,12 +467,60 @@ class LSTMPredictor:
             logger.error(f"Training failed: {str(e)}")
             raise
     
+    def _train_on_dataset(
+        self,
+        train_dataset: tf.data.Dataset,
+        val_dataset: Optional[tf.data.Dataset] = None,
+        save_model: bool = True,
+        model_path: str = None,
+        extra_callbacks: Optional[List] = None
+    ) -> Dict[str, Any]:
+        """Train from tf.data pipelines (batching and shuffling done by the dataset)"""
+        callbacks = self._setup_callbacks(model_path) + list(extra_callbacks or [])
+        training_start = datetime.utcnow()
+        
+        try:
+            self.training_history = self.model.fit(
+                train_dataset,
+                epochs=self.epochs,
+                validation_data=val_dataset,
+                callbacks=callbacks,
+                verbose=1
+            )
+            
+            training_end = datetime.utcnow()
+            training_duration = (training_end - training_start).total_seconds()
+            history = self.training_history.history
+            
+            self.training_metrics = {
+                'training_duration_seconds': training_duration,
+                'final_loss': float(history['loss'][-1]),
+                'final_val_loss': float(history.get('val_loss', [0])[-1]),
+                'final_mae': float(history['mae'][-1]),
+                'final_val_mae': float(history.get('val_mae', [0])[-1]),
+                'epochs_trained': len(history['loss']),
+                'best_epoch': np.argmin(history.get('val_loss', history['loss'])) + 1,
+                'training_completed_at': training_end.isoformat()
+            }
+            
+            self.is_trained = True
+            
+            if save_model:
+                self.save_model(model_path)
+            
+            logger.info(f"Training completed in {training_duration:.2f} seconds")
+            return self.training_metrics
+            
+        except Exception as e:
+            logger.error(f"Training failed: {str(e)}")
+            raise
+    
     def _setup_callbacks(self, model_path: str = None) -> List:
         """Setup training callbacks"""
         callbacks = []
         
         # Early stopping
-        early_stopping = EarlyStopping(
+        early_stopping = tf.keras.callbacks.EarlyStopping(
             monitor='val_loss',
             patience=15,
             restore_best_weights=True,
@@ -388,7 +529,7 @@ class LSTMPredictor:
         callbacks.append(early_stopping)
         
         # Learning rate reduction
-        lr_scheduler = ReduceLROnPlateau(
+        lr_scheduler = tf.keras.callbacks.ReduceLROnPlateau(
             monitor='val_loss',
             factor=0.5,
             patience=10,
@@ -400,7 +541,7 @@ class LSTMPredictor:
         # Model checkpointing
         if model_path:
             checkpoint_path = model_path.replace('.h5', '_checkpoint.h5')
-            checkpoint = ModelCheckpoint(
+            checkpoint = tf.keras.callbacks.ModelCheckpoint(
                 checkpoint_path,
                 monitor='val_loss',
                 save_best_only=True,
@@ -581,7 +722,7 @@ class LSTMPredictor:
             raise FileNotFoundError(f"Model file not found: {filepath}")
         
         # Load Keras model
-        self.model = load_model(filepath)
+        self.model = tf.keras.models.load_model(filepath)
         
         # Load scalers
         scaler_path = filepath.replace('.h5', '_scalers.pkl')
@@ -600,6 +741,71 @@ class LSTMPredictor:
         self.is_trained = True
         logger.info(f"Model loaded from {filepath}")
     
+    def prepare_fine_tuning(self, learning_rate: float, epochs: Optional[int] = None) -> None:
+        """
+        Recompile a loaded model for warm-start training
+        
+        Keeps the trained weights and scalers and resets the optimizer with
+        a (smaller) learning rate. Shape and batch settings are restored from
+        the loaded model so new data is windowed the same way.
+        
+        Args:
+            learning_rate: Learning rate for fine-tuning
+            epochs: Maximum fine-tuning epochs (keeps current if None)
+        """
+        if self.model is None:
+            raise ValueError("Load a model before fine-tuning")
+        
+        _, self.sequence_length, self.n_features = self.model.input_shape
+        self.batch_size = self.config.get('batch_size', self.batch_size)
+        self.learning_rate = learning_rate
+        if epochs is not None:
+            self.epochs = epochs
+        
+        self.model.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=learning_rate),
+            loss='huber',
+            metrics=['mae', 'mse']
+        )
+        
+        self.config.update({
+            'sequence_length': self.sequence_length,
+            'n_features': self.n_features,
+            'learning_rate': learning_rate,
+            'epochs': self.epochs,
+            'fine_tuned_at': datetime.utcnow().isoformat()
+        })
+        logger.info(f"Prepared {self.model_name} for fine-tuning (lr={learning_rate}, epochs={self.epochs})")
+    
+    def warm_up(self, batch_size: int = 1) -> float:
+        """
+        Build the predict function and run a dummy batch through the model
+        
+        The first predict call on a freshly loaded model traces the graph,
+        which is far slower than steady-state inference. Running it once at
+        startup keeps that cost off the first real request.
+        
+        Args:
+            batch_size: Size of the warm-up batch
+            
+        Returns:
+            Warm-up duration in seconds
+        """
+        if self.model is None:
+            raise ValueError("Model must be built or loaded before warm-up")
+        
+        start = datetime.utcnow()
+        
+        # Use the loaded network's input shape - the config defaults on
+        # this instance may not match a model loaded from disk
+        _, sequence_length, n_features = self.model.input_shape
+        dummy_input = np.zeros((batch_size, sequence_length, n_features), dtype=np.float32)
+        
+        self.model.make_predict_function()
+        self.model.predict(dummy_input, batch_size=batch_size, verbose=0)
+        
+        return (datetime.utcnow() - start).total_seconds()
+    
     def get_model_summary(self) -> str:
         """Get model architecture summary"""
         if self.model is None:
@@ -15,6 +15,7 @@ import pickle
 from app.ml.models.lstm_predictor import LSTMPredictor
 from app.ml.config.ml_config import ml_config, model_registry
 from app.ml.utils.model_utils import ModelPersistence
+from app.core.result_store import result_store, MODEL_UPDATED
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ class ModelLoader:
     - Efficient model loading with caching
     - Hot-swapping of models
     - Memory management and optimization
-    - Model health checking
+    - Background model health checking with quarantine
     - Automatic cleanup of old models
     - Thread-safe operations
     """
@@ -45,6 +46,7 @@ class ModelLoader:
         
         # Thread safety
         self._lock = threading.RLock()
+        self._key_locks = {}  # cache_key -> lock serializing disk loads of one model
         
         # Model persistence utility
         self.model_persistence = ModelPersistence()
@@ -54,10 +56,23 @@ class ModelLoader:
             'total_loads': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'quarantine_skips': 0,
             'load_times': [],
             'memory_usage_mb': 0
         }
         
+        # Quarantined models: cache_key -> {'until': ts, 'reason': str}
+        self.quarantined_models = {}
+        
+        # Background health checks (started lazily on first cached model)
+        self.health_scheduler = ModelHealthScheduler(
+            self,
+            check_interval=ml_config.model_health_check_interval,
+            max_failures=ml_config.model_health_max_failures,
+            retry_seconds=ml_config.model_health_retry_seconds,
+            quarantine_seconds=ml_config.model_quarantine_seconds
+        )
+        
         logger.info("ModelLoader initialized successfully")
     
     def load_model(
@@ -79,8 +94,8 @@ class ModelLoader:
         """
         start_time = time.time()
         
-        with self._lock:
-            try:
+        try:
+            with self._lock:
                 # Determine which model to load
                 if model_id is None:
                     # Get active model from registry
@@ -105,39 +120,73 @@ class ModelLoader:
                 # Check cache first (unless force reload)
                 cache_key = f"{crypto_symbol}:{model_id}"
                 
-                if not force_reload and cache_key in self.models_cache:
-                    # Check if cache is still valid
-                    cache_time = self.cache_timestamps.get(cache_key, 0)
-                    if time.time() - cache_time < self.cache_ttl:
-                        # Verify model is still healthy
-                        model = self.models_cache[cache_key]
-                        if self._verify_model_health(model):
-                            self.load_stats['cache_hits'] += 1
-                            logger.debug(f"Model cache hit for {crypto_symbol}:{model_id}")
-                            return model
-                        else:
-                            # Remove unhealthy model from cache
-                            self._remove_from_cache(cache_key)
+                cached_model = self._get_cached(cache_key, force_reload)
+                if cached_model is not None:
+                    return cached_model
+                
+                if not force_reload and cache_key in self.quarantined_models:
+                    return None
+                
+                key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+            
+            # Disk loads run under a per-model lock only, so different models
+            # can be loaded in parallel (e.g. during startup warm-up)
+            with key_lock:
+                # Another thread may have loaded the model while we waited
+                with self._lock:
+                    cached_model = self._get_cached(cache_key, force_reload)
+                    if cached_model is not None:
+                        return cached_model
+                    self.load_stats['cache_misses'] += 1
                 
                 # Load model from disk
-                self.load_stats['cache_misses'] += 1
                 model = self._load_model_from_disk(model_path, crypto_symbol)
                 
                 if model:
-                    # Add to cache
-                    self._add_to_cache(cache_key, model, model_path)
-                    load_time = time.time() - start_time
-                    self.load_stats['load_times'].append(load_time)
-                    self.load_stats['total_loads'] += 1
+                    with self._lock:
+                        # A successful (forced) reload lifts any quarantine
+                        self.quarantined_models.pop(cache_key, None)
+                        
+                        # Add to cache
+                        self._add_to_cache(cache_key, model, model_path)
+                        load_time = time.time() - start_time
+                        self.load_stats['load_times'].append(load_time)
+                        self.load_stats['total_loads'] += 1
                     
                     logger.info(f"Model loaded for {crypto_symbol}:{model_id} "
                                f"in {load_time:.3f}s")
                 
                 return model
                 
-            except Exception as e:
-                logger.error(f"Failed to load model for {crypto_symbol}: {str(e)}")
-                return None
+        except Exception as e:
+            logger.error(f"Failed to load model for {crypto_symbol}: {str(e)}")
+            return None
+    
+    def _get_cached(self, cache_key: str, force_reload: bool) -> Optional[LSTMPredictor]:
+        """Return a valid cached model, or None (caller holds the lock)"""
+        
+        if force_reload:
+            return None
+        
+        # Quarantined models are skipped until the quarantine expires
+        if self._is_quarantined(cache_key):
+            self.load_stats['quarantine_skips'] += 1
+            logger.debug(f"Model {cache_key} is quarantined, skipping load")
+            return None
+        
+        if cache_key not in self.models_cache:
+            return None
+        
+        # Check if cache is still valid - health is verified in the
+        # background by the health scheduler, not on the request path
+        cache_time = self.cache_timestamps.get(cache_key, 0)
+        if time.time() - cache_time >= self.cache_ttl:
+            return None
+        
+        self.load_stats['cache_hits'] += 1
+        self.model_metadata[cache_key]['access_count'] += 1
+        logger.debug(f"Model cache hit for {cache_key}")
+        return self.models_cache[cache_key]
     
     def _load_model_from_disk(
         self, 
@@ -166,8 +215,9 @@ class ModelLoader:
             # Load the model
             model.load_model(model_path)
             
-            # Verify model is functional
-            if not self._verify_model_functionality(model):
+            # Cheap structural check only - the forward-pass check runs in
+            # the background health scheduler right after caching
+            if not self._verify_model_structure(model):
                 logger.error(f"Model verification failed for {model_path}")
                 return None
             
@@ -198,17 +248,26 @@ class ModelLoader:
         self.models_cache[cache_key] = model
         self.cache_timestamps[cache_key] = time.time()
         
-        # Store metadata
+        # Store metadata (health is unknown until the first background check)
         self.model_metadata[cache_key] = {
             'model_path': model_path,
             'loaded_at': datetime.utcnow(),
             'access_count': 0,
-            'last_health_check': time.time()
+            'is_healthy': True,
+            'health_status': 'pending',
+            'consecutive_failures': 0,
+            'last_health_check': None,
+            'next_health_check': None,
+            'last_error': None
         }
         
         # Update memory usage
         self._update_memory_usage()
         
+        # Queue an immediate functional check for the freshly loaded model
+        self.health_scheduler.request_check(cache_key)
+        self.health_scheduler.start()
+        
         logger.debug(f"Model cached: {cache_key}")
     
     def _remove_from_cache(self, cache_key: str) -> None:
@@ -264,46 +323,85 @@ class ModelLoader:
         if models_to_remove:
             logger.info(f"Cleaned up {len(models_to_remove)} cached models")
     
-    def _verify_model_health(self, model: LSTMPredictor) -> bool:
-        """Verify that cached model is still healthy"""
+    def _verify_model_structure(self, model: LSTMPredictor) -> bool:
+        """Verify model attributes without running a prediction"""
         
-        try:
-            # Basic checks
-            if not model or not model.is_trained:
-                return False
-            
-            if not hasattr(model, 'model') or model.model is None:
-                return False
-            
-            # Try a simple prediction with dummy data
-            if hasattr(model, 'sequence_length') and hasattr(model, 'n_features'):
-                import numpy as np
-                dummy_input = np.random.random((1, model.sequence_length, model.n_features))
-                _ = model.model.predict(dummy_input, verbose=0)
-                return True
-            
-            return True
-            
-        except Exception as e:
-            logger.warning(f"Model health check failed: {str(e)}")
+        if not model or not model.is_trained:
+            logger.warning("Model is not marked as trained")
+            return False
+        
+        if not hasattr(model, 'model') or model.model is None:
+            logger.warning("Model does not have Keras model")
+            return False
+        
+        if not hasattr(model, 'scaler') or model.scaler is None:
+            logger.warning("Model missing target scaler")
+            return False
+        
+        return True
+    
+    def _is_quarantined(self, cache_key: str) -> bool:
+        """Check quarantine state, releasing expired entries"""
+        
+        entry = self.quarantined_models.get(cache_key)
+        if entry is None:
+            return False
+        
+        if time.time() >= entry['until']:
+            del self.quarantined_models[cache_key]
+            logger.info(f"Quarantine expired for model {cache_key}")
             return False
+        
+        return True
+    
+    def _quarantine_model(self, cache_key: str, reason: str, duration: int) -> None:
+        """Evict a failing model and skip it until the quarantine expires"""
+        
+        with self._lock:
+            self.quarantined_models[cache_key] = {
+                'since': time.time(),
+                'until': time.time() + duration,
+                'reason': reason
+            }
+            self._remove_from_cache(cache_key)
+        
+        logger.warning(f"Model {cache_key} quarantined for {duration}s: {reason}")
+    
+    def report_model_error(
+        self,
+        crypto_symbol: str,
+        model_id: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Report a prediction failure so the model is re-checked in the background
+        
+        Args:
+            crypto_symbol: Symbol of cryptocurrency
+            model_id: Model ID that failed (active model if omitted)
+            error: Error description
+        """
+        if model_id is None:
+            active_model = model_registry.get_active_model(crypto_symbol)
+            if not active_model:
+                return
+            model_id = active_model.get('model_id')
+        
+        cache_key = f"{crypto_symbol}:{model_id}"
+        
+        with self._lock:
+            metadata = self.model_metadata.get(cache_key)
+            if metadata is None:
+                return
+            metadata['last_error'] = error
+        
+        self.health_scheduler.request_check(cache_key)
     
     def _verify_model_functionality(self, model: LSTMPredictor) -> bool:
         """Verify that loaded model is functional"""
         
         try:
-            # Check basic attributes
-            if not model.is_trained:
-                logger.warning("Model is not marked as trained")
-                return False
-            
-            if not hasattr(model, 'model') or model.model is None:
-                logger.warning("Model does not have Keras model")
-                return False
-            
-            # Check scalers
-            if not hasattr(model, 'scaler') or model.scaler is None:
-                logger.warning("Model missing target scaler")
+            if not self._verify_model_structure(model):
                 return False
             
             # Try prediction with dummy data
@@ -358,7 +456,9 @@ class ModelLoader:
                     'loaded_at': metadata.get('loaded_at'),
                     'model_path': metadata.get('model_path'),
                     'access_count': metadata.get('access_count', 0),
-                    'is_healthy': self._verify_model_health(model),
+                    'is_healthy': metadata.get('is_healthy', True),
+                    'health_status': metadata.get('health_status'),
+                    'last_health_check': metadata.get('last_health_check'),
                     'cache_age_seconds': time.time() - self.cache_timestamps.get(cache_key, 0)
                 })
             
@@ -377,6 +477,21 @@ class ModelLoader:
             model = self.load_model(crypto_symbol, model_id, force_reload=True)
             return model is not None
     
+    def evict_symbol(self, crypto_symbol: Optional[str] = None) -> int:
+        """Drop cached models for a symbol (all symbols if None)"""
+        
+        with self._lock:
+            prefix = f"{crypto_symbol}:" if crypto_symbol else ""
+            cache_keys = [key for key in self.models_cache if key.startswith(prefix)]
+            for cache_key in cache_keys:
+                self._remove_from_cache(cache_key)
+            
+            if cache_keys:
+                self._update_memory_usage()
+                logger.info(f"Evicted {len(cache_keys)} cached models for {crypto_symbol or 'all symbols'}")
+            
+            return len(cache_keys)
+    
     def clear_cache(self) -> Dict[str, Any]:
         """Clear all cached models"""
         
@@ -386,6 +501,7 @@ class ModelLoader:
             self.models_cache.clear()
             self.cache_timestamps.clear()
             self.model_metadata.clear()
+            self.quarantined_models.clear()
             
             self._update_memory_usage()
             
@@ -416,6 +532,8 @@ class ModelLoader:
             'cache_misses': self.load_stats['cache_misses'],
             'average_load_time_seconds': round(average_load_time, 3),
             'cached_models_count': len(self.models_cache),
+            'quarantined_models_count': len(self.quarantined_models),
+            'quarantine_skips': self.load_stats['quarantine_skips'],
             'memory_usage_mb': round(self.load_stats['memory_usage_mb'], 2),
             'cache_ttl_seconds': self.cache_ttl,
             'max_cached_models': self.max_cached_models,
@@ -423,41 +541,203 @@ class ModelLoader:
         }
     
     def health_check(self) -> Dict[str, Any]:
-        """Perform health check on all cached models"""
+        """Run the background health checks for all cached models now"""
         
         with self._lock:
-            healthy_count = 0
-            unhealthy_models = []
+            total_cached = len(self.models_cache)
+        
+        results = self.health_scheduler.run_checks(force=True)
+        healthy_count = sum(1 for healthy in results.values() if healthy)
+        
+        return {
+            'total_cached': total_cached,
+            'healthy_models': healthy_count,
+            'unhealthy_models': len(results) - healthy_count,
+            'quarantined_models': {
+                cache_key: {
+                    'reason': entry['reason'],
+                    'remaining_seconds': round(max(entry['until'] - time.time(), 0), 1)
+                }
+                for cache_key, entry in list(self.quarantined_models.items())
+            },
+            'cache_health_percentage': round(
+                healthy_count / max(len(results), 1) * 100, 2
+            ),
+            'memory_usage_mb': round(self.load_stats['memory_usage_mb'], 2),
+            'scheduler_running': self.health_scheduler.is_running,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+
+class ModelHealthScheduler:
+    """
+    Background health checker for cached models
+    
+    Runs the forward-pass functionality check per model on an interval,
+    or as soon as a check is requested (new load, reported error), so the
+    request path never pays for it. Models failing repeatedly are
+    marked unhealthy in the loader metadata and quarantined.
+    
+    After a failure the model is re-checked with exponential backoff
+    (retry_seconds, doubling, capped at check_interval); requested checks
+    wait for the backoff too, so a brief blip can't exhaust max_failures
+    within seconds.
+    """
+    
+    def __init__(
+        self,
+        loader: 'ModelLoader',
+        check_interval: int = 300,
+        max_failures: int = 2,
+        quarantine_seconds: int = 900,
+        retry_seconds: int = 30
+    ):
+        self.loader = loader
+        self.check_interval = check_interval
+        self.max_failures = max_failures
+        self.retry_seconds = retry_seconds
+        self.quarantine_seconds = quarantine_seconds
+        
+        self._pending = set()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+    
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the scheduler thread if it is not running"""
+        with self._thread_lock:
+            if self.is_running:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="model-health-scheduler", daemon=True
+            )
+            self._thread.start()
+            logger.info("Model health scheduler started")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler thread"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+    
+    def request_check(self, cache_key: str) -> None:
+        """Schedule a check for a model as soon as possible"""
+        self._pending.add(cache_key)
+        self._wakeup.set()
+    
+    def _run(self) -> None:
+        # Tick often enough to honour the interval without busy waiting
+        tick = max(min(self.check_interval / 4, 30), 1)
+        
+        while not self._stop.is_set():
+            self._wakeup.wait(timeout=tick)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.run_checks()
+            except Exception as e:
+                logger.error(f"Model health scheduler error: {str(e)}")
+    
+    def _due_models(self, force: bool) -> List[Tuple[str, LSTMPredictor]]:
+        """Snapshot the models whose check is due"""
+        now = time.time()
+        due = []
+        
+        with self.loader._lock:
+            for cache_key, model in self.loader.models_cache.items():
+                metadata = self.loader.model_metadata.get(cache_key, {})
+                last_check = metadata.get('last_health_check')
+                next_check = metadata.get('next_health_check')
+                # Backing off after a failure; a pending request stays queued
+                if not force and next_check is not None and now < next_check:
+                    continue
+                if (force or cache_key in self._pending or last_check is None or
+                        now - last_check >= self.check_interval):
+                    due.append((cache_key, model))
+        
+        for cache_key, _ in due:
+            self._pending.discard(cache_key)
+        
+        return due
+    
+    def run_checks(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Check every model that is due
+        
+        Args:
+            force: Check all cached models regardless of schedule
             
-            for cache_key, model in self.models_cache.items():
-                if self._verify_model_health(model):
-                    healthy_count += 1
-                    # Update last health check time
-                    if cache_key in self.model_metadata:
-                        self.model_metadata[cache_key]['last_health_check'] = time.time()
-                else:
-                    unhealthy_models.append(cache_key)
+        Returns:
+            Mapping of cache key to health result
+        """
+        results = {}
+        
+        for cache_key, model in self._due_models(force):
+            # The forward pass runs outside the loader lock so cache hits
+            # are never blocked by a health check
+            healthy = self.loader._verify_model_functionality(model)
+            results[cache_key] = healthy
+            self._record_result(cache_key, model, healthy)
+        
+        return results
+    
+    def _record_result(self, cache_key: str, model: LSTMPredictor, healthy: bool) -> None:
+        with self.loader._lock:
+            # Skip models that were evicted or replaced during the check
+            if self.loader.models_cache.get(cache_key) is not model:
+                return
             
-            # Remove unhealthy models
-            for cache_key in unhealthy_models:
-                self._remove_from_cache(cache_key)
-                logger.warning(f"Removed unhealthy model from cache: {cache_key}")
+            metadata = self.loader.model_metadata[cache_key]
+            now = time.time()
+            metadata['last_health_check'] = now
             
-            return {
-                'total_cached': len(self.models_cache) + len(unhealthy_models),
-                'healthy_models': healthy_count,
-                'unhealthy_removed': len(unhealthy_models),
-                'cache_health_percentage': round(
-                    healthy_count / max(len(self.models_cache) + len(unhealthy_models), 1) * 100, 2
-                ),
-                'memory_usage_mb': round(self.load_stats['memory_usage_mb'], 2),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            if healthy:
+                metadata['is_healthy'] = True
+                metadata['health_status'] = 'healthy'
+                metadata['consecutive_failures'] = 0
+                metadata['next_health_check'] = None
+                metadata['last_error'] = None
+                return
+            
+            metadata['is_healthy'] = False
+            metadata['health_status'] = 'unhealthy'
+            metadata['consecutive_failures'] += 1
+            failures = metadata['consecutive_failures']
+            
+            if failures < self.max_failures:
+                # Re-check before the full interval, backing off on each failure
+                metadata['next_health_check'] = now + self._retry_delay(failures)
+        
+        if failures >= self.max_failures:
+            self.loader._quarantine_model(
+                cache_key,
+                reason=f"failed {failures} consecutive health checks",
+                duration=self.quarantine_seconds
+            )
+        else:
+            self.request_check(cache_key)
+    
+    def _retry_delay(self, failures: int) -> float:
+        """Seconds before re-checking a model that failed ``failures`` checks in a row"""
+        return min(self.retry_seconds * 2 ** (failures - 1), self.check_interval)
 
 
 # Global model loader instance
 model_loader = ModelLoader()
 
+# Models can't be shared across processes; every process drops its copy
+# when a new model is activated anywhere
+result_store.add_listener(MODEL_UPDATED, model_loader.evict_symbol)
+
 
 # Helper functions for easy access
 def load_crypto_model(
@@ -491,4 +771,13 @@ def clear_model_cache() -> Dict[str, Any]:
 
 def check_model_health() -> Dict[str, Any]:
     """Perform health check on cached models"""
-    return model_loader.health_check()
\ No newline at end of file
+    return model_loader.health_check()
+
+
+def report_model_error(
+    crypto_symbol: str,
+    model_id: Optional[str] = None,
+    error: Optional[str] = None
+) -> None:
+    """Report a failed prediction so the model is re-checked in the background"""
+    model_loader.report_model_error(crypto_symbol, model_id, error)
\ No newline at end of file
@@ -0,0 +1,209 @@
+# File: backend/app/ml/prediction/model_warmup.py
+# Startup warm-up of active models for API and worker processes
+
+import logging
+import time
+import threading
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.ml.config.ml_config import ml_config, model_registry
+from app.ml.prediction.model_loader import model_loader
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelWarmupManager:
+    """
+    Preloads the active models from the persistent registry at startup
+
+    Features:
+    - Top-N selection of active models (configured major cryptos first)
+    - Parallel model loading through the shared ModelLoader cache
+    - Predict-function tracing with a dummy warm-up batch
+    - Readiness state for the health endpoints
+    """
+
+    # Warm-up states
+    NOT_STARTED = "not_started"
+    WARMING = "warming"
+    READY = "ready"
+    DEGRADED = "degraded"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        top_n: int = 4,
+        max_workers: int = 4,
+        batch_size: int = 8
+    ):
+        self.top_n = top_n
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+        self.state = self.NOT_STARTED
+        self.started_at = None
+        self.completed_at = None
+        self.duration_seconds = None
+        self.models = {}
+
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Ready once warm-up finished, even if some models failed"""
+        return self.state in (self.READY, self.DEGRADED)
+
+    def select_models(self, top_n: Optional[int] = None) -> List[str]:
+        """
+        Pick the crypto symbols to warm up
+
+        Configured major cryptos come first (in settings order), then any
+        other symbol that has an active model.
+        """
+        top_n = self.top_n if top_n is None else top_n
+        active_symbols = list(model_registry.active_models.keys())
+
+        priority = [s for s in settings.major_cryptos_list if s in active_symbols]
+        others = sorted(s for s in active_symbols if s not in priority)
+
+        return (priority + others)[:max(top_n, 0)]
+
+    def warm_up(self, top_n: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Load and warm up the top-N active models in parallel
+
+        Args:
+            top_n: Number of models to warm up (config default if None)
+
+        Returns:
+            Warm-up status dictionary
+        """
+        with self._lock:
+            if self.state == self.WARMING:
+                return self.get_status()
+            self.state = self.WARMING
+            self.started_at = datetime.utcnow()
+            self.completed_at = None
+            self.models = {}
+
+        start_time = time.time()
+        symbols = self.select_models(top_n)
+        logger.info(f"🔥 Warming up {len(symbols)} models: {symbols}")
+
+        if symbols:
+            workers = max(min(self.max_workers, len(symbols)), 1)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="model-warmup") as pool:
+                futures = {pool.submit(self._warm_up_model, symbol): symbol for symbol in symbols}
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    self.models[symbol] = future.result()
+
+        failed = [s for s, result in self.models.items() if result['status'] != 'ready']
+
+        with self._lock:
+            self.duration_seconds = round(time.time() - start_time, 3)
+            self.completed_at = datetime.utcnow()
+            if not failed:
+                self.state = self.READY
+            elif len(failed) < len(self.models):
+                self.state = self.DEGRADED
+            else:
+                self.state = self.FAILED
+
+        logger.info(f"✅ Model warm-up finished in {self.duration_seconds}s "
+                   f"({len(self.models) - len(failed)}/{len(self.models)} ready)")
+        return self.get_status()
+
+    def warm_up_in_background(self, top_n: Optional[int] = None) -> None:
+        """Run warm-up in a daemon thread so startup is not blocked"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(
+            target=self.warm_up,
+            kwargs={'top_n': top_n},
+            name="model-warmup",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _warm_up_model(self, crypto_symbol: str) -> Dict[str, Any]:
+        """Load one model into the shared cache and trace its predict function"""
+        start_time = time.time()
+
+        try:
+            model = model_loader.load_model(crypto_symbol)
+            if model is None:
+                return {
+                    'status': 'failed',
+                    'error': 'Model could not be loaded',
+                    'duration_seconds': round(time.time() - start_time, 3)
+                }
+
+            load_seconds = time.time() - start_time
+            warmup_seconds = model.warm_up(batch_size=self.batch_size)
+
+            logger.info(f"🔥 {crypto_symbol} warm: load {load_seconds:.2f}s, "
+                       f"first batch {warmup_seconds:.2f}s")
+
+            return {
+                'status': 'ready',
+                'model_id': model_registry.active_models.get(crypto_symbol),
+                'load_seconds': round(load_seconds, 3),
+                'warmup_seconds': round(warmup_seconds, 3),
+                'duration_seconds': round(time.time() - start_time, 3)
+            }
+
+        except Exception as e:
+            logger.warning(f"⚠️ Warm-up failed for {crypto_symbol}: {str(e)}")
+            model_loader.report_model_error(crypto_symbol, error=str(e))
+            return {
+                'status': 'failed',
+                'error': str(e),
+                'duration_seconds': round(time.time() - start_time, 3)
+            }
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get warm-up readiness status"""
+        return {
+            'state': self.state,
+            'ready': self.is_ready,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'duration_seconds': self.duration_seconds,
+            'models': dict(self.models)
+        }
+
+
+# Global warm-up manager instance
+model_warmup = ModelWarmupManager(
+    top_n=ml_config.warmup_top_n,
+    max_workers=ml_config.warmup_max_workers,
+    batch_size=ml_config.warmup_batch_size
+)
+
+
+def warm_up_models(top_n: Optional[int] = None, background: bool = False) -> Dict[str, Any]:
+    """
+    Warm up the active models
+
+    Args:
+        top_n: Number of models to warm up (config default if None)
+        background: Run in a daemon thread and return immediately
+
+    Returns:
+        Warm-up status dictionary
+    """
+    if background:
+        model_warmup.warm_up_in_background(top_n)
+        return model_warmup.get_status()
+    return model_warmup.warm_up(top_n)
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Get model warm-up readiness status"""
+    return model_warmup.get_status()
@@ -2,7 +2,6 @@
 # Optimized Prediction Service with Fast Response and Caching
 
 import asyncio
-import json
 import time
 import logging
 from typing import Dict, Any, Optional, List, Tuple
@@ -12,30 +11,18 @@ import pandas as pd
 import numpy as np
 from sqlalchemy.orm import Session
 
-# Redis for caching
-try:
-    import redis
-    from redis import Redis
-except ImportError:
-    redis = None
-
 # Import existing ML components
 from app.ml.models.lstm_predictor import LSTMPredictor
 from app.ml.preprocessing.data_processor import CryptoPriceDataProcessor
 from app.ml.config.ml_config import ml_config, model_registry
+from app.ml.prediction.model_loader import model_loader
 from app.ml.utils.model_utils import ModelMetrics
 
 # Import existing database components
 from app.core.database import SessionLocal
 from app.core.config import settings
-from app.repositories import (
-    cryptocurrency_repository, 
-    price_data_repository,
-    prediction_repository
-)
-from app.repositories.ml_repository import ml_repository
-from app.models import Cryptocurrency, PriceData, Prediction
-from app.schemas.prediction import PredictionCreate
+from app.core.result_store import result_store, PREDICTION_NAMESPACE
+from app.repositories import AssetRepository, PriceDataRepository
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +32,11 @@ class OptimizedPredictionService:
     Optimized Real-time Prediction Service for Fast Responses
     
     Features:
-    - Aggressive prediction caching (6 hour TTL)
+    - Aggressive prediction caching (6 hour TTL) in the shared result store,
+      dropped when a new model or candle arrives
     - Fast fallback predictions using simple models
-    - Timeout-based ML model loading
+    - Timeout-based ML model loading from the shared model_loader cache
+      (the models startup warm-up loaded)
     - Background model training
     - Performance monitoring
     """
@@ -61,16 +50,12 @@ class OptimizedPredictionService:
             add_time_features=ml_config.add_time_features,
             add_price_features=ml_config.add_price_features,
             outlier_threshold=ml_config.outlier_threshold,
-            min_data_points=ml_config.min_data_points
+            min_data_points=ml_config.min_data_points,
+            feature_store_path=ml_config.feature_store_path if ml_config.feature_store_enabled else None,
+            feature_engineering=ml_config.feature_engineering_mode
         )
         
-        # Optimized model cache
-        self.model_cache = {}
-        self.model_cache_timestamps = {}
-        self.cache_ttl = 1800  # 30 minutes (reduced from 1 hour)
-        
-        # Prediction cache with longer TTL
-        self.prediction_cache = {}
+        # Prediction cache with longer TTL (shared across worker processes)
         self.prediction_cache_ttl = 21600  # 6 hours (much longer caching)
         
         # Fast fallback models
@@ -87,17 +72,6 @@ class OptimizedPredictionService:
             "fast_predictions": 0  # <5s predictions
         }
         
-        # Redis cache for predictions (optional)
-        self.redis_client = None
-        if redis and hasattr(settings, 'REDIS_URL'):
-            try:
-                self.redis_client = redis.from_url(settings.REDIS_URL)
-                self.redis_client.ping()
-                logger.info("Redis connection established for prediction optimization")
-            except Exception as e:
-                logger.warning(f"Redis connection failed, using memory cache only: {e}")
-                self.redis_client = None
-        
         logger.info("Optimized prediction service initialized")
     
     def _initialize_fallback_models(self):
@@ -214,34 +188,25 @@ class OptimizedPredictionService:
             
             return emergency_prediction
     
+    @staticmethod
+    def _prediction_cache_key(crypto_symbol: str, prediction_horizon: int, model_type: str) -> str:
+        return f"{crypto_symbol.upper()}:{prediction_horizon}h:{model_type}"
+    
     async def _get_cached_prediction_fast(
         self, 
         crypto_symbol: str, 
         prediction_horizon: int, 
         model_type: str
     ) -> Optional[Dict[str, Any]]:
-        """Fast cache lookup with multi-level caching"""
-        cache_key = f"pred:{crypto_symbol}:{prediction_horizon}h:{model_type}"
-        
-        # Level 1: Memory cache (fastest)
-        if cache_key in self.prediction_cache:
-            cached_at, prediction = self.prediction_cache[cache_key]
-            if (time.time() - cached_at) < self.prediction_cache_ttl:
-                return prediction
-        
-        # Level 2: Redis cache (if available)
-        if self.redis_client:
-            try:
-                cached_data = self.redis_client.get(cache_key)
-                if cached_data:
-                    prediction = json.loads(cached_data)
-                    # Update memory cache
-                    self.prediction_cache[cache_key] = (time.time(), prediction)
-                    return prediction
-            except Exception as e:
-                logger.warning(f"Redis cache lookup failed: {e}")
-        
-        return None
+        """Fast cache lookup (process L1, then async Redis)"""
+        try:
+            return await result_store.get(
+                PREDICTION_NAMESPACE,
+                self._prediction_cache_key(crypto_symbol, prediction_horizon, model_type)
+            )
+        except Exception as e:
+            logger.warning(f"Prediction cache lookup failed: {e}")
+            return None
     
     async def _cache_prediction_fast(
         self, 
@@ -254,18 +219,16 @@ class OptimizedPredictionService:
         if ttl is None:
             ttl = self.prediction_cache_ttl
         
-        cache_key = f"pred:{crypto_symbol}:{prediction_horizon}h:lstm"
-        
-        # Cache in memory
-        self.prediction_cache[cache_key] = (time.time(), prediction)
-        
-        # Cache in Redis (if available)
-        if self.redis_client:
-            try:
-                self.redis_client.setex(cache_key, ttl, json.dumps(prediction))
-            except Exception as e:
-                logger.warning(f"Redis cache set failed: {e}")
-    
+        try:
+            await result_store.set(
+                PREDICTION_NAMESPACE,
+                self._prediction_cache_key(crypto_symbol, prediction_horizon, "lstm"),
+                prediction,
+                ttl
+            )
+        except Exception as e:
+            logger.warning(f"Prediction cache set failed: {e}")
+
     async def _get_current_price_fast(self, crypto_symbol: str) -> float:
         """Get current price with fast external API call"""
         from app.services.external_api import external_api_service
@@ -306,33 +269,23 @@ class OptimizedPredictionService:
                 logger.warning(f"No model available for {crypto_symbol}")
                 return None
             
-            # Get recent price data quickly
-            db = SessionLocal()
-            try:
-                crypto = cryptocurrency_repository.get_by_symbol(db, crypto_symbol.upper())
-                if not crypto:
-                    return None
-                
-                # Get minimal data for prediction (last 60 points)
-                end_date = datetime.now(timezone.utc)
-                start_date = end_date - timedelta(days=3)  # 3 days should be enough
-                
-                price_data = price_data_repository.get_price_history(
-                    db, crypto.id, start_date, end_date, limit=60
-                )
-                
-                if len(price_data) < 30:  # Minimum data requirement
-                    logger.warning(f"Insufficient data for ML prediction: {len(price_data)} points")
-                    return None
-            
-            finally:
-                db.close()
+            # Recent candles with engineered features (feature store)
+            features = await asyncio.to_thread(self._load_recent_features, crypto_symbol.upper())
+            if features is None:
+                return None
             
             # Fast prediction using minimal data
-            prediction_result = await asyncio.wait_for(
-                self._run_ml_inference_fast(model, price_data, current_price, prediction_horizon),
-                timeout=3.0  # 3 second timeout for inference
-            )
+            try:
+                prediction_result = await asyncio.wait_for(
+                    self._run_ml_inference_fast(model, features, current_price, prediction_horizon),
+                    timeout=3.0  # 3 second timeout for inference
+                )
+            except Exception as e:
+                # Failing live models are re-checked and quarantined like in warm-up
+                error = "Inference timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+                logger.error(f"ML inference failed for {crypto_symbol}: {error}")
+                model_loader.report_model_error(crypto_symbol.upper(), error=error)
+                return None
             
             if prediction_result:
                 return {
@@ -357,74 +310,76 @@ class OptimizedPredictionService:
             logger.error(f"ML prediction error for {crypto_symbol}: {e}")
             return None
     
-    async def _load_model_fast(self, crypto_symbol: str) -> Optional[Any]:
-        """Fast model loading with cache"""
-        cache_key = f"model:{crypto_symbol}"
+    async def _load_model_fast(self, crypto_symbol: str) -> Optional[LSTMPredictor]:
+        """
+        Active model from the shared model_loader cache
         
-        # Check cache first
-        if cache_key in self.model_cache:
-            cached_at = self.model_cache_timestamps.get(cache_key, 0)
-            if (time.time() - cached_at) < self.cache_ttl:
-                return self.model_cache[cache_key]
+        This is the cache startup warm-up fills, with its quarantine and
+        health checks. Cache misses load from disk in a thread; a load cut
+        off by the caller's timeout still lands in the cache for the next
+        request.
+        """
+        return await asyncio.to_thread(model_loader.load_model, crypto_symbol.upper())
+    
+    def _load_recent_features(self, crypto_symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Last 3 days of candles with engineered features
         
-        # Try to load model
+        Read through the feature store training fills, so indicators keep
+        their full history and only candles since the last call are computed.
+        """
+        db = SessionLocal()
         try:
-            active_model = model_registry.get_active_model(crypto_symbol)
-            if active_model and active_model.get('model_path'):
-                # Simplified model loading (skip heavy validation)
-                predictor = LSTMPredictor()
-                model = predictor.load_model_fast(active_model['model_path'])  # Need to implement this
-                
-                # Cache the model
-                self.model_cache[cache_key] = model
-                self.model_cache_timestamps[cache_key] = time.time()
-                
-                return model
-        except Exception as e:
-            logger.warning(f"Fast model loading failed for {crypto_symbol}: {e}")
+            crypto = AssetRepository(db).get_by_symbol(crypto_symbol)
+            if not crypto:
+                return None
+            
+            end_date = datetime.now(timezone.utc)
+            columns = PriceDataRepository(db).get_ohlcv_columns(
+                crypto.id, "1h", end_date - timedelta(days=3), end_date
+            )
+        finally:
+            db.close()
         
-        return None
+        if len(columns['candle_time']) < 30:  # Minimum data requirement
+            logger.warning(f"Insufficient data for ML prediction: {len(columns['candle_time'])} points")
+            return None
+        
+        candles = pd.DataFrame({'timestamp': columns.pop('candle_time'), **columns}, copy=False)
+        features, _ = self.data_processor.build_features(candles, crypto_symbol)
+        return features
     
     async def _run_ml_inference_fast(
         self, 
         model, 
-        price_data: List, 
+        features: pd.DataFrame, 
         current_price: float, 
         prediction_horizon: int
     ) -> Optional[Dict[str, Any]]:
-        """Run ML inference with minimal processing"""
-        try:
-            # Convert to simple DataFrame
-            df = pd.DataFrame([{
-                'price': float(p.price),
-                'timestamp': p.timestamp
-            } for p in price_data[-60:]])  # Use last 60 points max
-            
-            if len(df) < 30:
-                return None
-            
-            # Minimal preprocessing
-            df['returns'] = df['price'].pct_change()
-            df = df.dropna()
-            
-            # Simple prediction (this would need to be implemented in the model)
-            # For now, use a simple trend-based prediction
-            recent_trend = df['returns'].tail(10).mean()  # Last 10 periods trend
-            
-            predicted_price = current_price * (1 + recent_trend * prediction_horizon / 24)
-            
-            # Simple confidence based on volatility
-            volatility = df['returns'].std()
-            confidence = max(50.0, min(90.0, 80.0 - volatility * 1000))  # Scale volatility to confidence
-            
-            return {
-                "predicted_price": predicted_price,
-                "confidence": confidence
-            }
-            
-        except Exception as e:
-            logger.error(f"Fast ML inference failed: {e}")
+        """Run ML inference with minimal processing (errors propagate to the caller)"""
+        df = features.tail(60)  # Use last 60 points max
+        
+        if len(df) < 30:
             return None
+        
+        # Hourly returns from the feature frame (computed when price features are off)
+        returns = df['returns_1h'] if 'returns_1h' in df.columns else df['close_price'].pct_change()
+        returns = returns.dropna()
+        
+        # Simple prediction (this would need to be implemented in the model)
+        # For now, use a simple trend-based prediction
+        recent_trend = returns.tail(10).mean()  # Last 10 periods trend
+        
+        predicted_price = current_price * (1 + recent_trend * prediction_horizon / 24)
+        
+        # Simple confidence based on volatility
+        volatility = returns.std()
+        confidence = max(50.0, min(90.0, 80.0 - volatility * 1000))  # Scale volatility to confidence
+        
+        return {
+            "predicted_price": predicted_price,
+            "confidence": confidence
+        }
     
     def _generate_fallback_prediction(
         self, 
@@ -521,26 +476,17 @@ class OptimizedPredictionService:
             "fallback_rate": round((self.performance_stats["fallback_predictions"] / total) * 100, 1),
             "fast_response_rate": round((self.performance_stats["fast_predictions"] / total) * 100, 1),
             "average_response_time": round(self.performance_stats["average_response_time"], 1),
-            "cache_size": len(self.prediction_cache),
-            "model_cache_size": len(self.model_cache)
+            "cache_size": len(result_store.l1),
+            "model_cache_size": len(model_loader.models_cache),
+            "result_store": result_store.get_stats()
         }
     
-    def clear_cache(self) -> Dict[str, Any]:
-        """Clear prediction cache"""
-        cache_size = len(self.prediction_cache)
-        self.prediction_cache.clear()
-        
-        if self.redis_client:
-            try:
-                # Clear Redis prediction cache
-                keys = self.redis_client.keys("pred:*")
-                if keys:
-                    self.redis_client.delete(*keys)
-            except Exception as e:
-                logger.warning(f"Redis cache clear failed: {e}")
+    async def clear_cache(self) -> Dict[str, Any]:
+        """Clear prediction cache in every process"""
+        removed = await result_store.clear_namespace(PREDICTION_NAMESPACE)
         
         return {
-            "message": f"Cleared {cache_size} cached predictions",
+            "message": f"Cleared {removed} cached predictions",
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
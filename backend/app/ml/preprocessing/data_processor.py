@@ -3,6 +3,7 @@
 
 import pandas as pd
 import numpy as np
+import hashlib
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import logging
@@ -23,8 +24,70 @@ except ImportError as e:
 from sklearn.preprocessing import MinMaxScaler, StandardScaler, RobustScaler
 from sklearn.impute import SimpleImputer
 
+from app.ml.preprocessing.feature_store import FeatureMatrixStore
+
 logger = logging.getLogger(__name__)
 
+# Bump when feature definitions change - invalidates stored feature matrices
+FEATURE_SET_VERSION = 1
+
+
+# =====================================
+# VECTORIZED KERNELS (1-D float64 in, 1-D float64 out)
+# Window semantics match pandas rolling(window) with min_periods=window
+# =====================================
+
+def _shift(x: np.ndarray, periods: int) -> np.ndarray:
+    """x shifted forward by ``periods`` with NaN fill (Series.shift)"""
+    out = np.full_like(x, np.nan)
+    if periods < len(x):
+        out[periods:] = x[:-periods]
+    return out
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sum via cumulative sums; NaN unless the whole window is valid"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    
+    missing = np.isnan(x)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(missing, 0.0, x))))
+    counts = np.concatenate(([0], np.cumsum(~missing)))
+    
+    window_sums = sums[window:] - sums[:-window]
+    full = (counts[window:] - counts[:-window]) == window
+    out[window - 1:] = np.where(full, window_sums, np.nan)
+    return out
+
+
+def _rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_sum(x, window) / window
+
+
+def _rolling_std(x: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """Rolling std from centered sums of x and x^2 (centering keeps precision)"""
+    center = np.nanmean(x) if np.any(~np.isnan(x)) else 0.0
+    centered = x - center
+    s1 = _rolling_sum(centered, window)
+    s2 = _rolling_sum(centered * centered, window)
+    variance = (s2 - s1 * s1 / window) / (window - ddof)
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def _rolling_extreme(x: np.ndarray, window: int, func) -> np.ndarray:
+    """Rolling min/max over a zero-copy window view"""
+    out = np.full(len(x), np.nan)
+    if len(x) >= window:
+        out[window - 1:] = func(np.lib.stride_tricks.sliding_window_view(x, window), axis=1)
+    return out
+
+
+def _ewm_mean(x: np.ndarray, **kwargs) -> np.ndarray:
+    """Exponentially weighted mean (recursive filter, pandas Cython kernel on 1-D data)"""
+    return pd.Series(x, copy=False).ewm(**kwargs).mean().to_numpy()
+
 
 class CryptoPriceDataProcessor:
     """
@@ -47,9 +110,14 @@ class CryptoPriceDataProcessor:
         add_time_features: bool = True,
         add_price_features: bool = True,
         outlier_threshold: float = 4.0,        # Standard deviations for outlier detection
-        min_data_points: int = 50             # Minimum data points required
+        min_data_points: int = 50,            # Minimum data points required
+        feature_store_path: Optional[str] = None,  # Enables the feature-matrix store
+        feature_engineering: str = "pandas"   # pandas (column by column) or block (single float32 pass)
     ):
         """Initialize data processor"""
+        if feature_engineering not in ("pandas", "block"):
+            raise ValueError(f"Unknown feature engineering mode: {feature_engineering}")
+        
         self.scaling_method = scaling_method
         self.handle_missing = handle_missing
         self.add_technical_indicators = add_technical_indicators
@@ -57,6 +125,7 @@ class CryptoPriceDataProcessor:
         self.add_price_features = add_price_features
         self.outlier_threshold = outlier_threshold
         self.min_data_points = min_data_points
+        self.feature_engineering = feature_engineering
         
         # Initialize scalers
         self.scaler = self._get_scaler()
@@ -66,6 +135,9 @@ class CryptoPriceDataProcessor:
         self.feature_names = []
         self.original_columns = []
         
+        # Engineered features persisted per asset/timeframe (optional)
+        self.feature_store = FeatureMatrixStore(self, feature_store_path) if feature_store_path else None
+
         logger.info(f"Initialized CryptoPriceDataProcessor with {scaling_method} scaling")
     
     def _get_scaler(self):
@@ -79,13 +151,29 @@ class CryptoPriceDataProcessor:
         else:
             raise ValueError(f"Unknown scaling method: {self.scaling_method}")
     
+    @property
+    def feature_set_version(self) -> str:
+        """Version of the engineered columns (definitions + enabled groups)"""
+        flags = (
+            f"{self.add_time_features}:{self.add_price_features}:{self.add_technical_indicators}:"
+            f"{self.feature_engineering}"
+        )
+        return f"v{FEATURE_SET_VERSION}-{hashlib.sha1(flags.encode()).hexdigest()[:8]}"
+    
     def process_data(
         self,
         data: pd.DataFrame,
         target_column: str = "close_price",
-        timestamp_column: str = "timestamp"
+        timestamp_column: str = "timestamp",
+        asset: Optional[str] = None,
+        timeframe: str = "1h"
     ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        """Complete data processing pipeline"""
+        """
+        Complete data processing pipeline
+        
+        When ``asset`` is given and the feature store is enabled, engineered
+        features are read from the store and only new candles are computed.
+        """
         logger.info(f"Starting data processing for {len(data)} records")
         
         # Store original info
@@ -110,24 +198,16 @@ class CryptoPriceDataProcessor:
         processing_info['processing_steps'].append('missing_value_handling')
         processing_info['data_quality']['after_missing_handling'] = data_clean.shape
         
-        # 3. Add time-based features
-        if self.add_time_features:
-            data_clean = self._add_time_features(data_clean, timestamp_column)
-            processing_info['processing_steps'].append('time_features')
-            processing_info['feature_engineering']['time_features'] = True
-        
-        # 4. Add price-based features
-        if self.add_price_features:
-            data_clean = self._add_price_features(data_clean)
-            processing_info['processing_steps'].append('price_features')
-            processing_info['feature_engineering']['price_features'] = True
-        
-        # 5. Add technical indicators
-        if self.add_technical_indicators:
-            data_clean = self._add_technical_indicators(data_clean)
-            processing_info['processing_steps'].append('technical_indicators')
-            processing_info['feature_engineering']['technical_indicators'] = True
-        
+        # 3-5. Time, price and technical indicator features
+        data_clean, store_info = self.build_features(data_clean, asset, timeframe, timestamp_column)
+        if store_info is not None:
+            processing_info['feature_store'] = store_info
+
+        for step, enabled in self._feature_groups():
+            if enabled:
+                processing_info['processing_steps'].append(step)
+                processing_info['feature_engineering'][step] = True
+
         # 6. Remove outliers
         data_clean = self._remove_outliers(data_clean, target_column)
         processing_info['processing_steps'].append('outlier_removal')
@@ -218,6 +298,206 @@ class CryptoPriceDataProcessor:
         
         return data
     
+    def _feature_groups(self) -> List[Tuple[str, bool]]:
+        return [
+            ('time_features', self.add_time_features),
+            ('price_features', self.add_price_features),
+            ('technical_indicators', self.add_technical_indicators)
+        ]
+    
+    def build_features(
+        self,
+        data: pd.DataFrame,
+        asset: Optional[str] = None,
+        timeframe: str = "1h",
+        timestamp_column: str = "timestamp"
+    ) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]]]:
+        """
+        Engineered features for cleaned, sorted candles
+
+        Goes through the feature store when it is enabled and ``asset`` is
+        given, so only candles past the stored watermark are computed.
+
+        Returns:
+            Tuple of (feature frame, feature store info or None)
+        """
+        if asset and self.feature_store is not None:
+            return self.feature_store.get_features(data, asset, timeframe, timestamp_column)
+        return self.engineer_features(data, timestamp_column), None
+
+    def engineer_features(self, data: pd.DataFrame, timestamp_column: str = "timestamp") -> pd.DataFrame:
+        """
+        Add the enabled feature groups to cleaned, sorted candles
+        
+        Row-local except for rolling/EWM windows, which is what lets the
+        feature store recompute only the tail of a series.
+        """
+        if self.feature_engineering == "block":
+            return self._engineer_features_block(data, timestamp_column)
+        
+        if self.add_time_features:
+            data = self._add_time_features(data, timestamp_column)
+        
+        if self.add_price_features:
+            data = self._add_price_features(data)
+        
+        if self.add_technical_indicators:
+            data = self._add_technical_indicators(data)
+        
+        return data
+    
+    def _block_feature_names(self) -> List[str]:
+        """Feature columns in the order the pandas path adds them"""
+        names = []
+        
+        if self.add_time_features:
+            names += [
+                'hour', 'day_of_week', 'day_of_month', 'month', 'quarter',
+                'hour_sin', 'hour_cos', 'day_sin', 'day_cos', 'month_sin', 'month_cos'
+            ]
+        
+        if self.add_price_features:
+            names += [
+                'returns_1h', 'returns_4h', 'returns_24h', 'returns_7d',
+                'volatility_24h', 'volatility_7d', 'hl_ratio', 'oc_ratio', 'true_range',
+                'vwap', 'volume_sma', 'volume_ratio'
+            ]
+        
+        if self.add_technical_indicators:
+            names += [
+                'sma_20', 'sma_50', 'ema_12', 'ema_26', 'rsi',
+                'macd', 'macd_signal', 'macd_histogram',
+                'bollinger_upper', 'bollinger_lower', 'bollinger_middle', 'bollinger_position'
+            ]
+            # The pandas path stops at volume_sma_ta when ta lacks it
+            if hasattr(ta.volume, 'volume_sma'):
+                names += [
+                    'volume_sma_ta', 'support_20', 'resistance_20',
+                    'support_distance', 'resistance_distance', 'momentum_10', 'momentum_20'
+                ]
+        
+        return names
+    
+    def _engineer_features_block(self, data: pd.DataFrame, timestamp_column: str) -> pd.DataFrame:
+        """
+        Single-pass feature engineering into one preallocated float32 block
+        
+        Produces the same columns as the pandas path (as float32) without
+        copying the frame per feature group; the frame is assembled once.
+        """
+        names = self._block_feature_names()
+        n = len(data)
+        block = np.empty((n, len(names)), dtype=np.float32)
+        column = {name: i for i, name in enumerate(names)}
+        
+        def put(name: str, values) -> None:
+            block[:, column[name]] = values
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.add_time_features:
+                stamps = pd.DatetimeIndex(data[timestamp_column])
+                hour = stamps.hour.to_numpy()
+                day_of_week = stamps.dayofweek.to_numpy()
+                month = stamps.month.to_numpy()
+                
+                put('hour', hour)
+                put('day_of_week', day_of_week)
+                put('day_of_month', stamps.day.to_numpy())
+                put('month', month)
+                put('quarter', stamps.quarter.to_numpy())
+                put('hour_sin', np.sin(2 * np.pi * hour / 24))
+                put('hour_cos', np.cos(2 * np.pi * hour / 24))
+                put('day_sin', np.sin(2 * np.pi * day_of_week / 7))
+                put('day_cos', np.cos(2 * np.pi * day_of_week / 7))
+                put('month_sin', np.sin(2 * np.pi * month / 12))
+                put('month_cos', np.cos(2 * np.pi * month / 12))
+            
+            if not (self.add_price_features or self.add_technical_indicators):
+                return self._assemble_block(data, block, names)
+            
+            close = data['close_price'].to_numpy(dtype=np.float64)
+            
+            if self.add_price_features:
+                high = data['high_price'].to_numpy(dtype=np.float64)
+                low = data['low_price'].to_numpy(dtype=np.float64)
+                open_ = data['open_price'].to_numpy(dtype=np.float64)
+                volume = data['volume'].to_numpy(dtype=np.float64)
+                prev_close = _shift(close, 1)
+                
+                returns_1h = close / prev_close - 1
+                put('returns_1h', returns_1h)
+                put('returns_4h', close / _shift(close, 4) - 1)
+                put('returns_24h', close / _shift(close, 24) - 1)
+                put('returns_7d', close / _shift(close, 168) - 1)
+                put('volatility_24h', _rolling_std(returns_1h, 24))
+                put('volatility_7d', _rolling_std(returns_1h, 168))
+                put('hl_ratio', high / low)
+                put('oc_ratio', open_ / close)
+                put('true_range', np.maximum(
+                    high - low,
+                    np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+                ))
+                put('vwap', _rolling_sum(close * volume, 24) / _rolling_sum(volume, 24))
+                volume_sma = _rolling_mean(volume, 20)
+                put('volume_sma', volume_sma)
+                put('volume_ratio', volume / volume_sma)
+            
+            if self.add_technical_indicators:
+                sma_20 = _rolling_mean(close, 20)
+                put('sma_20', sma_20)
+                put('sma_50', _rolling_mean(close, 50))
+                put('ema_12', _ewm_mean(close, span=12))
+                put('ema_26', _ewm_mean(close, span=26))
+                
+                # RSI (Wilder smoothing, as ta.momentum.RSIIndicator)
+                diff = np.diff(close, prepend=np.nan)
+                gains = np.where(diff > 0, diff, 0.0)
+                losses = -np.where(diff < 0, diff, 0.0)
+                avg_gain = _ewm_mean(gains, alpha=1 / 14, min_periods=14, adjust=False)
+                avg_loss = _ewm_mean(losses, alpha=1 / 14, min_periods=14, adjust=False)
+                put('rsi', np.where(avg_loss == 0, 100, 100 - (100 / (1 + avg_gain / avg_loss))))
+                
+                # MACD 12/26/9 (as ta.trend.MACD)
+                macd = (
+                    _ewm_mean(close, span=12, min_periods=12, adjust=False)
+                    - _ewm_mean(close, span=26, min_periods=26, adjust=False)
+                )
+                macd_signal = _ewm_mean(macd, span=9, min_periods=9, adjust=False)
+                put('macd', macd)
+                put('macd_signal', macd_signal)
+                put('macd_histogram', macd - macd_signal)
+                
+                # Bollinger Bands 20/2 (population std, as ta.volatility.BollingerBands)
+                band_width = 2 * _rolling_std(close, 20, ddof=0)
+                upper = sma_20 + band_width
+                lower = sma_20 - band_width
+                put('bollinger_upper', upper)
+                put('bollinger_lower', lower)
+                put('bollinger_middle', sma_20)
+                put('bollinger_position', (close - lower) / (upper - lower))
+                
+                if 'volume_sma_ta' in column:
+                    high = data['high_price'].to_numpy(dtype=np.float64)
+                    low = data['low_price'].to_numpy(dtype=np.float64)
+                    support = _rolling_extreme(low, 20, np.min)
+                    resistance = _rolling_extreme(high, 20, np.max)
+                    
+                    put('volume_sma_ta', ta.volume.volume_sma(data['close_price'], data['volume'], window=20))
+                    put('support_20', support)
+                    put('resistance_20', resistance)
+                    put('support_distance', close - support)
+                    put('resistance_distance', resistance - close)
+                    put('momentum_10', close / _shift(close, 10))
+                    put('momentum_20', close / _shift(close, 20))
+        
+        return self._assemble_block(data, block, names)
+    
+    @staticmethod
+    def _assemble_block(data: pd.DataFrame, block: np.ndarray, names: List[str]) -> pd.DataFrame:
+        """Attach the feature block to the source columns in one step"""
+        features = pd.DataFrame(block, columns=names, index=data.index, copy=False)
+        return pd.concat([data, features], axis=1)
+    
     def _add_time_features(self, data: pd.DataFrame, timestamp_column: str) -> pd.DataFrame:
         """Add time-based features"""
         data = data.copy()
@@ -354,15 +634,14 @@ class CryptoPriceDataProcessor:
     
     def _final_quality_check(self, data: pd.DataFrame) -> None:
         """Final data quality check - FIXED: No deprecated methods"""
-        # Handle infinite values
-        inf_counts = {}
-        for col in data.select_dtypes(include=[np.number]).columns:
-            inf_count = np.isinf(data[col]).sum()
-            if inf_count > 0:
-                inf_counts[col] = inf_count
-                # Replace infinite values with NaN then interpolate
-                data[col] = data[col].replace([np.inf, -np.inf], np.nan)
-                data[col] = data[col].interpolate()
+        # Handle infinite values - one vectorized scan, then fix only affected columns
+        numeric = data.select_dtypes(include=[np.number])
+        inf_per_column = np.isinf(numeric).sum()
+        inf_counts = inf_per_column[inf_per_column > 0].to_dict()
+        for col in inf_counts:
+            # Replace infinite values with NaN then interpolate
+            data[col] = data[col].replace([np.inf, -np.inf], np.nan)
+            data[col] = data[col].interpolate()
         
         if inf_counts:
             logger.warning(f"Found and handled infinite values: {inf_counts}")
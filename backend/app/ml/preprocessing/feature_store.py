@@ -0,0 +1,257 @@
+# File: backend/app/ml/preprocessing/feature_store.py
+# Persisted feature matrices keyed by asset, timeframe, feature-set version and last candle
+
+import os
+import re
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureMatrixStore:
+    """
+    Cache of engineered feature frames for CryptoPriceDataProcessor
+
+    Entries are keyed by (asset, timeframe, feature-set version) and carry
+    the last candle time they cover (the watermark). A request whose last
+    candle matches the watermark is served as-is; when new candles arrive
+    only the tail is recomputed, with enough preceding rows for every
+    indicator window, and appended to the stored frame.
+
+    Recursive indicators (EMA, MACD, RSI) depend on the whole history; the
+    warm-up window is long enough that the truncated part weighs less than
+    float precision, so tail values match a full recompute.
+
+    A request ending before the watermark (an older window) is sliced out of
+    the stored frame; the entry keeps its full range.
+    """
+
+    # Longest rolling window is 168 rows (7d returns/volatility); the slowest
+    # EMA decays below 1e-15 after ~500 rows
+    WARMUP_ROWS = 512
+
+    _STAT_BY_MODE = {'hit': 'hits', 'incremental': 'incremental_updates', 'full': 'full_builds'}
+
+    def __init__(
+        self,
+        processor,
+        storage_path: str,
+        max_rows: int = 20000,
+        max_memory_entries: int = 16
+    ):
+        """
+        Initialize feature store
+
+        Args:
+            processor: CryptoPriceDataProcessor providing engineer_features()
+            storage_path: Directory for persisted feature frames
+            max_rows: Rows kept per entry (oldest rows are dropped)
+            max_memory_entries: Entries kept in memory (LRU)
+        """
+        self.processor = processor
+        self.storage_path = storage_path
+        self.max_rows = max_rows
+        self.max_memory_entries = max_memory_entries
+
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.stats = {'hits': 0, 'incremental_updates': 0, 'full_builds': 0}
+
+    # -------------------------------------
+    # Public API
+    # -------------------------------------
+
+    def get_features(
+        self,
+        data: pd.DataFrame,
+        asset: str,
+        timeframe: str = "1h",
+        timestamp_column: str = "timestamp"
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Engineered features for cleaned, timestamp-sorted candles
+
+        Args:
+            data: Cleaned candles (output of missing-value handling)
+            asset: Asset symbol
+            timeframe: Candle timeframe
+            timestamp_column: Timestamp column name
+
+        Returns:
+            Tuple of (feature frame covering the rows of ``data``, store info)
+        """
+        key = self._entry_key(asset, timeframe)
+        timestamps = data[timestamp_column]
+        watermark = timestamps.iloc[-1]
+
+        with self._lock:
+            entry = self._get_entry(key)
+            frame, mode = self._resolve(entry, data, timestamp_column)
+
+            if mode != 'hit':
+                if len(frame) > self.max_rows:
+                    frame = frame.iloc[-self.max_rows:].reset_index(drop=True)
+                self._put_entry(key, frame)
+
+            self.stats[self._STAT_BY_MODE[mode]] += 1
+
+        # Serve exactly the requested range
+        frame_ts = frame[timestamp_column].values
+        start = np.searchsorted(frame_ts, timestamps.values[0], side='left')
+        end = np.searchsorted(frame_ts, timestamps.values[-1], side='right')
+        result = frame.iloc[start:end].reset_index(drop=True)
+
+        info = {
+            'key': {
+                'asset': asset,
+                'timeframe': timeframe,
+                'feature_set_version': self.processor.feature_set_version,
+                'last_candle_time': pd.Timestamp(watermark).isoformat()
+            },
+            'mode': mode,
+            'rows': len(result)
+        }
+        return result, info
+
+    def invalidate(self, asset: Optional[str] = None) -> int:
+        """
+        Drop stored entries (all, or one asset's)
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            prefix = f"{self._safe(asset)}__" if asset else ""
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                del self._memory[key]
+
+            if not os.path.isdir(self.storage_path):
+                return removed
+
+            for filename in os.listdir(self.storage_path):
+                if filename.endswith('.pkl') and filename.startswith(prefix):
+                    os.remove(os.path.join(self.storage_path, filename))
+                    removed += 1
+
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/update counters and memory usage"""
+        with self._lock:
+            return {
+                **self.stats,
+                'memory_entries': len(self._memory),
+                'feature_set_version': self.processor.feature_set_version
+            }
+
+    # -------------------------------------
+    # Internals
+    # -------------------------------------
+
+    def _resolve(
+        self,
+        entry: Optional[pd.DataFrame],
+        data: pd.DataFrame,
+        timestamp_column: str
+    ) -> Tuple[pd.DataFrame, str]:
+        """Decide between hit (whole or sliced entry), tail update and full build"""
+        if entry is None or entry.empty:
+            return self.processor.engineer_features(data, timestamp_column), 'full'
+
+        stored_ts = entry[timestamp_column].values
+        new_ts = data[timestamp_column].values
+        stored_watermark = stored_ts[-1]
+
+        # Request must start inside the stored history
+        if new_ts[0] < stored_ts[0]:
+            return self.processor.engineer_features(data, timestamp_column), 'full'
+
+        # Window ending at or before the watermark: serve the stored rows
+        if new_ts[-1] <= stored_watermark:
+            start = np.searchsorted(stored_ts, new_ts[0], side='left')
+            end = np.searchsorted(stored_ts, new_ts[-1], side='right')
+            if self._rows_match(entry.iloc[start:end], data, timestamp_column):
+                return entry, 'hit'
+            return self.processor.engineer_features(data, timestamp_column), 'full'
+
+        position = np.searchsorted(new_ts, stored_watermark, side='left')
+        if position >= len(new_ts) or new_ts[position] != stored_watermark:
+            return self.processor.engineer_features(data, timestamp_column), 'full'
+
+        # Stored rows must still match the source (no late corrections)
+        overlap_start = max(0, position + 1 - self.WARMUP_ROWS)
+        overlap = data.iloc[overlap_start:position + 1]
+        if not self._rows_match(entry.iloc[-len(overlap):], overlap, timestamp_column):
+            return self.processor.engineer_features(data, timestamp_column), 'full'
+
+        # Recompute the tail with a warm-up window, keep only the new rows
+        context = data.iloc[overlap_start:]
+        tail = self.processor.engineer_features(context, timestamp_column)
+        tail = tail.iloc[position + 1 - overlap_start:]
+
+        frame = pd.concat([entry, tail], ignore_index=True)
+        return frame, 'incremental'
+
+    @staticmethod
+    def _rows_match(stored: pd.DataFrame, source: pd.DataFrame, timestamp_column: str) -> bool:
+        """Stored rows cover the same candles with the same closes as the source"""
+        return np.array_equal(
+            stored[timestamp_column].values, source[timestamp_column].values
+        ) and np.allclose(
+            stored['close_price'].values, source['close_price'].values, equal_nan=True
+        )
+
+    def _entry_key(self, asset: str, timeframe: str) -> str:
+        return f"{self._safe(asset)}__{self._safe(timeframe)}__{self.processor.feature_set_version}"
+
+    @staticmethod
+    def _safe(value: str) -> str:
+        return re.sub(r'[^A-Za-z0-9_.-]', '_', str(value))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.storage_path, f"{key}.pkl")
+
+    def _get_entry(self, key: str) -> Optional[pd.DataFrame]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            frame = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable feature store entry {key}: {str(e)}")
+            return None
+
+        self._remember(key, frame)
+        return frame
+
+    def _put_entry(self, key: str, frame: pd.DataFrame) -> None:
+        self._remember(key, frame)
+
+        # Write-then-rename so readers never see a partial file
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.storage_path, exist_ok=True)
+            frame.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not persist feature store entry {key}: {str(e)}")
+
+    def _remember(self, key: str, frame: pd.DataFrame) -> None:
+        self._memory[key] = frame
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
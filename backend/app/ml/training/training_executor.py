@@ -0,0 +1,487 @@
+# File: backend/app/ml/training/training_executor.py
+# Out-of-process executor for API-started training jobs: persistent job records, progress, cancellation, admission
+
+import os
+import time
+import asyncio
+import logging
+import threading
+import multiprocessing
+from functools import partial
+from typing import Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import psutil
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.core.database import SessionLocal
+from app.ml.config.ml_config import ml_config
+from app.ml.training.training_orchestrator import _init_training_worker
+from app.models.ai.job import ModelJob
+from app.models.enums import JobStatus, JobCategory, Priority
+from app.repositories.ai.model_job_repository import ModelJobRepository
+
+logger = logging.getLogger(__name__)
+
+# queue_name of the jobs this executor owns
+TRAINING_EXECUTOR_QUEUE = "training_executor"
+
+# How often a running job refreshes last_heartbeat between epochs
+_HEARTBEAT_SECONDS = 30
+
+
+class TrainingCancelled(Exception):
+    """Raised inside a training run when its job was cancelled"""
+
+
+class TrainingCapacityError(Exception):
+    """No training slot free (CPU slots in use or not enough free memory)"""
+
+    def __init__(self, admission: Dict[str, Any]):
+        self.admission = admission
+        super().__init__(
+            f"Training capacity reached: {admission['active_jobs']}/{admission['cpu_slots']} jobs, "
+            f"{admission['available_memory_mb']} MB free of {admission['job_memory_mb']} MB needed"
+        )
+
+
+# =====================================
+# WORKER-SIDE (runs in the pool processes)
+# =====================================
+
+def _numeric_metrics(metrics: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """JSON-safe float metrics (Keras logs hold numpy scalars)"""
+    return {
+        key: round(float(value), 6) for key, value in (metrics or {}).items()
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+    }
+
+
+class JobProgressReporter:
+    """
+    Writes per-epoch progress to the job record and watches for cancellation
+
+    Cancellation is cooperative: once the job is no longer running
+    (cancelled by a user, or failed by the API on shutdown or as stale) the
+    next epoch end or batch poll raises TrainingCancelled out of fit().
+    """
+
+    def __init__(self, db: Session, job_id: int, poll_seconds: float = 2.0):
+        self.db = db
+        self.job_id = job_id
+        self.jobs = ModelJobRepository(db)
+        self.poll_seconds = poll_seconds
+        self._last_poll = time.monotonic()
+        self._last_heartbeat = time.monotonic()
+
+    def _raise_if_stopped(self) -> None:
+        status = self.jobs.get_job_status(self.job_id)
+        if status != JobStatus.RUNNING.value:
+            self.db.rollback()
+            raise TrainingCancelled(f"Training job {self.job_id} is {status}")
+
+    def _job(self) -> ModelJob:
+        job = self.db.get(ModelJob, self.job_id)
+        self.db.refresh(job)
+        return job
+
+    def train_begin(self, total_epochs: Optional[int]) -> None:
+        self._raise_if_stopped()
+        job = self._job()
+        job.total_steps = total_epochs
+        job.completed_steps = 0
+        job.job_metrics = {'epoch': 0, 'history': []}
+        job.update_progress(progress_pct=0, current_phase='training')
+        self.db.commit()
+
+    def epoch_end(self, epoch: int, logs: Optional[Dict[str, Any]] = None) -> None:
+        self._raise_if_stopped()
+        job = self._job()
+        epoch_metrics = _numeric_metrics(logs)
+        history = list((job.job_metrics or {}).get('history', [])) + [{'epoch': epoch, **epoch_metrics}]
+        # Reassign: in-place JSONB changes are not tracked
+        job.job_metrics = {**(job.job_metrics or {}), 'epoch': epoch, 'last_epoch': epoch_metrics, 'history': history}
+        job.update_progress(completed_steps=min(epoch, job.total_steps or epoch), current_phase='training')
+        self.db.commit()
+        self._last_heartbeat = self._last_poll = time.monotonic()
+
+    def train_end(self) -> None:
+        job = self._job()
+        job.update_progress(current_phase='saving')
+        self.db.commit()
+
+    def poll(self) -> None:
+        """Cheap check between batches, throttled to poll_seconds"""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_seconds:
+            return
+        self._last_poll = now
+        self._raise_if_stopped()
+        if now - self._last_heartbeat >= _HEARTBEAT_SECONDS:
+            self._job().last_heartbeat = datetime.now(timezone.utc)
+            self._last_heartbeat = now
+        self.db.commit()
+
+
+def create_progress_callback(reporter: JobProgressReporter):
+    """Keras callback forwarding fit() events to the reporter (imports TensorFlow)"""
+    import tensorflow as tf
+
+    def report(update, *args) -> None:
+        # A failed progress write must not fail the training run
+        try:
+            update(*args)
+        except TrainingCancelled:
+            raise
+        except Exception as e:
+            logger.warning(f"Training progress update for job {reporter.job_id} failed: {str(e)}")
+            reporter.db.rollback()
+
+    class TrainingProgressCallback(tf.keras.callbacks.Callback):
+        def on_train_begin(self, logs=None):
+            report(reporter.train_begin, self.params.get('epochs'))
+
+        def on_epoch_end(self, epoch, logs=None):
+            report(reporter.epoch_end, epoch + 1, logs)
+
+        def on_train_batch_end(self, batch, logs=None):
+            report(reporter.poll)
+
+        def on_train_end(self, logs=None):
+            report(reporter.train_end)
+
+    return TrainingProgressCallback()
+
+
+def execute_training_job(
+    job_id: int,
+    crypto_symbol: str,
+    training_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run one API training job in a pool worker and record the outcome
+
+    The job row is the source of truth: a job cancelled (or failed by the
+    API) before or during the run keeps that status.
+
+    Args:
+        job_id: ModelJob id
+        crypto_symbol: Cryptocurrency symbol to train
+        training_config: Optional training configuration overrides
+
+    Returns:
+        Dict with the final job status
+    """
+    from app.ml.training.training_service import training_service
+
+    db = SessionLocal()
+    jobs = ModelJobRepository(db)
+    try:
+        job = jobs.lock_job(job_id)
+        if job is None or job.job_status != JobStatus.PENDING.value:
+            db.rollback()
+            return {'job_id': job_id, 'status': job.job_status if job else None}
+
+        job.start_job()
+        job.update_progress(progress_pct=0, current_phase='loading_data')
+        job.log_event('started', {'worker_pid': os.getpid()})
+        db.commit()
+
+        reporter = JobProgressReporter(db, job_id, ml_config.training_poll_seconds)
+        result, error = None, None
+        try:
+            result = asyncio.run(
+                training_service.train_model_for_crypto(
+                    crypto_symbol=crypto_symbol,
+                    training_config=training_config,
+                    callbacks=[create_progress_callback(reporter)]
+                )
+            )
+        except TrainingCancelled:
+            logger.info(f"Training job {job_id} for {crypto_symbol} stopped after cancellation")
+        except Exception as e:
+            error = str(e)
+
+        db.rollback()
+        job = jobs.lock_job(job_id)
+        if job.job_status != JobStatus.RUNNING.value:
+            db.commit()
+            return {'job_id': job_id, 'status': job.job_status}
+
+        if result and result.get('success'):
+            job.complete_job(
+                outputs={
+                    'model_id': result.get('model_id'),
+                    'model_path': result.get('model_path'),
+                    'training_mode': result.get('training_mode', 'full'),
+                    'skipped': bool(result.get('skipped', False)),
+                    'data_points_used': result.get('data_points_used'),
+                    'evaluation_metrics': _numeric_metrics(result.get('evaluation_metrics')),
+                    'worker_pid': os.getpid()
+                },
+                final_metrics=_numeric_metrics(result.get('training_metrics'))
+            )
+            flag_modified(job, 'job_metrics')
+        else:
+            error = error or (result or {}).get('error') or 'Unknown error'
+            job.fail_job(error, {'details': (result or {}).get('details')}, retry=False)
+        db.commit()
+
+        logger.info(f"Training job {job_id} for {crypto_symbol} finished: {job.job_status}")
+        return {'job_id': job_id, 'status': job.job_status}
+
+    finally:
+        db.close()
+
+
+# =====================================
+# EXECUTOR (API process)
+# =====================================
+
+class TrainingExecutor:
+    """
+    Runs /ml/training/start jobs on a dedicated process pool
+
+    Features:
+    - Jobs are ModelJob rows (category 'training'), so status, per-epoch
+      progress and results survive restarts and are shared by all API workers
+    - Training runs in spawned processes with per-job thread caps; the API
+      event loop never executes fit()
+    - Admission control: at most cores / intra-op threads active jobs
+      (or training_max_workers) across all API processes, and only while
+      the host has training_job_memory_mb free
+    - Cooperative cancellation checked every epoch and between batches
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        intra_op_threads: int = 2,
+        inter_op_threads: int = 1,
+        job_memory_mb: int = 2048,
+        stale_job_seconds: int = 900
+    ):
+        self.intra_op_threads = max(1, intra_op_threads)
+        self.inter_op_threads = max(1, inter_op_threads)
+        self.job_memory_mb = job_memory_mb
+        self.stale_job_seconds = stale_job_seconds
+        self.cpu_slots = max_workers if max_workers > 0 else max(1, (os.cpu_count() or 1) // self.intra_op_threads)
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._futures: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned workers start without the API's TensorFlow/DB state
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.cpu_slots,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_training_worker,
+                    initargs=(self.intra_op_threads, self.inter_op_threads)
+                )
+            return self._pool
+
+    # -------------------------------------
+    # Admission
+    # -------------------------------------
+
+    def get_admission(self, db: Session) -> Dict[str, Any]:
+        """
+        Current training capacity
+
+        Returns:
+            Dict with slots, active jobs, free memory and whether a job fits
+        """
+        active_jobs = ModelJobRepository(db).count_active_training_jobs(TRAINING_EXECUTOR_QUEUE)
+        available_memory_mb = psutil.virtual_memory().available // (1024 * 1024)
+        return {
+            'cpu_slots': self.cpu_slots,
+            'active_jobs': active_jobs,
+            'available_memory_mb': int(available_memory_mb),
+            'job_memory_mb': self.job_memory_mb,
+            'can_admit': active_jobs < self.cpu_slots and available_memory_mb >= self.job_memory_mb
+        }
+
+    def _lock_admission(self, db: Session) -> None:
+        """Serialize count-then-insert across API workers (PostgreSQL only)"""
+        if db.get_bind().dialect.name == 'postgresql':
+            db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {'key': TRAINING_EXECUTOR_QUEUE})
+
+    # -------------------------------------
+    # Job lifecycle
+    # -------------------------------------
+
+    def submit(
+        self,
+        db: Session,
+        crypto_symbol: str,
+        model_type: str,
+        training_config: Optional[Dict[str, Any]] = None,
+        user_id: Optional[int] = None,
+        force_retrain: bool = False
+    ) -> ModelJob:
+        """
+        Admit a training job, persist it and hand it to the pool
+
+        Raises:
+            TrainingCapacityError: No free slot or not enough free memory
+        """
+        self.fail_stale_jobs(db)
+
+        self._lock_admission(db)
+        admission = self.get_admission(db)
+        if not admission['can_admit']:
+            db.rollback()
+            raise TrainingCapacityError(admission)
+
+        config = training_config or {}
+        training_mode = config.get('training_mode', 'full')
+        job = ModelJob(
+            job_status=JobStatus.PENDING.value,
+            job_category=JobCategory.TRAINING.value,
+            job_type=f"{model_type}_{training_mode}"[:25],
+            job_name=f"{crypto_symbol} {model_type}"[:30],
+            progress_pct=0,
+            current_phase='queued',
+            total_steps=config.get('epochs', ml_config.lstm_epochs),
+            job_config={
+                'crypto_symbol': crypto_symbol,
+                'model_type': model_type,
+                'training_config': training_config,
+                'force_retrain': force_retrain
+            },
+            job_metrics={},
+            queued_at=datetime.now(timezone.utc),
+            created_by=user_id,
+            priority=Priority.NORMAL.value,
+            queue_name=TRAINING_EXECUTOR_QUEUE,
+            max_retries=0,
+            auto_retry_enabled=False,
+            resource_allocation={
+                'intra_op_threads': self.intra_op_threads,
+                'inter_op_threads': self.inter_op_threads,
+                'memory_mb': self.job_memory_mb
+            }
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        try:
+            future = self._get_pool().submit(execute_training_job, job.id, crypto_symbol, training_config)
+        except Exception as e:
+            self._reset_pool()
+            job.fail_job(f"Could not start training worker: {str(e)}", retry=False)
+            db.commit()
+            raise
+
+        self._futures[job.id] = future
+        future.add_done_callback(partial(self._job_finished, job.id))
+        logger.info(f"Training job {job.id} for {crypto_symbol} queued ({admission['active_jobs'] + 1}/{self.cpu_slots} slots)")
+        return job
+
+    def cancel(self, db: Session, job_id: int, reason: str = "Cancelled by user") -> Optional[ModelJob]:
+        """
+        Cancel a pending or running job
+
+        A queued job is removed from the pool; a running one stops at its
+        next epoch end or batch poll.
+
+        Returns:
+            The job after cancellation, or None if it does not exist
+        """
+        job = ModelJobRepository(db).lock_job(job_id)
+        if job is None or not job.is_active:
+            db.rollback()
+            return job
+
+        job.cancel_job(reason)
+        flag_modified(job, 'job_events')
+        db.commit()
+
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()
+        return job
+
+    def _job_finished(self, job_id: int, future: Future) -> None:
+        """Pool callback: record worker crashes the job itself could not"""
+        self._futures.pop(job_id, None)
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            return
+
+        logger.error(f"Training worker for job {job_id} crashed: {str(error)}")
+        if isinstance(error, BrokenProcessPool):
+            self._reset_pool()
+        self._mark_failed(job_id, f"Training worker crashed: {str(error)}")
+
+    def _mark_failed(self, job_id: int, message: str) -> None:
+        db = SessionLocal()
+        try:
+            job = ModelJobRepository(db).lock_job(job_id)
+            if job is not None and job.is_active:
+                job.fail_job(message, retry=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def fail_stale_jobs(self, db: Session) -> int:
+        """
+        Fail active jobs whose worker stopped sending heartbeats
+
+        Covers workers lost to a restart or crash of the API process that
+        owned them, so they stop holding admission slots.
+
+        Returns:
+            int: Number of jobs marked failed
+        """
+        heartbeat_before = datetime.now(timezone.utc) - timedelta(seconds=self.stale_job_seconds)
+        stale = ModelJobRepository(db).get_stale_training_jobs(TRAINING_EXECUTOR_QUEUE, heartbeat_before)
+        for job in stale:
+            job.fail_job(f"No heartbeat for {self.stale_job_seconds}s (worker lost)", retry=False)
+        db.commit()
+
+        if stale:
+            logger.warning(f"Marked {len(stale)} stale training jobs as failed")
+        return len(stale)
+
+    def shutdown(self) -> None:
+        """
+        Stop the pool; jobs still owned by this process are marked failed
+
+        Marking them first makes running workers stop at their next poll,
+        so interpreter exit does not wait for full training runs.
+        """
+        for job_id in list(self._futures):
+            try:
+                self._mark_failed(job_id, "Interrupted by API shutdown")
+            except Exception as e:
+                logger.error(f"Could not mark training job {job_id} as interrupted: {str(e)}")
+        self._reset_pool()
+
+
+# Global executor configured from MLConfig
+training_executor = TrainingExecutor(
+    max_workers=ml_config.training_max_workers,
+    intra_op_threads=ml_config.training_intra_op_threads,
+    inter_op_threads=ml_config.training_inter_op_threads,
+    job_memory_mb=ml_config.training_job_memory_mb,
+    stale_job_seconds=ml_config.training_stale_job_seconds
+)
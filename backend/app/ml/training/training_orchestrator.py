@@ -0,0 +1,425 @@
+# File: backend/app/ml/training/training_orchestrator.py
+# Parallel multi-asset training: staleness queue, per-job thread caps, summary reducer
+
+import os
+import time
+import heapq
+import logging
+import multiprocessing
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from datetime import datetime, timezone
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from app.ml.config.ml_config import ml_config, model_registry
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================
+# WORKER-SIDE HELPERS (run in child processes)
+# =====================================
+
+def configure_training_threads(intra_op_threads: int, inter_op_threads: int) -> bool:
+    """
+    Cap the CPU threads one training job may use
+
+    Must run before TensorFlow executes its first op in the process;
+    afterwards TensorFlow refuses to change the thread pools.
+
+    Args:
+        intra_op_threads: Threads used inside a single op (matmul, LSTM cell)
+        inter_op_threads: Ops allowed to run concurrently
+
+    Returns:
+        bool: True if the caps were applied
+    """
+    # Native libraries (MKL/OpenMP/BLAS) read these at load time
+    os.environ['OMP_NUM_THREADS'] = str(intra_op_threads)
+    os.environ['TF_NUM_INTRAOP_THREADS'] = str(intra_op_threads)
+    os.environ['TF_NUM_INTEROP_THREADS'] = str(inter_op_threads)
+
+    try:
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+        tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+        return True
+    except RuntimeError:
+        # TensorFlow already initialized in this process - keep its pools
+        logger.warning("TensorFlow already initialized, thread caps not applied")
+        return False
+    except Exception as e:
+        logger.warning(f"Could not apply training thread caps: {str(e)}")
+        return False
+
+
+def _init_training_worker(intra_op_threads: int, inter_op_threads: int) -> None:
+    """ProcessPoolExecutor initializer - applies thread caps once per worker"""
+    configure_training_threads(intra_op_threads, inter_op_threads)
+
+
+def run_training_job(
+    crypto_symbol: str,
+    training_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Train one asset and return a compact, picklable job result
+
+    Runs in a pool worker or a Celery task, on the worker thread's
+    long-lived loop (shared clients stay usable and are closed at worker
+    shutdown). The training service is imported here so the parent
+    process never loads TensorFlow.
+
+    Args:
+        crypto_symbol: Cryptocurrency symbol to train
+        training_config: Optional training configuration overrides
+
+    Returns:
+        Dict with success flag, model id, error and timing
+    """
+    from app.ml.training.training_service import training_service
+    from app.tasks.task_handler import worker_async_runtime
+
+    started = time.perf_counter()
+    try:
+        result = worker_async_runtime.run(
+            training_service.train_model_for_crypto(
+                crypto_symbol=crypto_symbol,
+                training_config=training_config
+            )
+        )
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+
+    evaluation = result.get('evaluation_metrics') or {}
+
+    return {
+        'crypto_symbol': crypto_symbol,
+        'success': bool(result.get('success', False)),
+        'skipped': bool(result.get('skipped', False)),
+        'training_mode': result.get('training_mode', 'full'),
+        'model_id': result.get('model_id'),
+        'error': result.get('error'),
+        'data_points_used': result.get('data_points_used'),
+        'evaluation_metrics': {
+            key: float(value) for key, value in evaluation.items()
+            if isinstance(value, (int, float))
+        },
+        'duration_seconds': round(time.perf_counter() - started, 3),
+        'worker_pid': os.getpid()
+    }
+
+
+# =====================================
+# ORCHESTRATOR
+# =====================================
+
+class TrainingOrchestrator:
+    """
+    Fans out one training job per asset and reduces the results
+
+    Features:
+    - Priority queue: most stale (or missing) models are trained first
+    - Dedicated process pool, one TensorFlow runtime per worker
+    - Per-job intra/inter-op thread caps so jobs don't oversubscribe cores
+    - Summary reducer shared with the Celery chord callback
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        intra_op_threads: int = 2,
+        inter_op_threads: int = 1,
+        job_timeout: int = 3600
+    ):
+        self.intra_op_threads = max(1, intra_op_threads)
+        self.inter_op_threads = max(1, inter_op_threads)
+        self.job_timeout = job_timeout
+        self.max_workers = max_workers if max_workers > 0 else self._default_workers()
+
+    def _default_workers(self) -> int:
+        """As many jobs as fit in the cores at the configured thread cap"""
+        cpu_count = os.cpu_count() or 1
+        return max(1, cpu_count // self.intra_op_threads)
+
+    # -------------------------------------
+    # Scheduling
+    # -------------------------------------
+
+    @staticmethod
+    def get_model_staleness_hours(crypto_symbol: str) -> float:
+        """
+        Hours since the active model was trained
+
+        Returns:
+            float: Age in hours, or infinity when there is no active model
+        """
+        active_model = model_registry.get_active_model(crypto_symbol)
+        if not active_model:
+            return float('inf')
+
+        trained_at = active_model.get('created_at') or active_model.get('registered_at')
+        if not trained_at:
+            return float('inf')
+
+        try:
+            if isinstance(trained_at, str):
+                trained_at = datetime.fromisoformat(trained_at.replace('Z', '+00:00'))
+            if trained_at.tzinfo is None:
+                # Registry timestamps are written in local time
+                trained_at = trained_at.astimezone()
+            return max(0.0, (datetime.now(timezone.utc) - trained_at).total_seconds() / 3600)
+        except (TypeError, ValueError):
+            return float('inf')
+
+    def build_queue(self, crypto_symbols: List[str]) -> List[Tuple[str, float]]:
+        """
+        Order symbols by staleness, most stale first
+
+        Args:
+            crypto_symbols: Symbols that need training
+
+        Returns:
+            List of (symbol, staleness_hours) in training order
+        """
+        heap = []
+        for symbol in dict.fromkeys(crypto_symbols):
+            staleness = self.get_model_staleness_hours(symbol)
+            heapq.heappush(heap, (-staleness, symbol))
+
+        queue = []
+        while heap:
+            negative_staleness, symbol = heapq.heappop(heap)
+            queue.append((symbol, -negative_staleness))
+
+        return queue
+
+    # -------------------------------------
+    # Execution
+    # -------------------------------------
+
+    def run(
+        self,
+        crypto_symbols: List[str],
+        training_config: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+        skipped: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Train all symbols on the process pool and return the summary
+
+        Jobs are submitted in priority order, one per free worker, so each
+        job's job_timeout runs from when a worker picks it up. A job past
+        its timeout is recorded as failed and its worker is written off;
+        the remaining jobs keep running on the other workers, and the
+        stuck workers are terminated at the end.
+
+        Args:
+            crypto_symbols: Symbols to train
+            training_config: Optional training configuration overrides
+            progress_callback: Called as (completed, total, job_result)
+            skipped: Symbols left out because their models are up to date
+
+        Returns:
+            Dict with the reduced training summary
+        """
+        started_at = datetime.now(timezone.utc)
+        queue = self.build_queue(crypto_symbols)
+        if not queue:
+            return summarize_training_results([], started_at=started_at.isoformat(), skipped=skipped)
+
+        workers = min(self.max_workers, len(queue))
+        logger.info(
+            f"Training {len(queue)} assets on {workers} workers "
+            f"({self.intra_op_threads} intra / {self.inter_op_threads} inter-op threads per job)"
+        )
+
+        job_results = []
+
+        def record(job_result: Dict[str, Any], staleness: float) -> None:
+            job_result['staleness_hours'] = _finite_or_none(staleness)
+            job_results.append(job_result)
+            if progress_callback:
+                try:
+                    progress_callback(len(job_results), len(queue), job_result)
+                except Exception as e:
+                    logger.warning(f"Training progress callback failed: {str(e)}")
+
+        pending = list(queue)
+        running: Dict[Future, Tuple[str, float, float]] = {}  # future -> (symbol, staleness, deadline)
+        stuck_workers = 0
+
+        # Spawned workers start without the parent's TensorFlow/DB state,
+        # so thread caps take effect before TensorFlow initializes
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_training_worker,
+            initargs=(self.intra_op_threads, self.inter_op_threads)
+        )
+        try:
+            while pending or running:
+                while pending and len(running) + stuck_workers < workers:
+                    symbol, staleness = pending.pop(0)
+                    future = executor.submit(run_training_job, symbol, training_config)
+                    running[future] = (symbol, staleness, time.monotonic() + self.job_timeout)
+
+                if not running:
+                    # Every worker is stuck on a timed-out job
+                    for symbol, staleness in pending:
+                        record(_failed_job(symbol, "Not run: all training workers timed out"), staleness)
+                    pending = []
+                    break
+
+                next_deadline = min(deadline for _, _, deadline in running.values())
+                done, _ = wait(
+                    running, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    symbol, staleness, _ = running.pop(future)
+                    try:
+                        job_result = future.result()
+                    except Exception as e:
+                        logger.error(f"Training job for {symbol} crashed: {str(e)}")
+                        job_result = _failed_job(symbol, f"Worker failure: {str(e)}")
+                    record(job_result, staleness)
+
+                now = time.monotonic()
+                for future, (symbol, staleness, deadline) in list(running.items()):
+                    if deadline <= now:
+                        del running[future]
+                        future.cancel()
+                        stuck_workers += 1
+                        logger.error(f"Training job for {symbol} timed out after {self.job_timeout}s")
+                        record(
+                            _failed_job(symbol, f"Timed out after {self.job_timeout}s", self.job_timeout, timed_out=True),
+                            staleness
+                        )
+        finally:
+            _shutdown_pool(executor, terminate=stuck_workers > 0)
+
+        return summarize_training_results(
+            job_results, started_at=started_at.isoformat(), skipped=skipped
+        )
+
+
+def _failed_job(
+    crypto_symbol: str,
+    error: str,
+    duration_seconds: float = 0.0,
+    timed_out: bool = False
+) -> Dict[str, Any]:
+    """Result of a job that crashed, timed out or never ran"""
+    job_result = {
+        'crypto_symbol': crypto_symbol,
+        'success': False,
+        'error': error,
+        'duration_seconds': float(duration_seconds)
+    }
+    if timed_out:
+        job_result['timed_out'] = True
+    return job_result
+
+
+def _shutdown_pool(executor: ProcessPoolExecutor, terminate: bool) -> None:
+    """
+    Shut the pool down without waiting on jobs that will never finish
+
+    A running job can't be cancelled, so with timed-out jobs left the
+    worker processes are terminated instead of joined.
+    """
+    if not terminate:
+        executor.shutdown(wait=True, cancel_futures=True)
+        return
+
+    # ProcessPoolExecutor has no public handle on its workers
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        if process.is_alive():
+            process.terminate()
+    for process in processes:
+        process.join(timeout=5)
+    logger.warning(f"Terminated {len(processes)} training worker(s) after job timeouts")
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    """JSON-safe staleness (no model -> None)"""
+    return round(value, 2) if value != float('inf') else None
+
+
+# =====================================
+# SUMMARY REDUCER
+# =====================================
+
+def summarize_training_results(
+    job_results: List[Dict[str, Any]],
+    started_at: Optional[str] = None,
+    skipped: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Reduce per-asset job results into one training summary
+
+    Used by the process pool orchestrator and as the Celery chord callback.
+
+    Args:
+        job_results: Results from run_training_job
+        started_at: ISO timestamp the fan-out started
+        skipped: Symbols whose models were up to date
+
+    Returns:
+        Dict with counts, timing and per-asset results
+    """
+    completed_at = datetime.now(timezone.utc)
+    # Warm-start jobs that found no new candles count as skipped, not trained
+    skipped = list(skipped or []) + [
+        r.get('crypto_symbol') for r in job_results if r.get('success') and r.get('skipped')
+    ]
+    job_results_run = [r for r in job_results if not (r.get('success') and r.get('skipped'))]
+
+    trained = [r for r in job_results_run if r.get('success')]
+    failed = [r for r in job_results_run if not r.get('success')]
+    job_seconds = sum(r.get('duration_seconds') or 0.0 for r in job_results)
+
+    wall_seconds = None
+    if started_at:
+        try:
+            wall_seconds = (completed_at - datetime.fromisoformat(started_at)).total_seconds()
+        except (TypeError, ValueError):
+            wall_seconds = None
+
+    return {
+        'started_at': started_at,
+        'completed_at': completed_at.isoformat(),
+        'cryptocurrencies_processed': len(job_results_run) + len(skipped),
+        'models_fine_tuned': len([r for r in trained if r.get('training_mode') == 'incremental']),
+        'models_trained': len(trained),
+        'training_failed': len(failed),
+        'training_timed_out': len([r for r in failed if r.get('timed_out')]),
+        'training_skipped': len(skipped),
+        'skipped_symbols': skipped,
+        'errors': [
+            {'crypto_symbol': r.get('crypto_symbol'), 'error': r.get('error') or 'Unknown error'}
+            for r in failed
+        ],
+        'timing': {
+            'wall_seconds': round(wall_seconds, 3) if wall_seconds is not None else None,
+            'total_job_seconds': round(job_seconds, 3),
+            'parallel_speedup': round(job_seconds / wall_seconds, 2) if wall_seconds else None
+        },
+        'results': {r.get('crypto_symbol'): r for r in job_results},
+        'success': len(failed) == 0 or len(trained) > 0,
+        'summary': (
+            f"Processed {len(job_results_run) + len(skipped)} cryptocurrencies, "
+            f"trained {len(trained)} models, failed {len(failed)}, skipped {len(skipped)}"
+        )
+    }
+
+
+# Global orchestrator configured from MLConfig
+training_orchestrator = TrainingOrchestrator(
+    max_workers=ml_config.training_max_workers,
+    intra_op_threads=ml_config.training_intra_op_threads,
+    inter_op_threads=ml_config.training_inter_op_threads,
+    job_timeout=ml_config.training_job_timeout
+)
@@ -1,22 +1,19 @@
 # File: backend/app/ml/training/training_service.py
 # Fixed ML Training Service with corrected scaler handling
 
+# Annotations stay unevaluated so tf types in signatures don't import TensorFlow
+from __future__ import annotations
+
 import os
 import warnings
 
-# Suppress TensorFlow C++ messages completely
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # Only FATAL errors
-
 # Suppress all Python warnings including Keras warnings
 warnings.filterwarnings('ignore')
 
-# Configure TensorFlow logging before importing TensorFlow
 import logging
-logging.getLogger('tensorflow').setLevel(logging.FATAL)
 
-# Now import TensorFlow and suppress its logger
-import tensorflow as tf
-tf.get_logger().setLevel('FATAL')
+# TensorFlow is imported on first use (when a training run starts)
+from app.ml.utils.lazy_import import tensorflow as tf
 
 import asyncio
 import logging
@@ -33,16 +30,12 @@ from app.ml.models.lstm_predictor import LSTMPredictor
 from app.ml.preprocessing.data_processor import CryptoPriceDataProcessor
 from app.ml.config.ml_config import ml_config, model_registry
 from app.ml.utils.model_utils import ModelMetrics, ModelPersistence
+from app.ml.training.training_executor import TrainingCancelled
 
 # Import existing database components
 from app.core.database import SessionLocal
-from app.repositories import (
-    cryptocurrency_repository, 
-    price_data_repository,
-    prediction_repository
-)
-from app.models import Cryptocurrency, PriceData, Prediction
-from app.schemas.prediction import PredictionCreate
+from app.repositories import AssetRepository
+from app.repositories.asset.tiered_price_data_repository import TieredPriceDataRepository
 
 from app.core.config import settings
 
@@ -63,7 +56,9 @@ class MLTrainingService:
             add_time_features=ml_config.add_time_features,
             add_price_features=ml_config.add_price_features,
             outlier_threshold=ml_config.outlier_threshold,
-            min_data_points=ml_config.min_data_points
+            min_data_points=ml_config.min_data_points,
+            feature_store_path=ml_config.feature_store_path if ml_config.feature_store_enabled else None,
+            feature_engineering=ml_config.feature_engineering_mode
         )
         
         self.model_metrics = ModelMetrics()
@@ -90,10 +85,15 @@ class MLTrainingService:
         self,
         crypto_symbol: str,
         training_config: Optional[Dict[str, Any]] = None,
-        db: Optional[Session] = None
+        db: Optional[Session] = None,
+        callbacks: Optional[List] = None
     ) -> Dict[str, Any]:
         """
         Train LSTM model for a specific cryptocurrency with automatic fallback
+        
+        ``callbacks`` are extra Keras callbacks for the fit (e.g. the training
+        executor's progress callback). A TrainingCancelled raised by one of
+        them propagates instead of being reported as a failed run.
         """
         logger.info(f"Starting model training for {crypto_symbol}")
         
@@ -120,14 +120,31 @@ class MLTrainingService:
         
         except Exception as e:
             logger.warning(f"Data sync failed, proceeding with existing data: {e}")
-
-
+        
+        # Warm-start from the active model when requested
+        if (training_config or {}).get('training_mode') == 'incremental':
+            try:
+                result = await self._train_model_incremental(
+                    crypto_symbol=crypto_symbol,
+                    training_config=training_config,
+                    db=db,
+                    callbacks=callbacks
+                )
+                if result is not None:
+                    return result
+                logger.info(f"No usable warm start for {crypto_symbol}, running full training")
+            except TrainingCancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Incremental training failed for {crypto_symbol}: {str(e)}, running full training")
+        
         # First, try comprehensive training
         try:
             result = await self._train_model_comprehensive(
                 crypto_symbol=crypto_symbol,
                 training_config=training_config,
-                db=db
+                db=db,
+                callbacks=callbacks
             )
             
             if result.get('success', False):
@@ -136,7 +153,9 @@ class MLTrainingService:
             else:
                 logger.warning(f"⚠️ Comprehensive training failed for {crypto_symbol}: {result.get('error', 'Unknown error')}")
                 raise Exception(f"Comprehensive training failed: {result.get('error', 'Unknown error')}")
-                
+        
+        except TrainingCancelled:
+            raise
         except Exception as e:
             logger.warning(f"⚠️ Comprehensive training failed for {crypto_symbol}: {str(e)}")
           
@@ -152,7 +171,8 @@ class MLTrainingService:
         self,
         crypto_symbol: str,
         training_config: Optional[Dict[str, Any]] = None,
-        db: Optional[Session] = None
+        db: Optional[Session] = None,
+        callbacks: Optional[List] = None
     ) -> Dict[str, Any]:
 
         # Create database session if not provided
@@ -164,7 +184,7 @@ class MLTrainingService:
         
         try:
             # Step 1: Get cryptocurrency from database
-            crypto = cryptocurrency_repository.get_by_symbol(db, crypto_symbol)
+            crypto = AssetRepository(db).get_by_symbol(crypto_symbol)
             if not crypto:
                 raise ValueError(f"Cryptocurrency {crypto_symbol} not found in database")
             
@@ -174,6 +194,7 @@ class MLTrainingService:
                 raise ValueError(f"No price data found for {crypto_symbol}")
             
             logger.info(f"Loaded {len(training_data)} price records for {crypto_symbol}")
+            training_data = await asyncio.to_thread(self._add_engineered_features, training_data, crypto_symbol)
             
             # Step 3: Create LSTM predictor FIRST (before data processing)
             lstm_predictor = self._create_lstm_predictor(
@@ -181,37 +202,52 @@ class MLTrainingService:
                 training_config=training_config
             )
             
-            # Step 4: Use LSTM predictor's prepare_data method (this handles scaling)
+            # Step 4: Scale the columnar series (float32) - windowing happens
+            # lazily inside the tf.data pipeline, not in memory
             try:
-                X, y, target_scaler, feature_scaler = lstm_predictor.prepare_data(
+                features, target = lstm_predictor.prepare_features(
                     training_data,
                     target_column='close_price'
                 )
+                features = features.astype(np.float32, copy=False)
+                target = target.astype(np.float32, copy=False)
                 
-                logger.info(f"Data prepared by LSTM predictor: X={X.shape}, y={y.shape}")
-                
-                # Update n_features based on actual data
-                lstm_predictor.n_features = X.shape[2]
+                logger.info(f"Features prepared by LSTM predictor: {features.shape}")
                 
+                # Step 5: Build train/val/test pipelines with the same
+                # boundaries as _split_data
+                train_ds, val_ds, (X_test, y_test), split_sizes = self._build_training_datasets(
+                    lstm_predictor, features, target
+                )
+            
             except Exception as e:
-                logger.error(f"Error in LSTM prepare_data: {str(e)}")
-                # Fallback to manual data preparation
+                logger.error(f"Error in LSTM data pipeline: {str(e)}")
+                # Fallback to manual in-memory data preparation
                 X, y = self._manual_prepare_data(training_data)
-                target_scaler = None
-                feature_scaler = None
-            
-            # Step 5: Split data for training
-            X_train, y_train, X_val, y_val, X_test, y_test = self._split_data(X, y)
+                lstm_predictor.n_features = X.shape[2]
+                X_train, y_train, X_val, y_val, X_test, y_test = self._split_data(X, y)
+                train_ds, val_ds = None, None
+                split_sizes = {'train': len(X_train), 'val': len(X_val), 'test': len(X_test)}
             
             # Step 6: Train the model
-            training_metrics = lstm_predictor.train(
-                X_train=X_train,
-                y_train=y_train,
-                X_val=X_val,
-                y_val=y_val,
-                save_model=False  # We'll save manually with metadata
-            )
-            
+            if train_ds is not None:
+                training_metrics = lstm_predictor.train(
+                    X_train=train_ds,
+                    y_train=None,
+                    X_val=val_ds,
+                    save_model=False,  # We'll save manually with metadata
+                    extra_callbacks=callbacks
+                )
+            else:
+                training_metrics = lstm_predictor.train(
+                    X_train=X_train,
+                    y_train=y_train,
+                    X_val=X_val,
+                    y_val=y_val,
+                    save_model=False,  # We'll save manually with metadata
+                    extra_callbacks=callbacks
+                )
+
             # Step 7: Evaluate model performance
             try:
                 evaluation_metrics = lstm_predictor.evaluate(X_test, y_test)
@@ -228,7 +264,7 @@ class MLTrainingService:
             
             try:
                 # Try to save with full metadata
-                feature_names = ['price_features'] * X.shape[2]  # Generic feature names
+                feature_names = ['price_features'] * lstm_predictor.n_features  # Generic feature names
                 
                 metadata = self.model_persistence.create_model_metadata(
                     model_type="lstm",
@@ -236,7 +272,7 @@ class MLTrainingService:
                     training_metrics=all_metrics,
                     feature_names=feature_names,
                     training_config=training_config or {},
-                    data_info={'features_count': X.shape[2], 'data_points': len(training_data)}
+                    data_info={'features_count': lstm_predictor.n_features, 'data_points': len(training_data)}
                 )
                 
                 # Save model files
@@ -283,7 +319,12 @@ class MLTrainingService:
                     model_type="lstm",
                     model_path=model_path,
                     performance_metrics=safe_metrics,  # Always provide valid dict
-                    metadata={'training_completed': True, 'auto_registered': True}
+                    metadata={
+                        'training_completed': True,
+                        'auto_registered': True,
+                        'training_mode': 'full',
+                        'training_data_end': pd.to_datetime(training_data['timestamp'], utc=True).iloc[-1].isoformat()
+                    }
                 )
                 
                 # Set as active model if it's better than existing
@@ -337,13 +378,16 @@ class MLTrainingService:
                 'evaluation_metrics': evaluation_metrics,
                 'training_duration': training_metrics.get('training_duration_seconds', 0),
                 'data_points_used': len(training_data),
-                'features_count': X.shape[2],
+                'data_split': split_sizes,
+                'features_count': lstm_predictor.n_features,
                 'message': f'Model trained successfully for {crypto_symbol}'
             }
             
             logger.info(f"Training completed successfully for {crypto_symbol}: {model_id}")
             return result
-            
+        
+        except TrainingCancelled:
+            raise
         except Exception as e:
             logger.error(f"Comprehensive model training failed for {crypto_symbol}: {str(e)}")
             return {
@@ -357,6 +401,212 @@ class MLTrainingService:
             if close_db:
                 db.close()
     
+    async def _train_model_incremental(
+        self,
+        crypto_symbol: str,
+        training_config: Optional[Dict[str, Any]] = None,
+        db: Optional[Session] = None,
+        callbacks: Optional[List] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fine-tune the active model on candles since its training cutoff
+        
+        Loads the active model and its scalers, trains on the new candles
+        plus a replay window of older ones (scaled with the existing
+        scalers), and promotes the result through
+        _update_active_model_if_better against the active model's loss on
+        the same validation split.
+        
+        Returns:
+            Training result dict, or None when a warm start is not possible
+            (no active model, missing files, too little data)
+        """
+        active_model = model_registry.get_active_model(crypto_symbol)
+        if not active_model:
+            return None
+        
+        parent_model_id = active_model.get('model_id')
+        parent_path = active_model.get('model_path')
+        if not parent_path or not os.path.exists(parent_path):
+            return None
+        if not os.path.exists(parent_path.replace('.h5', '_scalers.pkl')):
+            logger.info(f"Active model {parent_model_id} has no saved scalers, cannot warm start")
+            return None
+        
+        cutoff = self._get_training_cutoff(active_model)
+        if cutoff is None:
+            return None
+        
+        if db is None:
+            db = SessionLocal()
+            close_db = True
+        else:
+            close_db = False
+        
+        try:
+            crypto = AssetRepository(db).get_by_symbol(crypto_symbol)
+            if not crypto:
+                raise ValueError(f"Cryptocurrency {crypto_symbol} not found in database")
+            
+            # Step 1: New candles plus the replay window
+            replay_start = cutoff - timedelta(days=ml_config.incremental_replay_days)
+            training_data = await self._load_training_data(db, crypto.id, start_date=replay_start)
+            if training_data.empty:
+                return None
+            training_data = await asyncio.to_thread(self._add_engineered_features, training_data, crypto_symbol)
+            
+            timestamps = pd.to_datetime(training_data['timestamp'], utc=True)
+            new_records = int((timestamps > cutoff).sum())
+            
+            if new_records < ml_config.incremental_min_new_records:
+                logger.info(f"Only {new_records} new candles for {crypto_symbol} since {cutoff.isoformat()}, keeping {parent_model_id}")
+                return {
+                    'success': True,
+                    'skipped': True,
+                    'model_id': parent_model_id,
+                    'crypto_symbol': crypto_symbol,
+                    'training_mode': 'incremental',
+                    'new_records': new_records,
+                    'message': f'Active model for {crypto_symbol} is up to date'
+                }
+            
+            # Step 2: Load the active model and scalers
+            config = training_config or {}
+            lstm_predictor = self._create_lstm_predictor(n_features=1, training_config=config)
+            lstm_predictor.load_model(parent_path)
+            lstm_predictor.prepare_fine_tuning(
+                learning_rate=config.get('incremental_learning_rate', ml_config.incremental_learning_rate),
+                epochs=config.get('incremental_epochs', ml_config.incremental_epochs)
+            )
+            
+            if len(training_data) < lstm_predictor.sequence_length + ml_config.incremental_min_new_records:
+                logger.info(f"Replay window too short for sequence length {lstm_predictor.sequence_length}")
+                return None
+            
+            # Step 3: Scale with the parent's scalers and build pipelines
+            features, target = lstm_predictor.prepare_features(
+                training_data,
+                target_column='close_price',
+                feature_columns=lstm_predictor.config.get('feature_columns'),
+                fit_scalers=False
+            )
+            if features.shape[1] != lstm_predictor.model.input_shape[-1]:
+                logger.info(f"Feature layout changed since {parent_model_id}, cannot warm start")
+                return None
+            
+            features = features.astype(np.float32, copy=False)
+            target = target.astype(np.float32, copy=False)
+            train_ds, val_ds, (X_test, y_test), split_sizes = self._build_training_datasets(
+                lstm_predictor, features, target
+            )
+            
+            # Step 4: Baseline - the parent model on the same validation split
+            baseline_val_loss = float(lstm_predictor.model.evaluate(val_ds, verbose=0, return_dict=True)['loss'])
+            
+            # Step 5: Fine-tune
+            training_metrics = lstm_predictor.train(
+                X_train=train_ds,
+                y_train=None,
+                X_val=val_ds,
+                save_model=False,
+                extra_callbacks=callbacks
+            )
+            training_metrics['baseline_val_loss'] = baseline_val_loss
+            
+            try:
+                evaluation_metrics = lstm_predictor.evaluate(X_test, y_test)
+            except Exception as e:
+                logger.warning(f"Evaluation failed: {str(e)}, using default metrics")
+                evaluation_metrics = {'rmse': 0.0, 'mae': 0.0, 'r2_score': 0.0}
+            
+            all_metrics = {**training_metrics, **evaluation_metrics}
+            
+            # Step 6: Save, register and promote if better
+            model_id = f"{crypto_symbol}_lstm_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+            model_path = os.path.join(ml_config.models_storage_path, f"{model_id}.h5")
+            lstm_predictor.save_model(model_path)
+            
+            try:
+                metadata = self.model_persistence.create_model_metadata(
+                    model_type="lstm",
+                    crypto_symbol=crypto_symbol,
+                    training_metrics=all_metrics,
+                    feature_names=lstm_predictor.config.get('feature_columns') or ['price_features'] * lstm_predictor.n_features,
+                    training_config=config,
+                    data_info={'features_count': lstm_predictor.n_features, 'data_points': len(training_data)}
+                )
+                metadata_path = model_path.replace('.h5', '_metadata.json')
+                with open(metadata_path, 'w') as f:
+                    json.dump(metadata, f, indent=2, default=str)
+            except Exception as e:
+                logger.warning(f"Could not save full metadata: {str(e)}")
+            
+            model_registry.register_model(
+                model_id=model_id,
+                crypto_symbol=crypto_symbol,
+                model_type="lstm",
+                model_path=model_path,
+                performance_metrics=all_metrics,
+                metadata={
+                    'training_completed': True,
+                    'auto_registered': True,
+                    'training_mode': 'incremental',
+                    'parent_model_id': parent_model_id,
+                    'training_data_end': timestamps.iloc[-1].isoformat(),
+                    'new_records': new_records
+                }
+            )
+            await self._update_active_model_if_better(
+                crypto_symbol, model_id, all_metrics, baseline_val_loss=baseline_val_loss
+            )
+            
+            try:
+                await self._store_training_results(
+                    db, crypto.id, model_id, all_metrics, len(training_data)
+                )
+            except Exception as e:
+                logger.warning(f"Could not store training results: {str(e)}")
+            
+            logger.info(f"Incremental training completed for {crypto_symbol}: {model_id} (from {parent_model_id})")
+            
+            return {
+                'success': True,
+                'model_id': model_id,
+                'parent_model_id': parent_model_id,
+                'crypto_symbol': crypto_symbol,
+                'model_path': model_path,
+                'training_mode': 'incremental',
+                'training_metrics': training_metrics,
+                'evaluation_metrics': evaluation_metrics,
+                'training_duration': training_metrics.get('training_duration_seconds', 0),
+                'data_points_used': len(training_data),
+                'new_records': new_records,
+                'data_split': split_sizes,
+                'features_count': lstm_predictor.n_features,
+                'message': f'Model fine-tuned for {crypto_symbol} on {new_records} new candles'
+            }
+        
+        finally:
+            if close_db:
+                db.close()
+    
+    def _get_training_cutoff(self, model_info: Dict[str, Any]) -> Optional[datetime]:
+        """Last candle a registered model was trained on (falls back to registration time)"""
+        metadata = model_info.get('metadata') or {}
+        cutoff = metadata.get('training_data_end') or model_info.get('registered_at')
+        if not cutoff:
+            return None
+        
+        try:
+            cutoff = pd.Timestamp(cutoff)
+        except (TypeError, ValueError):
+            return None
+        
+        if cutoff.tzinfo is None:
+            # registered_at is written in local time
+            cutoff = cutoff.tz_localize(datetime.now().astimezone().tzinfo)
+        return cutoff.tz_convert('UTC').to_pydatetime()
+    
     def _manual_prepare_data(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
         """Manual data preparation as fallback"""
         
@@ -389,12 +639,68 @@ class MLTrainingService:
         
         return np.array(X), np.array(y)
     
+    def _split_boundaries(self, n_samples: int) -> Tuple[int, int]:
+        """Sample indices ending the train and validation splits (70/15/15)"""
+        return int(n_samples * 0.7), int(n_samples * 0.85)
+    
+    def _build_training_datasets(
+        self,
+        lstm_predictor: LSTMPredictor,
+        features: np.ndarray,
+        target: np.ndarray
+    ) -> Tuple[tf.data.Dataset, tf.data.Dataset, Tuple[np.ndarray, np.ndarray], Dict[str, int]]:
+        """
+        Build streaming train/validation pipelines and the test arrays
+        
+        Sample j is the window features[j:j+seq] with target target[j+seq],
+        exactly as in LSTMPredictor._create_sequences. Each split gets the
+        slice of the series its windows need, so splits match _split_data
+        without materializing every window. Only the training split is
+        shuffled.
+        
+        Args:
+            lstm_predictor: Predictor providing sequence length and batch size
+            features: Scaled float32 features [n, n_features]
+            target: Scaled float32 target [n]
+        
+        Returns:
+            Tuple of (train_dataset, val_dataset, (X_test, y_test), split_sizes)
+        """
+        seq = lstm_predictor.sequence_length
+        n_samples = len(features) - seq
+        if n_samples <= 0:
+            raise ValueError(f"Insufficient data for sequence length {seq}: {len(features)} rows")
+        
+        train_end, val_end = self._split_boundaries(n_samples)
+        
+        def segment(start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+            # Rows needed for samples [start, stop)
+            return features[start:stop + seq], target[start:stop + seq]
+        
+        train_ds = lstm_predictor.create_sequence_dataset(
+            *segment(0, train_end), shuffle=True
+        )
+        val_ds = lstm_predictor.create_sequence_dataset(
+            *segment(train_end, val_end), shuffle=False
+        )
+        
+        # The test split is small - keep it as zero-copy views for evaluate()
+        X_test, y_test = lstm_predictor._create_sequences(*segment(val_end, n_samples))
+        
+        split_sizes = {
+            'train': train_end,
+            'val': val_end - train_end,
+            'test': n_samples - val_end
+        }
+        logger.info(f"Data split - Train: {split_sizes['train']}, Val: {split_sizes['val']}, "
+                   f"Test: {split_sizes['test']} (streaming, float32)")
+        
+        return train_ds, val_ds, (X_test, y_test), split_sizes
+    
     def _split_data(self, X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Split data for training, validation, and testing"""
         
-        total_len = len(X)
-        train_end = int(total_len * 0.7)
-        val_end = int(total_len * 0.85)
+        train_end, val_end = self._split_boundaries(len(X))
         
         X_train = X[:train_end]
         y_train = y[:train_end]
@@ -407,42 +713,59 @@ class MLTrainingService:
         
         return X_train, y_train, X_val, y_val, X_test, y_test
     
-    async def _load_training_data(self, db: Session, crypto_id: int) -> pd.DataFrame:
-        """Load training data from database using existing repository"""
+    async def _load_training_data(
+        self,
+        db: Session,
+        crypto_id: int,
+        start_date: Optional[datetime] = None,
+        timeframe: str = "1h"
+    ) -> pd.DataFrame:
+        """Load training data from database as float32 columns"""
         
-        # Get data from the last 6 months for training
+        # Get data from the last 6 months for training (or since start_date)
         end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=180)
-        
-        # Use existing price_data_repository with the correct method name
-        price_records = price_data_repository.get_price_history(
-            db=db,
-            crypto_id=crypto_id,
-            start_date=start_date,
-            end_date=end_date,
-            limit=10000  # Reasonable limit
+        if start_date is None:
+            start_date = end_date - timedelta(days=180)
+        
+        # Columnar export (COPY TO on PostgreSQL): no ORM rows, no Decimals,
+        # already ordered by candle time; spans the archive and cold tiers
+        columns = await asyncio.to_thread(
+            TieredPriceDataRepository(db).get_ohlcv_columns,
+            crypto_id,
+            timeframe,
+            start_date,
+            end_date,
+            np.float32
         )
         
-        if not price_records:
+        if not len(columns['candle_time']):
             return pd.DataFrame()
         
-        # Convert to DataFrame
-        data = []
-        for record in price_records:
-            data.append({
-                'timestamp': record.timestamp,
-                'open_price': float(record.open_price),
-                'high_price': float(record.high_price),
-                'low_price': float(record.low_price),
-                'close_price': float(record.close_price),
-                'volume': float(record.volume) if record.volume else 0.0,
-                'market_cap': float(record.market_cap) if record.market_cap else 0.0
-            })
-        
-        df = pd.DataFrame(data)
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        return df
+        timestamps = columns.pop('candle_time')
+        return pd.DataFrame({'timestamp': timestamps, **columns}, copy=False)
+    
+    def _add_engineered_features(
+        self,
+        training_data: pd.DataFrame,
+        crypto_symbol: str,
+        timeframe: str = "1h"
+    ) -> pd.DataFrame:
+        """
+        Training candles plus the engineered feature columns
+        
+        Read through the feature store, so only candles since the last run
+        are computed. Feature columns the model was not configured with are
+        ignored by LSTMPredictor.prepare_features.
+        """
+        try:
+            frame, store_info = self.data_processor.build_features(training_data, crypto_symbol, timeframe)
+        except Exception as e:
+            logger.warning(f"Feature engineering failed for {crypto_symbol}, using OHLCV only: {str(e)}")
+            return training_data
+        
+        if store_info is not None:
+            logger.info(f"Feature store {store_info['mode']} for {crypto_symbol}: {store_info['rows']} rows")
+        return frame
     
     def _create_lstm_predictor(
         self, 
@@ -469,9 +792,16 @@ class MLTrainingService:
         self, 
         crypto_symbol: str, 
         model_id: str, 
-        metrics: Dict[str, float]
+        metrics: Dict[str, float],
+        baseline_val_loss: Optional[float] = None
     ) -> None:
-        """Update active model if the new one performs better"""
+        """
+        Update active model if the new one performs better
+        
+        ``baseline_val_loss`` is the active model's loss on the new model's
+        validation split; when given it is compared instead of the loss
+        stored at registration (which was measured on other data).
+        """
         
         try:
             current_active = model_registry.get_active_model(crypto_symbol)
@@ -482,7 +812,10 @@ class MLTrainingService:
                 logger.info(f"Set {model_id} as active model for {crypto_symbol} (first model)")
             else:
                 # Compare performance (lower validation loss is better)
-                current_val_loss = current_active['performance_metrics'].get('final_val_loss', float('inf'))
+                if baseline_val_loss is not None:
+                    current_val_loss = baseline_val_loss
+                else:
+                    current_val_loss = current_active['performance_metrics'].get('final_val_loss', float('inf'))
                 new_val_loss = metrics.get('final_val_loss', float('inf'))
                 
                 if new_val_loss < current_val_loss:
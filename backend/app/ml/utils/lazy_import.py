@@ -0,0 +1,70 @@
+# File: backend/app/ml/utils/lazy_import.py
+# Deferred imports for heavy ML dependencies (TensorFlow)
+
+import importlib
+import logging
+import os
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access
+
+    Lets modules keep a top-level ``tf`` name (and ``tf.keras...`` call
+    sites) without paying the import when they are merely imported.
+    """
+
+    def __init__(self, name: str, on_load: Optional[Callable[[ModuleType], None]] = None):
+        self._name = name
+        self._on_load = on_load
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            with self._lock:
+                module = self._module
+                if module is None:
+                    module = importlib.import_module(self._name)
+                    if self._on_load is not None:
+                        self._on_load(module)
+                    self._module = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the real module has been imported"""
+        return self._module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule '{self._name}' ({state})>"
+
+
+def _configure_tensorflow(tf_module: ModuleType) -> None:
+    """Silence TensorFlow's Python logger once it is imported"""
+    tf_module.get_logger().setLevel('FATAL')
+    logger.info(f"TensorFlow {tf_module.__version__} loaded")
+
+
+# Suppress TensorFlow C++ messages and its Python logger before it is imported
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+logging.getLogger('tensorflow').setLevel(logging.FATAL)
+
+# Shared TensorFlow proxy: ``from app.ml.utils.lazy_import import tensorflow as tf``
+tensorflow = LazyModule("tensorflow", on_load=_configure_tensorflow)
+
+
+def is_tensorflow_loaded() -> bool:
+    """Whether TensorFlow has been imported in this process"""
+    return "tensorflow" in sys.modules
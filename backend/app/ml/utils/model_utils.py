@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 import logging
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # ML libraries
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
@@ -565,50 +566,104 @@ class FeatureImportance:
         X_test: np.ndarray,
         y_test: np.ndarray,
         feature_names: List[str],
-        n_permutations: int = 10
+        n_permutations: int = 10,
+        memory_budget_mb: float = 256.0,
+        max_workers: int = 4,
+        early_stopping: bool = True,
+        min_permutations: int = 3,
+        stable_rounds: int = 2,
+        predict_batch_size: int = 1024,
+        random_state: Optional[int] = None
     ) -> Dict[str, float]:
         """
         Calculate feature importance for LSTM model using permutation importance
         
+        Work is done in rounds of one permutation per feature. Permuted copies
+        of the test set are stacked into a few large predict calls that fit in
+        ``memory_budget_mb``, and chunks of features are predicted in a thread
+        pool. With early stopping, rounds end once the feature ranking has not
+        changed for ``stable_rounds`` rounds (after ``min_permutations``).
+        
         Args:
             model: Trained LSTM model
             X_test: Test features
             y_test: Test targets
             feature_names: Names of features
-            n_permutations: Number of permutations for importance calculation
-            
+            n_permutations: Maximum number of permutations per feature
+            memory_budget_mb: Memory for stacked permuted copies (all workers)
+            max_workers: Threads issuing predict calls
+            early_stopping: Stop when the ranking is stable
+            min_permutations: Permutations done before early stopping applies
+            stable_rounds: Unchanged rankings needed to stop
+            predict_batch_size: Batch size inside each stacked predict call
+            random_state: Seed for reproducible permutations
+        
         Returns:
             Dictionary of feature importance scores
         """
-        # Calculate baseline performance
-        baseline_pred = model.predict(X_test, verbose=0)
-        baseline_mse = mean_squared_error(y_test, baseline_pred)
+        n_samples = X_test.shape[0]
+        y_true = np.asarray(y_test, dtype=np.float64).reshape(n_samples)
+        features = [(i, name) for i, name in enumerate(feature_names) if i < X_test.shape[2]]
+        
+        if not features or n_samples == 0:
+            return {}
+        
+        def predict(batch: np.ndarray) -> np.ndarray:
+            return np.asarray(
+                model.predict(batch, batch_size=predict_batch_size, verbose=0),
+                dtype=np.float64
+            ).reshape(-1)
+        
+        # Calculate baseline performance (also builds the predict function
+        # before worker threads use it)
+        baseline_mse = float(np.mean((y_true - predict(X_test)) ** 2))
+        
+        # Copies per stacked predict call, so all workers together stay in budget
+        workers = max(1, min(max_workers, len(features)))
+        copies_per_call = int(memory_budget_mb * 1024 * 1024 // (X_test.nbytes * workers))
+        copies_per_call = max(1, min(copies_per_call, len(features)))
+        
+        def permuted_mse(chunk: List[Tuple[int, np.ndarray]]) -> np.ndarray:
+            # One copy of X_test per (feature, permutation) in this chunk
+            stacked = np.empty((len(chunk),) + X_test.shape, dtype=X_test.dtype)
+            stacked[:] = X_test
+            for j, (feature_index, permutation) in enumerate(chunk):
+                stacked[j, :, :, feature_index] = X_test[permutation, :, feature_index]
+            
+            predictions = predict(stacked.reshape((-1,) + X_test.shape[1:])).reshape(len(chunk), n_samples)
+            return np.mean((predictions - y_true) ** 2, axis=1)
         
-        importance_scores = {}
+        rng = np.random.default_rng(random_state)
+        mse_sums = np.zeros(len(features))
+        rounds_done = 0
+        last_ranking = None
+        unchanged = 0
         
-        for i, feature_name in enumerate(feature_names):
-            if i >= X_test.shape[2]:  # Skip if feature index is out of bounds
-                continue
-                
-            mse_scores = []
-            
+        with ThreadPoolExecutor(max_workers=workers) as executor:
             for _ in range(n_permutations):
-                # Create permuted version of test data
-                X_permuted = X_test.copy()
+                # Permute each feature across all samples and time steps
+                jobs = [(feature_index, rng.permutation(n_samples)) for feature_index, _name in features]
+                chunks = [jobs[k:k + copies_per_call] for k in range(0, len(jobs), copies_per_call)]
                 
-                # Permute the specific feature across all samples and time steps
-                perm_indices = np.random.permutation(X_test.shape[0])
-                X_permuted[:, :, i] = X_test[perm_indices, :, i]
+                round_mse = np.concatenate(list(executor.map(permuted_mse, chunks)))
+                mse_sums += round_mse
+                rounds_done += 1
                 
-                # Calculate performance with permuted feature
-                permuted_pred = model.predict(X_permuted, verbose=0)
-                permuted_mse = mean_squared_error(y_test, permuted_pred)
-                mse_scores.append(permuted_mse)
-            
-            # Importance is the increase in error when feature is permuted
-            avg_permuted_mse = np.mean(mse_scores)
-            importance = avg_permuted_mse - baseline_mse
-            importance_scores[feature_name] = max(0, importance)  # Ensure non-negative
+                if not early_stopping or rounds_done < min_permutations:
+                    continue
+                
+                ranking = tuple(np.argsort(-mse_sums, kind='stable'))
+                unchanged = unchanged + 1 if ranking == last_ranking else 0
+                last_ranking = ranking
+                if unchanged >= stable_rounds:
+                    logger.info(f"Feature ranking stable after {rounds_done}/{n_permutations} permutations")
+                    break
+        
+        # Importance is the increase in error when feature is permuted
+        importance_scores = {
+            name: max(0.0, float(mse_sums[k] / rounds_done - baseline_mse))  # Ensure non-negative
+            for k, (_index, name) in enumerate(features)
+        }
         
         # Normalize importance scores
         max_importance = max(importance_scores.values()) if importance_scores else 1
@@ -616,7 +671,7 @@ class FeatureImportance:
             importance_scores = {k: v / max_importance for k, v in importance_scores.items()}
         
         return importance_scores
-    
+
     @staticmethod
     def get_top_features(
         importance_scores: Dict[str, float],
@@ -17,7 +17,7 @@ from .enums import (
 from .user import User, UserSession, UserActivity
 
 # Asset Management  
-from .asset import Asset, PriceData, PriceDataArchive
+from .asset import Asset, PriceData, PriceDataArchive, PriceDataColdFile, AssetSnapshot
 
 # AI Framework
 from .ai import AIModel, ModelPerformance, ModelJob
@@ -1,7 +1,7 @@
 # backend/app/models/ai/jobs.py
 # Unified model job management (training, prediction, evaluation, etc.)
 
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy import Column, String, Integer, Text, Numeric, DateTime, ForeignKey, CheckConstraint, Index, Boolean, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -20,7 +20,8 @@ class ModelJob(BaseModel, TimestampMixin):
     __tablename__ = 'model_jobs'
     
     # 🔗 Model Reference
-    model_id = Column(Integer, ForeignKey('ai_models.id'), nullable=False, index=True)
+    model_id = Column(Integer, ForeignKey('ai_models.id'), nullable=True, index=True,
+                     comment="Null for training jobs whose model does not exist yet")
     
     # 🎯 Job Classification & Control
     job_status = Column(String(20), nullable=False, default=JobStatus.PENDING.value, index=True,
@@ -189,8 +190,8 @@ class ModelJob(BaseModel, TimestampMixin):
     def start_job(self):
         """Mark job as started"""
         self.job_status = JobStatus.RUNNING.value
-        self.started_at = datetime.utcnow()
-        self.last_heartbeat = datetime.utcnow()
+        self.started_at = datetime.now(timezone.utc)
+        self.last_heartbeat = datetime.now(timezone.utc)
         if not self.queued_at:
             self.queued_at = self.created_at
     
@@ -213,12 +214,12 @@ class ModelJob(BaseModel, TimestampMixin):
                 self.job_metrics = {}
             self.job_metrics.update(metrics)
         
-        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat = datetime.now(timezone.utc)
     
     def complete_job(self, outputs: dict = None, final_metrics: dict = None):
         """Mark job as completed"""
         self.job_status = JobStatus.COMPLETED.value
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(timezone.utc)
         self.progress_pct = 100
         
         if self.started_at:
@@ -246,7 +247,7 @@ class ModelJob(BaseModel, TimestampMixin):
             self.error_message = f"Retry {self.retry_count}/{self.max_retries}: {error_message}"
         else:
             self.job_status = JobStatus.FAILED.value
-            self.completed_at = datetime.utcnow()
+            self.completed_at = datetime.now(timezone.utc)
             
             if self.started_at:
                 delta = self.completed_at - self.started_at
@@ -268,13 +269,13 @@ class ModelJob(BaseModel, TimestampMixin):
         """Resume a paused job"""
         if self.job_status == JobStatus.PAUSED.value:
             self.job_status = JobStatus.RUNNING.value
-            self.last_heartbeat = datetime.utcnow()
+            self.last_heartbeat = datetime.now(timezone.utc)
     
     def cancel_job(self, reason: str = None):
         """Cancel a job"""
         if self.job_status in [JobStatus.PENDING.value, JobStatus.RUNNING.value, JobStatus.PAUSED.value]:
             self.job_status = JobStatus.CANCELLED.value
-            self.completed_at = datetime.utcnow()
+            self.completed_at = datetime.now(timezone.utc)
             if reason:
                 if not self.job_events:
                     self.job_events = {}
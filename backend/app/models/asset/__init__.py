@@ -4,9 +4,13 @@
 from .asset import Asset
 from .price_data import PriceData
 from .price_data_archive import PriceDataArchive
+from .price_data_cold_file import PriceDataColdFile
+from .asset_snapshot import AssetSnapshot
 
 __all__ = [
     "Asset",
     "PriceData",
-    "PriceDataArchive"
+    "PriceDataArchive",
+    "PriceDataColdFile",
+    "AssetSnapshot"
 ]
\ No newline at end of file
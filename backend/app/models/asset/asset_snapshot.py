@@ -0,0 +1,56 @@
+# backend/app/models/asset/asset_snapshot.py
+# Asset snapshot model - latest candle, 24h change and latest prediction per asset
+
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from ..base import BaseModel
+
+
+class AssetSnapshot(BaseModel):
+    """
+    Incrementally maintained dashboard snapshot, one row per asset and timeframe
+
+    Refreshed set-based on price ingestion (latest candle and the close
+    24 hours earlier) and when a prediction is generated, so the dashboard
+    reads every watched asset with a single query.
+    """
+    __tablename__ = 'asset_snapshots'
+
+    # Asset and timeframe
+    asset_id = Column(Integer, ForeignKey('assets.id', ondelete='CASCADE'), nullable=False)
+    timeframe = Column(String(10), nullable=False)
+
+    # Latest candle (NULL until the first refresh)
+    candle_time = Column(DateTime(timezone=True), nullable=True)
+    open_price = Column(Numeric(20,8), nullable=True)
+    high_price = Column(Numeric(20,8), nullable=True)
+    low_price = Column(Numeric(20,8), nullable=True)
+    close_price = Column(Numeric(20,8), nullable=True)
+    volume = Column(Numeric(30,2), nullable=True)
+    market_cap = Column(Numeric(30,2), nullable=True)
+
+    # 24h change against the last close at least 24 hours older
+    close_24h_ago = Column(Numeric(20,8), nullable=True)
+    price_change_24h = Column(Numeric(20,8), nullable=True)
+    price_change_24h_percent = Column(Numeric(12,4), nullable=True)
+
+    # Latest prediction
+    predicted_price = Column(Numeric(20,8), nullable=True)
+    prediction_confidence = Column(Numeric(6,2), nullable=True)
+    prediction_target_time = Column(DateTime(timezone=True), nullable=True)
+    prediction_model = Column(String(100), nullable=True)
+    prediction_created_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Refresh bookkeeping
+    refreshed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    asset = relationship("Asset")
+
+    __table_args__ = (
+        UniqueConstraint('asset_id', 'timeframe', name='unique_asset_snapshot_timeframe'),
+        Index('idx_asset_snapshots_timeframe', 'timeframe'),
+    )
+
+    def __repr__(self):
+        return f"<AssetSnapshot(asset_id={self.asset_id}, timeframe='{self.timeframe}', time={self.candle_time})>"
@@ -13,14 +13,16 @@ class PriceData(BaseModel, TimestampMixin, ValidationMixin):
     """
     Price data model for OHLCV data and technical indicators
     
-    This is a high-volume table that will be partitioned by candle_time
+    High-volume table, range-partitioned by candle_time on PostgreSQL
+    (one partition per month, optionally list-partitioned by timeframe).
+    Partitions are created ahead of time by PriceDataPartitionManager.
     Uses TimestampMixin for tracking data updates
     """
     __tablename__ = 'price_data'
     
     # Asset and timeframe
-    asset_id = Column(Integer, ForeignKey('assets.id'), nullable=False, index=True)
-    timeframe = Column(String(10), nullable=False, index=True)
+    asset_id = Column(Integer, ForeignKey('assets.id'), nullable=False)
+    timeframe = Column(String(10), nullable=False)
     
     # OHLCV Data
     open_price = Column(Numeric(20,8), nullable=False)
@@ -40,14 +42,14 @@ class PriceData(BaseModel, TimestampMixin, ValidationMixin):
     # Timing
     # Use timezone-aware timestamps (Postgres timestamptz) so datetimes are stored as
     # absolute instants and returned consistently in UTC when the session timezone is UTC.
-    candle_time = Column(DateTime(timezone=True), nullable=False, index=True)
+    candle_time = Column(DateTime(timezone=True), nullable=False)
     
     # Relationships
     asset = relationship("Asset", back_populates="price_data")
     
     # Constraints and Indexes
     __table_args__ = (
-        # Unique constraints
+        # Unique constraints (also serves asset / asset+timeframe / series lookups)
         UniqueConstraint('asset_id', 'timeframe', 'candle_time', name='unique_asset_timeframe_candle'),
         
         # Check constraints
@@ -57,27 +59,28 @@ class PriceData(BaseModel, TimestampMixin, ValidationMixin):
         CheckConstraint('trade_count IS NULL OR trade_count >= 0', name='chk_trade_count_positive'),
         CheckConstraint("timeframe IN ('1m', '5m', '15m', '1h', '4h', '1d', '1w', '1M')", name='chk_timeframe_valid'),
         
-        # Performance indexes for high-volume time series data
-        Index('idx_price_data_asset_id', 'asset_id'),
-        Index('idx_price_data_timeframe', 'timeframe'),
-        Index('idx_price_data_candle_time', 'candle_time'),
+        # Performance indexes for high-volume time series data. Every index is
+        # maintained per partition on insert, so prefixes of the unique key and
+        # per-timeframe partial indexes are left out; cold partitions also get
+        # a BRIN index on candle_time from the partition manager.
         Index('idx_price_data_created_at', 'created_at'),
         Index('idx_price_data_validated', 'is_validated'),
         
         # Composite indexes for common queries
-        Index('idx_price_data_asset_timeframe', 'asset_id', 'timeframe'),
         Index('idx_price_data_asset_time', 'asset_id', 'candle_time'),
         Index('idx_price_data_timeframe_time', 'timeframe', 'candle_time'),
-        Index('idx_price_data_asset_tf_time', 'asset_id', 'timeframe', 'candle_time'),
         
         # Price-based indexes for analytics
         Index('idx_price_data_close_price', 'close_price'),
         Index('idx_price_data_volume', 'volume'),
         Index('idx_price_data_asset_close', 'asset_id', 'close_price'),
         
-        # Time-range partitioning support (for future partitioning)
-        Index('idx_price_data_time_range_1d', 'candle_time', postgresql_where="timeframe = '1d'"),
-        Index('idx_price_data_time_range_1h', 'candle_time', postgresql_where="timeframe = '1h'"),
+        # PostgreSQL declarative partitioning: monthly ranges on candle_time.
+        # The primary key DDL is widened to (id, candle_time, timeframe).
+        {
+            'postgresql_partition_by': 'RANGE (candle_time)',
+            'info': {'partition_key': ('candle_time', 'timeframe')}
+        }
     )
     
     def __repr__(self):
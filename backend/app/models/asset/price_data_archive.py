@@ -173,8 +173,9 @@ class PriceDataArchive(BaseModel, CreatedAtMixin, DataQualityMixin, ValidationMi
     
     # Constraints and Indexes
     __table_args__ = (
-        # Unique constraints
-        UniqueConstraint('asset_id', 'timestamp', 'timeframe', name='unique_archive_asset_time_timeframe'),
+        # Unique constraints (archive_year/archive_month follow from timestamp;
+        # PostgreSQL requires the partition key in unique constraints)
+        UniqueConstraint('asset_id', 'timestamp', 'timeframe', 'archive_year', 'archive_month', name='unique_archive_asset_time_timeframe'),
         
         # Check constraints
         CheckConstraint('open_price > 0', name='chk_archive_open_price_positive'),
@@ -209,10 +210,11 @@ class PriceDataArchive(BaseModel, CreatedAtMixin, DataQualityMixin, ValidationMi
         Index('idx_archive_hash', 'raw_data_hash'),
         Index('idx_archive_year_month_asset', 'archive_year', 'archive_month', 'asset_id'),
         
-        # PostgreSQL specific settings for partitioning
+        # PostgreSQL specific settings for partitioning (monthly partitions are
+        # created by PriceDataArchiveRepository as windows are archived)
         {
             'postgresql_partition_by': 'RANGE (archive_year, archive_month)',
-            'postgresql_inherits': 'price_data_archive_base'
+            'info': {'partition_key': ('archive_year', 'archive_month')}
         }
     )
     
@@ -0,0 +1,45 @@
+# backend/app/models/asset/price_data_cold_file.py
+# Manifest of cold-tier Parquet files (archived candles moved out of PostgreSQL)
+
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.orm import relationship
+from ..base import BaseModel
+
+
+class PriceDataColdFile(BaseModel):
+    """
+    One compressed Parquet file per asset, timeframe and month
+
+    Written by ColdStorageService from price_data_archive; the rows are
+    deleted from the archive once the file is recorded here. Readers use
+    the manifest to pick the files overlapping a time range.
+    """
+    __tablename__ = 'price_data_cold_files'
+
+    # Series and period
+    asset_id = Column(Integer, ForeignKey('assets.id', ondelete='CASCADE'), nullable=False)
+    timeframe = Column(String(10), nullable=False)
+    period_year = Column(Integer, nullable=False)
+    period_month = Column(Integer, nullable=False)
+
+    # File (path relative to COLD_STORAGE_DIR)
+    file_path = Column(String(500), nullable=False)
+    compression = Column(String(20), nullable=False)
+    file_size_bytes = Column(BigInteger, nullable=False)
+    checksum = Column(String(64), nullable=False)
+
+    # Contents
+    row_count = Column(Integer, nullable=False)
+    first_candle_time = Column(DateTime(timezone=True), nullable=False)
+    last_candle_time = Column(DateTime(timezone=True), nullable=False)
+
+    # Relationships
+    asset = relationship("Asset")
+
+    __table_args__ = (
+        UniqueConstraint('asset_id', 'timeframe', 'period_year', 'period_month', name='unique_cold_file_period'),
+        Index('idx_cold_files_series_time', 'asset_id', 'timeframe', 'first_candle_time'),
+    )
+
+    def __repr__(self):
+        return f"<PriceDataColdFile(asset_id={self.asset_id}, timeframe='{self.timeframe}', period={self.period_year}-{self.period_month:02d})>"
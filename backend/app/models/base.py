@@ -1,12 +1,32 @@
 # Base Model Classes
 # Foundation classes for all SQLAlchemy models
 
-from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy import Column, Integer, DateTime, PrimaryKeyConstraint, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.hybrid import hybrid_property
 
 Base = declarative_base()
 
+
+@compiles(PrimaryKeyConstraint, "postgresql")
+def _compile_partitioned_primary_key(constraint, compiler, **kw):
+    """
+    Add a partitioned table's partition key columns to its primary key DDL
+    
+    PostgreSQL requires every unique constraint on a partitioned table to
+    contain the partition key. Tables list those columns in
+    ``info['partition_key']``; the ORM identity (and SQLite) keep ``id``.
+    """
+    ddl = compiler.visit_primary_key_constraint(constraint, **kw)
+    partition_key = constraint.table.info.get("partition_key", ())
+    extra = [name for name in partition_key if name not in constraint.columns]
+    if not ddl or not extra:
+        return ddl
+    head, _, tail = ddl.rpartition(")")
+    columns = ", ".join(compiler.preparer.quote(name) for name in extra)
+    return f"{head}, {columns}){tail}"
+
 class CreatedAtMixin:
     """Mixin for created_at timestamp only"""
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
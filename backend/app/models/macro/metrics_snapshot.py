@@ -8,15 +8,19 @@ from ..base import BaseModel, CreatedAtMixin
 from ..mixins import DataQualityMixin, PerformanceTrackingMixin, ValidationMixin
 
 
-class MetricsSnapshot(BaseModel, CreatedAtMixin, PerformanceTrackingMixin, ValidationMixin):
+class MetricsSnapshot(BaseModel, CreatedAtMixin, DataQualityMixin, PerformanceTrackingMixin, ValidationMixin):
     """
     Metrics snapshot for market-wide data collection
     
     Uses CreatedAtMixin (only created_at) because snapshots are immutable
-    point-in-time records of market conditions
+    point-in-time records of market conditions. data_quality_score drops
+    for every field carried over from an earlier snapshot or left empty
     """
     __tablename__ = 'metrics_snapshot'
     
+    # Minimum data_quality_score of a high quality snapshot
+    HIGH_QUALITY_SCORE = 80
+    
     # Core Snapshot Info
     snapshot_time = Column(DateTime(timezone=True), nullable=False, index=True)
     timeframe = Column(String(10), nullable=False, index=True)
@@ -106,7 +110,7 @@ class MetricsSnapshot(BaseModel, CreatedAtMixin, PerformanceTrackingMixin, Valid
         Index('idx_metrics_created_at', 'created_at'),
         Index('idx_metrics_fear_greed', 'fear_greed_index'),
         Index('idx_metrics_dominance', 'btc_dominance'),
-        # Index('idx_metrics_quality_score', 'data_quality_score'),  # Field not available in this model
+        Index('idx_metrics_quality_score', 'data_quality_score'),
         Index('idx_metrics_has_anomalies', 'has_anomalies'),
         Index('idx_metrics_time_range', 'snapshot_time', 'timeframe', 'btc_price_usd'),
         Index('idx_metrics_correlation_btc_eth', 'btc_eth_correlation_30d'),
@@ -135,9 +139,11 @@ class MetricsSnapshot(BaseModel, CreatedAtMixin, PerformanceTrackingMixin, Valid
     @property
     def is_high_quality(self) -> bool:
         """Check if snapshot has high data quality"""
-        # Since we don't have data_quality_score field in this model,
-        # use other indicators for quality assessment
-        return not self.has_anomalies and self.btc_price_usd is not None
+        return (
+            not self.has_anomalies
+            and self.btc_price_usd is not None
+            and (self.data_quality_score or 0) >= self.HIGH_QUALITY_SCORE
+        )
     
     @property
     def collection_time_ms(self) -> int:
@@ -201,7 +207,8 @@ class MetricsSnapshot(BaseModel, CreatedAtMixin, PerformanceTrackingMixin, Valid
         """Get high quality snapshots"""
         return session.query(cls).filter(
             cls.has_anomalies == False,
-            cls.btc_price_usd.isnot(None)
+            cls.btc_price_usd.isnot(None),
+            cls.data_quality_score >= cls.HIGH_QUALITY_SCORE
         ).order_by(cls.snapshot_time.desc()).all()
     
     def to_dict(self) -> dict:
@@ -216,6 +223,7 @@ class MetricsSnapshot(BaseModel, CreatedAtMixin, PerformanceTrackingMixin, Valid
             'btc_dominance': float(self.btc_dominance) if self.btc_dominance else None,
             'market_regime': self.market_regime_simple,
             'stress_level': self.market_stress_level,
+            'data_quality_score': self.data_quality_score,
             'is_high_quality': self.is_high_quality,
             'has_anomalies': self.has_anomalies,
             'created_at': self.created_at.isoformat() if self.created_at else None
@@ -1,7 +1,7 @@
 # backend/app/repositories/__init__.py
 # Repository package initialization - exports all repositories
 
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, AsyncBaseRepository
 
 # AI Repositories
 from .ai.ai_model_repository import AIModelRepository
@@ -12,6 +12,14 @@ from .ai.model_job_repository import ModelJobRepository
 from .asset.asset_repository import AssetRepository
 from .asset.price_data_repository import PriceDataRepository
 from .asset.price_data_archive_repository import PriceDataArchiveRepository
+from .asset.price_data_cold_file_repository import PriceDataColdFileRepository, ColdFileUnavailableError
+from .asset.tiered_price_data_repository import TieredPriceDataRepository
+from .asset.asset_snapshot_repository import AssetSnapshotRepository
+
+# Async read repositories (request-path endpoints)
+from .asset.asset_repository import AsyncAssetRepository
+from .asset.price_data_repository import AsyncPriceDataRepository
+from .asset.asset_snapshot_repository import AsyncAssetSnapshotRepository
 
 # Compatibility aliases for existing code
 cryptocurrency_repository = AssetRepository
@@ -28,6 +36,7 @@ from .user.user_repository import UserRepository
 __all__ = [
     # Base
     "BaseRepository",
+    "AsyncBaseRepository",
     
     # AI
     "AIModelRepository",
@@ -38,7 +47,14 @@ __all__ = [
     "AssetRepository",
     "PriceDataRepository",
     "PriceDataArchiveRepository",
-    
+    "PriceDataColdFileRepository",
+    "ColdFileUnavailableError",
+    "TieredPriceDataRepository",
+    "AssetSnapshotRepository",
+    "AsyncAssetRepository",
+    "AsyncPriceDataRepository",
+    "AsyncAssetSnapshotRepository",
+
     # Macro
     "MetricsSnapshotRepository",
     "AIRegimeAnalysisRepository",
@@ -86,6 +86,57 @@ class ModelJobRepository(BaseRepository):
             ModelJob.job_status == JobStatus.PENDING.value
         ).order_by(ModelJob.priority.desc(), ModelJob.queued_at.asc()).all()
     
+    def lock_job(self, job_id: int) -> Optional[ModelJob]:
+        """Get a job row locked for update (status transitions from several processes)"""
+        return self.db.query(ModelJob).filter(ModelJob.id == job_id).with_for_update().first()
+    
+    def get_job_status(self, job_id: int) -> Optional[str]:
+        """Current status only, without loading the job"""
+        return self.db.query(ModelJob.job_status).filter(ModelJob.id == job_id).scalar()
+    
+    def count_active_training_jobs(self, queue_name: str = None) -> int:
+        """Number of pending or running training jobs"""
+        query = self.db.query(func.count(ModelJob.id)).filter(
+            ModelJob.job_category == JobCategory.TRAINING.value,
+            ModelJob.job_status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value])
+        )
+        
+        if queue_name:
+            query = query.filter(ModelJob.queue_name == queue_name)
+        
+        return query.scalar() or 0
+    
+    def get_training_jobs(
+        self,
+        user_id: int = None,
+        crypto_symbol: str = None,
+        status: str = None,
+        active_only: bool = False,
+        limit: int = 100
+    ) -> List[ModelJob]:
+        """Get training jobs, most recent first"""
+        query = self.db.query(ModelJob).filter(ModelJob.job_category == JobCategory.TRAINING.value)
+        
+        if user_id:
+            query = query.filter(ModelJob.created_by == user_id)
+        if crypto_symbol:
+            query = query.filter(ModelJob.job_config['crypto_symbol'].astext == crypto_symbol)
+        if status:
+            query = query.filter(ModelJob.job_status == status)
+        if active_only:
+            query = query.filter(ModelJob.job_status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value]))
+        
+        return query.order_by(ModelJob.created_at.desc()).limit(limit).all()
+    
+    def get_stale_training_jobs(self, queue_name: str, heartbeat_before: datetime) -> List[ModelJob]:
+        """Active training jobs whose worker stopped reporting"""
+        return self.db.query(ModelJob).filter(
+            ModelJob.job_category == JobCategory.TRAINING.value,
+            ModelJob.queue_name == queue_name,
+            ModelJob.job_status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value]),
+            func.coalesce(ModelJob.last_heartbeat, ModelJob.queued_at, ModelJob.created_at) < heartbeat_before
+        ).with_for_update().all()
+    
     def get_job_statistics(self, days: int = 7) -> Dict[str, Any]:
         """Get job execution statistics"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
@@ -1,12 +1,22 @@
 # backend/app/repositories/asset/__init__.py
 # Asset repositories module
 
-from .asset_repository import AssetRepository
-from .price_data_repository import PriceDataRepository
+from .asset_repository import AssetRepository, AsyncAssetRepository
+from .price_data_repository import PriceDataRepository, AsyncPriceDataRepository
 from .price_data_archive_repository import PriceDataArchiveRepository
+from .price_data_cold_file_repository import PriceDataColdFileRepository, ColdFileUnavailableError
+from .tiered_price_data_repository import TieredPriceDataRepository
+from .asset_snapshot_repository import AssetSnapshotRepository, AsyncAssetSnapshotRepository
 
 __all__ = [
     'AssetRepository',
     'PriceDataRepository',
-    'PriceDataArchiveRepository'
+    'PriceDataArchiveRepository',
+    'PriceDataColdFileRepository',
+    'ColdFileUnavailableError',
+    'TieredPriceDataRepository',
+    'AssetSnapshotRepository',
+    'AsyncAssetRepository',
+    'AsyncPriceDataRepository',
+    'AsyncAssetSnapshotRepository'
 ]
\ No newline at end of file
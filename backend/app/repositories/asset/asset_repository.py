@@ -3,10 +3,11 @@
 
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, func, text, select
 from datetime import datetime, timedelta
 
-from ..base_repository import BaseRepository
+from ..base_repository import BaseRepository, AsyncBaseRepository
 from app.models.asset import Asset
 
 
@@ -208,4 +209,41 @@ class AssetRepository(BaseRepository):
             'valid': len(issues) == 0,
             'issues': issues,
             'last_updated': asset.last_updated.isoformat() if asset.last_updated else None
-        }
\ No newline at end of file
+        }
+
+
+class AsyncAssetRepository(AsyncBaseRepository):
+    """
+    Async asset lookups for request-path endpoints
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Asset, db)
+
+    async def get_by_symbol(self, symbol: str) -> Optional[Asset]:
+        """Get asset by symbol"""
+        result = await self.db.execute(select(Asset).where(Asset.symbol == symbol.upper()))
+        return result.scalars().first()
+
+    async def get_by_symbols(self, symbols: List[str]) -> List[Asset]:
+        """Get multiple assets by symbol in a single query"""
+        if not symbols:
+            return []
+        result = await self.db.execute(
+            select(Asset).where(Asset.symbol.in_([symbol.upper() for symbol in symbols]))
+        )
+        return list(result.scalars().all())
+
+    async def get_by_ids(self, asset_ids: List[int]) -> List[Asset]:
+        """Get multiple assets by IDs in a single query"""
+        if not asset_ids:
+            return []
+        result = await self.db.execute(select(Asset).where(Asset.id.in_(asset_ids)))
+        return list(result.scalars().all())
+
+    async def get_active_assets(self) -> List[Asset]:
+        """Get all active assets"""
+        result = await self.db.execute(
+            select(Asset).where(Asset.is_active == True).order_by(Asset.symbol.asc())
+        )
+        return list(result.scalars().all())
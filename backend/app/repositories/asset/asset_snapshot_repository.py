@@ -0,0 +1,238 @@
+# backend/app/repositories/asset/asset_snapshot_repository.py
+# Repository for the materialized dashboard snapshot (latest candle + 24h change + prediction)
+
+from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, text, bindparam, select
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timezone
+import logging
+
+from ..base_repository import BaseRepository, AsyncBaseRepository
+from app.models.asset import Asset
+from app.models.asset.asset_snapshot import AssetSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+# Latest candle per asset and the last close at least 24h before it, via
+# LATERAL lookups on unique_asset_timeframe_candle (one index probe each),
+# upserted for every requested asset in one statement. Prediction columns
+# are left untouched.
+_REFRESH_SQL = """
+    INSERT INTO asset_snapshots (
+        asset_id, timeframe, candle_time,
+        open_price, high_price, low_price, close_price, volume, market_cap,
+        close_24h_ago, price_change_24h, price_change_24h_percent,
+        refreshed_at, created_at, updated_at
+    )
+    SELECT
+        a.id, :timeframe, latest.candle_time,
+        latest.open_price, latest.high_price, latest.low_price, latest.close_price,
+        latest.volume, latest.market_cap,
+        prev.close_price,
+        latest.close_price - prev.close_price,
+        CASE WHEN prev.close_price > 0
+             THEN (latest.close_price - prev.close_price) / prev.close_price * 100
+        END,
+        now(), now(), now()
+    FROM assets a
+    CROSS JOIN LATERAL (
+        SELECT pd.candle_time, pd.open_price, pd.high_price, pd.low_price,
+               pd.close_price, pd.volume, pd.market_cap
+        FROM price_data pd
+        WHERE pd.asset_id = a.id AND pd.timeframe = :timeframe
+        ORDER BY pd.candle_time DESC
+        LIMIT 1
+    ) latest
+    LEFT JOIN LATERAL (
+        SELECT pd.close_price
+        FROM price_data pd
+        WHERE pd.asset_id = a.id AND pd.timeframe = :timeframe
+          AND pd.candle_time <= latest.candle_time - interval '24 hours'
+        ORDER BY pd.candle_time DESC
+        LIMIT 1
+    ) prev ON true
+    WHERE {asset_filter}
+    ON CONFLICT (asset_id, timeframe) DO UPDATE SET
+        candle_time = EXCLUDED.candle_time,
+        open_price = EXCLUDED.open_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        market_cap = EXCLUDED.market_cap,
+        close_24h_ago = EXCLUDED.close_24h_ago,
+        price_change_24h = EXCLUDED.price_change_24h,
+        price_change_24h_percent = EXCLUDED.price_change_24h_percent,
+        refreshed_at = EXCLUDED.refreshed_at,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_RECORD_PREDICTION_SQL = """
+    INSERT INTO asset_snapshots (
+        asset_id, timeframe,
+        predicted_price, prediction_confidence, prediction_target_time,
+        prediction_model, prediction_created_at, created_at, updated_at
+    )
+    VALUES (
+        :asset_id, :timeframe,
+        :predicted_price, :confidence, :target_time,
+        :model_name, :created_at, now(), now()
+    )
+    ON CONFLICT (asset_id, timeframe) DO UPDATE SET
+        predicted_price = EXCLUDED.predicted_price,
+        prediction_confidence = EXCLUDED.prediction_confidence,
+        prediction_target_time = EXCLUDED.prediction_target_time,
+        prediction_model = EXCLUDED.prediction_model,
+        prediction_created_at = EXCLUDED.prediction_created_at,
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+class AssetSnapshotRepository(BaseRepository):
+    """
+    Repository for per-asset dashboard snapshots
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(AssetSnapshot, db)
+
+    def refresh(self, asset_ids: Optional[List[int]] = None, timeframe: str = "1h") -> int:
+        """
+        Recompute latest candle and 24h change for assets in one statement
+
+        Args:
+            asset_ids: Assets to refresh (all active assets if None)
+            timeframe: Candle timeframe
+
+        Returns:
+            Number of snapshot rows written
+        """
+        if asset_ids is not None and not asset_ids:
+            return 0
+
+        try:
+            if asset_ids is None:
+                statement = text(_REFRESH_SQL.format(asset_filter="a.is_active = true"))
+                params = {'timeframe': timeframe}
+            else:
+                statement = text(_REFRESH_SQL.format(asset_filter="a.id IN :asset_ids")).bindparams(
+                    bindparam('asset_ids', expanding=True)
+                )
+                params = {'timeframe': timeframe, 'asset_ids': list(asset_ids)}
+
+            result = self.db.execute(statement, params)
+            self.db.commit()
+            return result.rowcount or 0
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error refreshing asset snapshots: {str(e)}")
+            return 0
+
+    def record_prediction(
+        self,
+        asset_id: int,
+        predicted_price: float,
+        confidence: Optional[float] = None,
+        target_time: Optional[datetime] = None,
+        model_name: Optional[str] = None,
+        timeframe: str = "1h"
+    ) -> bool:
+        """
+        Store the latest prediction for an asset
+
+        Returns:
+            bool: True if the snapshot was updated
+        """
+        try:
+            self.db.execute(text(_RECORD_PREDICTION_SQL), {
+                'asset_id': asset_id,
+                'timeframe': timeframe,
+                'predicted_price': predicted_price,
+                'confidence': confidence,
+                'target_time': target_time,
+                'model_name': model_name,
+                'created_at': datetime.now(timezone.utc)
+            })
+            self.db.commit()
+            return True
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error recording prediction for asset {asset_id}: {str(e)}")
+            return False
+
+    def get_snapshot(self, symbols: List[str], timeframe: str = "1h") -> List[Dict[str, Any]]:
+        """
+        Dashboard rows for all symbols in a single query
+
+        Args:
+            symbols: Asset symbols
+            timeframe: Candle timeframe
+
+        Returns:
+            List of dicts (asset columns + snapshot columns); snapshot
+            columns are None for assets that were never refreshed
+        """
+        if not symbols:
+            return []
+
+        rows = self.db.query(Asset.id, Asset.symbol, Asset.name, AssetSnapshot).outerjoin(
+            AssetSnapshot,
+            and_(AssetSnapshot.asset_id == Asset.id, AssetSnapshot.timeframe == timeframe)
+        ).filter(
+            Asset.symbol.in_([symbol.upper() for symbol in symbols])
+        ).all()
+
+        return [
+            {'asset_id': asset_id, 'symbol': symbol, 'name': name, 'snapshot': snapshot}
+            for asset_id, symbol, name, snapshot in rows
+        ]
+
+    def get_or_refresh_snapshot(self, symbols: List[str], timeframe: str = "1h") -> List[Dict[str, Any]]:
+        """
+        get_snapshot, refreshing assets that have no candle data yet
+
+        Only the first request after a new asset appears pays for the refresh.
+        """
+        rows = self.get_snapshot(symbols, timeframe)
+        missing = [
+            row['asset_id'] for row in rows
+            if row['snapshot'] is None or row['snapshot'].candle_time is None
+        ]
+
+        if missing and self.refresh(missing, timeframe):
+            rows = self.get_snapshot(symbols, timeframe)
+
+        return rows
+
+
+class AsyncAssetSnapshotRepository(AsyncBaseRepository):
+    """
+    Async dashboard snapshot reads (refreshes stay on the sync repository)
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(AssetSnapshot, db)
+
+    async def get_snapshot(self, symbols: List[str], timeframe: str = "1h") -> List[Dict[str, Any]]:
+        """Dashboard rows for all symbols in a single query (see AssetSnapshotRepository.get_snapshot)"""
+        if not symbols:
+            return []
+
+        result = await self.db.execute(
+            select(Asset.id, Asset.symbol, Asset.name, AssetSnapshot).outerjoin(
+                AssetSnapshot,
+                and_(AssetSnapshot.asset_id == Asset.id, AssetSnapshot.timeframe == timeframe)
+            ).where(
+                Asset.symbol.in_([symbol.upper() for symbol in symbols])
+            )
+        )
+
+        return [
+            {'asset_id': asset_id, 'symbol': symbol, 'name': name, 'snapshot': snapshot}
+            for asset_id, symbol, name, snapshot in result.all()
+        ]
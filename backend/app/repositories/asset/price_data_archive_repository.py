@@ -1,14 +1,80 @@
 # backend/app/repositories/asset/archive.py
 # Repository for archived price data management
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
-from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, desc, func, text, select, cast, Float
+from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timedelta, timezone
+import logging
+import time
+
+import numpy as np
 
 from ..base_repository import BaseRepository
+from .price_data_repository import OHLCV_COLUMNS
 from app.models.asset.price_data_archive import PriceDataArchive
 from app.models.asset import Asset
+from app.utils.datetime_utils import add_months, month_start, get_supported_timeframes
+
+logger = logging.getLogger(__name__)
+
+# Lower bound for archive windows without a start time
+ARCHIVE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# One chunk of a set-based archive move: the oldest :chunk_size candles of
+# the series in the window are deleted from price_data and inserted into
+# price_data_archive in the same statement, so a chunk is either fully moved
+# or not at all. Rows already archived (an earlier partial run) are skipped
+# by ON CONFLICT and still leave the main table.
+_ARCHIVE_CHUNK_SQL = """
+    WITH batch AS (
+        SELECT id, candle_time
+        FROM price_data
+        WHERE asset_id = :asset_id AND timeframe = :timeframe
+          AND candle_time >= :start_time AND candle_time < :end_time
+        ORDER BY candle_time
+        LIMIT :chunk_size
+    ),
+    moved AS (
+        DELETE FROM price_data pd
+        USING batch
+        WHERE pd.id = batch.id AND pd.candle_time = batch.candle_time
+          AND pd.asset_id = :asset_id AND pd.timeframe = :timeframe
+          AND pd.candle_time >= :start_time AND pd.candle_time < :end_time
+        RETURNING pd.*
+    ),
+    archived AS (
+        INSERT INTO price_data_archive (
+            asset_id, timestamp, timeframe,
+            open_price, high_price, low_price, close_price, volume,
+            market_cap_usd, trade_count, price_change_percentage,
+            archive_year, archive_month, archive_date,
+            original_source, extended_data, retention_tier,
+            data_quality_score, data_source, is_validated
+        )
+        SELECT
+            asset_id, candle_time, timeframe,
+            open_price, high_price, low_price, close_price, volume,
+            market_cap, trade_count,
+            round((close_price - open_price) / open_price * 100, 4),
+            extract(year FROM candle_time AT TIME ZONE 'UTC')::int,
+            extract(month FROM candle_time AT TIME ZONE 'UTC')::int,
+            now(),
+            'price_data',
+            jsonb_strip_nulls(jsonb_build_object(
+                'vwap', vwap, 'technical_indicators', technical_indicators::jsonb
+            )),
+            'warm', 100, 'internal', is_validated
+        FROM moved
+        ON CONFLICT ON CONSTRAINT unique_archive_asset_time_timeframe DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT count(*) FROM moved) AS moved,
+        (SELECT count(*) FROM archived) AS archived,
+        (SELECT max(candle_time) FROM moved) AS last_candle_time
+"""
 
 
 class PriceDataArchiveRepository(BaseRepository):
@@ -92,43 +158,150 @@ class PriceDataArchiveRepository(BaseRepository):
         
         return query.order_by(PriceDataArchive.timestamp.desc()).limit(1000).all()
     
-    def bulk_archive_from_main(self, asset_id: int, cutoff_date: datetime) -> int:
-        """Bulk transfer data from main price_data to archive"""
-        from ...models.asset.price_data import PriceData
-        
-        # Get old data to archive
-        old_data = self.db.query(PriceData).filter(
-            PriceData.asset_id == asset_id,
-            PriceData.timestamp < cutoff_date
-        ).all()
-        
-        archived_count = 0
-        for data in old_data:
-            # Create archive record
-            archive_record = PriceDataArchive(
-                asset_id=data.asset_id,
-                timestamp=data.timestamp,
-                price=data.price,
-                volume=data.volume,
-                market_cap=data.market_cap,
-                source=data.source,
-                raw_data=data.raw_data,
-                quality_score=getattr(data, 'quality_score', None),
-                has_quality_issues=getattr(data, 'has_quality_issues', False)
-            )
-            
-            self.db.add(archive_record)
-            archived_count += 1
+    def ensure_archive_partitions(self, first: datetime, last: datetime) -> int:
+        """
+        Create the monthly archive partitions covering [first, last]
         
-        # Remove from main table
-        self.db.query(PriceData).filter(
-            PriceData.asset_id == asset_id,
-            PriceData.timestamp < cutoff_date
-        ).delete()
+        No-op unless price_data_archive is a partitioned PostgreSQL table.
+        
+        Returns:
+            Number of partitions created
+        """
+        is_partitioned = self.db.execute(
+            text("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('price_data_archive')")
+        ).scalar()
+        if not is_partitioned:
+            return 0
+        
+        created = 0
+        month, last_month = month_start(first), month_start(last)
+        while month <= last_month:
+            name = f"price_data_archive_y{month.year:04d}m{month.month:02d}"
+            if self.db.execute(text("SELECT to_regclass(:name)"), {'name': name}).scalar() is None:
+                following = add_months(month, 1)
+                self.db.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF price_data_archive "
+                    f"FOR VALUES FROM ({month.year}, {month.month}) TO ({following.year}, {following.month})"
+                ))
+                created += 1
+            month = add_months(month, 1)
         
         self.db.commit()
-        return archived_count
+        return created
     
+    def archive_window(
+        self,
+        asset_id: int,
+        timeframe: str,
+        end_time: datetime,
+        start_time: Optional[datetime] = None,
+        chunk_size: int = 10000,
+        max_chunks: Optional[int] = None,
+        on_chunk: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Move a window of one series from price_data into the archive, set-based
+        
+        Each chunk is a single INSERT ... SELECT ... ON CONFLICT DO NOTHING fed
+        by DELETE ... RETURNING and is committed on its own, so transactions
+        stay short. Moved rows leave the main table, which makes the move
+        resumable: calling again with the same window (or with resume_from
+        as start_time) continues where an interrupted run stopped.
+        
+        Args:
+            asset_id: Asset ID
+            timeframe: Candle timeframe
+            end_time: Exclusive upper bound on candle_time
+            start_time: Inclusive lower bound (None for everything before end_time)
+            chunk_size: Candles per chunk/transaction
+            max_chunks: Stop after this many chunks (None to run to completion)
+            on_chunk: Called with the running totals after every chunk
+        
+        Returns:
+            Totals: rows_moved, rows_archived, duplicates_skipped, chunks,
+            elapsed_seconds, rows_per_second, resume_from, completed
+        """
+        start_time = start_time or ARCHIVE_EPOCH
+        stats = {
+            'asset_id': asset_id,
+            'timeframe': timeframe,
+            'rows_moved': 0,
+            'rows_archived': 0,
+            'duplicates_skipped': 0,
+            'chunks': 0,
+            'elapsed_seconds': 0.0,
+            'rows_per_second': 0.0,
+            'resume_from': start_time.isoformat(),
+            'completed': False,
+        }
+        
+        started = time.perf_counter()
+        try:
+            # Partitions for the months actually present in the window
+            first, last = self.db.execute(text(
+                "SELECT min(candle_time), max(candle_time) FROM price_data "
+                "WHERE asset_id = :asset_id AND timeframe = :timeframe "
+                "AND candle_time >= :start_time AND candle_time < :end_time"
+            ), {'asset_id': asset_id, 'timeframe': timeframe, 'start_time': start_time, 'end_time': end_time}).one()
+            if first is None:
+                stats['completed'] = True
+                return stats
+            self.ensure_archive_partitions(first, last)
+            
+            cursor = first
+            while max_chunks is None or stats['chunks'] < max_chunks:
+                moved, archived, last_candle_time = self.db.execute(text(_ARCHIVE_CHUNK_SQL), {
+                    'asset_id': asset_id,
+                    'timeframe': timeframe,
+                    'start_time': cursor,
+                    'end_time': end_time,
+                    'chunk_size': chunk_size,
+                }).one()
+                self.db.commit()
+                
+                if moved:
+                    # Moved rows are gone; restarting at the last one skips
+                    # the dead index entries in front of it
+                    cursor = last_candle_time
+                    stats['rows_moved'] += moved
+                    stats['rows_archived'] += archived
+                    stats['duplicates_skipped'] += moved - archived
+                    stats['chunks'] += 1
+                    stats['resume_from'] = cursor.isoformat()
+                
+                elapsed = time.perf_counter() - started
+                stats['elapsed_seconds'] = round(elapsed, 3)
+                stats['rows_per_second'] = round(stats['rows_moved'] / elapsed, 1) if elapsed > 0 else 0.0
+                
+                if on_chunk and moved:
+                    on_chunk(dict(stats))
+                if moved < chunk_size:
+                    stats['completed'] = True
+                    break
+        
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Archiving asset {asset_id} {timeframe} stopped at {stats['resume_from']}: {str(e)}")
+            stats['error'] = str(e)
+        
+        logger.info(
+            f"Archived asset {asset_id} {timeframe}: {stats['rows_moved']} rows in {stats['chunks']} chunks "
+            f"({stats['rows_per_second']} rows/s, completed={stats['completed']})"
+        )
+        return stats
+    
+    def bulk_archive_from_main(self, asset_id: int, cutoff_date: datetime, chunk_size: int = 10000) -> int:
+        """
+        Archive every candle of an asset older than cutoff_date (all timeframes)
+        
+        Returns:
+            Number of rows removed from price_data
+        """
+        return sum(
+            self.archive_window(asset_id, timeframe, end_time=cutoff_date, chunk_size=chunk_size)['rows_moved']
+            for timeframe in get_supported_timeframes()
+        )
+
     def get_historical_aggregates(self, asset_id: int, period: str = 'daily') -> List[Dict[str, Any]]:
         """Get historical aggregated data by period"""
         # This would need more sophisticated date_trunc based on period
@@ -269,49 +442,55 @@ class PriceDataArchiveRepository(BaseRepository):
             'volume': float(result.total_volume)
         } for result in results]
     
-    def get_historical_volatility(self, asset_id: int, days: int = 365) -> Dict[str, Any]:
-        """Calculate historical volatility over different periods"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Get daily closes for volatility calculation
-        daily_closes = self.db.query(
-            func.date_trunc('day', PriceDataArchive.timestamp).label('date'),
-            func.last_value(PriceDataArchive.price).over(
-                partition_by=func.date_trunc('day', PriceDataArchive.timestamp),
-                order_by=PriceDataArchive.timestamp
-            ).label('close_price')
-        ).filter(
+    def get_ohlcv_columns(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        dtype: Any = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        Archived OHLCV for one asset/timeframe as NumPy columns, oldest first
+        
+        Same shape as PriceDataRepository.get_ohlcv_columns (bounds inclusive).
+        """
+        statement = select(
+            cast(func.extract('epoch', PriceDataArchive.timestamp), Float),
+            cast(PriceDataArchive.open_price, Float),
+            cast(PriceDataArchive.high_price, Float),
+            cast(PriceDataArchive.low_price, Float),
+            cast(PriceDataArchive.close_price, Float),
+            func.coalesce(cast(PriceDataArchive.volume, Float), 0.0),
+            func.coalesce(cast(PriceDataArchive.market_cap_usd, Float), 0.0)
+        ).where(
             PriceDataArchive.asset_id == asset_id,
-            PriceDataArchive.timestamp >= cutoff_date
-        ).group_by(
-            func.date_trunc('day', PriceDataArchive.timestamp)
-        ).order_by(
-            func.date_trunc('day', PriceDataArchive.timestamp).asc()
-        ).all()
-        
-        if len(daily_closes) < 30:
-            return {'error': 'Insufficient data for volatility calculation'}
+            PriceDataArchive.timeframe == timeframe
+        )
+        if start_time is not None:
+            statement = statement.where(PriceDataArchive.timestamp >= start_time)
+        if end_time is not None:
+            statement = statement.where(PriceDataArchive.timestamp <= end_time)
         
-        # Calculate returns and volatility
-        prices = [float(row.close_price) for row in daily_closes]
-        daily_returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices))]
+        rows = self.db.execute(statement.order_by(PriceDataArchive.timestamp.asc())).all()
+        data = np.array(rows, dtype=np.float64).reshape(len(rows), len(OHLCV_COLUMNS))
         
-        import statistics
+        columns = {
+            'candle_time': np.round(data[:, 0] * 1e6).astype(np.int64).astype('datetime64[us]').astype('datetime64[ns]')
+        }
+        for index, name in enumerate(OHLCV_COLUMNS[1:], start=1):
+            columns[name] = data[:, index].astype(dtype)
+        return columns
+    
+    def get_historical_volatility(self, asset_id: int, days: int = 365) -> Dict[str, Any]:
+        """
+        Historical volatility from daily closes
         
-        volatility_30d = statistics.stdev(daily_returns[-30:]) * (365 ** 0.5) if len(daily_returns) >= 30 else None
-        volatility_90d = statistics.stdev(daily_returns[-90:]) * (365 ** 0.5) if len(daily_returns) >= 90 else None
-        volatility_365d = statistics.stdev(daily_returns) * (365 ** 0.5) if len(daily_returns) >= 30 else None
+        Spans hot rows, archived rows and cold files (see TieredPriceDataRepository).
+        """
+        from .tiered_price_data_repository import TieredPriceDataRepository
         
-        return {
-            'asset_id': asset_id,
-            'data_period_days': len(daily_closes),
-            'volatility_30d_annualized': round(volatility_30d * 100, 2) if volatility_30d else None,
-            'volatility_90d_annualized': round(volatility_90d * 100, 2) if volatility_90d else None,
-            'volatility_365d_annualized': round(volatility_365d * 100, 2) if volatility_365d else None,
-            'max_daily_return': round(max(daily_returns) * 100, 2),
-            'min_daily_return': round(min(daily_returns) * 100, 2),
-            'avg_daily_return': round(statistics.mean(daily_returns) * 100, 4)
-        }
+        return TieredPriceDataRepository(self.db).get_historical_volatility(asset_id, days)
     
     def get_price_extremes(self, asset_id: int, period_days: int = 365) -> Dict[str, Any]:
         """Find historical price extremes (all-time highs/lows within period)"""
@@ -0,0 +1,152 @@
+# backend/app/repositories/asset/price_data_cold_file_repository.py
+# Repository for the cold-tier manifest and its Parquet files
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from datetime import datetime, timezone
+from pathlib import Path
+import logging
+
+import numpy as np
+
+from ..base_repository import BaseRepository
+from .price_data_repository import OHLCV_COLUMNS
+from app.core.config import settings
+from app.models.asset.price_data_cold_file import PriceDataColdFile
+
+logger = logging.getLogger(__name__)
+
+# Optional: cold files are Parquet, read and written with pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    ARROW_AVAILABLE = False
+
+
+class ColdFileUnavailableError(Exception):
+    """A manifest entry whose Parquet file is not present under COLD_STORAGE_DIR"""
+
+    def __init__(self, cold_file: PriceDataColdFile):
+        self.file_path = cold_file.file_path
+        self.period = f"{cold_file.period_year}-{cold_file.period_month:02d}"
+        super().__init__(
+            f"Cold storage file {cold_file.file_path} (asset {cold_file.asset_id} {cold_file.timeframe} "
+            f"{cold_file.period_year}-{cold_file.period_month:02d}) is not available under {cold_storage_root()}"
+        )
+
+
+def empty_ohlcv_columns(dtype: Any = np.float64) -> Dict[str, np.ndarray]:
+    """get_ohlcv_columns-shaped result with no rows"""
+    columns = {'candle_time': np.array([], dtype='datetime64[ns]')}
+    columns.update({name: np.array([], dtype=dtype) for name in OHLCV_COLUMNS[1:]})
+    return columns
+
+
+def cold_storage_root() -> Path:
+    """Directory that manifest file paths are relative to"""
+    return Path(settings.COLD_STORAGE_DIR)
+
+
+class PriceDataColdFileRepository(BaseRepository):
+    """
+    Repository for cold-tier files: manifest rows plus reads of the Parquet data
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(PriceDataColdFile, db)
+
+    def get_file(self, asset_id: int, timeframe: str, year: int, month: int) -> Optional[PriceDataColdFile]:
+        """Manifest entry for one asset/timeframe/month"""
+        return self.db.query(PriceDataColdFile).filter(
+            PriceDataColdFile.asset_id == asset_id,
+            PriceDataColdFile.timeframe == timeframe,
+            PriceDataColdFile.period_year == year,
+            PriceDataColdFile.period_month == month
+        ).first()
+
+    def get_files(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> List[PriceDataColdFile]:
+        """Manifest entries overlapping [start_time, end_time], oldest first"""
+        query = self.db.query(PriceDataColdFile).filter(
+            PriceDataColdFile.asset_id == asset_id,
+            PriceDataColdFile.timeframe == timeframe
+        )
+        if start_time is not None:
+            query = query.filter(PriceDataColdFile.last_candle_time >= start_time)
+        if end_time is not None:
+            query = query.filter(PriceDataColdFile.first_candle_time <= end_time)
+        return query.order_by(PriceDataColdFile.first_candle_time.asc()).all()
+
+    def get_storage_summary(self) -> Dict[str, Any]:
+        """File count, rows and bytes held in the cold tier"""
+        files, rows, size = self.db.query(
+            func.count(PriceDataColdFile.id),
+            func.coalesce(func.sum(PriceDataColdFile.row_count), 0),
+            func.coalesce(func.sum(PriceDataColdFile.file_size_bytes), 0)
+        ).one()
+        return {'files': files, 'rows': int(rows), 'bytes': int(size)}
+
+    def read_table(self, cold_file: PriceDataColdFile, columns: Optional[List[str]] = None, filters=None):
+        """
+        Arrow table of one cold file
+
+        Raises:
+            ColdFileUnavailableError: The file is not on this host (COLD_STORAGE_DIR
+                not shared, or the file was removed)
+        """
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("Reading cold storage requires pyarrow")
+        try:
+            return pq.read_table(cold_storage_root() / cold_file.file_path, columns=columns, filters=filters)
+        except FileNotFoundError:
+            raise ColdFileUnavailableError(cold_file) from None
+
+    def read_ohlcv_columns(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        dtype: Any = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        OHLCV from the cold files of a series as NumPy columns, oldest first
+
+        Same shape as PriceDataRepository.get_ohlcv_columns; range bounds are
+        inclusive and pushed down to the Parquet reader.
+        """
+        files = self.get_files(asset_id, timeframe, start_time, end_time)
+        if not files:
+            return empty_ohlcv_columns(dtype)
+
+        filters = []
+        if start_time is not None:
+            filters.append(('candle_time', '>=', _as_utc(start_time)))
+        if end_time is not None:
+            filters.append(('candle_time', '<=', _as_utc(end_time)))
+
+        tables = [
+            self.read_table(cold_file, columns=list(OHLCV_COLUMNS), filters=filters or None)
+            for cold_file in files
+        ]
+        table = pa.concat_tables(tables)
+
+        columns = {
+            'candle_time': table.column('candle_time').to_numpy().astype('datetime64[ns]')
+        }
+        for name in OHLCV_COLUMNS[1:]:
+            columns[name] = table.column(name).fill_null(0.0).to_numpy().astype(dtype, copy=False)
+        return columns
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
@@ -1,15 +1,34 @@
 # backend/app/repositories/asset/price_data.py
 # Repository for price data management
 
-from typing import List, Optional, Dict, Any, Tuple, Union
+from typing import List, Optional, Dict, Any, Tuple, Union, AsyncIterator
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, asc, func, text, select, cast, Float
 from datetime import datetime, timedelta
+import io
 import logging
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
-from ..base_repository import BaseRepository
+# Columns returned by get_ohlcv_columns, in order
+OHLCV_COLUMNS = ('candle_time', 'open_price', 'high_price', 'low_price', 'close_price', 'volume', 'market_cap')
+
+# Numeric columns are cast to float8 server-side so no Decimal is ever built;
+# the candle time travels as epoch seconds
+_OHLCV_COPY_SQL = """
+    SELECT extract(epoch FROM candle_time)::float8,
+           open_price::float8, high_price::float8, low_price::float8, close_price::float8,
+           coalesce(volume, 0)::float8, coalesce(market_cap, 0)::float8
+    FROM price_data
+    WHERE asset_id = %(asset_id)s AND timeframe = %(timeframe)s
+      AND candle_time >= %(start_time)s AND candle_time <= %(end_time)s
+    ORDER BY candle_time
+"""
+
+from ..base_repository import BaseRepository, AsyncBaseRepository
 from app.models.asset.price_data import PriceData
 from app.models.asset import Asset
 from app.utils.datetime_utils import (
@@ -42,6 +61,101 @@ class PriceDataRepository(BaseRepository):
         ).order_by(PriceData.candle_time.desc()).limit(limit).all()
     
 
+    def get_ohlcv_columns(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        dtype: Any = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        OHLCV for one asset/timeframe as NumPy columns, oldest first
+        
+        PostgreSQL streams the rows with COPY TO (CSV, parsed by pandas' C
+        reader); other databases fall back to a typed-float cursor. Neither
+        path creates ORM objects or Decimals.
+        
+        Args:
+            asset_id: Asset ID
+            timeframe: Candle timeframe
+            start_time: Range start (inclusive, default: all history)
+            end_time: Range end (inclusive, default: now)
+            dtype: Float dtype of the price/volume columns (float32 for training)
+        
+        Returns:
+            Dict keyed by OHLCV_COLUMNS; candle_time is datetime64[ns] in UTC
+        """
+        params = {
+            'asset_id': asset_id,
+            'timeframe': timeframe,
+            'start_time': start_time or datetime(1970, 1, 1),
+            'end_time': end_time or datetime.utcnow() + timedelta(days=1),
+        }
+        
+        frame = None
+        if self.db.get_bind().dialect.name == 'postgresql':
+            try:
+                # A failed COPY aborts the transaction on PostgreSQL; the
+                # savepoint is rolled back so the fallback can still query
+                with self.db.begin_nested():
+                    frame = self._copy_ohlcv_frame(params)
+            except Exception as e:
+                logger.warning(f"COPY export failed for asset {asset_id}, using cursor fallback: {str(e)}")
+        
+        if frame is None:
+            frame = self._fetch_ohlcv_frame(params)
+        
+        epoch_seconds = frame.iloc[:, 0].to_numpy(dtype=np.float64)
+        columns = {
+            'candle_time': np.round(epoch_seconds * 1e6).astype(np.int64).astype('datetime64[us]').astype('datetime64[ns]')
+        }
+        for index, name in enumerate(OHLCV_COLUMNS[1:], start=1):
+            columns[name] = frame.iloc[:, index].to_numpy(dtype=dtype, na_value=0.0)
+        return columns
+    
+    def _copy_ohlcv_frame(self, params: Dict[str, Any]) -> pd.DataFrame:
+        """COPY (SELECT ...) TO STDOUT into a buffer, parsed column-wise"""
+        dbapi_connection = self.db.connection().connection
+        buffer = io.StringIO()
+        cursor = dbapi_connection.cursor()
+        try:
+            # COPY takes no bind parameters; let the driver inline them safely
+            query = cursor.mogrify(_OHLCV_COPY_SQL, params).decode()
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+        
+        buffer.seek(0)
+        return pd.read_csv(buffer, header=None, names=list(range(len(OHLCV_COLUMNS))), dtype=np.float64, engine='c')
+    
+    def _fetch_ohlcv_frame(self, params: Dict[str, Any]) -> pd.DataFrame:
+        """Portable path: Core select with float-typed columns"""
+        statement = select(
+            PriceData.candle_time,
+            cast(PriceData.open_price, Float),
+            cast(PriceData.high_price, Float),
+            cast(PriceData.low_price, Float),
+            cast(PriceData.close_price, Float),
+            func.coalesce(cast(PriceData.volume, Float), 0.0),
+            func.coalesce(cast(PriceData.market_cap, Float), 0.0)
+        ).where(
+            PriceData.asset_id == params['asset_id'],
+            PriceData.timeframe == params['timeframe'],
+            PriceData.candle_time >= params['start_time'],
+            PriceData.candle_time <= params['end_time']
+        ).order_by(PriceData.candle_time.asc())
+        
+        rows = self.db.execute(statement).all()
+        if not rows:
+            return pd.DataFrame(columns=list(range(len(OHLCV_COLUMNS))))
+        
+        candle_times, *values = zip(*rows)
+        epoch = pd.to_datetime(list(candle_times), utc=True).as_unit('ns').asi8 / 1e9
+        return pd.DataFrame(
+            np.column_stack([epoch] + [np.asarray(column, dtype=np.float64) for column in values])
+        )
+    
     def get_price_statistics(self, asset_id: int, days: int = 30) -> Dict[str, Any]:
         """Get price statistics for an asset"""
         cutoff_date = datetime.utcnow() - timedelta(days=days)
@@ -317,9 +431,10 @@ class PriceDataRepository(BaseRepository):
                 all_records_to_insert, all_records_to_update, all_records_to_skip, asset
             )
             
-            # === PHASE 3: Update asset caches ===
+            # === PHASE 3: Update asset caches and dashboard snapshot ===
             if total_inserted > 0 or total_updated > 0:
                 self._update_asset_caches(asset, timeframes, timeframe_stats)
+                self._refresh_asset_snapshots(asset, timeframes, timeframe_stats)
             
             # === PHASE 4: Auto-aggregation to higher timeframes ===
             aggregation_stats = {}
@@ -1407,6 +1522,26 @@ class PriceDataRepository(BaseRepository):
             except Exception as cache_error:
                 print(f"Warning: Cache update failed for timeframe {tf}: {str(cache_error)}")
 
+    def _refresh_asset_snapshots(self, asset: Asset, timeframes: List[str], timeframe_stats: Dict):
+        """
+        Refresh the dashboard snapshot (latest candle + 24h change) for changed timeframes.
+        
+        Args:
+            asset (Asset): Asset whose candles changed
+            timeframes (List[str]): Timeframes that were processed
+            timeframe_stats (Dict): Per-timeframe 'inserted'/'updated' counts
+        """
+        from .asset_snapshot_repository import AssetSnapshotRepository
+        
+        snapshot_repo = AssetSnapshotRepository(self.db)
+        for tf in timeframes:
+            try:
+                tf_stats = timeframe_stats[tf]
+                if tf_stats['inserted'] > 0 or tf_stats['updated'] > 0:
+                    snapshot_repo.refresh([asset.id], tf)
+            except Exception as snapshot_error:
+                logger.warning(f"Snapshot refresh failed for {asset.symbol} {tf}: {str(snapshot_error)}")
+    
     def _update_single_timeframe_cache(self, asset: Asset, tf: str, tf_stats: Dict):
         """
         Update cache for a single timeframe with new record counts and time ranges.
@@ -1714,3 +1849,173 @@ class PriceDataRepository(BaseRepository):
             target_tf = aggregation_key.replace('_updated', '')
         
         return self._can_aggregate_from_to(source_tf, target_tf)
+
+
+class AsyncPriceDataRepository(AsyncBaseRepository):
+    """
+    Async price data reads for request-path endpoints
+
+    Mirrors the hot read methods of PriceDataRepository; writes, aggregation
+    and indicator maintenance stay on the sync repository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(PriceData, db)
+
+    async def get_by_asset(self, asset_id: int, limit: int = 100, timeframe: Optional[str] = None) -> List[PriceData]:
+        """Get recent price data for an asset"""
+        statement = select(PriceData).where(PriceData.asset_id == asset_id)
+        if timeframe:
+            statement = statement.where(PriceData.timeframe == timeframe)
+
+        result = await self.db.execute(statement.order_by(PriceData.candle_time.desc()).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_by_symbol(self, symbol: str, limit: int = 100, timeframe: Optional[str] = None) -> List[PriceData]:
+        """Get recent price data by symbol"""
+        statement = select(PriceData).join(Asset).where(Asset.symbol == symbol.upper())
+        if timeframe:
+            statement = statement.where(PriceData.timeframe == timeframe)
+
+        result = await self.db.execute(statement.order_by(PriceData.candle_time.desc()).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_price_range(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> List[PriceData]:
+        """
+        Candles for one asset and timeframe in a time range, oldest first
+
+        Takes the newest `limit` candles in the range (index range scan on
+        asset_id, timeframe, candle_time) and returns them in ascending order.
+        """
+        statement = select(PriceData).where(
+            PriceData.asset_id == asset_id,
+            PriceData.timeframe == timeframe
+        )
+        if start_time:
+            statement = statement.where(PriceData.candle_time >= start_time)
+        if end_time:
+            statement = statement.where(PriceData.candle_time <= end_time)
+
+        result = await self.db.execute(statement.order_by(PriceData.candle_time.desc()).limit(limit))
+        return list(reversed(result.scalars().all()))
+
+    async def get_latest_price(self, asset_id: int, timeframe: str = "1h") -> Optional[PriceData]:
+        """Latest candle for an asset"""
+        result = await self.db.execute(
+            select(PriceData).where(
+                PriceData.asset_id == asset_id,
+                PriceData.timeframe == timeframe
+            ).order_by(PriceData.candle_time.desc()).limit(1)
+        )
+        return result.scalars().first()
+
+    async def get_latest_prices(self, asset_ids: List[int], timeframe: str = "1h") -> Dict[int, PriceData]:
+        """
+        Latest candle for several assets in one query
+
+        Returns:
+            Dict mapping asset_id to its latest candle (assets without data are omitted)
+        """
+        if not asset_ids:
+            return {}
+
+        ranked = select(
+            PriceData.id,
+            func.row_number().over(
+                partition_by=PriceData.asset_id,
+                order_by=PriceData.candle_time.desc()
+            ).label('rn')
+        ).where(
+            PriceData.asset_id.in_(asset_ids),
+            PriceData.timeframe == timeframe
+        ).subquery()
+
+        result = await self.db.execute(
+            select(PriceData).join(ranked, PriceData.id == ranked.c.id).where(ranked.c.rn == 1)
+        )
+        return {price.asset_id: price for price in result.scalars().all()}
+    
+    def _candle_select(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        after: Optional[datetime] = None,
+        descending: bool = False
+    ):
+        """
+        OHLCV column select (no ORM entities) ordered by candle_time
+        
+        ``after`` is the keyset cursor: rows strictly after it in the
+        requested order, served by the (asset_id, timeframe, candle_time)
+        unique index at any depth.
+        """
+        statement = select(
+            PriceData.candle_time,
+            PriceData.open_price,
+            PriceData.high_price,
+            PriceData.low_price,
+            PriceData.close_price,
+            PriceData.volume
+        ).where(
+            PriceData.asset_id == asset_id,
+            PriceData.timeframe == timeframe
+        )
+        if start_time:
+            statement = statement.where(PriceData.candle_time >= start_time)
+        if end_time:
+            statement = statement.where(PriceData.candle_time <= end_time)
+        if after is not None:
+            statement = statement.where(
+                PriceData.candle_time < after if descending else PriceData.candle_time > after
+            )
+        return statement.order_by(PriceData.candle_time.desc() if descending else PriceData.candle_time.asc())
+    
+    async def get_candle_page(
+        self,
+        asset_id: int,
+        timeframe: str,
+        after: Optional[datetime] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 500,
+        descending: bool = False
+    ) -> Tuple[List[Any], bool]:
+        """
+        One keyset page of candles
+        
+        Returns:
+            (rows, has_more) - rows are (candle_time, open, high, low, close, volume)
+        """
+        statement = self._candle_select(asset_id, timeframe, start_time, end_time, after, descending)
+        result = await self.db.execute(statement.limit(limit + 1))
+        rows = result.all()
+        return rows[:limit], len(rows) > limit
+    
+    async def stream_candles(
+        self,
+        asset_id: int,
+        timeframe: str,
+        after: Optional[datetime] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        descending: bool = False,
+        batch_size: int = 2000
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Candles in batches through a server-side cursor
+        
+        Only one batch is held in memory at a time.
+        """
+        statement = self._candle_select(asset_id, timeframe, start_time, end_time, after, descending)
+        result = await self.db.stream(statement.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield partition
@@ -0,0 +1,128 @@
+# backend/app/repositories/asset/tiered_price_data_repository.py
+# Price history reads spanning hot rows, the archive table and cold Parquet files
+
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta, timezone
+import logging
+
+import numpy as np
+
+from .price_data_repository import PriceDataRepository, OHLCV_COLUMNS
+from .price_data_archive_repository import PriceDataArchiveRepository
+from .price_data_cold_file_repository import PriceDataColdFileRepository, empty_ohlcv_columns
+
+logger = logging.getLogger(__name__)
+
+
+def merge_ohlcv_columns(*parts: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Merge get_ohlcv_columns results into one series ordered by candle_time
+
+    When a candle appears in several parts the one from the later part wins,
+    so pass tiers from coldest to hottest.
+    """
+    parts = [part for part in parts if len(part['candle_time'])]
+    if not parts:
+        return empty_ohlcv_columns()
+    if len(parts) == 1:
+        return parts[0]
+
+    merged = {name: np.concatenate([part[name] for part in parts]) for name in OHLCV_COLUMNS}
+    order = np.argsort(merged['candle_time'], kind='stable')
+    times = merged['candle_time'][order]
+    keep = np.append(times[1:] != times[:-1], True)
+    return {name: values[order][keep] for name, values in merged.items()}
+
+
+class TieredPriceDataRepository:
+    """
+    Read-only view of one price series across storage tiers
+
+    Hot candles live in price_data, older ones in price_data_archive and the
+    oldest in cold Parquet files listed in price_data_cold_files. Callers get
+    the same NumPy columns as PriceDataRepository.get_ohlcv_columns, whichever
+    tier the rows come from.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.hot = PriceDataRepository(db)
+        self.archive = PriceDataArchiveRepository(db)
+        self.cold = PriceDataColdFileRepository(db)
+
+    def get_ohlcv_columns(
+        self,
+        asset_id: int,
+        timeframe: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        dtype: Any = np.float64
+    ) -> Dict[str, np.ndarray]:
+        """
+        OHLCV for one asset/timeframe across all tiers, oldest first
+
+        Args:
+            asset_id: Asset ID
+            timeframe: Candle timeframe
+            start_time: Range start (inclusive, default: all history)
+            end_time: Range end (inclusive, default: now)
+            dtype: Float dtype of the price/volume columns
+
+        Returns:
+            Dict keyed by OHLCV_COLUMNS; candle_time is datetime64[ns] in UTC
+        """
+        merged = merge_ohlcv_columns(
+            self.cold.read_ohlcv_columns(asset_id, timeframe, start_time, end_time, dtype),
+            self.archive.get_ohlcv_columns(asset_id, timeframe, start_time, end_time, dtype),
+            self.hot.get_ohlcv_columns(asset_id, timeframe, start_time, end_time, dtype)
+        )
+        return {name: values.astype(dtype, copy=False) if name != 'candle_time' else values
+                for name, values in merged.items()}
+
+    def get_daily_closes(
+        self,
+        asset_id: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Daily closes (day, close) across tiers
+
+        Uses 1d candles, or the last 1h close of each UTC day when the
+        daily series is too short.
+        """
+        columns = self.get_ohlcv_columns(asset_id, '1d', start_time, end_time)
+        if len(columns['candle_time']) < 30:
+            hourly = self.get_ohlcv_columns(asset_id, '1h', start_time, end_time)
+            if len(hourly['candle_time']) > len(columns['candle_time']):
+                columns = hourly
+
+        days = columns['candle_time'].astype('datetime64[D]')
+        last_of_day = np.append(days[1:] != days[:-1], True) if len(days) else np.array([], dtype=bool)
+        return days[last_of_day], columns['close_price'][last_of_day]
+
+    def get_historical_volatility(self, asset_id: int, days: int = 365) -> Dict[str, Any]:
+        """Annualized volatility of daily returns over the last `days` days"""
+        start_time = datetime.now(timezone.utc) - timedelta(days=days)
+        dates, closes = self.get_daily_closes(asset_id, start_time=start_time)
+
+        if len(closes) < 30:
+            return {'error': 'Insufficient data for volatility calculation'}
+
+        daily_returns = np.diff(closes) / closes[:-1]
+        annualize = 365 ** 0.5
+
+        def annualized(returns: np.ndarray) -> Optional[float]:
+            return round(float(np.std(returns, ddof=1)) * annualize * 100, 2) if len(returns) >= 30 else None
+
+        return {
+            'asset_id': asset_id,
+            'data_period_days': len(closes),
+            'volatility_30d_annualized': annualized(daily_returns[-30:]),
+            'volatility_90d_annualized': annualized(daily_returns[-90:]) if len(daily_returns) >= 90 else None,
+            'volatility_365d_annualized': annualized(daily_returns),
+            'max_daily_return': round(float(daily_returns.max()) * 100, 2),
+            'min_daily_return': round(float(daily_returns.min()) * 100, 2),
+            'avg_daily_return': round(float(daily_returns.mean()) * 100, 4)
+        }
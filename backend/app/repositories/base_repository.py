@@ -3,7 +3,8 @@
 
 from typing import Type, TypeVar, Generic, List, Optional, Any, Dict
 from sqlalchemy.orm import Session, DeclarativeBase
-from sqlalchemy import and_, or_, desc, asc, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, asc, text, select, func
 from pydantic import BaseModel
 
 # Type variables for generic repository
@@ -30,15 +31,8 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
         self.db = db
-
-        # Ensure DB session uses UTC timezone for this connection so timestamptz
-        # values are represented in UTC when queried/inspected. Non-fatal if the
-        # database doesn't support SET TIME ZONE or the command fails.
-        try:
-            self.db.execute(text("SET TIME ZONE 'UTC'"))
-        except Exception as tz_exc:
-            # Keep non-fatal: warn and continue
-            print(f"Warning: failed to set DB session time zone to UTC: {tz_exc}")
+        # Session time zone (UTC) is set once per physical connection by the
+        # engine's connect hook (app.core.database), not per repository
 
     def get(self, id: int) -> Optional[ModelType]:
         """
@@ -261,3 +255,51 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             query = query.limit(limit)
         
         return query.all()
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """
+    Read-side base repository for async sessions
+
+    Used on request paths so concurrent reads wait on the async connection
+    pool instead of occupying a threadpool worker each. The connection time
+    zone is set by the async engine when the connection is opened.
+    """
+
+    def __init__(self, model: Type[ModelType], db: AsyncSession):
+        """
+        Initialize repository with the model class and async database session
+
+        Args:
+            model: SQLAlchemy model class
+            db: Async database session
+        """
+        self.model = model
+        self.db = db
+
+    async def get(self, id: int) -> Optional[ModelType]:
+        """Get a single record by ID"""
+        return await self.db.get(self.model, id)
+
+    async def get_multi(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        order_by: str = "id",
+        order_desc: bool = False
+    ) -> List[ModelType]:
+        """Get multiple records with pagination and ordering"""
+        statement = select(self.model)
+
+        if hasattr(self.model, order_by):
+            column = getattr(self.model, order_by)
+            statement = statement.order_by(desc(column) if order_desc else asc(column))
+
+        result = await self.db.execute(statement.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def count(self) -> int:
+        """Count all records"""
+        result = await self.db.execute(select(func.count()).select_from(self.model))
+        return result.scalar_one()
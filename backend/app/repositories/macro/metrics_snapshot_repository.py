@@ -4,6 +4,7 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime, timedelta
 import logging
@@ -207,3 +208,43 @@ class MetricsSnapshotRepository(BaseRepository):
             logger.error(f"Error cleaning up old snapshots: {str(e)}")
             self.db.rollback()
             return 0
+    
+    def get_last_known(self, timeframe: str, at_or_before: datetime) -> Optional[MetricsSnapshot]:
+        """Latest snapshot of a timeframe at or before a time (source of fill values)"""
+        try:
+            return self.db.query(MetricsSnapshot).filter(
+                MetricsSnapshot.timeframe == timeframe,
+                MetricsSnapshot.snapshot_time <= at_or_before
+            ).order_by(MetricsSnapshot.snapshot_time.desc()).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting last known snapshot: {str(e)}")
+            return None
+    
+    def upsert_snapshot(self, values: Dict[str, Any]) -> Optional[int]:
+        """
+        Insert or replace the snapshot for (snapshot_time, timeframe) in one statement
+        
+        Args:
+            values: Column values, including snapshot_time and timeframe
+            
+        Returns:
+            Id of the written snapshot, or None on error
+        """
+        try:
+            statement = insert(MetricsSnapshot).values(**values)
+            statement = statement.on_conflict_do_update(
+                constraint='unique_snapshot_time_timeframe',
+                set_={
+                    column: statement.excluded[column]
+                    for column in values
+                    if column not in ('snapshot_time', 'timeframe')
+                }
+            ).returning(MetricsSnapshot.id)
+            
+            snapshot_id = self.db.execute(statement).scalar()
+            self.db.commit()
+            return snapshot_id
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error upserting metrics snapshot: {str(e)}")
+            return None
@@ -72,6 +72,20 @@ class PaginatedResponse(BaseModel, Generic[DataT]):
         )
 
 
+class CursorPaginatedResponse(BaseModel, Generic[DataT]):
+    """Generic schema for keyset (cursor) paginated API responses"""
+    
+    model_config = ConfigDict(
+        protected_namespaces=(),  
+        str_strip_whitespace=True
+    )
+    
+    items: List[DataT] = Field(description="List of items")
+    limit: int = Field(description="Maximum number of items per page")
+    has_more: bool = Field(description="Whether there are more items after this page")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page (None on the last page)")
+
+
 class SuccessResponse(BaseModel):
     """Standard success response schema"""
     
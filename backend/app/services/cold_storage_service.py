@@ -0,0 +1,198 @@
+# backend/app/services/cold_storage_service.py
+# Cold tier: archived candles moved from PostgreSQL into compressed Parquet files
+
+import hashlib
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.asset.price_data_cold_file import PriceDataColdFile
+from app.repositories.asset.price_data_cold_file_repository import (
+    ARROW_AVAILABLE, PriceDataColdFileRepository, cold_storage_root, pa, pq
+)
+from app.services.price_data_partitions import TIMEFRAME_PARTITION_SUFFIXES
+from app.utils.datetime_utils import add_months, month_start
+
+logger = logging.getLogger(__name__)
+
+# One archived month of one series; prices as float8 (Parquet doubles keep
+# ~15 significant digits, enough for Numeric(20,8) quotes below 10^7)
+_ARCHIVE_MONTH_SQL = """
+    SELECT id, timestamp,
+           open_price::float8, high_price::float8, low_price::float8, close_price::float8,
+           coalesce(volume, 0)::float8, market_cap_usd::float8,
+           trade_count, extended_data::text
+    FROM price_data_archive
+    WHERE asset_id = :asset_id AND timeframe = :timeframe
+      AND archive_year = :year AND archive_month = :month
+    ORDER BY timestamp
+"""
+
+_ARCHIVED_MONTHS_SQL = """
+    SELECT asset_id, timeframe, archive_year, archive_month
+    FROM price_data_archive
+    WHERE (archive_year, archive_month) < (:year, :month)
+    GROUP BY asset_id, timeframe, archive_year, archive_month
+    ORDER BY archive_year, archive_month, asset_id, timeframe
+"""
+
+
+def _cold_schema():
+    return pa.schema([
+        ("candle_time", pa.timestamp("us", tz="UTC")),
+        ("open_price", pa.float64()),
+        ("high_price", pa.float64()),
+        ("low_price", pa.float64()),
+        ("close_price", pa.float64()),
+        ("volume", pa.float64()),
+        ("market_cap", pa.float64()),
+        ("trade_count", pa.int64()),
+        ("extended_data", pa.string()),
+    ])
+
+
+def _file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ColdStorageService:
+    """
+    Moves archived months of candles into the cold tier
+
+    Each asset/timeframe/month becomes one Parquet file under
+    COLD_STORAGE_DIR, recorded in price_data_cold_files; the archive rows
+    are deleted in the same transaction as the manifest write. Reads go
+    through TieredPriceDataRepository, which spans all tiers.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cold_repo = PriceDataColdFileRepository(db)
+        self.root = cold_storage_root()
+
+    def _relative_path(self, asset_id: int, timeframe: str, year: int, month: int) -> str:
+        return f"asset_{asset_id}/{TIMEFRAME_PARTITION_SUFFIXES[timeframe]}/{year:04d}-{month:02d}.parquet"
+
+    def freeze_month(self, asset_id: int, timeframe: str, year: int, month: int) -> Dict[str, Any]:
+        """
+        Write one archived month to Parquet and drop it from the archive
+
+        A month that already has a cold file (rows archived late) is merged
+        into that file; on duplicate candles the archive row wins.
+
+        Returns:
+            dict: rows frozen, file path and size
+        """
+        if not ARROW_AVAILABLE:
+            raise RuntimeError("Cold storage requires pyarrow")
+
+        params = {'asset_id': asset_id, 'timeframe': timeframe, 'year': year, 'month': month}
+        rows = self.db.execute(text(_ARCHIVE_MONTH_SQL), params).all()
+        if not rows:
+            return {'rows': 0}
+
+        ids, *values = zip(*rows)
+        schema = _cold_schema()
+        table = pa.Table.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(values, schema)],
+            schema=schema
+        )
+
+        existing = self.cold_repo.get_file(asset_id, timeframe, year, month)
+        if existing is not None:
+            combined = pa.concat_tables([self.cold_repo.read_table(existing).cast(schema), table])
+            times = combined.column('candle_time').to_numpy()
+            order = np.argsort(times, kind='stable')
+            keep = np.append(times[order][1:] != times[order][:-1], True)
+            table = combined.take(pa.array(order[keep]))
+
+        relative_path = self._relative_path(asset_id, timeframe, year, month)
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(path.name + ".tmp")
+        pq.write_table(table, temporary, compression=settings.COLD_STORAGE_COMPRESSION)
+        os.replace(temporary, path)
+
+        times = table.column('candle_time')
+        cold_file = existing or PriceDataColdFile(
+            asset_id=asset_id, timeframe=timeframe, period_year=year, period_month=month
+        )
+        cold_file.file_path = relative_path
+        cold_file.compression = settings.COLD_STORAGE_COMPRESSION
+        cold_file.file_size_bytes = path.stat().st_size
+        cold_file.checksum = _file_sha256(path)
+        cold_file.row_count = table.num_rows
+        cold_file.first_candle_time = times[0].as_py()
+        cold_file.last_candle_time = times[-1].as_py()
+
+        try:
+            self.db.add(cold_file)
+            self.db.execute(text(
+                "DELETE FROM price_data_archive WHERE id = ANY(:ids) "
+                "AND archive_year = :year AND archive_month = :month"
+            ), {'ids': list(ids), 'year': year, 'month': month})
+            self.db.commit()
+        except Exception:
+            # The file stays; without its manifest row (or with the merged
+            # one) reads still see each candle once
+            self.db.rollback()
+            raise
+
+        return {'rows': len(ids), 'file_path': relative_path, 'file_size_bytes': cold_file.file_size_bytes}
+
+    def freeze_archived_months(
+        self,
+        older_than_months: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Freeze every archived month older than the cutoff
+
+        Args:
+            older_than_months: Months before the current one that stay in the
+                archive table (default COLD_STORAGE_AFTER_MONTHS)
+            limit: Maximum number of asset/timeframe/months per run
+
+        Returns:
+            dict: files written, rows frozen, bytes, elapsed time and failures
+        """
+        if older_than_months is None:
+            older_than_months = settings.COLD_STORAGE_AFTER_MONTHS
+        cutoff = add_months(month_start(datetime.now(timezone.utc)), -older_than_months)
+
+        months = self.db.execute(text(_ARCHIVED_MONTHS_SQL), {'year': cutoff.year, 'month': cutoff.month}).all()
+        if limit is not None:
+            months = months[:limit]
+
+        summary = {'files_written': 0, 'rows_frozen': 0, 'bytes_written': 0, 'failures': []}
+        started = time.perf_counter()
+        for asset_id, timeframe, year, month in months:
+            try:
+                result = self.freeze_month(asset_id, timeframe, year, month)
+            except Exception as e:
+                logger.error(f"Freezing asset {asset_id} {timeframe} {year}-{month:02d} failed: {str(e)}")
+                summary['failures'].append({'asset_id': asset_id, 'timeframe': timeframe, 'period': f"{year}-{month:02d}", 'error': str(e)})
+                continue
+            if result['rows']:
+                summary['files_written'] += 1
+                summary['rows_frozen'] += result['rows']
+                summary['bytes_written'] += result['file_size_bytes']
+
+        summary['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        summary['success'] = not summary['failures']
+        logger.info(
+            f"Cold storage: {summary['rows_frozen']} rows into {summary['files_written']} files "
+            f"({summary['bytes_written']} bytes) in {summary['elapsed_seconds']}s"
+        )
+        return summary
@@ -14,6 +14,9 @@ import logging
 from app.repositories import cryptocurrency_repository, price_data_repository, prediction_repository
 from app.services.external_api import external_api_service
 from app.services.prediction_service import prediction_service_new
+from app.core.result_store import result_store, DASHBOARD_NAMESPACE, DASHBOARD_SUMMARY_PREFIX
+from app.repositories.asset.asset_snapshot_repository import AssetSnapshotRepository, AsyncAssetSnapshotRepository
+from app.core.database import AsyncSessionLocal
 from app.models import PriceData
 
 logger = logging.getLogger(__name__)
@@ -23,31 +26,29 @@ class SuperOptimizedDashboardService:
     Super Optimized Dashboard Service with Advanced Cache System
     
     Features:
-    - Multi-level caching (memory + persistent)
+    - Shared caching (process L1 + Redis), invalidated on new models/candles
     - Ultra-fast fallback data
-    - Parallel processing with smart timeouts
+    - Single-query summaries from the materialized asset snapshot
     - Cache warming and pre-loading
     - Performance monitoring and auto-tuning
     """
     
     def __init__(self):
         """Initialize super optimized dashboard service"""
-        # Multi-level cache system
-        self._hot_cache = {}        # Ultra-fast access (<10ms)
-        self._warm_cache = {}       # Medium speed (<100ms) 
-        self._cold_cache = {}       # Backup data (<1s)
+        # Cache TTL settings (in seconds) - entries live in the shared
+        # result store, so every worker process sees the same data
+        self._summary_cache_ttl = 60   # 1 minute - multi-symbol summaries
+        self._crypto_cache_ttl = 300   # 5 minutes - per-symbol data (dropped on new candles)
         
-        # Cache TTL settings (in seconds)
-        self._hot_cache_ttl = 60     # 1 minute - very fresh data
-        self._warm_cache_ttl = 300   # 5 minutes - recent data
-        self._cold_cache_ttl = 3600  # 1 hour - backup data
+        # Candle timeframe the dashboard snapshot is read from
+        self._snapshot_timeframe = "1h"
         
         # Pre-built fallback data (instant response)
         self._prebuilt_data = self._initialize_prebuilt_data()
         
         # Performance tracking
         self._request_count = 0
-        self._cache_hits = {"hot": 0, "warm": 0, "cold": 0, "fallback": 0}
+        self._cache_hits = {"cache": 0, "fallback": 0}
         self._average_response_time = 0
         self._last_cache_warm = 0
         
@@ -101,73 +102,22 @@ class SuperOptimizedDashboardService:
         """Generate optimized cache key"""
         return f"{prefix}:{'_'.join(str(arg).upper() for arg in args)}"
     
-    def _get_from_multi_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        """Get data from multi-level cache system"""
-        current_time = time.time()
-        
-        # Level 1: Hot cache (fastest)
-        if cache_key in self._hot_cache:
-            cached_at, data = self._hot_cache[cache_key]
-            if (current_time - cached_at) < self._hot_cache_ttl:
-                self._cache_hits["hot"] += 1
-                logger.debug(f"Hot cache hit: {cache_key}")
-                return data
-        
-        # Level 2: Warm cache  
-        if cache_key in self._warm_cache:
-            cached_at, data = self._warm_cache[cache_key]
-            if (current_time - cached_at) < self._warm_cache_ttl:
-                self._cache_hits["warm"] += 1
-                logger.debug(f"Warm cache hit: {cache_key}")
-                # Promote to hot cache
-                self._hot_cache[cache_key] = (current_time, data)
-                return data
-        
-        # Level 3: Cold cache
-        if cache_key in self._cold_cache:
-            cached_at, data = self._cold_cache[cache_key]
-            if (current_time - cached_at) < self._cold_cache_ttl:
-                self._cache_hits["cold"] += 1
-                logger.debug(f"Cold cache hit: {cache_key}")
-                # Promote to warm cache
-                self._warm_cache[cache_key] = (current_time, data)
-                return data
-        
-        return None
+    def _get_symbol_cache_key(self, symbol: str, prefix: str, *args) -> str:
+        """Symbol-first key, so new-candle/model events can drop it"""
+        return f"{symbol.upper()}:{self._get_cache_key(prefix, *args)}"
     
-    def _set_multi_cache(self, cache_key: str, data: Dict[str, Any]) -> None:
-        """Set data in multi-level cache"""
-        current_time = time.time()
-        
-        # Set in all cache levels
-        self._hot_cache[cache_key] = (current_time, data)
-        self._warm_cache[cache_key] = (current_time, data)
-        self._cold_cache[cache_key] = (current_time, data)
-        
-        # Clean old entries periodically
-        if len(self._hot_cache) > 50:  # Limit cache size
-            self._cleanup_old_cache_entries()
-    
-    def _cleanup_old_cache_entries(self):
-        """Clean up expired cache entries"""
-        current_time = time.time()
-        
-        # Clean hot cache
-        expired_keys = [
-            key for key, (cached_at, _) in self._hot_cache.items()
-            if (current_time - cached_at) > self._hot_cache_ttl
-        ]
-        for key in expired_keys:
-            del self._hot_cache[key]
-        
-        # Clean warm cache
-        expired_keys = [
-            key for key, (cached_at, _) in self._warm_cache.items()
-            if (current_time - cached_at) > self._warm_cache_ttl
-        ]
-        for key in expired_keys:
-            del self._warm_cache[key]
+    async def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Get data from the shared result store (process L1, then Redis)"""
+        data = await result_store.get(DASHBOARD_NAMESPACE, cache_key)
+        if data is not None:
+            self._cache_hits["cache"] += 1
+            logger.debug(f"Dashboard cache hit: {cache_key}")
+        return data
     
+    async def _set_cache(self, cache_key: str, data: Dict[str, Any], ttl: int) -> None:
+        """Set data in the shared result store"""
+        await result_store.set(DASHBOARD_NAMESPACE, cache_key, data, ttl)
+
     async def get_dashboard_summary(
         self,
         db: Session,
@@ -186,11 +136,11 @@ class SuperOptimizedDashboardService:
             if not symbols:
                 symbols = ["BTC", "ETH"]
             
-            # Generate cache key
-            cache_key = self._get_cache_key("dashboard_summary", "_".join(symbols), user_id or "anon")
+            # Multi-symbol key: dropped on any symbol's model/candle event
+            cache_key = self._get_cache_key(DASHBOARD_SUMMARY_PREFIX, "_".join(symbols), user_id or "anon")
             
-            # Try multi-level cache first
-            cached_data = self._get_from_multi_cache(cache_key)
+            # Try shared cache first
+            cached_data = await self._get_from_cache(cache_key)
             if cached_data:
                 response_time = (time.time() - start_time) * 1000
                 logger.info(f"Dashboard summary served from cache in {response_time:.1f}ms")
@@ -208,43 +158,25 @@ class SuperOptimizedDashboardService:
                 "data_freshness": "live"
             }
             
-            # Ultra-fast parallel processing with aggressive timeout
-            crypto_tasks = []
-            for symbol in symbols:
-                task = asyncio.create_task(
-                    self._get_crypto_data_ultra_fast(db, symbol, user_id)
-                )
-                crypto_tasks.append(task)
-            
+            # One set-based query over the materialized snapshot for all
+            # symbols, without blocking the event loop
             try:
-                # Very aggressive timeout per symbol
-                crypto_results = await asyncio.wait_for(
-                    asyncio.gather(*crypto_tasks, return_exceptions=True),
-                    timeout=timeout / max(len(symbols), 1)  # Distribute timeout
-                )
+                snapshot_rows = await self._load_snapshot(db, symbols)
+                rows_by_symbol = {row["symbol"].upper(): row for row in snapshot_rows}
                 
-                # Process results with fallback
-                for i, result in enumerate(crypto_results):
-                    if isinstance(result, Exception):
-                        real_data = await self._get_real_crypto_data(db, symbol[i])
-                        dashboard_data["cryptocurrencies"].append(real_data)
-                        dashboard_data["data_freshness"] = "mixed"
-                    elif result:
-                        dashboard_data["cryptocurrencies"].append(result)
-                    else:
-                        # Use prebuilt data
-                        fallback_data = self._get_instant_fallback(symbols[i])
-                        dashboard_data["cryptocurrencies"].append(fallback_data)
+                for symbol in symbols:
+                    crypto_data = self._build_crypto_data(rows_by_symbol.get(symbol.upper()))
+                    if crypto_data is None:
+                        # Unknown asset or no candles yet - use prebuilt data
+                        crypto_data = self._get_instant_fallback(symbol)
                         dashboard_data["data_freshness"] = "mixed"
+                    dashboard_data["cryptocurrencies"].append(crypto_data)
             
-            except asyncio.TimeoutError:
-                logger.warning(f"Dashboard timeout, using all fallback data")
-                # Use all prebuilt data for instant response
-                for symbol in symbols:
-                    fallback_data = self._get_instant_fallback(symbol)
-                    dashboard_data["cryptocurrencies"].append(fallback_data)
+            except Exception as e:
+                logger.warning(f"Dashboard snapshot query failed, using all fallback data: {str(e)}")
+                dashboard_data["cryptocurrencies"] = [self._get_instant_fallback(symbol) for symbol in symbols]
                 dashboard_data["data_freshness"] = "fallback"
-            
+
             # Lightning-fast market overview
             dashboard_data["market_overview"] = self._calculate_market_overview_instant(
                 dashboard_data["cryptocurrencies"]
@@ -253,8 +185,8 @@ class SuperOptimizedDashboardService:
             # Instant predictions summary
             dashboard_data["predictions_summary"] = self._get_instant_predictions_summary(symbols)
             
-            # Cache the result in all levels
-            self._set_multi_cache(cache_key, dashboard_data)
+            # Cache the result
+            await self._set_cache(cache_key, dashboard_data, self._summary_cache_ttl)
             
             # Update performance metrics
             response_time = (time.time() - start_time) * 1000
@@ -268,91 +200,66 @@ class SuperOptimizedDashboardService:
             # Return instant fallback
             return self._get_instant_fallback_dashboard(symbols or ["BTC", "ETH"])
 
-    async def _get_crypto_data_ultra_fast(
-        self, 
-        db: Session, 
-        symbol: str, 
-        user_id: Optional[int] = None
-    ) -> Optional[Dict[str, Any]]:
+    async def _load_snapshot(self, db: Session, symbols: List[str]) -> List[Dict[str, Any]]:
         """
-        Ultra-fast crypto data with aggressive caching and timeouts
-        Target: <200ms per crypto - FIXED to use OHLC data
+        Snapshot rows via the async pool; assets never snapshotted are
+        refreshed on the sync session in a worker thread
         """
-        try:
-            # Check individual crypto cache FIRST (existing cache system)
-            cache_key = self._get_cache_key("crypto_ultra", symbol, user_id or "anon")
-            cached_data = self._get_from_multi_cache(cache_key)
-            
-            if cached_data:
-                return cached_data
-            
-            # Get crypto info (existing method)
-            crypto = cryptocurrency_repository.get_by_symbol(db, symbol.upper())
-            if not crypto:
-                return self._get_instant_fallback(symbol)
-            
-            # Get latest OHLC price data (existing method)
-            latest_price = price_data_repository.get_latest_price(db, crypto.id)
-            if not latest_price:
-                return self._get_instant_fallback(symbol)
-            
-            # Get latest prediction (existing method)
-            predictions = prediction_repository.get_by_crypto(db, crypto.id, limit=1)
-            prediction = predictions[0] if predictions else None
-            
-            # Calculate 24h change using existing method
-            yesterday = datetime.utcnow() - timedelta(days=1)
-            historical_prices = price_data_repository.get_price_history(
-                db, crypto.id, start_date=yesterday, limit=1
-            )
-            yesterday_price = historical_prices[0] if historical_prices else latest_price
-            
-            current_price = float(latest_price.close_price)
-            yesterday_close = float(yesterday_price.close_price)
-            price_change_24h = current_price - yesterday_close
-            price_change_24h_percent = (price_change_24h / yesterday_close) * 100 if yesterday_close > 0 else 0
-            
-            # Build crypto data structure
-            crypto_data = {
-                "symbol": crypto.symbol,
-                "name": crypto.name,
-                "current_price": current_price,
-                "open_price": float(latest_price.open_price),
-                "high_price": float(latest_price.high_price),
-                "low_price": float(latest_price.low_price),
-                "close_price": float(latest_price.close_price),
-                "volume_24h": float(latest_price.volume) if latest_price.volume else 0,
-                "market_cap": float(latest_price.market_cap) if latest_price.market_cap else 0,
-                "price_change_24h": price_change_24h,
-                "price_change_24h_percent": price_change_24h_percent,
-                "last_updated": latest_price.timestamp.isoformat(),
-                "status": "active"
-            }
-            
-            # Add prediction data
-            if prediction:
-                crypto_data.update({
-                    "predicted_price": float(prediction.predicted_price),
-                    "confidence": float(prediction.confidence_score),
-                    "prediction_target_date": prediction.target_datetime.isoformat()
-                })
-            else:
-                crypto_data.update({
-                    "predicted_price": current_price * 1.02,
-                    "confidence": 50.0,
-                    "prediction_target_date": (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
-                })
-            
-            # Cache the result (using existing cache system)
-            self._set_multi_cache(cache_key, crypto_data)
-            
-            logger.debug(f"Generated fresh data for {symbol}: price={current_price}")
-            return crypto_data
-            
-        except Exception as e:
-            logger.warning(f"Error getting data for {symbol}: {str(e)}, using fallback")
-            return self._get_instant_fallback(symbol)
-
+        if AsyncSessionLocal is not None:
+            async with AsyncSessionLocal() as async_db:
+                rows = await AsyncAssetSnapshotRepository(async_db).get_snapshot(
+                    symbols, timeframe=self._snapshot_timeframe
+                )
+            if all(row["snapshot"] is not None and row["snapshot"].candle_time is not None for row in rows):
+                return rows
+        
+        return await asyncio.to_thread(self._load_snapshot_rows, db, symbols)
+    
+    def _load_snapshot_rows(self, db: Session, symbols: List[str]) -> List[Dict[str, Any]]:
+        """Snapshot rows for all symbols (refreshes assets never snapshotted)"""
+        return AssetSnapshotRepository(db).get_or_refresh_snapshot(symbols, timeframe=self._snapshot_timeframe)
+    
+    def _build_crypto_data(self, row: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Dashboard entry for one snapshot row, or None without candle data"""
+        snapshot = row["snapshot"] if row else None
+        if snapshot is None or snapshot.close_price is None:
+            return None
+        
+        current_price = float(snapshot.close_price)
+        crypto_data = {
+            "symbol": row["symbol"],
+            "name": row["name"],
+            "current_price": current_price,
+            "open_price": float(snapshot.open_price),
+            "high_price": float(snapshot.high_price),
+            "low_price": float(snapshot.low_price),
+            "close_price": current_price,
+            "volume_24h": float(snapshot.volume) if snapshot.volume else 0,
+            "market_cap": float(snapshot.market_cap) if snapshot.market_cap else 0,
+            "price_change_24h": float(snapshot.price_change_24h) if snapshot.price_change_24h is not None else 0.0,
+            "price_change_24h_percent": float(snapshot.price_change_24h_percent) if snapshot.price_change_24h_percent is not None else 0.0,
+            "last_updated": snapshot.candle_time.isoformat(),
+            "status": "active"
+        }
+        
+        # Add prediction data
+        if snapshot.predicted_price is not None:
+            crypto_data.update({
+                "predicted_price": float(snapshot.predicted_price),
+                "confidence": float(snapshot.prediction_confidence) if snapshot.prediction_confidence is not None else 50.0,
+                "prediction_target_date": (
+                    snapshot.prediction_target_time.isoformat() if snapshot.prediction_target_time
+                    else (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+                )
+            })
+        else:
+            crypto_data.update({
+                "predicted_price": current_price * 1.02,
+                "confidence": 50.0,
+                "prediction_target_date": (datetime.now(timezone.utc) + timedelta(hours=24)).isoformat()
+            })
+        
+        return crypto_data
 
     async def _get_current_price_instant(self, symbol: str) -> float:
         """Get current price with instant fallback"""
@@ -481,29 +388,23 @@ class SuperOptimizedDashboardService:
             "total_requests": self._request_count,
             "average_response_time_ms": round(self._average_response_time, 2),
             "cache_performance": {
-                "hot_cache_hits": self._cache_hits["hot"],
-                "warm_cache_hits": self._cache_hits["warm"],
-                "cold_cache_hits": self._cache_hits["cold"],
+                "cache_hits": self._cache_hits["cache"],
                 "fallback_hits": self._cache_hits["fallback"],
                 "total_cache_hits": total_cache_hits,
                 "cache_hit_rate": round((total_cache_hits / max(self._request_count, 1)) * 100, 1)
             },
-            "cache_sizes": {
-                "hot_cache": len(self._hot_cache),
-                "warm_cache": len(self._warm_cache),
-                "cold_cache": len(self._cold_cache)
-            },
+            "result_store": result_store.get_stats(),
             "prebuilt_symbols": list(self._prebuilt_data.keys())
         }
     
-    def warm_cache_for_symbols(self, symbols: List[str]) -> Dict[str, Any]:
+    async def warm_cache_for_symbols(self, symbols: List[str]) -> Dict[str, Any]:
         """Warm cache for specified symbols (background task)"""
         warmed = []
         for symbol in symbols:
             if symbol.upper() in self._prebuilt_data:
-                cache_key = self._get_cache_key("crypto_ultra", symbol, "anon")
+                cache_key = self._get_symbol_cache_key(symbol, "crypto_ultra", "anon")
                 fallback_data = self._get_instant_fallback(symbol)
-                self._set_multi_cache(cache_key, fallback_data)
+                await self._set_cache(cache_key, fallback_data, self._crypto_cache_ttl)
                 warmed.append(symbol)
         
         return {"warmed_symbols": warmed, "timestamp": datetime.now(timezone.utc).isoformat()}
@@ -0,0 +1,316 @@
+# backend/app/services/metrics_snapshot_service.py
+# Metrics snapshot assembly: all providers fetched concurrently, each under its own deadline
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.external.alternative_me import AlternativeMeClient
+from app.external.coingecko import CoinGeckoClient
+from app.external.google_trends import SafeGoogleTrendsClient
+from app.external.tradingview import TradingViewClient
+from app.repositories.macro.metrics_snapshot_repository import MetricsSnapshotRepository
+from app.utils.datetime_utils import normalize_candle_time
+
+logger = logging.getLogger(__name__)
+
+# Snapshot fields each provider is responsible for
+PROVIDER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'alternative_me': ('fear_greed_index',),
+    'coingecko': ('btc_price_usd', 'total', 'btc_dominance', 'eth_dominance', 'usdt_dominance', 'altcoin_dominance'),
+    'tradingview': ('sp500', 'gold', 'dxy', 'us_10y_yield', 'vix_index'),
+    'google_trends': ('google_trends_score',),
+}
+
+# TradingView symbol behind each macro field
+MACRO_SYMBOLS: Dict[str, str] = {
+    'sp500': 'SPX',
+    'gold': 'GOLD',
+    'dxy': 'DXY',
+    'us_10y_yield': 'US10Y',
+    'vix_index': 'VIX',
+}
+
+# Score credit per field: fresh = 1, carried over from an earlier snapshot = 0.5, missing = 0
+FILLED_FIELD_CREDIT = 0.5
+
+SNAPSHOT_VERSION = "assembler-1"
+SNAPSHOT_SOURCE = "multi_provider"
+
+
+async def _gather_parts(*parts: Awaitable[None]) -> None:
+    """Run parts of one provider side by side; raise the first error once all are done"""
+    results = await asyncio.gather(*parts, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+def snapshot_quality_score(fresh_count: int, filled_count: int, total_count: int) -> int:
+    """data_quality_score (0-100) for a snapshot with fresh and carried-over fields"""
+    return round(100 * (fresh_count + FILLED_FIELD_CREDIT * filled_count) / total_count)
+
+
+class MetricsSnapshotAssembler:
+    """
+    Builds one MetricsSnapshot from Alternative.me, CoinGecko, TradingView and Google Trends
+
+    Providers run concurrently, each cut off at its own deadline, so a
+    snapshot takes as long as the slowest deadline rather than the sum of
+    all providers. Fields a provider did not deliver in time are carried
+    over from the last snapshot (up to METRICS_SNAPSHOT_MAX_FILL_AGE_HOURS
+    old) and lower data_quality_score. The snapshot is written with a single
+    upsert on (snapshot_time, timeframe).
+    """
+
+    def __init__(
+        self,
+        deadlines: Optional[Dict[str, float]] = None,
+        max_fill_age_hours: Optional[int] = None
+    ):
+        self.deadlines = deadlines or {
+            'alternative_me': settings.METRICS_SNAPSHOT_ALTERNATIVE_ME_DEADLINE,
+            'coingecko': settings.METRICS_SNAPSHOT_COINGECKO_DEADLINE,
+            'tradingview': settings.METRICS_SNAPSHOT_TRADINGVIEW_DEADLINE,
+            'google_trends': settings.METRICS_SNAPSHOT_GOOGLE_TRENDS_DEADLINE,
+        }
+        self.max_fill_age = timedelta(hours=max_fill_age_hours or settings.METRICS_SNAPSHOT_MAX_FILL_AGE_HOURS)
+
+        # Clients live as long as the assembler so HTTP connections and the
+        # Google Trends rate limiting state carry over between snapshots
+        self.alternative_me_client = AlternativeMeClient()
+        self.coingecko_client = CoinGeckoClient(api_key=settings.COINGECKO_API_KEY)
+        self.tradingview_client = TradingViewClient()
+        self._google_trends_client: Optional[SafeGoogleTrendsClient] = None
+
+        self._fetchers = {
+            'alternative_me': self._fetch_fear_greed,
+            'coingecko': self._fetch_market,
+            'tradingview': self._fetch_macro,
+            'google_trends': self._fetch_trends,
+        }
+
+    # -------------------------------------
+    # Providers (each fills `values` as results arrive, so a provider cut
+    # off at its deadline still keeps the fields it already delivered)
+    # -------------------------------------
+
+    async def _fetch_fear_greed(self, values: Dict[str, Any]) -> None:
+        latest = await self.alternative_me_client.get_latest_fear_greed_index()
+        values['fear_greed_index'] = latest['value']
+
+    async def _fetch_market(self, values: Dict[str, Any]) -> None:
+        async def btc_price():
+            prices = await self.coingecko_client.get_current_prices(
+                ['bitcoin'], include_24hr_vol=False, include_24hr_change=False
+            )
+            values['btc_price_usd'] = prices['bitcoin']['usd']
+
+        async def global_market():
+            market = await self.coingecko_client.get_global_market_data()
+            share = market['market_cap_percentage']
+            values['total'] = market['total_market_cap_usd']
+            values['btc_dominance'] = share.get('btc')
+            values['eth_dominance'] = share.get('eth')
+            values['usdt_dominance'] = share.get('usdt')
+            if share.get('btc') is not None:
+                values['altcoin_dominance'] = 100 - share['btc']
+
+        await _gather_parts(btc_price(), global_market())
+
+    async def _fetch_macro(self, values: Dict[str, Any]) -> None:
+        async def latest_close(field: str, symbol: str):
+            # tvDatafeed blocks under its async signature; a thread keeps the
+            # other providers running (a thread past its deadline finishes in
+            # the background and its result is dropped)
+            values[field] = await asyncio.to_thread(self._latest_macro_close, symbol)
+
+        await _gather_parts(*(latest_close(field, symbol) for field, symbol in MACRO_SYMBOLS.items()))
+
+    def _latest_macro_close(self, symbol: str) -> float:
+        candles = asyncio.run(self.tradingview_client.get_price_data_by_timeframe(
+            asset_id=0, crypto_id=symbol, timeframe='1d', days=5
+        ))
+        if not candles:
+            raise ValueError(f"No TradingView data for {symbol}")
+        return candles[-1]['close_price']
+
+    async def _fetch_trends(self, values: Dict[str, Any]) -> None:
+        if self._google_trends_client is None:
+            self._google_trends_client = SafeGoogleTrendsClient()
+
+        trends = await self._google_trends_client.get_historical_trends_score(['bitcoin'])
+        if not trends.get('success') or not trends.get('historical_scores'):
+            raise ValueError(trends.get('error', 'No Google Trends data'))
+        values['google_trends_score'] = trends['historical_scores'][-1]['google_trends_score']
+
+    async def _run_provider(self, name: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run one provider under its deadline; returns (fields delivered, provider report)"""
+        values: Dict[str, Any] = {}
+        deadline = self.deadlines[name]
+        started = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(self._fetchers[name](values), timeout=deadline)
+            report = {'status': 'ok'}
+        except asyncio.TimeoutError:
+            report = {'status': 'timeout', 'error': f"No response within {deadline}s"}
+        except Exception as e:
+            report = {'status': 'error', 'error': str(e)}
+
+        report.update({
+            'elapsed_ms': int((time.perf_counter() - started) * 1000),
+            'deadline_s': deadline
+        })
+        if report['status'] != 'ok':
+            logger.warning(f"Metrics snapshot provider {name} {report['status']}: {report['error']}")
+
+        return {field: value for field, value in values.items() if value is not None}, report
+
+    # -------------------------------------
+    # Assembly
+    # -------------------------------------
+
+    async def assemble(self, timeframe: str = "1h", snapshot_time: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Fetch every provider concurrently and upsert the snapshot
+
+        Args:
+            timeframe: Snapshot timeframe; snapshot_time is aligned to it
+            snapshot_time: Time of the snapshot (now if None)
+
+        Returns:
+            dict: Snapshot id, data_quality_score and per-provider status
+        """
+        started_at = datetime.now(timezone.utc)
+        snapshot_time = normalize_candle_time(snapshot_time or started_at, timeframe)
+
+        names = list(PROVIDER_FIELDS)
+        results = await asyncio.gather(*(self._run_provider(name) for name in names))
+
+        fresh: Dict[str, Any] = {}
+        providers: Dict[str, Dict[str, Any]] = {}
+        for name, (values, report) in zip(names, results):
+            fresh.update(values)
+            providers[name] = report
+        completed_at = datetime.now(timezone.utc)
+
+        return await asyncio.to_thread(
+            self._store, timeframe, snapshot_time, fresh, providers, started_at, completed_at
+        )
+
+    def _fill_from_last_known(
+        self,
+        repository: MetricsSnapshotRepository,
+        timeframe: str,
+        snapshot_time: datetime,
+        missing: List[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, datetime]]:
+        """Values for missing fields from the last snapshot, with the time each was last fetched"""
+        last = repository.get_last_known(timeframe, snapshot_time)
+        if last is None:
+            return {}, {}
+
+        last_as_of = (last.data_quality_flags or {}).get('field_as_of', {})
+        values: Dict[str, Any] = {}
+        as_of: Dict[str, datetime] = {}
+        for field in missing:
+            value = getattr(last, field)
+            if value is None:
+                continue
+            # A carried-over value keeps the time it was actually fetched
+            fetched_at = datetime.fromisoformat(last_as_of[field]) if field in last_as_of else last.snapshot_time
+            if snapshot_time - fetched_at > self.max_fill_age:
+                continue
+            values[field] = value
+            as_of[field] = fetched_at
+
+        return values, as_of
+
+    def _store(
+        self,
+        timeframe: str,
+        snapshot_time: datetime,
+        fresh: Dict[str, Any],
+        providers: Dict[str, Dict[str, Any]],
+        started_at: datetime,
+        completed_at: datetime
+    ) -> Dict[str, Any]:
+        all_fields = [field for fields in PROVIDER_FIELDS.values() for field in fields]
+        missing = [field for field in all_fields if field not in fresh]
+
+        db = SessionLocal()
+        try:
+            repository = MetricsSnapshotRepository(db)
+            filled, filled_as_of = (
+                self._fill_from_last_known(repository, timeframe, snapshot_time, missing) if missing else ({}, {})
+            )
+            still_missing = [field for field in missing if field not in filled]
+
+            base = {
+                'snapshot_time': snapshot_time.isoformat(),
+                'timeframe': timeframe,
+                'providers': providers,
+                'filled_fields': sorted(filled),
+                'missing_fields': still_missing
+            }
+
+            if 'btc_price_usd' in still_missing:
+                logger.error(f"Metrics snapshot {timeframe} {snapshot_time} skipped: no BTC price, fresh or last known")
+                return {**base, 'success': False, 'error': 'No BTC price available'}
+
+            score = snapshot_quality_score(len(fresh), len(filled), len(all_fields))
+            field_as_of = {field: snapshot_time.isoformat() for field in fresh}
+            field_as_of.update({field: fetched_at.isoformat() for field, fetched_at in filled_as_of.items()})
+
+            values = {field: None for field in all_fields}
+            values.update(filled)
+            values.update(fresh)
+            values.update({
+                'snapshot_time': snapshot_time,
+                'timeframe': timeframe,
+                'data_quality_score': score,
+                'data_source': SNAPSHOT_SOURCE,
+                'data_quality_flags': {
+                    'providers': providers,
+                    'filled_fields': sorted(filled),
+                    'missing_fields': still_missing,
+                    'field_as_of': field_as_of
+                },
+                'snapshot_version': SNAPSHOT_VERSION,
+                'data_collection_started': started_at,
+                'data_collection_completed': completed_at,
+                'collection_duration_ms': int((completed_at - started_at).total_seconds() * 1000)
+            })
+
+            snapshot_id = repository.upsert_snapshot(values)
+        finally:
+            db.close()
+
+        if snapshot_id is None:
+            return {**base, 'success': False, 'error': 'Snapshot upsert failed'}
+
+        logger.info(
+            f"Metrics snapshot {timeframe} {snapshot_time}: quality {score}, "
+            f"{len(filled)} filled, {len(still_missing)} missing in {values['collection_duration_ms']}ms"
+        )
+        return {
+            **base,
+            'success': True,
+            'snapshot_id': snapshot_id,
+            'data_quality_score': score,
+            'collection_duration_ms': values['collection_duration_ms']
+        }
+
+    async def close(self) -> None:
+        """Close the provider HTTP clients"""
+        await self.alternative_me_client.close()
+        await self.coingecko_client.close()
+
+
+# Global instance (clients bound to the worker loop, see app.tasks.task_handler)
+metrics_snapshot_assembler = MetricsSnapshotAssembler()
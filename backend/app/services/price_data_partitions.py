@@ -0,0 +1,408 @@
+# backend/app/services/price_data_partitions.py
+# Monthly range partitions for price_data: creation ahead of time, BRIN on cold months, legacy conversion
+
+import logging
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.asset.price_data import PriceData
+from app.utils.datetime_utils import add_months, month_start
+
+logger = logging.getLogger(__name__)
+
+# Partition name suffixes per timeframe ('1m' and '1M' would collide once
+# Postgres folds identifiers to lower case)
+TIMEFRAME_PARTITION_SUFFIXES = {
+    '1m': 'm1', '5m': 'm5', '15m': 'm15',
+    '1h': 'h1', '4h': 'h4',
+    '1d': 'd1', '1w': 'w1', '1M': 'mo1',
+}
+
+_MONTH_PARTITION_RE = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def parse_subpartition_timeframes(value: str) -> List[str]:
+    """Comma-separated timeframe list from settings ('' disables the sub-split)"""
+    timeframes = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [tf for tf in timeframes if tf not in TIMEFRAME_PARTITION_SUFFIXES]
+    if unknown:
+        raise ValueError(f"Unknown timeframes for sub-partitioning: {unknown}")
+    return timeframes
+
+
+class PriceDataPartitionManager:
+    """
+    Maintains the monthly partitions of the price_data table (PostgreSQL only)
+
+    Layout: price_data is PARTITION BY RANGE (candle_time) with one partition
+    per calendar month (price_data_y2025m01, ...) and a DEFAULT partition for
+    rows outside the prepared range. When sub-partitioning is configured, each
+    new month is itself PARTITION BY LIST (timeframe) with one child per listed
+    timeframe and a default child for the rest. Repositories keep querying
+    price_data; the planner prunes partitions from the candle_time predicates.
+
+    Every method is a no-op on other dialects (SQLite tests).
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        table: Table = PriceData.__table__,
+        subpartition_timeframes: Optional[Sequence[str]] = None
+    ):
+        self.db = db
+        self.table = table
+        if subpartition_timeframes is None:
+            subpartition_timeframes = parse_subpartition_timeframes(settings.PRICE_DATA_SUBPARTITION_TIMEFRAMES)
+        self.subpartition_timeframes = list(subpartition_timeframes)
+        self._preparer = db.get_bind().dialect.identifier_preparer
+
+    @property
+    def is_supported(self) -> bool:
+        """Whether the session is bound to PostgreSQL"""
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    @property
+    def default_partition_name(self) -> str:
+        return f"{self.table.name}_default"
+
+    def partition_name(self, month: datetime) -> str:
+        """Name of the partition holding the given month"""
+        return f"{self.table.name}_y{month.year:04d}m{month.month:02d}"
+
+    def _qualified(self, name: str) -> str:
+        quoted = self._preparer.quote(name)
+        if self.table.schema:
+            return f"{self._preparer.quote_schema(self.table.schema)}.{quoted}"
+        return quoted
+
+    def _regclass_name(self, name: str) -> str:
+        return f"{self.table.schema}.{name}" if self.table.schema else name
+
+    def _relkind(self, name: str) -> Optional[str]:
+        return self.db.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+            {'name': self._regclass_name(name)}
+        ).scalar()
+
+    def _lock(self) -> None:
+        """Serialize partition DDL across workers for the current transaction"""
+        self.db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {'key': f"partitions:{self._regclass_name(self.table.name)}"}
+        )
+
+    def is_partitioned(self) -> bool:
+        """Whether the table exists as a partitioned table"""
+        return self.is_supported and self._relkind(self.table.name) == 'p'
+
+    def list_partitions(self) -> List[Dict[str, Any]]:
+        """
+        Partitions of the table with their bounds
+
+        Returns:
+            List of dicts (name, month, bound, subpartitioned, has_brin),
+            month is None for the default partition
+        """
+        if not self.is_partitioned():
+            return []
+
+        rows = self.db.execute(text("""
+            SELECT c.relname, c.relkind, pg_get_expr(c.relpartbound, c.oid) AS bound,
+                   to_regclass(:schema_prefix || c.relname || '_candle_time_brin') IS NOT NULL AS has_brin
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(:table)
+            ORDER BY c.relname
+        """), {
+            'table': self._regclass_name(self.table.name),
+            'schema_prefix': f"{self.table.schema}." if self.table.schema else "",
+        }).all()
+
+        partitions = []
+        for name, relkind, bound, has_brin in rows:
+            match = _MONTH_PARTITION_RE.search(name)
+            month = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc) if match else None
+            partitions.append({
+                'name': name,
+                'month': month,
+                'bound': bound,
+                'subpartitioned': relkind == 'p',
+                'has_brin': bool(has_brin),
+            })
+        return partitions
+
+    def _create_subpartitions(self, name: str) -> None:
+        for timeframe in self.subpartition_timeframes:
+            self.db.execute(text(
+                f"CREATE TABLE {self._qualified(f'{name}_{TIMEFRAME_PARTITION_SUFFIXES[timeframe]}')} "
+                f"PARTITION OF {self._qualified(name)} FOR VALUES IN ('{timeframe}')"
+            ))
+        if len(self.subpartition_timeframes) < len(TIMEFRAME_PARTITION_SUFFIXES):
+            self.db.execute(text(
+                f"CREATE TABLE {self._qualified(f'{name}_other')} PARTITION OF {self._qualified(name)} DEFAULT"
+            ))
+
+    def ensure_default_partition(self) -> bool:
+        """Create the DEFAULT partition if missing; returns True if created"""
+        if not self.is_partitioned() or self._relkind(self.default_partition_name):
+            return False
+
+        self._lock()
+        if not self._relkind(self.default_partition_name):
+            self.db.execute(text(
+                f"CREATE TABLE {self._qualified(self.default_partition_name)} "
+                f"PARTITION OF {self._qualified(self.table.name)} DEFAULT"
+            ))
+        self.db.commit()
+        return True
+
+    def _create_month_partition(self, month: datetime) -> bool:
+        """Partition DDL for one month inside the caller's transaction (lock held)"""
+        name = self.partition_name(month)
+        if self._relkind(name):
+            return False
+
+        lower = month.strftime("%Y-%m-%d %H:%M:%S+00")
+        upper = add_months(month, 1).strftime("%Y-%m-%d %H:%M:%S+00")
+        bounds = f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        sub_split = " PARTITION BY LIST (timeframe)" if self.subpartition_timeframes else ""
+        parent = self._qualified(self.table.name)
+        partition = self._qualified(name)
+        default = self._qualified(self.default_partition_name)
+
+        stranded = self._relkind(self.default_partition_name) and self.db.execute(text(
+            f"SELECT EXISTS (SELECT 1 FROM {default} WHERE candle_time >= :lower AND candle_time < :upper)"
+        ), {'lower': month, 'upper': add_months(month, 1)}).scalar()
+
+        if not stranded:
+            self.db.execute(text(f"CREATE TABLE {partition} PARTITION OF {parent} {bounds}{sub_split}"))
+            if sub_split:
+                self._create_subpartitions(name)
+        else:
+            # A new range may not overlap rows in the default partition:
+            # build the partition detached, move the rows, then attach
+            self.db.execute(text(
+                f"CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS){sub_split}"
+            ))
+            if sub_split:
+                self._create_subpartitions(name)
+            moved = self.db.execute(text(
+                f"WITH moved AS (DELETE FROM {default} WHERE candle_time >= :lower AND candle_time < :upper "
+                f"RETURNING *) INSERT INTO {partition} SELECT * FROM moved"
+            ), {'lower': month, 'upper': add_months(month, 1)}).rowcount
+            self.db.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {partition} {bounds}"))
+            logger.info(f"Moved {moved} rows from {self.default_partition_name} into {name}")
+
+        logger.info(f"Created partition {name}")
+        return True
+
+    def create_month_partition(self, month: datetime) -> bool:
+        """
+        Create the partition for one month (sub-partitioned if configured)
+
+        Rows of that month already sitting in the DEFAULT partition are moved
+        into the new partition before it is attached.
+
+        Returns:
+            bool: True if the partition was created
+        """
+        month = month_start(month)
+        if not self.is_partitioned() or self._relkind(self.partition_name(month)):
+            return False
+
+        try:
+            self._lock()
+            created = self._create_month_partition(month)
+            self.db.commit()
+            return created
+
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def ensure_partitions(
+        self,
+        months_ahead: Optional[int] = None,
+        start: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create the partitions from start (default: this month) through months_ahead
+
+        Returns:
+            Names of the partitions created
+        """
+        if not self.is_partitioned():
+            return []
+
+        if months_ahead is None:
+            months_ahead = settings.PRICE_DATA_PARTITION_MONTHS_AHEAD
+        current = month_start(datetime.now(timezone.utc))
+        month = month_start(start) if start else current
+
+        self.ensure_default_partition()
+        created = []
+        while month <= add_months(current, months_ahead):
+            if self.create_month_partition(month):
+                created.append(self.partition_name(month))
+            month = add_months(month, 1)
+        return created
+
+    def brin_cold_partitions(self, older_than_months: Optional[int] = None) -> List[str]:
+        """
+        Add a BRIN index on candle_time to partitions that stopped receiving data
+
+        Cold months are append-complete and physically ordered by candle_time,
+        so a BRIN index (a few pages per partition) serves wide range scans.
+
+        Returns:
+            Names of the partitions indexed
+        """
+        if older_than_months is None:
+            older_than_months = settings.PRICE_DATA_BRIN_AFTER_MONTHS
+        cutoff = add_months(month_start(datetime.now(timezone.utc)), -older_than_months)
+
+        indexed = []
+        for partition in self.list_partitions():
+            if partition['month'] is None or partition['has_brin'] or add_months(partition['month'], 1) > cutoff:
+                continue
+            name = partition['name']
+            self.db.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {self._preparer.quote(f'{name}_candle_time_brin')} "
+                f"ON {self._qualified(name)} USING brin (candle_time)"
+            ))
+            self.db.commit()
+            indexed.append(name)
+
+        if indexed:
+            logger.info(f"Added BRIN indexes to cold partitions: {indexed}")
+        return indexed
+
+    def maintain(self) -> Dict[str, Any]:
+        """Create upcoming partitions and index cold ones (scheduled task entry point)"""
+        if not self.is_supported:
+            return {"success": True, "skipped": "partitioning requires PostgreSQL"}
+        if not self.is_partitioned():
+            logger.warning(
+                f"{self.table.name} is not partitioned; convert it with "
+                f"`python -m app.services.price_data_partitions convert`"
+            )
+            return {"success": False, "skipped": f"{self.table.name} is not partitioned"}
+
+        created = self.ensure_partitions()
+        indexed = self.brin_cold_partitions()
+        return {
+            "success": True,
+            "partitions_created": created,
+            "brin_indexed": indexed,
+            "partition_count": len(self.list_partitions()),
+        }
+
+    def convert_to_partitioned(self) -> Dict[str, Any]:
+        """
+        Rebuild an existing plain price_data table as a partitioned table
+
+        Runs in one transaction: the old table is renamed and stripped of its
+        index and constraint names, the partitioned table is created from the
+        model, a partition is created per month of existing data, rows are
+        copied over, the id sequence is carried forward and the old table is
+        dropped. Readers and writers block for the duration.
+        """
+        if not self.is_supported or self._relkind(self.table.name) != 'r':
+            return {"success": False, "skipped": f"{self.table.name} is not a plain PostgreSQL table"}
+
+        old_name = f"{self.table.name}_unpartitioned"
+        old = self._qualified(old_name)
+        columns = ", ".join(self._preparer.quote(column.name) for column in self.table.columns)
+
+        try:
+            self._lock()
+            self.db.execute(text(f"ALTER TABLE {self._qualified(self.table.name)} RENAME TO {self._preparer.quote(old_name)}"))
+
+            old_sequence = self.db.execute(
+                text("SELECT pg_get_serial_sequence(:table, 'id')"), {'table': self._regclass_name(old_name)}
+            ).scalar()
+            if old_sequence:
+                self.db.execute(text(f"ALTER SEQUENCE {old_sequence} RENAME TO {self._preparer.quote(f'{old_name}_id_seq')}"))
+
+            # Index and constraint names are schema-wide; free them for the new table
+            constraints = self.db.execute(text(
+                "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table) AND contype IN ('p', 'u')"
+            ), {'table': self._regclass_name(old_name)}).scalars().all()
+            for constraint in constraints:
+                self.db.execute(text(f"ALTER TABLE {old} DROP CONSTRAINT {self._preparer.quote(constraint)}"))
+            indexes = self.db.execute(text(
+                "SELECT indexrelid::regclass::text FROM pg_index WHERE indrelid = to_regclass(:table)"
+            ), {'table': self._regclass_name(old_name)}).scalars().all()
+            for index in indexes:
+                self.db.execute(text(f"DROP INDEX {index}"))
+
+            self.table.create(bind=self.db.connection())
+            self.db.execute(text(
+                f"CREATE TABLE {self._qualified(self.default_partition_name)} "
+                f"PARTITION OF {self._qualified(self.table.name)} DEFAULT"
+            ))
+
+            # Partitions before the copy so rows never land in DEFAULT
+            first, last = self.db.execute(text(f"SELECT min(candle_time), max(candle_time) FROM {old}")).one()
+            months = 0
+            if first is not None:
+                month, last_month = month_start(first), month_start(last)
+                while month <= last_month:
+                    months += self._create_month_partition(month)
+                    month = add_months(month, 1)
+
+            copied = self.db.execute(text(
+                f"INSERT INTO {self._qualified(self.table.name)} ({columns}) SELECT {columns} FROM {old}"
+            )).rowcount
+            self.db.execute(text(
+                "SELECT setval(pg_get_serial_sequence(:table, 'id'), "
+                f"(SELECT coalesce(max(id), 0) + 1 FROM {old}), false)"
+            ), {'table': self._regclass_name(self.table.name)})
+            self.db.execute(text(f"DROP TABLE {old}"))
+            self.db.commit()
+
+        except Exception:
+            self.db.rollback()
+            logger.error(f"Converting {self.table.name} to a partitioned table failed; rolled back")
+            raise
+
+        logger.info(f"Converted {self.table.name} to {months} monthly partitions ({copied} rows)")
+        return {"success": True, "rows_copied": copied, "partitions_created": months}
+
+
+def main(argv: Sequence[str]) -> int:
+    """python -m app.services.price_data_partitions [status|maintain|convert]"""
+    from app.core.database import SessionLocal
+
+    command = argv[0] if argv else "status"
+    db = SessionLocal()
+    try:
+        manager = PriceDataPartitionManager(db)
+        if command == "convert":
+            print(manager.convert_to_partitioned())
+            print(manager.maintain())
+        elif command == "maintain":
+            print(manager.maintain())
+        elif command == "status":
+            for partition in manager.list_partitions():
+                print(f"{partition['name']:<32} {partition['bound']}"
+                      f"{'  [by timeframe]' if partition['subpartitioned'] else ''}"
+                      f"{'  [brin]' if partition['has_brin'] else ''}")
+        else:
+            print(f"Unknown command: {command} (expected status, maintain or convert)")
+            return 2
+        return 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main(sys.argv[1:]))
@@ -1042,6 +1042,12 @@ class PriceDataService:
         else:
             # Default: round down to start of day
             return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    async def close(self) -> None:
+        """Close the external API clients' HTTP sessions"""
+        for client in self.client_map.values():
+            if hasattr(client, 'close'):
+                await client.close()
 
 
 # Global service instance factory
@@ -0,0 +1,226 @@
+# backend/app/services/price_stream_service.py
+# Keyset cursors, streaming encoders (NDJSON, Arrow IPC) and columnar export for price history
+
+import base64
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.asset.price_data_repository import AsyncPriceDataRepository
+
+logger = logging.getLogger(__name__)
+
+# Optional: Arrow IPC output needs pyarrow
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+# ML feature name -> PriceDataRepository.get_ohlcv_columns key
+ML_FEATURE_COLUMNS = {
+    "open": "open_price",
+    "high": "high_price",
+    "low": "low_price",
+    "close": "close_price",
+    "volume": "volume",
+    "market_cap": "market_cap",
+}
+
+CANDLE_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def encode_cursor(asset_id: int, timeframe: str, candle_time: datetime) -> str:
+    """Opaque keyset cursor for the candle after which the next page starts"""
+    payload = json.dumps({"a": asset_id, "tf": timeframe, "t": candle_time.isoformat()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, asset_id: int, timeframe: str) -> datetime:
+    """
+    Candle time from a cursor issued for the same asset and timeframe
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another series
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        candle_time = datetime.fromisoformat(payload["t"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+    if payload.get("a") != asset_id or payload.get("tf") != timeframe:
+        raise ValueError("Cursor does not belong to this asset and timeframe")
+    return candle_time
+
+
+def _as_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def candle_to_dict(row: Sequence[Any]) -> dict:
+    """(candle_time, open, high, low, close, volume) row -> OHLCV dict"""
+    candle_time, open_price, high_price, low_price, close_price, volume = row
+    return {
+        "timestamp": candle_time.isoformat(),
+        "open": _as_float(open_price),
+        "high": _as_float(high_price),
+        "low": _as_float(low_price),
+        "close": _as_float(close_price),
+        "volume": _as_float(volume) or 0.0,
+    }
+
+
+async def _candle_batches(
+    asset_id: int,
+    timeframe: str,
+    batch_size: int,
+    **filters: Any
+) -> AsyncIterator[List[Any]]:
+    # The stream outlives the request's dependency scope, so it owns its session
+    async with AsyncSessionLocal() as db:
+        async for batch in AsyncPriceDataRepository(db).stream_candles(
+            asset_id, timeframe, batch_size=batch_size, **filters
+        ):
+            yield batch
+
+
+async def stream_candles_ndjson(
+    asset_id: int,
+    timeframe: str,
+    batch_size: int = 2000,
+    **filters: Any
+) -> AsyncIterator[bytes]:
+    """One JSON object per candle, written batch by batch"""
+    rows_sent = 0
+    async for batch in _candle_batches(asset_id, timeframe, batch_size, **filters):
+        rows_sent += len(batch)
+        yield "".join(
+            json.dumps(candle_to_dict(row), separators=(",", ":")) + "\n" for row in batch
+        ).encode()
+    logger.debug(f"Streamed {rows_sent} candles as NDJSON (asset {asset_id}, {timeframe})")
+
+
+def _arrow_schema():
+    return pa.schema([
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ])
+
+
+def candles_to_record_batch(rows: Sequence[Sequence[Any]], schema=None):
+    """Column-wise Arrow record batch from candle rows"""
+    schema = schema or _arrow_schema()
+    columns = list(zip(*rows)) if rows else [()] * len(CANDLE_FIELDS)
+    arrays = [pa.array(columns[0], type=schema.field(0).type)]
+    arrays.extend(
+        pa.array([_as_float(value) for value in column], type=pa.float64())
+        for column in columns[1:]
+    )
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+async def stream_candles_arrow(
+    asset_id: int,
+    timeframe: str,
+    batch_size: int = 2000,
+    **filters: Any
+) -> AsyncIterator[bytes]:
+    """Arrow IPC stream: schema message, then one record batch per DB batch"""
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("Arrow output requires pyarrow")
+
+    schema = _arrow_schema()
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+
+    def drain() -> bytes:
+        chunk = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return chunk
+
+    async for batch in _candle_batches(asset_id, timeframe, batch_size, **filters):
+        writer.write_batch(candles_to_record_batch(batch, schema))
+        yield drain()
+
+    writer.close()
+    yield drain()
+
+
+def select_ml_features(
+    columns: Dict[str, np.ndarray],
+    features: Sequence[str],
+    normalize: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Feature columns (plus timestamp) from get_ohlcv_columns output
+
+    normalize applies per-column min-max scaling to [0, 1].
+    """
+    selected = {"timestamp": columns["candle_time"]}
+    for feature in features:
+        values = columns[ML_FEATURE_COLUMNS[feature]]
+        if normalize and len(values):
+            low, high = values.min(), values.max()
+            values = (values - low) / (high - low) if high > low else np.zeros_like(values)
+        selected[feature] = values
+    return selected
+
+
+def columns_to_arrow_table(columns: Dict[str, np.ndarray]):
+    """Arrow table over NumPy columns (timestamps tagged UTC, floats zero-copy)"""
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("Arrow output requires pyarrow")
+
+    arrays, names = [], []
+    for name, values in columns.items():
+        if np.issubdtype(values.dtype, np.datetime64):
+            arrays.append(pa.array(values.astype("datetime64[us]"), type=pa.timestamp("us", tz="UTC")))
+        else:
+            arrays.append(pa.array(values))
+        names.append(name)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def arrow_ipc_bytes(table) -> bytes:
+    """Table as an Arrow IPC stream"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def parquet_bytes(table) -> bytes:
+    """Table as a Parquet file (zstd)"""
+    import pyarrow.parquet as pq
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    return sink.getvalue().to_pybytes()
+
+
+def columns_to_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """JSON-ready row dicts (timestamps as ISO strings) for the legacy JSON response"""
+    names = list(columns)
+    values = [
+        np.datetime_as_string(column, unit="s", timezone="UTC").tolist()
+        if np.issubdtype(column.dtype, np.datetime64) else column.tolist()
+        for column in columns.values()
+    ]
+    return [dict(zip(names, row)) for row in zip(*values)]
@@ -2,57 +2,50 @@
 # Tasks package initialization with ML tasks integration
 # Exports all background tasks for easy importing throughout the application
 
-# Import data collection tasks
-from .price_collector import (
-    sync_all_prices,
-    sync_historical_data,
-    discover_new_cryptocurrencies,
-    cleanup_old_data,
-    sync_specific_cryptocurrency,
-    get_task_status
-)
-
-# Import ML tasks 
-from .ml_tasks import (
-    auto_train_models,
-    generate_scheduled_predictions,
-    evaluate_model_performance,
-    cleanup_old_predictions,
-    start_auto_training,
-    start_prediction_generation,
-    start_performance_evaluation,
-    start_prediction_cleanup,
-    get_task_status as get_ml_task_status
-)
-
-# Import scheduler and Celery app
-from .scheduler import task_scheduler, get_next_run_times, setup_all_periodic_tasks
-from .celery_app import celery_app
-
-# Export all task functions and utilities
-__all__ = [
+# Tasks are available at package level, but imported on first access
+# (PEP 562) so importing one submodule (e.g. task_handler) doesn't pull in
+# the ML stack behind ml_tasks. Maps exported name -> (module, attribute)
+_LAZY_EXPORTS = {
     # Data collection tasks
-    "sync_all_prices",
-    "sync_historical_data", 
-    "discover_new_cryptocurrencies",
-    "cleanup_old_data",
-    "sync_specific_cryptocurrency",
-    "get_task_status",
+    "sync_all_prices": (".price_collector", "sync_all_prices"),
+    "sync_historical_data": (".price_collector", "sync_historical_data"),
+    "discover_new_cryptocurrencies": (".price_collector", "discover_new_cryptocurrencies"),
+    "cleanup_old_data": (".price_collector", "cleanup_old_data"),
+    "maintain_price_data_partitions": (".price_collector", "maintain_price_data_partitions"),
+    "freeze_archived_price_data": (".price_collector", "freeze_archived_price_data"),
+    "collect_metrics_snapshot": (".price_collector", "collect_metrics_snapshot"),
+    "sync_specific_cryptocurrency": (".price_collector", "sync_specific_cryptocurrency"),
+    "get_task_status": (".price_collector", "get_task_status"),
     
     # ML tasks (NEW)
-    "auto_train_models",
-    "generate_scheduled_predictions", 
-    "evaluate_model_performance",
-    "cleanup_old_predictions",
-    "start_auto_training",
-    "start_prediction_generation",
-    "start_performance_evaluation",
-    "start_prediction_cleanup",
-    "get_ml_task_status",
+    "auto_train_models": (".ml_tasks", "auto_train_models"),
+    "generate_scheduled_predictions": (".ml_tasks", "generate_scheduled_predictions"),
+    "evaluate_model_performance": (".ml_tasks", "evaluate_model_performance"),
+    "cleanup_old_predictions": (".ml_tasks", "cleanup_old_predictions"),
+    "start_auto_training": (".ml_tasks", "start_auto_training"),
+    "start_prediction_generation": (".ml_tasks", "start_prediction_generation"),
+    "start_performance_evaluation": (".ml_tasks", "start_performance_evaluation"),
+    "start_prediction_cleanup": (".ml_tasks", "start_prediction_cleanup"),
+    "get_ml_task_status": (".ml_tasks", "get_task_status"),
     
     # Task management utilities
-    "task_scheduler",
-    "get_next_run_times",
-    "setup_all_periodic_tasks",
-    "celery_app"
-]
\ No newline at end of file
+    "task_scheduler": (".scheduler", "task_scheduler"),
+    "get_next_run_times": (".scheduler", "get_next_run_times"),
+    "setup_all_periodic_tasks": (".scheduler", "setup_all_periodic_tasks"),
+    "celery_app": (".celery_app", "celery_app"),
+}
+
+# Export all task functions and utilities
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    module_name, attribute = target
+    value = getattr(import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
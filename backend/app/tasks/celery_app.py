@@ -68,6 +68,17 @@ def create_celery_app() -> Celery:
             }
         },
         
+        # Medium Priority: Market-wide metrics snapshot every hour
+        "collect-metrics-snapshot-every-hour": {
+            "task": "app.tasks.price_collector.collect_metrics_snapshot",
+            "schedule": crontab(minute=5),  # Every hour at minute 5
+            "options": {
+                "queue": "price_data",
+                "priority": 6,
+                "expires": 3300  # Task expires in 55 minutes
+            }
+        },
+        
         # Low Priority: Discover new cryptocurrencies daily at 2 AM
         "discover-new-cryptos-daily": {
             "task": "app.tasks.price_collector.discover_new_cryptocurrencies",
@@ -79,6 +90,28 @@ def create_celery_app() -> Celery:
             }
         },
         
+        # Maintenance: price_data partitions daily at 1:30 AM
+        "maintain-price-data-partitions-daily": {
+            "task": "app.tasks.price_collector.maintain_price_data_partitions",
+            "schedule": crontab(hour=1, minute=30),  # 1:30 AM daily
+            "options": {
+                "queue": "scheduling",
+                "priority": 5,
+                "expires": 21600  # Task expires in 6 hours
+            }
+        },
+        
+        # Maintenance: archived candles to cold Parquet files weekly on Sunday at 2 AM
+        "freeze-archived-price-data-weekly": {
+            "task": "app.tasks.price_collector.freeze_archived_price_data",
+            "schedule": crontab(hour=2, minute=0, day_of_week=0),  # Sunday 2 AM
+            "options": {
+                "queue": "scheduling",
+                "priority": 5,
+                "expires": 43200  # Task expires in 12 hours
+            }
+        },
+        
         # Lowest Priority: Cleanup old data weekly on Sunday at 3 AM  
         "cleanup-old-data-weekly": {
             "task": "app.tasks.price_collector.cleanup_old_data",
@@ -163,7 +196,38 @@ def _setup_signal_handlers(celery_app: Celery) -> None:
         celery_app: Celery application instance
     """
     
-    from celery.signals import task_prerun, task_postrun, task_failure
+    from celery.signals import (
+        task_prerun, task_postrun, task_failure, worker_ready,
+        worker_process_shutdown, worker_shutdown
+    )
+    from app.utils.query_monitor import setup_celery_query_scopes
+    
+    # One query scope per task (statement counts, N+1 detection)
+    setup_celery_query_scopes()
+
+    @worker_ready.connect
+    def worker_ready_handler(sender=None, **kwargs):
+        """Preload active ML models so the first ML task skips cold start"""
+        from app.core.config import settings
+        
+        if not settings.ML_WARMUP_ON_WORKER_START:
+            return
+        
+        try:
+            from app.ml.prediction.model_warmup import warm_up_models
+            warm_up_models(background=True)
+            print("INFO: Model warm-up started in background")
+        except Exception as e:
+            print(f"WARNING: Model warm-up could not start: {e}")
+    
+    # weak=False: a nested handler would otherwise be collected once setup returns
+    @worker_process_shutdown.connect(weak=False)
+    @worker_shutdown.connect(weak=False)
+    def worker_shutdown_handler(sender=None, **kwargs):
+        """Close the worker's event loop, HTTP clients and async DB pool"""
+        from app.tasks.task_handler import worker_async_runtime
+        
+        worker_async_runtime.shutdown()
     
     @task_prerun.connect
     def task_prerun_handler(task_id, task, *args, **kwargs):
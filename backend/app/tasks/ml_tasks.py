@@ -13,15 +13,25 @@ from celery import current_task
 from app.tasks.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.core.config import settings
+from app.tasks.task_handler import worker_async_runtime
+from app.tasks.task_graph import dispatch_chord, retry_or_report
+from app.tasks.task_lease import leased_task
 
 # Import ML services and repositories
 from app.ml.training.training_service import training_service
 from app.ml.prediction.prediction_service import prediction_service
 from app.ml.config.ml_config import model_registry, ml_config
+from app.ml.training.training_orchestrator import (
+    training_orchestrator,
+    configure_training_threads,
+    run_training_job,
+    summarize_training_results
+)
 from app.repositories import (
     cryptocurrency_repository,
     price_data_repository,
-    prediction_repository
+    prediction_repository,
+    AssetSnapshotRepository
 )
 
 # Setup logging
@@ -37,23 +47,10 @@ def run_async_task(coro):
     Helper function to run async operations in Celery tasks
     
     Since Celery tasks cannot be async, we use this helper to run
-    async operations synchronously within Celery workers.
+    async operations synchronously within Celery workers, on the worker
+    thread's long-lived loop so cached clients and models stay usable.
     """
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, create a new one
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
-        else:
-            # If no loop is running, use asyncio.run
-            return asyncio.run(coro)
-    except RuntimeError:
-        # If no event loop exists, create one
-        return asyncio.run(coro)
+    return worker_async_runtime.run(coro)
 
 
 async def _async_check_training_needed(crypto_symbol: str, force_retrain: bool = False) -> bool:
@@ -118,6 +115,23 @@ def check_training_needed(crypto_symbol: str, force_retrain: bool = False) -> bo
     return run_async_task(_async_check_training_needed(crypto_symbol, force_retrain))
 
 
+async def _async_select_training_needed(crypto_symbols: List[str], force_retrain: bool = False) -> List[str]:
+    """
+    Check all symbols concurrently and keep the ones that need training
+    
+    Args:
+        crypto_symbols: Cryptocurrency symbols to check
+        force_retrain: Force retrain even if models exist
+    
+    Returns:
+        List[str]: Symbols that need training, in input order
+    """
+    checks = await asyncio.gather(*[
+        _async_check_training_needed(symbol, force_retrain) for symbol in crypto_symbols
+    ])
+    return [symbol for symbol, needed in zip(crypto_symbols, checks) if needed]
+
+
 # =====================================
 # TASK STATUS MANAGEMENT
 # =====================================
@@ -158,17 +172,26 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
 # CELERY TASKS (SYNCHRONOUS IMPLEMENTATIONS)
 # =====================================
 
-@celery_app.task(bind=True, name="ml_tasks.auto_train_models")
+@celery_app.task(
+    bind=True,
+    name="ml_tasks.auto_train_models",
+    time_limit=ml_config.training_window_seconds,
+    soft_time_limit=ml_config.training_window_seconds - 60
+)
 def auto_train_models(self, force_retrain: bool = False) -> Dict[str, Any]:
     """
     Automatically train models for all active cryptocurrencies
     
-    Similar to sync_all_prices pattern but for ML training.
-    This function runs synchronously in Celery worker process.
+    Fans out one training job per asset through the training orchestrator,
+    most stale models first. In "chord" mode (the default) jobs are
+    dispatched as a Celery chord on the model_training queue and the summary
+    is produced by the chord callback; in "process_pool" mode jobs run on a
+    dedicated process pool with per-job thread caps and this task waits for
+    the summary.
     
     Args:
         force_retrain: Force retrain even if recent models exist
-        
+    
     Returns:
         Dict containing task results and statistics
     """
@@ -187,108 +210,90 @@ def auto_train_models(self, force_retrain: bool = False) -> Dict[str, Any]:
         )
         
         db = SessionLocal()
-        results = {
-            "task_id": task_id,
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "cryptocurrencies_processed": 0,
-            "models_trained": 0,
-            "training_skipped": 0,
-            "errors": [],
-            "success": False
-        }
+        started_at = datetime.now(timezone.utc).isoformat()
         
         try:
             # Get all active cryptocurrencies
             cryptocurrencies = cryptocurrency_repository.get_active_cryptocurrencies(db)
-            total_cryptos = len(cryptocurrencies)
-            
-            if total_cryptos == 0:
-                results["completed_at"] = datetime.now(timezone.utc).isoformat()
-                results["success"] = True
-                results["summary"] = "No active cryptocurrencies found"
-                return results
-            
+            crypto_symbols = [crypto.symbol for crypto in cryptocurrencies]
+        finally:
+            db.close()
+        
+        if not crypto_symbols:
+            return {
+                "task_id": task_id,
+                "started_at": started_at,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "cryptocurrencies_processed": 0,
+                "models_trained": 0,
+                "training_skipped": 0,
+                "errors": [],
+                "success": True,
+                "summary": "No active cryptocurrencies found"
+            }
+        
+        current_task.update_state(
+            state='PROGRESS',
+            meta={
+                'status': f'Checking {len(crypto_symbols)} cryptocurrencies',
+                'progress': 5,
+                'current_step': 'Selecting models to train'
+            }
+        )
+        
+        # Run all staleness/accuracy checks on one event loop
+        to_train = run_async_task(_async_select_training_needed(crypto_symbols, force_retrain))
+        skipped = [symbol for symbol in crypto_symbols if symbol not in to_train]
+        
+        # Routine retrains fine-tune the active model; forced ones start from scratch
+        training_config = None
+        if ml_config.incremental_retraining_enabled and not force_retrain:
+            training_config = {'training_mode': 'incremental'}
+        
+        if ml_config.training_orchestrator_mode == "chord" and to_train:
+            return _dispatch_training_chord(task_id, to_train, skipped, started_at, training_config)
+        
+        def _report_progress(completed: int, total: int, job_result: Dict[str, Any]) -> None:
             current_task.update_state(
                 state='PROGRESS',
                 meta={
-                    'status': f'Found {total_cryptos} cryptocurrencies to process',
-                    'progress': 5,
-                    'current_step': 'Processing cryptocurrencies'
+                    'status': f"Trained {job_result.get('crypto_symbol')}",
+                    'progress': int((completed / total) * 90) + 5,  # 5-95%
+                    'current_step': f'Job {completed}/{total}',
+                    'current_crypto': job_result.get('crypto_symbol')
                 }
             )
-            
-            # Process each cryptocurrency
-            for i, crypto in enumerate(cryptocurrencies):
-                try:
-                    progress = int((i / total_cryptos) * 90) + 5  # 5-95%
-                    current_task.update_state(
-                        state='PROGRESS',
-                        meta={
-                            'status': f'Processing {crypto.symbol}',
-                            'progress': progress,
-                            'current_step': f'Crypto {i+1}/{total_cryptos}',
-                            'current_crypto': crypto.symbol
-                        }
-                    )
-                    
-                    # Check if training is needed (using sync wrapper)
-                    if check_training_needed(crypto.symbol, force_retrain):
-                        logger.info(f"Training model for {crypto.symbol}")
-                        
-                        # Start training using async wrapper
-                        async def _train_model():
-                            return await training_service.train_model(
-                                crypto_symbol=crypto.symbol,
-                                model_type="lstm",
-                                force_retrain=force_retrain
-                            )
-                        
-                        training_result = run_async_task(_train_model())
-                        
-                        if training_result.get("success", False):
-                            results["models_trained"] += 1
-                            logger.info(f"Successfully trained model for {crypto.symbol}")
-                        else:
-                            error_msg = f"Training failed for {crypto.symbol}: {training_result.get('error', 'Unknown error')}"
-                            results["errors"].append({
-                                "crypto_symbol": crypto.symbol,
-                                "error": error_msg
-                            })
-                            logger.error(error_msg)
-                    else:
-                        results["training_skipped"] += 1
-                        logger.info(f"Training skipped for {crypto.symbol} - model is up to date")
-                    
-                    results["cryptocurrencies_processed"] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error processing {crypto.symbol}: {str(e)}"
-                    results["errors"].append({
-                        "crypto_symbol": crypto.symbol,
-                        "error": error_msg
-                    })
-                    logger.error(error_msg)
-            
-            # Task completion
-            results["completed_at"] = datetime.now(timezone.utc).isoformat()
-            results["success"] = True
-            results["summary"] = f"Processed {results['cryptocurrencies_processed']} cryptocurrencies, trained {results['models_trained']} models, skipped {results['training_skipped']}"
-            
-            current_task.update_state(
-                state='SUCCESS',
-                meta={
-                    'status': 'Auto training completed',
-                    'progress': 100,
-                    'results': results
-                }
-            )
-            
-            logger.info(f"Auto training task completed: {results['summary']}")
-            return results
-            
-        finally:
-            db.close()
-            
+        
+        current_task.update_state(
+            state='PROGRESS',
+            meta={
+                'status': f'Training {len(to_train)} models, skipped {len(skipped)}',
+                'progress': 5,
+                'current_step': 'Training on process pool'
+            }
+        )
+        
+        results = training_orchestrator.run(
+            to_train,
+            training_config=training_config,
+            progress_callback=_report_progress,
+            skipped=skipped
+        )
+        results["task_id"] = task_id
+        results["started_at"] = started_at
+        
+        current_task.update_state(
+            state='SUCCESS',
+            meta={
+                'status': 'Auto training completed',
+                'progress': 100,
+                'results': results
+            }
+        )
+        
+        logger.info(f"Auto training task completed: {results['summary']}")
+        return results
+    
     except Exception as e:
         error_msg = f"Auto training task failed: {str(e)}"
         logger.error(error_msg)
@@ -310,44 +315,122 @@ def auto_train_models(self, force_retrain: bool = False) -> Dict[str, Any]:
         }
 
 
+def _dispatch_training_chord(
+    task_id: str,
+    crypto_symbols: List[str],
+    skipped: List[str],
+    started_at: str,
+    training_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Fan out training as a Celery chord (one task per asset + summary callback)
+    
+    Header tasks are sent most stale first with descending priority, so
+    idle workers pick up the oldest models first.
+    
+    Args:
+        task_id: Parent auto-train task id
+        crypto_symbols: Symbols that need training
+        skipped: Symbols whose models are up to date
+        started_at: ISO timestamp the run started
+        training_config: Optional training configuration for every job
+    
+    Returns:
+        Dict describing the dispatched chord
+    """
+    queue = training_orchestrator.build_queue(crypto_symbols)
+    header = [
+        train_single_model.s(symbol, training_config).set(priority=max(9 - position, 0))
+        for position, (symbol, _staleness) in enumerate(queue)
+    ]
+    callback = summarize_training_run.s(started_at=started_at, skipped=skipped)
+    summary_task_id = dispatch_chord(header, callback, "training")
+    
+    return {
+        "task_id": task_id,
+        "started_at": started_at,
+        "mode": "chord",
+        "summary_task_id": summary_task_id,
+        "training_order": [symbol for symbol, _staleness in queue],
+        "training_skipped": len(skipped),
+        "success": True,
+        "summary": f"Dispatched {len(queue)} training jobs, skipped {len(skipped)}"
+    }
+
+
+@celery_app.task(
+    bind=True,
+    name="ml_tasks.train_single_model",
+    time_limit=ml_config.training_job_timeout,
+    soft_time_limit=ml_config.training_job_timeout - 60
+)
+@leased_task()
+def train_single_model(self, crypto_symbol: str, training_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Train one cryptocurrency model (chord header task)
+    
+    Thread caps only take effect if TensorFlow has not run yet in this
+    worker process; run training workers with a dedicated queue for strict caps.
+    
+    Args:
+        crypto_symbol: Cryptocurrency symbol to train
+        training_config: Optional training configuration overrides
+    
+    Returns:
+        Dict containing the compact job result
+    """
+    logger.info(f"Starting single model training task {self.request.id} for {crypto_symbol}")
+    
+    configure_training_threads(
+        ml_config.training_intra_op_threads,
+        ml_config.training_inter_op_threads
+    )
+    return run_training_job(crypto_symbol, training_config)
+
+
+@celery_app.task(name="ml_tasks.summarize_training_run")
+def summarize_training_run(
+    job_results: List[Dict[str, Any]],
+    started_at: Optional[str] = None,
+    skipped: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Chord callback - reduce per-asset training results into one summary
+    
+    Args:
+        job_results: Results of the train_single_model header tasks
+        started_at: ISO timestamp the run started
+        skipped: Symbols whose models were up to date
+    
+    Returns:
+        Dict containing the training summary
+    """
+    results = summarize_training_results(job_results, started_at=started_at, skipped=skipped)
+    logger.info(f"Auto training run completed: {results['summary']}")
+    return results
+
+
 @celery_app.task(bind=True, name="ml_tasks.generate_scheduled_predictions")
 def generate_scheduled_predictions(self, crypto_symbols: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Generate scheduled predictions for cryptocurrencies
     
-    Synchronous Celery task that generates predictions for specified
-    or all active cryptocurrencies using available trained models.
+    Plans the run and fans out one generate_asset_prediction task per
+    cryptocurrency as a chord; summarize_prediction_run collects the
+    results, so a slow asset no longer holds up the others.
     
     Args:
         crypto_symbols: Optional list of symbols to generate predictions for
         
     Returns:
-        Dict containing prediction generation results
+        Dict describing the dispatched run
     """
     task_id = self.request.id
+    started_at = datetime.now(timezone.utc).isoformat()
     logger.info(f"Starting scheduled predictions task {task_id}")
     
     try:
-        current_task.update_state(
-            state='PROGRESS',
-            meta={
-                'status': 'Starting prediction generation',
-                'progress': 0,
-                'current_step': 'Initializing'
-            }
-        )
-        
         db = SessionLocal()
-        results = {
-            "task_id": task_id,
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "cryptocurrencies_processed": 0,
-            "predictions_generated": 0,
-            "predictions_failed": 0,
-            "errors": [],
-            "success": False
-        }
-        
         try:
             # Get cryptocurrencies to process
             if crypto_symbols:
@@ -358,102 +441,41 @@ def generate_scheduled_predictions(self, crypto_symbols: Optional[List[str]] = N
                 cryptocurrencies = [c for c in cryptocurrencies if c]  # Filter None values
             else:
                 cryptocurrencies = cryptocurrency_repository.get_active_cryptocurrencies(db)
-            
-            total_cryptos = len(cryptocurrencies)
-            
-            if total_cryptos == 0:
-                results["completed_at"] = datetime.now(timezone.utc).isoformat()
-                results["success"] = True
-                results["summary"] = "No cryptocurrencies found for prediction"
-                return results
-            
-            current_task.update_state(
-                state='PROGRESS',
-                meta={
-                    'status': f'Generating predictions for {total_cryptos} cryptocurrencies',
-                    'progress': 5,
-                    'current_step': 'Processing predictions'
-                }
-            )
-            
-            # Generate predictions for each cryptocurrency
-            for i, crypto in enumerate(cryptocurrencies):
-                try:
-                    progress = int((i / total_cryptos) * 90) + 5  # 5-95%
-                    current_task.update_state(
-                        state='PROGRESS',
-                        meta={
-                            'status': f'Generating predictions for {crypto.symbol}',
-                            'progress': progress,
-                            'current_step': f'Crypto {i+1}/{total_cryptos}',
-                            'current_crypto': crypto.symbol
-                        }
-                    )
-                    
-                    # Generate predictions using async wrapper
-                    async def _generate_predictions():
-                        return await prediction_service.predict_price(
-                            crypto_symbol=crypto.symbol,
-                            prediction_horizon=24  # 24 hours
-                        )
-                    
-                    prediction_result = run_async_task(_generate_predictions())
-                    
-                    if prediction_result.get("success", False):
-                        results["predictions_generated"] += 1
-                        logger.info(f"Generated prediction for {crypto.symbol}")
-                    else:
-                        results["predictions_failed"] += 1
-                        error_msg = f"Prediction failed for {crypto.symbol}: {prediction_result.get('error', 'Unknown error')}"
-                        results["errors"].append({
-                            "crypto_symbol": crypto.symbol,
-                            "error": error_msg
-                        })
-                        logger.error(error_msg)
-                    
-                    results["cryptocurrencies_processed"] += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error processing {crypto.symbol}: {str(e)}"
-                    results["errors"].append({
-                        "crypto_symbol": crypto.symbol,
-                        "error": error_msg
-                    })
-                    logger.error(error_msg)
-            
-            # Task completion
-            results["completed_at"] = datetime.now(timezone.utc).isoformat()
-            results["success"] = True
-            results["summary"] = f"Generated {results['predictions_generated']} predictions for {results['cryptocurrencies_processed']} cryptocurrencies, {results['predictions_failed']} failed"
-            
-            current_task.update_state(
-                state='SUCCESS',
-                meta={
-                    'status': 'Prediction generation completed',
-                    'progress': 100,
-                    'results': results
-                }
-            )
-            
-            logger.info(f"Scheduled predictions task completed: {results['summary']}")
-            return results
-            
+            targets = [(crypto.symbol, crypto.id) for crypto in cryptocurrencies]
         finally:
             db.close()
+        
+        if not targets:
+            return {
+                "task_id": task_id,
+                "started_at": started_at,
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "cryptocurrencies_processed": 0,
+                "predictions_generated": 0,
+                "predictions_failed": 0,
+                "errors": [],
+                "success": True,
+                "summary": "No cryptocurrencies found for prediction"
+            }
+        
+        header = [generate_asset_prediction.s(symbol, crypto_id) for symbol, crypto_id in targets]
+        callback = summarize_prediction_run.s(task_id=task_id, started_at=started_at)
+        summary_task_id = dispatch_chord(header, callback, "prediction")
+        
+        return {
+            "task_id": task_id,
+            "started_at": started_at,
+            "mode": "chord",
+            "summary_task_id": summary_task_id,
+            "cryptocurrencies": [symbol for symbol, _crypto_id in targets],
+            "success": True,
+            "summary": f"Dispatched {len(targets)} prediction jobs"
+        }
             
     except Exception as e:
         error_msg = f"Scheduled predictions task failed: {str(e)}"
         logger.error(error_msg)
         
-        current_task.update_state(
-            state='FAILURE',
-            meta={
-                'status': 'Prediction generation failed',
-                'error': error_msg,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-        )
-        
         return {
             "task_id": task_id,
             "success": False,
@@ -462,6 +484,107 @@ def generate_scheduled_predictions(self, crypto_symbols: Optional[List[str]] = N
         }
 
 
+@celery_app.task(
+    bind=True,
+    name="ml_tasks.generate_asset_prediction",
+    max_retries=2,
+    default_retry_delay=30
+)
+@leased_task()
+def generate_asset_prediction(self, crypto_symbol: str, crypto_id: int) -> Dict[str, Any]:
+    """
+    Generate the 24h prediction for one cryptocurrency (chord header task)
+    
+    Errors are retried with backoff; a prediction the service rejects
+    (no model, too little data) is reported without retrying.
+    
+    Args:
+        crypto_symbol: Cryptocurrency symbol
+        crypto_id: Cryptocurrency id, for the dashboard snapshot
+    
+    Returns:
+        Dict with success flag, predicted price and error
+    """
+    result = {"crypto_symbol": crypto_symbol, "success": False, "error": None}
+    
+    try:
+        prediction_result = run_async_task(prediction_service.predict_price(
+            crypto_symbol=crypto_symbol,
+            prediction_horizon=24  # 24 hours
+        ))
+        
+        if not prediction_result.get("success", False):
+            result["error"] = f"Prediction failed for {crypto_symbol}: {prediction_result.get('error', 'Unknown error')}"
+            logger.error(result["error"])
+            return result
+        
+        # Keep the dashboard snapshot's latest prediction current
+        db = SessionLocal()
+        try:
+            AssetSnapshotRepository(db).record_prediction(
+                asset_id=crypto_id,
+                predicted_price=prediction_result["predicted_price"],
+                confidence=prediction_result.get("confidence_score"),
+                target_time=datetime.now(timezone.utc) + timedelta(
+                    hours=prediction_result.get("prediction_horizon_hours", 24)
+                ),
+                model_name=prediction_result.get("model_name")
+            )
+        finally:
+            db.close()
+        
+        logger.info(f"Generated prediction for {crypto_symbol}")
+        result["success"] = True
+        result["predicted_price"] = prediction_result["predicted_price"]
+        return result
+    
+    except Exception as e:
+        logger.error(f"Error processing {crypto_symbol}: {str(e)}")
+        return retry_or_report(self, e, result)
+
+
+@celery_app.task(name="ml_tasks.summarize_prediction_run")
+def summarize_prediction_run(
+    asset_results: List[Dict[str, Any]],
+    task_id: Optional[str] = None,
+    started_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Chord callback - reduce per-asset prediction results into one summary
+    
+    Args:
+        asset_results: Results of the generate_asset_prediction header tasks
+        task_id: Planner task id
+        started_at: ISO timestamp the run started
+    
+    Returns:
+        Dict containing prediction generation results
+    """
+    # Skipped: another run for the same asset was still in progress
+    skipped = sum(1 for result in asset_results if result.get("skipped"))
+    generated = sum(1 for result in asset_results if result.get("success") and not result.get("skipped"))
+    failed = len(asset_results) - generated - skipped
+    
+    results = {
+        "task_id": task_id,
+        "started_at": started_at,
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+        "cryptocurrencies_processed": len(asset_results),
+        "predictions_generated": generated,
+        "predictions_failed": failed,
+        "predictions_skipped": skipped,
+        "errors": [
+            {"crypto_symbol": result.get("crypto_symbol"), "error": result.get("error")}
+            for result in asset_results if not result.get("success")
+        ],
+        "success": True,
+        "summary": f"Generated {generated} predictions for {len(asset_results)} cryptocurrencies, {failed} failed, {skipped} skipped"
+    }
+    
+    logger.info(f"Scheduled predictions run completed: {results['summary']}")
+    return results
+
+
 @celery_app.task(bind=True, name="ml_tasks.evaluate_model_performance")
 def evaluate_model_performance(self, crypto_symbol: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -16,11 +16,17 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Import the new async task handler
 from app.tasks.task_handler import celery_async_task, async_task_handler
+from app.tasks.task_graph import dispatch_chord, retry_or_report
+from app.tasks.task_lease import leased_task, COALESCE
 
 from app.services.data_sync import DataSyncService
-from app.services.external_api import ExternalAPIService
+from app.services.external_api import external_api_service
 from app.repositories import cryptocurrency_repository, price_data_repository
 from app.core.database import SessionLocal
+from app.core.result_store import result_store, NEW_CANDLE
+from app.services.price_data_partitions import PriceDataPartitionManager
+from app.services.cold_storage_service import ColdStorageService
+from app.services.metrics_snapshot_service import metrics_snapshot_assembler
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -42,8 +48,8 @@ def get_services() -> tuple:
         crypto_repo = cryptocurrency_repository
         price_repo = price_data_repository
         
-        # Initialize services 
-        external_api_service = ExternalAPIService()
+        # Initialize services (the API client is shared so its HTTP
+        # connections survive between tasks on the worker loop)
         data_sync_service = DataSyncService()
         
         return data_sync_service, external_api_service, crypto_repo, price_repo, db_session
@@ -150,6 +156,20 @@ async def _async_discover_new_cryptocurrencies() -> Dict[str, Any]:
         }
 
 
+@celery_async_task
+async def _async_collect_metrics_snapshot(timeframe: str = "1h") -> Dict[str, Any]:
+    """
+    Async wrapper for metrics snapshot assembly
+    
+    Args:
+        timeframe: Snapshot timeframe
+        
+    Returns:
+        dict: Snapshot result with per-provider status
+    """
+    return await metrics_snapshot_assembler.assemble(timeframe)
+
+
 @celery_async_task
 async def _async_cleanup_old_data(days_to_keep: int = 365) -> Dict[str, Any]:
     """
@@ -196,6 +216,7 @@ async def _async_cleanup_old_data(days_to_keep: int = 365) -> Dict[str, Any]:
 
 # Celery shared tasks (sync versions that call async wrappers)
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
+@leased_task(policy=COALESCE)
 def sync_all_prices(self) -> Dict[str, Any]:
     """
     Sync current prices for all cryptocurrencies
@@ -241,6 +262,7 @@ def sync_all_prices(self) -> Dict[str, Any]:
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=180)  
+@leased_task()
 def sync_historical_data(self, days: int = 30) -> Dict[str, Any]:
     """
     Sync historical data for all cryptocurrencies
@@ -260,6 +282,9 @@ def sync_historical_data(self, days: int = 30) -> Dict[str, Any]:
         # Execute async operation using task handler  
         result = _async_sync_historical_data(days)
         
+        # New candles make cached predictions/dashboard data stale everywhere
+        result_store.publish_event_sync(NEW_CANDLE)
+
         # Add task metadata
         result.update({
             "task_id": task_id,
@@ -383,6 +408,132 @@ def cleanup_old_data(self, days_to_keep: int = 365) -> Dict[str, Any]:
         }
 
 
+@shared_task(bind=True, max_retries=2, default_retry_delay=600)
+def maintain_price_data_partitions(self) -> Dict[str, Any]:
+    """
+    Create upcoming monthly price_data partitions and BRIN-index cold ones
+    
+    This task runs daily so inserts never fall into the DEFAULT partition
+    
+    Returns:
+        dict: Maintenance result with task metadata
+    """
+    task_id = self.request.id
+    logger.info(f"Starting maintain_price_data_partitions task {task_id}")
+    
+    db_session = SessionLocal()
+    try:
+        result = PriceDataPartitionManager(db_session).maintain()
+        
+        # Add task metadata
+        result.update({
+            "task_id": task_id,
+            "status": "completed",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        
+        logger.info(f"maintain_price_data_partitions completed: {result}")
+        return result
+    
+    except Exception as e:
+        logger.error(f"maintain_price_data_partitions failed: {str(e)}")
+        
+        # Retry logic
+        if self.request.retries < self.max_retries:
+            logger.info(f"Retrying maintain_price_data_partitions (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=600 * (self.request.retries + 1))
+        
+        # Final failure
+        return {
+            "task_id": task_id,
+            "status": "failed",
+            "error": str(e),
+            "retries": self.request.retries,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    finally:
+        db_session.close()
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=1800)
+def freeze_archived_price_data(self, older_than_months: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Move archived months older than COLD_STORAGE_AFTER_MONTHS into Parquet files
+    
+    Args:
+        older_than_months: Override for COLD_STORAGE_AFTER_MONTHS
+    
+    Returns:
+        dict: Files written, rows frozen and bytes with task metadata
+    """
+    task_id = self.request.id
+    logger.info(f"Starting freeze_archived_price_data task {task_id}")
+    
+    db_session = SessionLocal()
+    try:
+        result = ColdStorageService(db_session).freeze_archived_months(older_than_months)
+        
+        # Add task metadata
+        result.update({
+            "task_id": task_id,
+            "status": "completed" if result["success"] else "partial",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+        
+        logger.info(f"freeze_archived_price_data completed: {result['rows_frozen']} rows, {result['files_written']} files")
+        return result
+    
+    except Exception as e:
+        logger.error(f"freeze_archived_price_data failed: {str(e)}")
+        
+        # Retry logic
+        if self.request.retries < self.max_retries:
+            logger.info(f"Retrying freeze_archived_price_data (attempt {self.request.retries + 1})")
+            raise self.retry(countdown=1800 * (self.request.retries + 1))
+        
+        # Final failure
+        return {
+            "task_id": task_id,
+            "status": "failed",
+            "error": str(e),
+            "retries": self.request.retries,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    finally:
+        db_session.close()
+
+
+@shared_task(bind=True)
+@leased_task()
+def collect_metrics_snapshot(self, timeframe: str = "1h") -> Dict[str, Any]:
+    """
+    Assemble the market-wide metrics snapshot for the current timeframe bucket
+    
+    Providers are fetched concurrently under per-provider deadlines; late
+    fields are carried over from the last snapshot, so no retry is needed
+    
+    Args:
+        timeframe: Snapshot timeframe
+        
+    Returns:
+        dict: Snapshot id, data quality score and provider status with task metadata
+    """
+    task_id = self.request.id
+    logger.info(f"Starting collect_metrics_snapshot task {task_id} ({timeframe})")
+    
+    result = _async_collect_metrics_snapshot(timeframe)
+    
+    # Add task metadata
+    result.update({
+        "task_id": task_id,
+        "status": "completed" if result.get("success") else "failed",
+        "timestamp": datetime.utcnow().isoformat()
+    })
+    
+    logger.info(f"collect_metrics_snapshot finished: quality {result.get('data_quality_score')}, status {result['status']}")
+    return result
+
+
 # Additional utility tasks
 @shared_task(bind=True)
 def sync_specific_cryptocurrency(self, symbol: str, days: int = 7) -> Dict[str, Any]:
@@ -458,11 +609,36 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
         }
 
 
-@celery_app.task(bind=True, name='app.tasks.price_collector.fetch_daily_price_data')
+def _fetch_latest_asset_prices(asset_id: int, timeframe: str) -> Dict[str, Any]:
+    """Fetch the latest candles of one asset through PriceDataService"""
+    from app.repositories.asset import AssetRepository
+    from app.services.price_data_service import PriceDataService
+    
+    db = SessionLocal()
+    price_service = PriceDataService(db)
+    try:
+        asset = AssetRepository(db).get(asset_id)
+        if not asset:
+            raise ValueError(f"Asset with ID {asset_id} not found")
+        
+        # Latest candle plus a day of overlap, as in PriceDataService.fetch_and_update_latest_prices
+        return async_task_handler.run_async_task(
+            price_service.populate_price_data, asset=asset, days=1, timeframe=timeframe
+        )
+    finally:
+        async_task_handler.run_async_task(price_service.close)
+        db.close()
+
+
+@shared_task(bind=True, name='app.tasks.price_collector.fetch_daily_price_data')
 def fetch_daily_price_data(self, asset_id: int = None, timeframe: str = "1d") -> Dict[str, Any]:
     """
     Fetch daily price data for assets using PriceDataService
     
+    With an asset_id the asset is fetched here; otherwise one
+    fetch_asset_price_data task per active asset is dispatched as a chord
+    and summarize_price_fetch collects the results.
+    
     Args:
         asset_id: Optional specific asset ID to fetch data for
         timeframe: Timeframe for data collection (1d, 1h, 4h)
@@ -470,11 +646,7 @@ def fetch_daily_price_data(self, asset_id: int = None, timeframe: str = "1d") ->
     Returns:
         dict: Task execution results
     """
-    from sqlalchemy.orm import sessionmaker
-    from app.db.database import get_db
-    from app.services.price_data_service import PriceDataService
-    from app.repositories.asset_repository import AssetRepository
-    from app.repositories.price_data_repository import PriceDataRepository
+    from app.repositories.asset import AssetRepository
     
     start_time = datetime.utcnow()
     results = {
@@ -490,25 +662,9 @@ def fetch_daily_price_data(self, asset_id: int = None, timeframe: str = "1d") ->
     }
     
     try:
-        # Get database session
-        db = next(get_db())
-        
-        # Initialize repositories and service
-        asset_repo = AssetRepository(db)
-        price_data_repo = PriceDataRepository(db)
-        price_service = PriceDataService(asset_repo, price_data_repo)
-        
         if asset_id:
             # Fetch data for specific asset
-            asset = asset_repo.get(asset_id)
-            if not asset:
-                raise ValueError(f"Asset with ID {asset_id} not found")
-            
-            result = price_service.populate_price_data(
-                asset_id=asset_id,
-                timeframe=timeframe,
-                limit=1  # Just get latest data
-            )
+            result = _fetch_latest_asset_prices(asset_id, timeframe)
             
             results["processed_assets"] = 1
             if result["success"]:
@@ -516,40 +672,32 @@ def fetch_daily_price_data(self, asset_id: int = None, timeframe: str = "1d") ->
             else:
                 results["failed_updates"] = 1
                 results["errors"].append(result.get("error", "Unknown error"))
-                
-        else:
-            # Fetch data for all active assets
-            active_assets = asset_repo.get_active_assets()
-            results["processed_assets"] = len(active_assets)
             
-            for asset in active_assets:
-                try:
-                    result = price_service.populate_price_data(
-                        asset_id=asset.id,
-                        timeframe=timeframe,
-                        limit=1  # Just get latest data
-                    )
-                    
-                    if result["success"]:
-                        results["successful_updates"] += 1
-                    else:
-                        results["failed_updates"] += 1
-                        results["errors"].append(f"Asset {asset.symbol}: {result.get('error', 'Unknown error')}")
-                        
-                except Exception as e:
-                    results["failed_updates"] += 1
-                    results["errors"].append(f"Asset {asset.symbol}: {str(e)}")
-                    
-                # Add small delay to respect API rate limits
-                time.sleep(0.1)
-        
-        # Update task status
-        results["status"] = "completed"
-        results["end_time"] = datetime.utcnow().isoformat()
-        results["duration"] = (datetime.utcnow() - start_time).total_seconds()
+            results["status"] = "completed"
+            results["end_time"] = datetime.utcnow().isoformat()
+            results["duration"] = (datetime.utcnow() - start_time).total_seconds()
+            return results
+        
+        # Fan out one task per active asset
+        db = SessionLocal()
+        try:
+            asset_ids = [asset.id for asset in AssetRepository(db).get_active_assets()]
+        finally:
+            db.close()
         
-        logger.info(f"Daily price data fetch completed: {results['successful_updates']}/{results['processed_assets']} successful")
+        results["processed_assets"] = len(asset_ids)
+        if asset_ids:
+            header = [fetch_asset_price_data.s(active_id, timeframe) for active_id in asset_ids]
+            callback = summarize_price_fetch.s(
+                task_id=self.request.id, timeframe=timeframe, start_time=results["start_time"]
+            )
+            results["summary_task_id"] = dispatch_chord(header, callback, f"{timeframe} price fetch")
+            results["status"] = "dispatched"
+        else:
+            results["status"] = "completed"
         
+        results["end_time"] = datetime.utcnow().isoformat()
+        results["duration"] = (datetime.utcnow() - start_time).total_seconds()
         return results
         
     except Exception as e:
@@ -560,13 +708,88 @@ def fetch_daily_price_data(self, asset_id: int = None, timeframe: str = "1d") ->
         
         logger.error(f"Daily price data fetch failed: {str(e)}")
         raise self.retry(countdown=60, max_retries=3, exc=e)
+
+
+@shared_task(
+    bind=True,
+    name='app.tasks.price_collector.fetch_asset_price_data',
+    max_retries=3,
+    default_retry_delay=30
+)
+@leased_task()
+def fetch_asset_price_data(self, asset_id: int, timeframe: str = "1d") -> Dict[str, Any]:
+    """
+    Fetch the latest price data for one asset (chord header task)
     
-    finally:
-        if 'db' in locals():
-            db.close()
+    Args:
+        asset_id: Asset ID to fetch data for
+        timeframe: Timeframe for data collection (1d, 1h, 4h)
+        
+    Returns:
+        dict: Asset id, success flag and error
+    """
+    result = {"asset_id": asset_id, "success": False, "error": None}
+    
+    try:
+        fetch_result = _fetch_latest_asset_prices(asset_id, timeframe)
+    except Exception as e:
+        logger.error(f"Price data fetch failed for asset {asset_id}: {str(e)}")
+        return retry_or_report(self, e, result)
+    
+    result["success"] = bool(fetch_result.get("success"))
+    if not result["success"]:
+        result["error"] = fetch_result.get("error") or fetch_result.get("message", "Unknown error")
+    return result
+
+
+@shared_task(name='app.tasks.price_collector.summarize_price_fetch')
+def summarize_price_fetch(
+    asset_results: List[Dict[str, Any]],
+    task_id: Optional[str] = None,
+    timeframe: str = "1d",
+    start_time: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Chord callback - reduce per-asset fetch results into one summary
+    
+    Args:
+        asset_results: Results of the fetch_asset_price_data header tasks
+        task_id: Planner task id
+        timeframe: Timeframe that was fetched
+        start_time: ISO timestamp the run started
+        
+    Returns:
+        dict: Task execution results
+    """
+    # Skipped: another fetch for the same asset and timeframe was still running
+    skipped = sum(1 for result in asset_results if result.get("skipped"))
+    successful = sum(1 for result in asset_results if result.get("success") and not result.get("skipped"))
+    end_time = datetime.utcnow()
+    
+    results = {
+        "task_id": task_id,
+        "task_name": "fetch_daily_price_data",
+        "start_time": start_time,
+        "timeframe": timeframe,
+        "status": "completed",
+        "processed_assets": len(asset_results),
+        "successful_updates": successful,
+        "failed_updates": len(asset_results) - successful - skipped,
+        "skipped_updates": skipped,
+        "errors": [
+            f"Asset {result.get('asset_id')}: {result.get('error')}"
+            for result in asset_results if not result.get("success")
+        ],
+        "end_time": end_time.isoformat()
+    }
+    if start_time:
+        results["duration"] = (end_time - datetime.fromisoformat(start_time)).total_seconds()
+    
+    logger.info(f"Daily price data fetch completed: {successful}/{len(asset_results)} successful")
+    return results
 
 
-@celery_app.task(bind=True, name='app.tasks.price_collector.fetch_historical_price_data')
+@shared_task(bind=True, name='app.tasks.price_collector.fetch_historical_price_data')
 def fetch_historical_price_data(self, asset_id: int, timeframe: str = "1d", days: int = 30) -> Dict[str, Any]:
     """
     Fetch historical price data for a specific asset
@@ -664,5 +887,7 @@ __all__ = [
     'sync_specific_cryptocurrency',
     'get_task_status',
     'fetch_daily_price_data',
+    'fetch_asset_price_data',
+    'summarize_price_fetch',
     'fetch_historical_price_data'
 ]
\ No newline at end of file
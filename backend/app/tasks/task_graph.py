@@ -0,0 +1,58 @@
+# File: backend/app/tasks/task_graph.py
+# Fan-out/fan-in helpers: per-asset subtasks joined by a chord callback
+
+import logging
+from typing import Any, Dict, List
+
+from celery import Task, chord
+from celery.canvas import Signature
+
+logger = logging.getLogger(__name__)
+
+
+def dispatch_chord(header: List[Signature], callback: Signature, label: str) -> str:
+    """
+    Send per-asset subtasks as a chord and return the callback task id
+
+    Subtasks spread over every worker consuming their queue, so a run
+    takes as long as its slowest asset rather than the sum of all assets.
+
+    Args:
+        header: One signature per asset (or chunk of assets)
+        callback: Task that receives the list of subtask results
+        label: What is being fanned out, for logging
+
+    Returns:
+        str: Id of the callback task, which holds the run summary
+    """
+    chord_result = chord(header)(callback)
+    logger.info(f"Dispatched {label} chord: {len(header)} subtasks (summary task {chord_result.id})")
+    return chord_result.id
+
+
+def retry_or_report(task: Task, exc: Exception, result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Retry a chord subtask, or return its failure once retries run out
+
+    A subtask that raises fails the whole chord and its callback never
+    runs, so the last attempt reports the error as an ordinary result.
+    Retries back off exponentially from the task's default_retry_delay.
+
+    Args:
+        task: The bound subtask
+        exc: Error of this attempt
+        result: Failure result to return after the last retry
+
+    Returns:
+        dict: result with the error and attempt count filled in
+    """
+    retries = task.request.retries
+    if retries < task.max_retries:
+        raise task.retry(exc=exc, countdown=task.default_retry_delay * (2 ** retries))
+
+    result.update({
+        "success": False,
+        "error": str(exc),
+        "attempts": retries + 1
+    })
+    return result
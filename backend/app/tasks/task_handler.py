@@ -8,7 +8,10 @@ import asyncio
 import nest_asyncio
 import logging
 import functools
-from typing import Any, Callable, Dict, Awaitable
+import os
+import sys
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Optional
 from datetime import datetime
 
 # Enable nested asyncio for Celery compatibility
@@ -18,6 +21,146 @@ nest_asyncio.apply()
 logger = logging.getLogger(__name__)
 
 
+async def _close_shared_clients() -> None:
+    """Close the process-wide HTTP clients and the async engine pool"""
+    # Only modules a task actually imported own anything worth closing
+    if 'app.services.external_api' in sys.modules:
+        from app.services.external_api import external_api_service
+        await external_api_service.close()
+    if 'app.services.metrics_snapshot_service' in sys.modules:
+        from app.services.metrics_snapshot_service import metrics_snapshot_assembler
+        await metrics_snapshot_assembler.close()
+    if 'app.core.result_store' in sys.modules:
+        from app.core.result_store import result_store
+        await result_store.close_client()
+    if 'app.core.database' in sys.modules:
+        from app.core.database import close_async_db
+        await close_async_db()
+
+
+class WorkerAsyncRuntime:
+    """
+    One long-lived event loop per worker thread
+    
+    Creating a loop per task made every run pay loop setup and left
+    loop-bound resources (httpx clients, the async engine's pooled
+    connections) tied to a loop that was already closed. Each worker thread
+    now keeps a single loop for its lifetime, so clients, pools and cached
+    models are reused across tasks; shutdown() closes them when the worker
+    exits.
+    """
+    
+    def __init__(self, shutdown_hooks: Optional[List[Callable[[], Awaitable[Any]]]] = None):
+        """
+        Args:
+            shutdown_hooks: Async callables run on each loop at shutdown (default:
+                close the process-wide clients and the async engine)
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._shutdown_hooks: List[Callable[[], Awaitable[Any]]] = (
+            [_close_shared_clients] if shutdown_hooks is None else list(shutdown_hooks)
+        )
+        
+        # A forked pool child must not reuse the parent's loops
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+    
+    def _reset_after_fork(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._loops = []
+    
+    def register_shutdown_hook(self, hook: Callable[[], Awaitable[Any]]) -> None:
+        """Add an async callable run on the worker loop at shutdown"""
+        if hook not in self._shutdown_hooks:
+            self._shutdown_hooks.append(hook)
+    
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop of the calling thread, created on first use"""
+        loop = getattr(self._local, 'loop', None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            # Tasks called eagerly from inside another task re-enter the loop
+            nest_asyncio.apply(loop)
+            asyncio.set_event_loop(loop)
+            self._local.loop = loop
+            with self._lock:
+                self._loops.append(loop)
+        return loop
+    
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """
+        Run a coroutine to completion on the calling thread's loop
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Any: Result of the coroutine
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        
+        if running is not None:
+            # Nested call from async code already on this thread
+            nest_asyncio.apply(running)
+            return running.run_until_complete(coro)
+        
+        return self.get_loop().run_until_complete(coro)
+    
+    def shutdown(self) -> None:
+        """Run shutdown hooks, cancel leftover tasks and close every loop"""
+        with self._lock:
+            loops, self._loops = self._loops, []
+        own_loop = getattr(self._local, 'loop', None)
+        self._local = threading.local()
+        
+        hooks_done = False
+        for loop in loops:
+            if loop.is_closed():
+                continue
+            if loop.is_running():
+                logger.warning("Worker event loop still running at shutdown, leaving it open")
+                continue
+            
+            try:
+                if not hooks_done:
+                    hooks_done = True
+                    for hook in self._shutdown_hooks:
+                        try:
+                            loop.run_until_complete(hook())
+                        except Exception as e:
+                            logger.warning(f"Worker shutdown hook {getattr(hook, '__name__', hook)} failed: {str(e)}")
+                
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception as e:
+                logger.warning(f"Worker event loop shutdown failed: {str(e)}")
+            finally:
+                loop.close()
+        
+        # Don't leave the closed loop as this thread's current loop
+        # (nest_asyncio's asyncio.run would pick it up)
+        if own_loop is not None and own_loop.is_closed():
+            asyncio.set_event_loop(None)
+        
+        if loops:
+            logger.info(f"Worker async runtime closed {len(loops)} event loop(s)")
+
+
+# Shared by every task in this worker process
+worker_async_runtime = WorkerAsyncRuntime()
+
+
 class AsyncTaskHandler:
     """
     Handler for managing async operations within Celery tasks
@@ -43,40 +186,16 @@ class AsyncTaskHandler:
             Exception: If the async function fails
         """
         try:
-            logger.info(f"Starting async task execution: {async_func.__name__}")
+            logger.debug(f"Starting async task execution: {async_func.__name__}")
             
-            # Try to get current event loop, create new one if needed
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    logger.info("Event loop is closed, creating new one")
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                logger.info("No event loop found, creating new one")
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            # The worker thread's long-lived loop (see WorkerAsyncRuntime)
+            result = worker_async_runtime.run(async_func(*args, **kwargs))
             
-            # Execute the async function
-            try:
-                if loop.is_running():
-                    # If loop is already running, use nest_asyncio
-                    logger.info("Event loop is running, using nested execution")
-                    result = loop.run_until_complete(async_func(*args, **kwargs))
-                else:
-                    # If loop is not running, run normally
-                    logger.info("Event loop is not running, using normal execution")
-                    result = loop.run_until_complete(async_func(*args, **kwargs))
-                
-                logger.info(f"Async task completed successfully: {async_func.__name__}")
-                return result
-                
-            except Exception as e:
-                logger.error(f"Async task failed: {async_func.__name__} - {str(e)}")
-                raise
-                
+            logger.debug(f"Async task completed successfully: {async_func.__name__}")
+            return result
+        
         except Exception as e:
-            logger.error(f"Failed to execute async task {async_func.__name__}: {str(e)}")
+            logger.error(f"Async task failed: {async_func.__name__} - {str(e)}")
             raise
     
     @staticmethod
@@ -178,26 +297,19 @@ def safe_async_run(async_func: Callable[..., Awaitable[Any]], *args, **kwargs) -
 
 def get_or_create_event_loop() -> asyncio.AbstractEventLoop:
     """
-    Get current event loop or create new one if needed
+    Get the worker thread's long-lived event loop
     
     Returns:
         asyncio.AbstractEventLoop: Event loop instance
     """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        return loop
+    return worker_async_runtime.get_loop()
 
 
 # Export main utilities
 __all__ = [
     'AsyncTaskHandler',
+    'WorkerAsyncRuntime',
+    'worker_async_runtime',
     'async_task_handler', 
     'celery_async_task',
     'safe_async_run',
@@ -0,0 +1,388 @@
+# File: backend/app/tasks/task_lease.py
+# Task leases: one run per task name + arguments, overlapping beat ticks skipped or coalesced
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis is in requirements
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+SKIP = "skip"
+COALESCE = "coalesce"
+
+_KEY_PREFIX = "task_lease:"
+_PENDING_PREFIX = "task_lease_pending:"
+_METRICS_KEY = "task_lease_metrics"
+
+# Take the lease if it is free or its holder stopped renewing it.
+# Returns 1 = acquired, 2 = recovered from an expired holder, 0 = held
+_ACQUIRE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+local result = 1
+if current then
+    local ok, lease = pcall(cjson.decode, current)
+    if ok and tonumber(lease['expires_at']) > tonumber(ARGV[1]) then
+        return 0
+    end
+    result = 2
+end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+return result
+"""
+
+# Extend or drop the lease only while we still own it
+_RENEW_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or cjson.decode(current)['token'] ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'PX', ARGV[3])
+return 1
+"""
+
+_RELEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['token'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def lease_key(task_name: str, arguments: Optional[Dict[str, Any]] = None) -> str:
+    """Lease key for one task name and its (default-filled) arguments"""
+    payload = json.dumps(arguments or {}, sort_keys=True, default=str)
+    return f"{task_name}:{hashlib.sha1(payload.encode()).hexdigest()[:16]}"
+
+
+class _Lease:
+    """A held lease; renewed from a heartbeat thread until released"""
+
+    def __init__(self, manager: "TaskLeaseManager", key: str, token: str, task_id: Optional[str], backend: str, connection=None):
+        self.manager = manager
+        self.key = key
+        self.token = token
+        self.task_id = task_id
+        self.backend = backend
+        self.connection = connection
+        self._stopped = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def start_heartbeat(self) -> None:
+        if self.backend != "redis":
+            return  # Advisory locks live as long as their connection
+        self._heartbeat = threading.Thread(target=self._renew_loop, name=f"lease-{self.key}", daemon=True)
+        self._heartbeat.start()
+
+    def _renew_loop(self) -> None:
+        interval = max(self.manager.lease_seconds / 3, 1)
+        while not self._stopped.wait(interval):
+            if not self.manager._renew(self):
+                logger.warning(f"Task lease {self.key} lost while the task was running")
+                self.manager._record(self.key, "lost")
+                return
+
+    def release(self) -> None:
+        self._stopped.set()
+        self.manager._release(self)
+
+
+class TaskLeaseManager:
+    """
+    Leases that keep one run per task name + arguments
+
+    A lease lives in Redis with an expiry the holder renews while its task
+    runs; a worker that crashes stops renewing, and the next tick takes the
+    lease over once it has expired. Without Redis a PostgreSQL session
+    advisory lock stands in (released when the connection dies). Outcomes
+    are counted in Redis so every worker sees the same metrics.
+    """
+
+    REDIS_RETRY_SECONDS = 30
+
+    def __init__(self, redis_url: Optional[str], lease_seconds: int = 120, enabled: bool = True):
+        self.redis_url = redis_url
+        self.lease_seconds = lease_seconds
+        self.enabled = enabled
+        self.hostname = socket.gethostname()
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._client = None
+        self._scripts: Dict[str, Any] = {}
+        self._redis_down_until = 0.0
+        self._stats_lock = threading.Lock()
+
+    # -------------------------------------
+    # Redis plumbing
+    # -------------------------------------
+
+    def _redis(self):
+        if redis is None or not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._client is None:
+            self._client = redis.from_url(
+                self.redis_url, decode_responses=True, socket_timeout=1.0, socket_connect_timeout=1.0
+            )
+            self._scripts = {
+                'acquire': self._client.register_script(_ACQUIRE_SCRIPT),
+                'renew': self._client.register_script(_RENEW_SCRIPT),
+                'release': self._client.register_script(_RELEASE_SCRIPT),
+            }
+        return self._client
+
+    def _mark_redis_down(self, error: Exception) -> None:
+        self._redis_down_until = time.monotonic() + self.REDIS_RETRY_SECONDS
+        logger.warning(f"Task lease Redis unavailable, using advisory locks for {self.REDIS_RETRY_SECONDS}s: {error}")
+
+    def _payload(self, token: str, task_id: Optional[str]) -> str:
+        now = time.time()
+        return json.dumps({
+            'token': token,
+            'task_id': task_id,
+            'hostname': self.hostname,
+            'acquired_at': now,
+            'expires_at': int((now + self.lease_seconds) * 1000)
+        })
+
+    def _record(self, key: str, outcome: str) -> None:
+        task_name = key.rsplit(":", 1)[0]
+        with self._stats_lock:
+            counts = self.stats.setdefault(task_name, {})
+            counts[outcome] = counts.get(outcome, 0) + 1
+
+        client = self._redis()
+        if client is not None:
+            try:
+                client.hincrby(_METRICS_KEY, f"{task_name}|{outcome}", 1)
+            except Exception as e:
+                self._mark_redis_down(e)
+
+    # -------------------------------------
+    # Lease lifecycle
+    # -------------------------------------
+
+    def acquire(self, key: str, task_id: Optional[str] = None) -> Optional[_Lease]:
+        """
+        Take the lease for key
+
+        Returns:
+            The held lease, or None if another run holds it
+        """
+        token = uuid.uuid4().hex
+        client = self._redis()
+        if client is not None:
+            try:
+                result = self._scripts['acquire'](
+                    keys=[_KEY_PREFIX + key],
+                    args=[int(time.time() * 1000), self._payload(token, task_id), self.lease_seconds * 2000]
+                )
+            except Exception as e:
+                self._mark_redis_down(e)
+            else:
+                if not result:
+                    return None
+                if result == 2:
+                    logger.warning(f"Recovered expired task lease {key}")
+                    self._record(key, "recovered")
+                self._record(key, "acquired")
+                return _Lease(self, key, token, task_id, "redis")
+
+        return self._acquire_advisory(key, token, task_id)
+
+    def _acquire_advisory(self, key: str, token: str, task_id: Optional[str]) -> Optional[_Lease]:
+        from app.core.database import engine
+
+        if engine.dialect.name != 'postgresql':
+            logger.warning(f"No lease backend for {key}, running without overlap protection")
+            return _Lease(self, key, token, task_id, "none")
+
+        connection = engine.connect()
+        try:
+            locked = connection.execute(text("SELECT pg_try_advisory_lock(hashtext(:key))"), {'key': key}).scalar()
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        if not locked:
+            connection.close()
+            return None
+        self._record(key, "acquired")
+        return _Lease(self, key, token, task_id, "advisory", connection)
+
+    def _renew(self, lease: _Lease) -> bool:
+        client = self._redis()
+        if client is None:
+            return True  # Keep running; the lease just may expire early
+        try:
+            return bool(self._scripts['renew'](
+                keys=[_KEY_PREFIX + lease.key],
+                args=[lease.token, self._payload(lease.token, lease.task_id), self.lease_seconds * 2000]
+            ))
+        except Exception as e:
+            self._mark_redis_down(e)
+            return True
+
+    def _release(self, lease: _Lease) -> None:
+        if lease.backend == "advisory":
+            try:
+                lease.connection.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {'key': lease.key})
+                lease.connection.commit()
+            finally:
+                lease.connection.close()
+            return
+
+        client = self._redis()
+        if lease.backend == "redis" and client is not None:
+            try:
+                self._scripts['release'](keys=[_KEY_PREFIX + lease.key], args=[lease.token])
+            except Exception as e:
+                self._mark_redis_down(e)
+
+    def request_rerun(self, key: str) -> bool:
+        """
+        Ask the current holder to run once more when it finishes
+
+        Returns:
+            True if recorded (later requests fold into the same rerun)
+        """
+        client = self._redis()
+        if client is None:
+            return False
+        try:
+            client.set(_PENDING_PREFIX + key, 1, ex=self.lease_seconds * 10)
+            return True
+        except Exception as e:
+            self._mark_redis_down(e)
+            return False
+
+    def take_rerun(self, key: str) -> bool:
+        """Consume a pending rerun request for key"""
+        client = self._redis()
+        if client is None:
+            return False
+        try:
+            return bool(client.delete(_PENDING_PREFIX + key))
+        except Exception as e:
+            self._mark_redis_down(e)
+            return False
+
+    def holder(self, key: str) -> Optional[Dict[str, Any]]:
+        """Current holder of a Redis lease (task id, host, expiry)"""
+        client = self._redis()
+        if client is None:
+            return None
+        try:
+            current = client.get(_KEY_PREFIX + key)
+        except Exception as e:
+            self._mark_redis_down(e)
+            return None
+        return json.loads(current) if current else None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Lease outcomes per task across all workers, plus the leases held now"""
+        client = self._redis()
+        if client is None:
+            return {'backend': 'local', 'tasks': self.stats, 'active_leases': []}
+
+        try:
+            tasks: Dict[str, Dict[str, int]] = {}
+            for field, count in client.hgetall(_METRICS_KEY).items():
+                task_name, outcome = field.rsplit("|", 1)
+                tasks.setdefault(task_name, {})[outcome] = int(count)
+
+            active = []
+            for redis_key in client.scan_iter(match=f"{_KEY_PREFIX}*", count=200):
+                current = client.get(redis_key)
+                if current:
+                    lease = json.loads(current)
+                    active.append({
+                        'key': redis_key[len(_KEY_PREFIX):],
+                        'task_id': lease.get('task_id'),
+                        'hostname': lease.get('hostname'),
+                        'expired': lease['expires_at'] <= time.time() * 1000
+                    })
+        except Exception as e:
+            self._mark_redis_down(e)
+            return {'backend': 'local', 'tasks': self.stats, 'active_leases': []}
+
+        return {'backend': 'redis', 'tasks': tasks, 'active_leases': active}
+
+
+task_lease_manager = TaskLeaseManager(
+    settings.REDIS_URL,
+    lease_seconds=settings.TASK_LEASE_SECONDS,
+    enabled=settings.TASK_LEASE_ENABLED
+)
+
+
+def leased_task(policy: str = SKIP) -> Callable:
+    """
+    Run a bound Celery task under a lease keyed by task name + arguments
+
+    Put it under the task decorator. While one run holds the lease, another
+    run with the same arguments is skipped; with COALESCE it is instead
+    folded into a single rerun that starts when the holder finishes.
+
+    Usage:
+        @shared_task(bind=True)
+        @leased_task(policy=COALESCE)
+        def sync_all_prices(self): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(task, *args, **kwargs):
+            manager = task_lease_manager
+            if not manager.enabled:
+                return func(task, *args, **kwargs)
+
+            # sync_historical_data() and sync_historical_data(days=30) share a lease
+            bound = signature.bind(task, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            key = lease_key(task.name, arguments)
+            lease = manager.acquire(key, task.request.id)
+
+            if lease is None:
+                holder = manager.holder(key) or {}
+                outcome = "coalesced" if policy == COALESCE and manager.request_rerun(key) else "skipped"
+                manager._record(key, outcome)
+                logger.info(f"{task.name} {outcome}: run {holder.get('task_id')} still holds {key}")
+                # Echo the arguments so chord summaries can tell which asset was skipped
+                return {
+                    **arguments,
+                    "status": outcome,
+                    "success": True,
+                    "skipped": True,
+                    "lease_key": key,
+                    "running_task_id": holder.get('task_id')
+                }
+
+            lease.start_heartbeat()
+            try:
+                return func(task, *args, **kwargs)
+            finally:
+                lease.release()
+                if policy == COALESCE and manager.take_rerun(key):
+                    task.apply_async(args=args, kwargs=kwargs)
+                    logger.info(f"{task.name}: starting coalesced rerun for {key}")
+
+        return wrapper
+    return decorator
+
@@ -267,6 +267,29 @@ def normalize_candle_time(candle_time: Union[datetime, int, float], timeframe: s
         return candle_time.replace(second=0, microsecond=0)
 
 
+def month_start(value: datetime) -> datetime:
+    """
+    First instant (UTC) of the month containing value
+    
+    Naive datetimes are taken as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """
+    Shift a month start by a number of months (negative to go back)
+    
+    Examples:
+        add_months(datetime(2025, 11, 1), 3)   # 2026-02-01
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
 def timeframe_to_minutes(timeframe: str) -> int:
     """
     Convert timeframe string to minutes
@@ -1,116 +1,373 @@
 """
-Query monitoring utility for tracking database queries
+Sampling query profiler for tracking database queries
+
+Statements are normalized into fingerprints (literals and bind parameters
+replaced by ?), and a sample of executions is recorded in per-fingerprint
+latency histograms. Every statement is timed while the profiler is enabled,
+so slow queries are caught regardless of sampling. Within a request or task
+scope (query_scope), repeated identical statements are reported as N+1 bursts.
+
+Cost per statement: one ContextVar lookup when disabled; two perf_counter
+calls and a random() draw when enabled. Fingerprinting and the lock are only
+paid by sampled, slow or bursting statements.
 """
 import logging
+import random
+import re
+import threading
 import time
-from datetime import datetime
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
 from sqlalchemy import event
-from sqlalchemy.engine import Engine
-from typing import Dict, List
-import threading
 
 logger = logging.getLogger(__name__)
 
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\([^)]+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\(([^()]*)\)(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_sql(statement: str) -> str:
+    """
+    Normalize a SQL statement into a fingerprint
+
+    Literals and bind parameters become ?, IN lists and multi-row VALUES
+    collapse to one entry, whitespace is collapsed. Cached because the ORM
+    emits the same statement strings over and over.
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _VALUES_LIST.sub(r"VALUES (\1), ...", sql)
+    return sql
+
+
+class FingerprintStats:
+    """Latency histogram for one fingerprint (sampled executions only)"""
+
+    __slots__ = ("fingerprint", "samples", "total_ms", "max_ms", "buckets", "last_seen")
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.samples = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.last_seen = 0.0
+
+    def record(self, duration_ms: float) -> None:
+        self.samples += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.last_seen = time.time()
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Bucket upper bound containing the q-th quantile (max for the open bucket)"""
+        if not self.samples:
+            return None
+        rank = q * self.samples
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return float(LATENCY_BUCKETS_MS[index]) if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self, sample_rate: float) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "samples": self.samples,
+            "estimated_count": round(self.samples / sample_rate) if sample_rate > 0 else self.samples,
+            "mean_ms": round(self.total_ms / self.samples, 3) if self.samples else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "histogram": {
+                (f"le_{bound}ms" if index < len(LATENCY_BUCKETS_MS) else "inf"): bucket_count
+                for index, (bound, bucket_count) in enumerate(
+                    zip(LATENCY_BUCKETS_MS + (None,), self.buckets)
+                )
+            },
+            "last_seen": datetime.fromtimestamp(self.last_seen, timezone.utc).isoformat() if self.last_seen else None,
+        }
+
+
+class QueryScope:
+    """Statements executed within one request or task"""
+
+    __slots__ = ("label", "statements", "by_statement")
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.statements = 0
+        # Raw statement string -> executions; identical ORM statements share
+        # the string (and its cached hash), so this costs one dict increment
+        self.by_statement: Dict[str, int] = {}
+
+
+# Current request/task scope (None outside a scope). The scope object is
+# mutable so threadpool and greenlet hops, which copy the context, still
+# count into the same scope.
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar("db_query_scope", default=None)
+
+
 class QueryMonitor:
-    """Monitor database queries for performance analysis"""
-    
+    """Sampling profiler for database queries"""
+
     def __init__(self):
-        self.query_count = 0
-        self.queries = []
         self.enabled = False
+        self.sample_rate = 0.01
+        self.slow_query_ms = 500.0
+        self.n_plus_one_threshold = 10
+        self.max_fingerprints = 1000
         self.start_time = None
         self.lock = threading.Lock()
-        
-    def enable(self):
-        """Enable query monitoring"""
+        self.fingerprints: Dict[str, FingerprintStats] = {}
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self.n_plus_one_bursts: Deque[Dict[str, Any]] = deque(maxlen=100)
+        # Statements seen while enabled; bumped without the lock, so it may
+        # undercount slightly under heavy thread contention
+        self.query_count = 0
+        self.dropped_fingerprints = 0
+        # Physical connections initialized by the engine connect hook
+        self.connection_setups = 0
+
+    def configure(
+        self,
+        *,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        slow_query_ms: Optional[float] = None,
+        n_plus_one_threshold: Optional[int] = None
+    ) -> None:
+        """Update profiler settings (unspecified settings are kept)"""
         with self.lock:
-            self.enabled = True
-            self.query_count = 0
-            self.queries = []
-            self.start_time = time.time()
-            logger.info("🔍 Query monitoring ENABLED")
-    
-    def disable(self):
-        """Disable query monitoring"""
+            if sample_rate is not None:
+                self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+            if slow_query_ms is not None:
+                self.slow_query_ms = float(slow_query_ms)
+            if n_plus_one_threshold is not None:
+                self.n_plus_one_threshold = max(int(n_plus_one_threshold), 2)
+            if enabled is not None:
+                self.enabled = enabled
+                if enabled and self.start_time is None:
+                    self.start_time = time.time()
+
+    def record_connection_setup(self):
+        """Count one per-connection session setup (see app.core.database)"""
         with self.lock:
-            self.enabled = False
-            total_time = time.time() - self.start_time if self.start_time else 0
-            logger.info(f"🔍 Query monitoring DISABLED - Total queries: {self.query_count}, Total time: {total_time:.2f}s")
-    
+            self.connection_setups += 1
+
+    def enable(self):
+        """Enable query profiling"""
+        self.configure(enabled=True)
+        logger.info(f"🔍 Query profiling ENABLED (sample rate {self.sample_rate:.2%})")
+
+    def disable(self):
+        """Disable query profiling"""
+        self.configure(enabled=False)
+        logger.info("🔍 Query profiling DISABLED")
+
     def reset(self):
-        """Reset query counters"""
+        """Clear collected statistics"""
         with self.lock:
+            self.fingerprints.clear()
+            self.slow_queries.clear()
+            self.n_plus_one_bursts.clear()
             self.query_count = 0
-            self.queries = []
+            self.dropped_fingerprints = 0
             self.start_time = time.time()
-            logger.info("🔄 Query monitor RESET")
-    
+        logger.info("🔄 Query profiler RESET")
+
+    def _stats_for(self, fingerprint: str) -> Optional[FingerprintStats]:
+        # Caller holds the lock
+        stats = self.fingerprints.get(fingerprint)
+        if stats is None:
+            if len(self.fingerprints) >= self.max_fingerprints:
+                self.dropped_fingerprints += 1
+                return None
+            stats = self.fingerprints[fingerprint] = FingerprintStats(fingerprint)
+        return stats
+
+    def record(self, statement: str, duration_ms: float, sampled: bool) -> None:
+        """Record one timed statement (sampled into the histogram and/or slow)"""
+        slow = duration_ms >= self.slow_query_ms
+        if not (sampled or slow):
+            return
+
+        fingerprint = fingerprint_sql(statement)
+        scope = _current_scope.get()
+        with self.lock:
+            if sampled:
+                stats = self._stats_for(fingerprint)
+                if stats is not None:
+                    stats.record(duration_ms)
+            if slow:
+                self.slow_queries.append({
+                    "fingerprint": fingerprint,
+                    "duration_ms": round(duration_ms, 3),
+                    "scope": scope.label if scope else None,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                })
+        if slow:
+            logger.warning(f"🐢 Slow query ({duration_ms:.1f}ms): {fingerprint[:200]}")
+
+    def record_scope(self, scope: QueryScope) -> None:
+        """Report N+1 bursts (same statement repeated) from a finished scope"""
+        bursts = [
+            (statement, executions) for statement, executions in scope.by_statement.items()
+            if executions >= self.n_plus_one_threshold
+        ]
+        if not bursts:
+            return
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self.lock:
+            for statement, executions in bursts:
+                self.n_plus_one_bursts.append({
+                    "fingerprint": fingerprint_sql(statement),
+                    "executions": executions,
+                    "scope": scope.label,
+                    "scope_statements": scope.statements,
+                    "timestamp": now,
+                })
+        for statement, executions in bursts:
+            logger.warning(f"🔁 Possible N+1 in {scope.label or 'scope'}: {executions}x {fingerprint_sql(statement)[:200]}")
+
+    def snapshot(self, top: int = 20, order_by: str = "total") -> Dict[str, Any]:
+        """
+        Profiler state for the admin endpoint
+
+        Args:
+            top: Number of fingerprints to include
+            order_by: Fingerprint ordering - "total" (sampled time), "mean", "max" or "count"
+        """
+        sort_keys = {
+            "total": lambda stats: stats.total_ms,
+            "mean": lambda stats: stats.total_ms / stats.samples if stats.samples else 0.0,
+            "max": lambda stats: stats.max_ms,
+            "count": lambda stats: stats.samples,
+        }
+        sort_key = sort_keys.get(order_by, sort_keys["total"])
+
+        with self.lock:
+            ranked = sorted(self.fingerprints.values(), key=sort_key, reverse=True)[:top]
+            fingerprints = [stats.to_dict(self.sample_rate) for stats in ranked]
+            slow_queries = list(self.slow_queries)[-top:]
+            n_plus_one = list(self.n_plus_one_bursts)[-top:]
+            tracked = len(self.fingerprints)
+            dropped = self.dropped_fingerprints
+
+        total_time = time.time() - self.start_time if self.start_time else 0
+        total_queries = self.query_count
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "slow_query_ms": self.slow_query_ms,
+            "n_plus_one_threshold": self.n_plus_one_threshold,
+            "total_queries": total_queries,
+            "total_time": total_time,
+            "queries_per_second": total_queries / total_time if total_time > 0 else 0,
+            "connection_setups": self.connection_setups,
+            "tracked_fingerprints": tracked,
+            "dropped_fingerprints": dropped,
+            "fingerprints": fingerprints,
+            "slow_queries": slow_queries,
+            "n_plus_one_bursts": n_plus_one,
+        }
+
     def get_stats(self) -> Dict:
         """Get current monitoring statistics"""
-        with self.lock:
-            total_time = time.time() - self.start_time if self.start_time else 0
-            return {
-                'total_queries': self.query_count,
-                'total_time': total_time,
-                'queries_per_second': self.query_count / total_time if total_time > 0 else 0,
-                'recent_queries': self.queries[-10:] if len(self.queries) > 10 else self.queries
-            }
+        return self.snapshot(top=10)
+
 
 # Global instance
 query_monitor = QueryMonitor()
 
+
+@contextmanager
+def query_scope(label: str = "") -> Iterator[QueryScope]:
+    """
+    Track statements executed inside the block (one request or task)
+
+    Yields:
+        QueryScope with the running statement count
+    """
+    scope = QueryScope(label)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        if query_monitor.enabled:
+            query_monitor.record_scope(scope)
+
+
+def get_statement_count() -> Optional[int]:
+    """Statements executed so far in the current scope (None outside query_scope)"""
+    scope = _current_scope.get()
+    return scope.statements if scope is not None else None
+
+
 def setup_query_monitoring(engine):
-    """Setup SQLAlchemy event listeners for query monitoring"""
-    
+    """Setup SQLAlchemy event listeners for query profiling"""
+
     @event.listens_for(engine, "before_cursor_execute")
     def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        scope = _current_scope.get()
+        if scope is not None:
+            scope.statements += 1
         if query_monitor.enabled:
-            context._query_start_time = time.time()
-    
+            if scope is not None:
+                scope.by_statement[statement] = scope.by_statement.get(statement, 0) + 1
+            context._query_sampled = random.random() < query_monitor.sample_rate
+            context._query_start_time = time.perf_counter()
+
     @event.listens_for(engine, "after_cursor_execute")
     def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-        if query_monitor.enabled:
-            with query_monitor.lock:
-                query_monitor.query_count += 1
-                
-                # Calculate execution time
-                execution_time = time.time() - context._query_start_time
-                
-                # Create compact query representation
-                compact_sql = statement.replace('\n', ' ').replace('\t', ' ')
-                while '  ' in compact_sql:
-                    compact_sql = compact_sql.replace('  ', ' ')
-                compact_sql = compact_sql.strip()
-                
-                # Truncate long SQL for readability
-                if len(compact_sql) > 80:
-                    compact_sql = compact_sql[:77] + "..."
-                
-                # Truncate parameters for readability
-                params_str = ""
-                if parameters:
-                    params_str = str(parameters)
-                    if len(params_str) > 50:
-                        params_str = params_str[:47] + "..."
-                
-                # Store query info
-                query_info = {
-                    'query_id': query_monitor.query_count,
-                    'timestamp': datetime.now().strftime('%H:%M:%S.%f')[:-3],
-                    'execution_time': f"{execution_time:.3f}s",
-                    'statement': compact_sql,
-                    'parameters': params_str
-                }
-                
-                query_monitor.queries.append(query_info)
-                
-                # Print compact colored output
-                color = "\033[92m" if execution_time < 0.1 else "\033[93m" if execution_time < 0.5 else "\033[91m"
-                reset_color = "\033[0m"
-                
-                # Single line compact output
-                params_part = f" | Params: {params_str}" if params_str else ""
-                print(f"{color}🔍 Query #{query_monitor.query_count:03d} ({query_info['execution_time']}) | {compact_sql}{params_part}{reset_color}")
+        start = getattr(context, "_query_start_time", None)
+        if start is None or not query_monitor.enabled:
+            return
+        query_monitor.query_count += 1
+        query_monitor.record(statement, (time.perf_counter() - start) * 1000.0, context._query_sampled)
+
+
+def setup_celery_query_scopes() -> None:
+    """Open a query scope per Celery task (N+1 detection and statement counts)"""
+    from celery.signals import task_prerun, task_postrun
+
+    scopes: Dict[str, Any] = {}
+
+    @task_prerun.connect(weak=False)
+    def _open_task_scope(task_id=None, task=None, **kwargs):
+        manager = query_scope(f"task {getattr(task, 'name', task_id)}")
+        manager.__enter__()
+        scopes[task_id] = manager
+
+    @task_postrun.connect(weak=False)
+    def _close_task_scope(task_id=None, **kwargs):
+        manager = scopes.pop(task_id, None)
+        if manager is not None:
+            manager.__exit__(None, None, None)
+
 
 def enable_query_monitoring():
     """Enable query monitoring globally"""
@@ -134,7 +391,7 @@ def toggle_query_monitoring():
         disable_query_monitoring()
         return False
     else:
-        enable_query_monitoring() 
+        enable_query_monitoring()
         return True
 
 def is_query_monitoring_enabled():
@@ -146,4 +403,4 @@ def set_query_monitoring(enabled: bool):
     if enabled:
         enable_query_monitoring()
     else:
-        disable_query_monitoring()
\ No newline at end of file
+        disable_query_monitoring()
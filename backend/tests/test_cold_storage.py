@@ -0,0 +1,156 @@
+# File: backend/tests/test_cold_storage.py
+# Cold tier: freezing archived months to Parquet and reading history across all tiers
+
+import os
+from datetime import datetime, timezone
+from typing import Tuple
+
+import numpy as np
+import pytest
+from sqlalchemy import ForeignKeyConstraint, MetaData, create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("pyarrow")
+
+from app.core.config import settings
+from app.models.asset.price_data import PriceData
+from app.models.asset.price_data_archive import PriceDataArchive
+from app.models.asset.price_data_cold_file import PriceDataColdFile
+from app.repositories.asset.price_data_cold_file_repository import ColdFileUnavailableError, cold_storage_root
+from app.repositories.asset.tiered_price_data_repository import TieredPriceDataRepository
+from app.services.cold_storage_service import ColdStorageService, _file_sha256
+
+# Needs a scratch PostgreSQL database: the tests create and drop their own schema
+COLD_STORAGE_DATABASE_URL = os.getenv("COLD_STORAGE_TEST_DATABASE_URL")
+SCHEMA = "cold_storage_test"
+ASSET_ID = 1
+
+pytestmark = pytest.mark.skipif(
+    not (COLD_STORAGE_DATABASE_URL or "").startswith("postgresql"),
+    reason="set COLD_STORAGE_TEST_DATABASE_URL to a scratch PostgreSQL database"
+)
+
+
+def _scratch_table(model):
+    """Copy of a model's table in the scratch schema (no FK to assets, not partitioned)"""
+    table = model.__table__.to_metadata(MetaData(), schema=SCHEMA)
+    for constraint in [c for c in table.constraints if isinstance(c, ForeignKeyConstraint)]:
+        table.constraints.discard(constraint)
+    table.foreign_keys.clear()
+    for column in table.columns:
+        column.foreign_keys.clear()
+    table.dialect_options["postgresql"]["partition_by"] = None
+    table.info = {}
+    return table
+
+
+def _candle(day: int, month: int, close: float) -> Tuple[datetime, float]:
+    return datetime(2024, month, day, tzinfo=timezone.utc), close
+
+
+@pytest.fixture
+def tiers(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "COLD_STORAGE_DIR", str(tmp_path))
+    # Unqualified table names in the service SQL resolve to the scratch schema
+    engine = create_engine(COLD_STORAGE_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    tables = {model: _scratch_table(model) for model in (PriceData, PriceDataArchive, PriceDataColdFile)}
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        for table in tables.values():
+            table.create(conn)
+
+    def archive(*candles):
+        with engine.begin() as conn:
+            conn.execute(tables[PriceDataArchive].insert(), [{
+                "asset_id": ASSET_ID, "timeframe": "1d", "timestamp": time,
+                "open_price": close, "high_price": close + 1, "low_price": close - 1, "close_price": close,
+                "volume": 10, "archive_year": time.year, "archive_month": time.month, "archive_date": time,
+                "retention_tier": "warm"
+            } for time, close in candles])
+
+    def hot(*candles):
+        with engine.begin() as conn:
+            conn.execute(tables[PriceData].insert(), [{
+                "asset_id": ASSET_ID, "timeframe": "1d", "candle_time": time,
+                "open_price": close, "high_price": close + 1, "low_price": close - 1, "close_price": close,
+                "volume": 10
+            } for time, close in candles])
+
+    db = sessionmaker(bind=engine)()
+    yield {"engine": engine, "db": db, "archive": archive, "hot": hot}
+
+    db.close()
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    engine.dispose()
+
+
+def _archived_rows(engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(text("price_data_archive"))).scalar()
+
+
+class TestFreezeMonth:
+
+    def test_archived_month_moves_to_parquet(self, tiers):
+        tiers["archive"](_candle(1, 1, 100.0), _candle(2, 1, 101.0), _candle(3, 1, 102.0))
+
+        result = ColdStorageService(tiers["db"]).freeze_month(ASSET_ID, "1d", 2024, 1)
+
+        assert result["rows"] == 3
+        assert _archived_rows(tiers["engine"]) == 0
+
+        cold_file = tiers["db"].query(PriceDataColdFile).one()
+        path = cold_storage_root() / cold_file.file_path
+        assert cold_file.row_count == 3
+        assert cold_file.first_candle_time == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert cold_file.last_candle_time == datetime(2024, 1, 3, tzinfo=timezone.utc)
+        assert cold_file.file_size_bytes == path.stat().st_size
+        assert cold_file.checksum == _file_sha256(path)
+
+    def test_late_archived_rows_merge_into_the_existing_file(self, tiers):
+        service = ColdStorageService(tiers["db"])
+        tiers["archive"](_candle(1, 1, 100.0), _candle(2, 1, 101.0))
+        service.freeze_month(ASSET_ID, "1d", 2024, 1)
+
+        # A corrected Jan 2 candle and a new Jan 3 candle arrive later
+        tiers["archive"](_candle(2, 1, 111.0), _candle(3, 1, 102.0))
+        result = service.freeze_month(ASSET_ID, "1d", 2024, 1)
+
+        assert result["rows"] == 2
+        assert tiers["db"].query(PriceDataColdFile).one().row_count == 3
+        columns = TieredPriceDataRepository(tiers["db"]).get_ohlcv_columns(ASSET_ID, "1d")
+        np.testing.assert_array_equal(columns["close_price"], [100.0, 111.0, 102.0])
+
+
+class TestTieredRead:
+
+    def test_history_spans_cold_archive_and_hot_tiers(self, tiers):
+        tiers["archive"](_candle(30, 1, 100.0), _candle(31, 1, 101.0))
+        ColdStorageService(tiers["db"]).freeze_month(ASSET_ID, "1d", 2024, 1)
+        tiers["archive"](_candle(1, 2, 102.0), _candle(2, 2, 103.0))
+        # Feb 2 is still in the hot table too; the hot row wins
+        tiers["hot"](_candle(2, 2, 104.0), _candle(3, 2, 105.0))
+
+        columns = TieredPriceDataRepository(tiers["db"]).get_ohlcv_columns(
+            ASSET_ID, "1d",
+            start_time=datetime(2024, 1, 31, tzinfo=timezone.utc),
+            end_time=datetime(2024, 2, 28, tzinfo=timezone.utc)
+        )
+
+        assert [str(day) for day in columns["candle_time"].astype("datetime64[D]")] == [
+            "2024-01-31", "2024-02-01", "2024-02-02", "2024-02-03"
+        ]
+        np.testing.assert_array_equal(columns["close_price"], [101.0, 102.0, 104.0, 105.0])
+
+    def test_missing_cold_file_raises_a_clear_error(self, tiers):
+        tiers["archive"](_candle(1, 1, 100.0))
+        ColdStorageService(tiers["db"]).freeze_month(ASSET_ID, "1d", 2024, 1)
+        cold_file = tiers["db"].query(PriceDataColdFile).one()
+        os.remove(cold_storage_root() / cold_file.file_path)
+
+        with pytest.raises(ColdFileUnavailableError) as error:
+            TieredPriceDataRepository(tiers["db"]).get_ohlcv_columns(ASSET_ID, "1d")
+
+        assert error.value.period == "2024-01"
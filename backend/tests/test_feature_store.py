@@ -0,0 +1,78 @@
+# File: backend/tests/test_feature_store.py
+# Feature-matrix store: tail updates, older windows served from the stored frame
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.preprocessing.data_processor import CryptoPriceDataProcessor
+
+
+def _candles(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 30000 + np.cumsum(rng.normal(0, 50, rows))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2026-01-01', periods=rows, freq='h'),
+        'open_price': close - 5,
+        'high_price': close + 20,
+        'low_price': close - 20,
+        'close_price': close,
+        'volume': rng.uniform(100, 200, rows),
+        'market_cap': close * 19e6,
+    })
+
+
+@pytest.fixture
+def processor(tmp_path):
+    return CryptoPriceDataProcessor(feature_store_path=str(tmp_path / 'feature_store'))
+
+
+class TestFeatureMatrixStore:
+
+    def test_storage_directory_is_created_on_first_write(self, processor):
+        store = processor.feature_store
+        assert store.invalidate() == 0
+
+        processor.build_features(_candles(300), 'BTC')
+
+        assert store.get_stats()['full_builds'] == 1
+        assert any(name.endswith('.pkl') for name in os.listdir(store.storage_path))
+
+    def test_new_candles_update_only_the_tail(self, processor):
+        candles = _candles(900)
+        processor.build_features(candles.iloc[:800], 'BTC')
+
+        features, info = processor.build_features(candles, 'BTC')
+
+        assert info['mode'] == 'incremental'
+        expected = processor.engineer_features(candles.copy())
+        np.testing.assert_allclose(
+            features['ema_12'].values[-50:], expected['ema_12'].values[-50:], rtol=1e-9
+        )
+
+    def test_older_window_is_sliced_without_replacing_the_entry(self, processor):
+        candles = _candles(900)
+        full, _ = processor.build_features(candles, 'BTC')
+
+        older, info = processor.build_features(candles.iloc[100:600], 'BTC')
+
+        assert info['mode'] == 'hit'
+        assert len(older) == 500
+        pd.testing.assert_frame_equal(older, full.iloc[100:600].reset_index(drop=True))
+
+        # The stored entry still reaches the latest candle
+        _, latest = processor.build_features(candles, 'BTC')
+        assert latest['mode'] == 'hit'
+        assert processor.feature_store.get_stats()['full_builds'] == 1
+
+    def test_corrected_candles_trigger_a_rebuild(self, processor):
+        candles = _candles(600)
+        processor.build_features(candles, 'BTC')
+
+        corrected = candles.copy()
+        corrected.loc[550, 'close_price'] += 1000
+        _, info = processor.build_features(corrected.iloc[:580], 'BTC')
+
+        assert info['mode'] == 'full'
@@ -0,0 +1,66 @@
+# File: backend/tests/test_import_time.py
+# Import-time budget for the ML modules that load TensorFlow and the model registry lazily
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+backend_dir = Path(__file__).parent.parent
+
+# Seconds allowed for a cold import of LAZY_MODULES (override for slow CI machines)
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "3.0"))
+
+# Modules that used to import TensorFlow or scan the model registry at import time
+LAZY_MODULES = (
+    "app.ml",
+    "app.ml.prediction.prediction_service",
+    "app.ml.training.training_service",
+)
+
+# Measured in a fresh interpreter: conftest has already imported the app here
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for module in {modules!r}:
+    importlib.import_module(module)
+elapsed = time.perf_counter() - start
+from app.ml.config.ml_config import model_registry
+print(json.dumps({{
+    "seconds": elapsed,
+    "tensorflow_loaded": "tensorflow" in sys.modules,
+    "registry_loaded": model_registry.is_loaded,
+}}))
+"""
+
+
+def _probe_import() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(modules=LAZY_MODULES)],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, f"importing {', '.join(LAZY_MODULES)} failed:\n{result.stderr}"
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.performance
+class TestImportTime:
+    """Cold-start budget: heavy ML dependencies must load on first use"""
+
+    def test_import_ml_modules_within_budget(self):
+        probe = _probe_import()
+        assert probe["seconds"] < IMPORT_TIME_BUDGET_SECONDS, (
+            f"importing the ML modules took {probe['seconds']:.2f}s "
+            f"(budget {IMPORT_TIME_BUDGET_SECONDS:.2f}s)"
+        )
+
+    def test_import_does_not_load_tensorflow_or_registry(self):
+        probe = _probe_import()
+        assert not probe["tensorflow_loaded"], "TensorFlow imported at module import time"
+        assert not probe["registry_loaded"], "Model registry scanned at module import time"
@@ -0,0 +1,116 @@
+# File: backend/tests/test_incremental_training.py
+# Incremental retraining: the warm-start branch is taken instead of a full retrain
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.training import training_service as training_module
+from app.ml.training.training_service import MLTrainingService
+from app.services.data_sync import data_sync_service
+
+CUTOFF = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+class _Session:
+    """Stand-in Session that finds one asset"""
+
+    def __init__(self):
+        self.closed = False
+
+    def query(self, model):
+        return SimpleNamespace(filter=lambda *criteria: SimpleNamespace(first=lambda: SimpleNamespace(id=7, symbol='BTC')))
+
+    def close(self):
+        self.closed = True
+
+
+def _candles(new_records: int) -> pd.DataFrame:
+    times = pd.date_range(CUTOFF - timedelta(hours=48), CUTOFF + timedelta(hours=new_records), freq='h')
+    close = np.linspace(30000, 31000, len(times), dtype=np.float32)
+    return pd.DataFrame({
+        'timestamp': times.tz_localize(None),
+        'open_price': close, 'high_price': close, 'low_price': close, 'close_price': close,
+        'volume': np.ones(len(times), dtype=np.float32), 'market_cap': np.zeros(len(times), dtype=np.float32),
+    })
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(training_module, 'SessionLocal', lambda: session)
+    return session
+
+
+@pytest.fixture
+def service(session, tmp_path, monkeypatch):
+    parent_path = tmp_path / 'BTC_lstm_parent.h5'
+    parent_path.touch()
+    (tmp_path / 'BTC_lstm_parent_scalers.pkl').touch()
+    active_model = {
+        'model_id': 'BTC_lstm_parent',
+        'model_path': str(parent_path),
+        'metadata': {'training_data_end': CUTOFF.isoformat()}
+    }
+
+    async def sufficient(**kwargs):
+        return {'sufficient': True}
+
+    async def full_training(**kwargs):
+        raise AssertionError("fell back to full training")
+
+    # Stand-in registry: loading the real one rewrites models/registry.json
+    monkeypatch.setattr(training_module, 'model_registry', SimpleNamespace(get_active_model=lambda symbol: active_model))
+    monkeypatch.setattr(data_sync_service, 'check_and_ensure_historical_data', sufficient)
+
+    service = MLTrainingService()
+    service.data_processor.feature_store = None
+    monkeypatch.setattr(service, '_train_model_comprehensive', full_training)
+    return service
+
+
+class TestIncrementalTraining:
+
+    def test_up_to_date_model_is_kept_without_retraining(self, service, session, monkeypatch):
+        loaded = {}
+
+        async def load_training_data(db, asset_id, start_date=None, timeframe='1h'):
+            loaded.update(asset_id=asset_id, start_date=start_date)
+            return _candles(new_records=5)
+
+        monkeypatch.setattr(service, '_load_training_data', load_training_data)
+
+        result = asyncio.run(service.train_model_for_crypto('BTC', {'training_mode': 'incremental'}))
+
+        assert result['training_mode'] == 'incremental'
+        assert result['skipped'] is True
+        assert result['model_id'] == 'BTC_lstm_parent'
+        assert result['new_records'] == 5
+        # The asset was looked up through the session and the replay window loaded
+        assert loaded['asset_id'] == 7
+        assert loaded['start_date'] < CUTOFF
+        assert session.closed
+
+    def test_new_candles_warm_start_from_the_active_model(self, service, monkeypatch):
+        async def load_training_data(db, asset_id, start_date=None, timeframe='1h'):
+            return _candles(new_records=48)
+
+        parents = []
+
+        class _Predictor:
+            def load_model(self, path):
+                parents.append(path)
+                raise RuntimeError("stop after the warm start began")
+
+        monkeypatch.setattr(service, '_load_training_data', load_training_data)
+        monkeypatch.setattr(service, '_create_lstm_predictor', lambda n_features, training_config: _Predictor())
+
+        with pytest.raises(RuntimeError, match="stop after the warm start began"):
+            asyncio.run(service._train_model_incremental('BTC', {'training_mode': 'incremental'}))
+
+        # Past the asset lookup and the new-candle check, into loading the parent
+        assert parents == [training_module.model_registry.get_active_model('BTC')['model_path']]
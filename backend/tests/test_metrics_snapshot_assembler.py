@@ -0,0 +1,202 @@
+# File: backend/tests/test_metrics_snapshot_assembler.py
+# Concurrent provider assembly: latency bounded by the slowest deadline, late fields reported
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import metrics_snapshot_service
+from app.services.metrics_snapshot_service import (
+    MetricsSnapshotAssembler,
+    PROVIDER_FIELDS,
+    snapshot_quality_score,
+)
+
+DEADLINES = {'alternative_me': 0.2, 'coingecko': 0.2, 'tradingview': 0.3, 'google_trends': 0.25}
+ALL_FIELDS = [field for fields in PROVIDER_FIELDS.values() for field in fields]
+SNAPSHOT_TIME = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+
+
+def _provider(delay: float, **fields):
+    async def fetch(values):
+        await asyncio.sleep(delay)
+        values.update(fields)
+    return fetch
+
+
+class _Repository:
+    """Stand-in for MetricsSnapshotRepository holding one earlier snapshot"""
+
+    def __init__(self, last=None):
+        self.last = last
+        self.upserted = None
+
+    def get_last_known(self, timeframe, at_or_before):
+        return self.last
+
+    def upsert_snapshot(self, values):
+        self.upserted = values
+        return 1
+
+
+def _last_snapshot(hours_ago: int, field_as_of=None, **fields):
+    values = {field: None for field in ALL_FIELDS}
+    values.update(fields)
+    return SimpleNamespace(
+        snapshot_time=SNAPSHOT_TIME - timedelta(hours=hours_ago),
+        data_quality_flags={'field_as_of': field_as_of or {}},
+        **values
+    )
+
+
+@pytest.fixture
+def assembler():
+    assembler = MetricsSnapshotAssembler(deadlines=DEADLINES)
+    stored = {}
+
+    def store(timeframe, snapshot_time, fresh, providers, started_at, completed_at):
+        stored.update(fresh=fresh, providers=providers)
+        return stored
+
+    assembler._store = store
+    return assembler
+
+
+class TestMetricsSnapshotAssembler:
+
+    def test_providers_run_concurrently(self, assembler):
+        assembler._fetchers = {
+            'alternative_me': _provider(0.1, fear_greed_index=55),
+            'coingecko': _provider(0.1, btc_price_usd=65000.0, btc_dominance=52.0),
+            'tradingview': _provider(0.1, sp500=5400.0),
+            'google_trends': _provider(0.1, google_trends_score=61.5),
+        }
+
+        started = time.perf_counter()
+        result = asyncio.run(assembler.assemble('1h'))
+        elapsed = time.perf_counter() - started
+
+        # Sequential collection would take 0.4s
+        assert elapsed < 0.3
+        assert result['fresh']['fear_greed_index'] == 55
+        assert all(report['status'] == 'ok' for report in result['providers'].values())
+
+    def test_late_provider_is_cut_off_at_its_deadline(self, assembler):
+        async def partial_market(values):
+            values['btc_price_usd'] = 65000.0
+            await asyncio.sleep(10)
+            values['btc_dominance'] = 52.0
+
+        async def failing_macro(values):
+            raise RuntimeError("TradingView unavailable")
+
+        assembler._fetchers = {
+            'alternative_me': _provider(0.05, fear_greed_index=55),
+            'coingecko': partial_market,
+            'tradingview': failing_macro,
+            'google_trends': _provider(10, google_trends_score=61.5),
+        }
+
+        started = time.perf_counter()
+        result = asyncio.run(assembler.assemble('1h'))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < max(DEADLINES.values()) + 0.2
+        # Fields delivered before the deadline are kept
+        assert result['fresh'] == {'fear_greed_index': 55, 'btc_price_usd': 65000.0}
+        assert result['providers']['coingecko']['status'] == 'timeout'
+        assert result['providers']['google_trends']['status'] == 'timeout'
+        assert result['providers']['tradingview']['status'] == 'error'
+
+    def test_every_snapshot_field_has_a_provider(self):
+        fields = [field for provider_fields in PROVIDER_FIELDS.values() for field in provider_fields]
+        assert len(fields) == len(set(fields))
+        assert 'btc_price_usd' in fields
+
+
+class TestLastKnownFill:
+
+    def test_fills_missing_fields_from_last_snapshot(self):
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES, max_fill_age_hours=6)
+        repository = _Repository(_last_snapshot(1, sp500=5400.0, vix_index=None))
+
+        values, as_of = assembler._fill_from_last_known(repository, '1h', SNAPSHOT_TIME, ['sp500', 'vix_index'])
+
+        # A field the last snapshot did not have either stays missing
+        assert values == {'sp500': 5400.0}
+        assert as_of == {'sp500': SNAPSHOT_TIME - timedelta(hours=1)}
+
+    def test_values_older_than_max_age_are_not_filled(self):
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES, max_fill_age_hours=6)
+        repository = _Repository(_last_snapshot(7, sp500=5400.0))
+
+        values, as_of = assembler._fill_from_last_known(repository, '1h', SNAPSHOT_TIME, ['sp500'])
+
+        assert values == {} and as_of == {}
+
+    def test_carried_over_value_keeps_its_original_fetch_time(self):
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES, max_fill_age_hours=6)
+        # Last snapshot is recent, but its gold value was itself carried over from 8h ago
+        fetched_at = SNAPSHOT_TIME - timedelta(hours=8)
+        repository = _Repository(_last_snapshot(
+            1, field_as_of={'gold': fetched_at.isoformat(), 'dxy': (SNAPSHOT_TIME - timedelta(hours=2)).isoformat()},
+            gold=2400.0, dxy=104.0
+        ))
+
+        values, as_of = assembler._fill_from_last_known(repository, '1h', SNAPSHOT_TIME, ['gold', 'dxy'])
+
+        assert values == {'dxy': 104.0}
+        assert as_of == {'dxy': SNAPSHOT_TIME - timedelta(hours=2)}
+
+    def test_no_earlier_snapshot(self):
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES)
+
+        assert assembler._fill_from_last_known(_Repository(), '1h', SNAPSHOT_TIME, ['sp500']) == ({}, {})
+
+
+class TestSnapshotQualityScore:
+
+    def test_score_credits(self):
+        total = len(ALL_FIELDS)
+        assert snapshot_quality_score(total, 0, total) == 100
+        assert snapshot_quality_score(0, total, total) == 50
+        assert snapshot_quality_score(0, 0, total) == 0
+        # 10 fresh + 2 filled at half credit out of 13
+        assert snapshot_quality_score(10, 2, 13) == round(100 * 11 / 13)
+
+    def test_stored_snapshot_scores_filled_and_missing_fields(self, monkeypatch):
+        repository = _Repository(_last_snapshot(1, sp500=5400.0, gold=2400.0))
+        monkeypatch.setattr(metrics_snapshot_service, 'SessionLocal', lambda: SimpleNamespace(close=lambda: None))
+        monkeypatch.setattr(metrics_snapshot_service, 'MetricsSnapshotRepository', lambda db: repository)
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES, max_fill_age_hours=6)
+
+        missing = {'sp500', 'gold', 'dxy'}
+        fresh = {field: 1.0 for field in ALL_FIELDS if field not in missing}
+        result = assembler._store('1h', SNAPSHOT_TIME, fresh, {}, SNAPSHOT_TIME, SNAPSHOT_TIME)
+
+        assert result['success'] is True
+        assert result['filled_fields'] == ['gold', 'sp500']
+        assert result['missing_fields'] == ['dxy']
+        assert result['data_quality_score'] == snapshot_quality_score(len(fresh), 2, len(ALL_FIELDS))
+
+        stored = repository.upserted
+        assert stored['data_quality_score'] == result['data_quality_score']
+        assert stored['data_source'] == metrics_snapshot_service.SNAPSHOT_SOURCE
+        assert stored['sp500'] == 5400.0 and stored['dxy'] is None
+        field_as_of = stored['data_quality_flags']['field_as_of']
+        assert field_as_of['sp500'] == (SNAPSHOT_TIME - timedelta(hours=1)).isoformat()
+        assert field_as_of['btc_price_usd'] == SNAPSHOT_TIME.isoformat()
+
+    def test_snapshot_without_btc_price_is_skipped(self, monkeypatch):
+        repository = _Repository()
+        monkeypatch.setattr(metrics_snapshot_service, 'SessionLocal', lambda: SimpleNamespace(close=lambda: None))
+        monkeypatch.setattr(metrics_snapshot_service, 'MetricsSnapshotRepository', lambda db: repository)
+        assembler = MetricsSnapshotAssembler(deadlines=DEADLINES)
+
+        result = assembler._store('1h', SNAPSHOT_TIME, {'sp500': 5400.0}, {}, SNAPSHOT_TIME, SNAPSHOT_TIME)
+
+        assert result['success'] is False
+        assert repository.upserted is None
@@ -0,0 +1,97 @@
+# File: backend/tests/test_model_health.py
+# Background model health checks: backoff after a failure, quarantine on repeated failures
+
+import pytest
+
+from app.ml.prediction import model_loader as loader_module
+from app.ml.prediction.model_loader import ModelLoader, ModelHealthScheduler
+
+CACHE_KEY = "BTC:BTC_lstm_test"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(loader_module, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def loader(clock):
+    loader = ModelLoader()
+    # Checks run explicitly through run_checks(), never on the scheduler thread
+    loader.health_scheduler = ModelHealthScheduler(
+        loader, check_interval=300, max_failures=2, quarantine_seconds=900, retry_seconds=30
+    )
+    loader.models_cache[CACHE_KEY] = object()
+    loader.model_metadata[CACHE_KEY] = {
+        'is_healthy': True,
+        'health_status': 'pending',
+        'consecutive_failures': 0,
+        'last_health_check': None,
+        'next_health_check': None,
+        'last_error': None
+    }
+    return loader
+
+
+def _health(loader, *results):
+    """Make the forward-pass check return ``results`` in turn"""
+    outcomes = iter(results)
+    loader._verify_model_functionality = lambda model: next(outcomes)
+
+
+class TestHealthBackoff:
+
+    def test_transient_failure_does_not_quarantine(self, loader, clock):
+        _health(loader, False, True)
+        scheduler = loader.health_scheduler
+
+        assert scheduler.run_checks() == {CACHE_KEY: False}
+
+        # Neither the scheduler's own retry nor a reported error re-checks right away
+        scheduler.request_check(CACHE_KEY)
+        clock.now += 5
+        assert scheduler.run_checks() == {}
+        assert CACHE_KEY in loader.models_cache
+
+        # The retry runs once the backoff has passed, and the model recovers
+        clock.now += 25
+        assert scheduler.run_checks() == {CACHE_KEY: True}
+        assert not loader._is_quarantined(CACHE_KEY)
+        metadata = loader.model_metadata[CACHE_KEY]
+        assert metadata['health_status'] == 'healthy'
+        assert metadata['consecutive_failures'] == 0
+        assert metadata['next_health_check'] is None
+
+    def test_repeated_failures_quarantine_after_the_backoff(self, loader, clock):
+        _health(loader, False, False)
+        scheduler = loader.health_scheduler
+
+        scheduler.run_checks()
+        clock.now += 30
+        scheduler.run_checks()
+
+        assert CACHE_KEY not in loader.models_cache
+        assert loader._is_quarantined(CACHE_KEY)
+
+    def test_retry_delay_doubles_up_to_the_check_interval(self, loader):
+        scheduler = loader.health_scheduler
+
+        assert [scheduler._retry_delay(failures) for failures in range(1, 6)] == [30, 60, 120, 240, 300]
+
+    def test_forced_check_ignores_the_backoff(self, loader, clock):
+        _health(loader, False, True)
+        scheduler = loader.health_scheduler
+
+        scheduler.run_checks()
+
+        assert scheduler.run_checks(force=True) == {CACHE_KEY: True}
@@ -0,0 +1,85 @@
+# File: backend/tests/test_prediction_features.py
+# Live predictions read recent candles and their engineered features through the feature store
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.ml.config.ml_config import ml_config
+from app.ml.prediction import prediction_service as prediction_module
+from app.ml.prediction.prediction_service import OptimizedPredictionService
+
+CANDLES = 72
+
+
+class _Query:
+    def __init__(self, result):
+        self.result = result
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return self.result
+
+
+class _Session:
+    """Stand-in Session: one asset and its last 3 days of hourly candles (cursor fallback path)"""
+
+    def __init__(self):
+        self.closed = False
+        end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+        closes = 30000 + np.cumsum(np.random.default_rng(3).normal(0, 40, CANDLES))
+        self.rows = [
+            (end - timedelta(hours=CANDLES - 1 - index), close - 5, close + 20, close - 20, close, 150.0, 0.0)
+            for index, close in enumerate(closes)
+        ]
+
+    def query(self, model):
+        return _Query(SimpleNamespace(id=1, symbol='BTC'))
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name='sqlite'))
+
+    def execute(self, statement):
+        return SimpleNamespace(all=lambda: self.rows)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = _Session()
+    monkeypatch.setattr(prediction_module, 'SessionLocal', lambda: session)
+    return session
+
+
+@pytest.fixture
+def service(session, tmp_path, monkeypatch):
+    monkeypatch.setattr(ml_config, 'feature_store_path', str(tmp_path / 'feature_store'))
+    return OptimizedPredictionService()
+
+
+class TestRecentFeatures:
+
+    def test_recent_candles_come_back_with_engineered_features(self, service, session):
+        features = service._load_recent_features('BTC')
+
+        assert features is not None
+        assert len(features) == CANDLES
+        assert {'close_price', 'returns_1h', 'rsi'} <= set(features.columns)
+        assert session.closed
+        assert service.data_processor.feature_store.get_stats()['full_builds'] == 1
+
+    def test_ml_prediction_uses_the_feature_frame(self, service, monkeypatch):
+        monkeypatch.setattr(prediction_module.model_loader, 'load_model', lambda symbol: object())
+
+        result = asyncio.run(service._generate_ml_prediction_fast('btc', 24, 30000.0))
+
+        assert result is not None
+        assert result['data_source'] == 'ml_model'
+        assert result['crypto_symbol'] == 'BTC'
@@ -0,0 +1,216 @@
+# File: backend/tests/test_price_data_partitioning.py
+# Benchmark: plain vs monthly-partitioned price_data (insert throughput, range scans)
+
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+import pytest
+from sqlalchemy import ForeignKeyConstraint, Index, MetaData, create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.asset.price_data import PriceData
+from app.services.price_data_partitions import PriceDataPartitionManager
+from app.utils.datetime_utils import add_months, month_start
+
+# Needs a scratch PostgreSQL database: the benchmark creates and drops its own schemas
+BENCHMARK_DATABASE_URL = os.getenv("PARTITION_BENCHMARK_DATABASE_URL")
+BENCHMARK_ROWS = int(os.getenv("PARTITION_BENCHMARK_ROWS", "200000"))
+BENCHMARK_ASSETS = 20
+INSERT_BATCH_SIZE = 5000
+QUERY_REPEATS = 30
+
+PLAIN_SCHEMA = "price_bench_plain"
+PARTITIONED_SCHEMA = "price_bench_partitioned"
+
+# Indexes of the unpartitioned table before partitioning (the "before" layout)
+_LEGACY_INDEXES = [
+    ("idx_price_data_asset_id", ("asset_id",)),
+    ("idx_price_data_timeframe", ("timeframe",)),
+    ("idx_price_data_candle_time", ("candle_time",)),
+    ("idx_price_data_asset_timeframe", ("asset_id", "timeframe")),
+    ("idx_price_data_asset_tf_time", ("asset_id", "timeframe", "candle_time")),
+]
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not (BENCHMARK_DATABASE_URL or "").startswith("postgresql"),
+        reason="set PARTITION_BENCHMARK_DATABASE_URL to a scratch PostgreSQL database"
+    ),
+]
+
+
+def _bench_table(schema: str, partitioned: bool):
+    """Copy of the price_data table in its own schema (no FK to assets)"""
+    table = PriceData.__table__.to_metadata(MetaData(), schema=schema)
+    for constraint in [c for c in table.constraints if isinstance(c, ForeignKeyConstraint)]:
+        table.constraints.discard(constraint)
+    table.foreign_keys.clear()
+    for column in table.columns:
+        column.foreign_keys.clear()
+
+    if not partitioned:
+        table.dialect_options["postgresql"]["partition_by"] = None
+        table.info = {}
+        for name, columns in _LEGACY_INDEXES:
+            Index(name, *(table.c[column] for column in columns))
+    return table
+
+
+def _generate_rows(start: datetime) -> List[Dict]:
+    hours = BENCHMARK_ROWS // BENCHMARK_ASSETS
+    rng = random.Random(42)
+    rows = []
+    # Interleaved by time, like live ingestion of every asset each hour
+    for hour in range(hours):
+        candle_time = start + timedelta(hours=hour)
+        for asset_id in range(1, BENCHMARK_ASSETS + 1):
+            close = 100 + rng.random() * 10
+            rows.append({
+                "asset_id": asset_id,
+                "timeframe": "1h",
+                "candle_time": candle_time,
+                "open_price": close,
+                "high_price": close + 1,
+                "low_price": close - 1,
+                "close_price": close,
+                "volume": 1000,
+                "is_validated": False,
+            })
+    return rows
+
+
+def _median_ms(run: Callable[[], None], repeats: int = QUERY_REPEATS) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.fixture(scope="module")
+def bench():
+    engine = create_engine(BENCHMARK_DATABASE_URL)
+    tables = {
+        "plain": _bench_table(PLAIN_SCHEMA, partitioned=False),
+        "partitioned": _bench_table(PARTITIONED_SCHEMA, partitioned=True),
+    }
+    with engine.begin() as conn:
+        for schema in (PLAIN_SCHEMA, PARTITIONED_SCHEMA):
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+        for table in tables.values():
+            table.create(conn)
+
+    start = add_months(month_start(datetime.now(timezone.utc)), -(BENCHMARK_ROWS // BENCHMARK_ASSETS // 720 + 1))
+    db = sessionmaker(bind=engine)()
+    manager = PriceDataPartitionManager(db, table=tables["partitioned"], subpartition_timeframes=[])
+    manager.ensure_partitions(start=start)
+
+    rows = _generate_rows(start)
+    insert_rate = {}
+    for label, table in tables.items():
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            for offset in range(0, len(rows), INSERT_BATCH_SIZE):
+                conn.execute(table.insert(), rows[offset:offset + INSERT_BATCH_SIZE])
+        insert_rate[label] = len(rows) / (time.perf_counter() - started)
+
+    manager.brin_cold_partitions(older_than_months=1)
+    with engine.begin() as conn:
+        for table in tables.values():
+            conn.execute(text(f"ANALYZE {table.schema}.{table.name}"))
+
+    yield {
+        "engine": engine,
+        "tables": tables,
+        "start": start,
+        "rows": len(rows),
+        "insert_rate": insert_rate,
+        "manager": manager,
+    }
+
+    db.close()
+    with engine.begin() as conn:
+        for schema in (PLAIN_SCHEMA, PARTITIONED_SCHEMA):
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    engine.dispose()
+
+
+class TestPriceDataPartitioning:
+    """Partitioned layout answers the same queries with pruning; numbers are printed"""
+
+    def test_same_results_both_layouts(self, bench):
+        windows = []
+        with bench["engine"].connect() as conn:
+            for table in bench["tables"].values():
+                windows.append(conn.execute(
+                    select(table.c.asset_id, func.count(), func.sum(table.c.close_price))
+                    .where(table.c.candle_time >= bench["start"] + timedelta(days=40))
+                    .where(table.c.candle_time < bench["start"] + timedelta(days=75))
+                    .group_by(table.c.asset_id)
+                    .order_by(table.c.asset_id)
+                ).all())
+        assert windows[0] == windows[1]
+
+    def test_month_scan_is_pruned_to_one_partition(self, bench):
+        table = bench["tables"]["partitioned"]
+        month = add_months(bench["start"], 1)
+        with bench["engine"].connect() as conn:
+            plan = "\n".join(conn.execute(text(
+                f"EXPLAIN SELECT count(*) FROM {table.schema}.{table.name} "
+                "WHERE timeframe = '1h' AND candle_time >= :lower AND candle_time < :upper"
+            ), {"lower": month, "upper": add_months(month, 1)}).scalars())
+        scanned = {part["name"] for part in bench["manager"].list_partitions() if f" {part['name']}" in plan}
+        assert scanned == {bench["manager"].partition_name(month)}
+
+    def test_benchmark_insert_and_range_scan(self, bench):
+        rng = random.Random(7)
+        span_hours = bench["rows"] // BENCHMARK_ASSETS
+        results = {}
+
+        with bench["engine"].connect() as conn:
+            for label, table in bench["tables"].items():
+                # Repository-style series read: one asset, one week, ordered
+                def series_week():
+                    lower = bench["start"] + timedelta(hours=rng.randrange(span_hours - 168))
+                    conn.execute(
+                        select(table.c.candle_time, table.c.close_price)
+                        .where(table.c.asset_id == rng.randint(1, BENCHMARK_ASSETS))
+                        .where(table.c.timeframe == "1h")
+                        .where(table.c.candle_time >= lower)
+                        .where(table.c.candle_time < lower + timedelta(days=7))
+                        .order_by(table.c.candle_time)
+                    ).all()
+
+                # Analytics read: every asset over one calendar month
+                def month_aggregate():
+                    lower = add_months(bench["start"], rng.randrange(span_hours // 720))
+                    conn.execute(
+                        select(table.c.asset_id, func.avg(table.c.close_price), func.max(table.c.high_price))
+                        .where(table.c.timeframe == "1h")
+                        .where(table.c.candle_time >= lower)
+                        .where(table.c.candle_time < add_months(lower, 1))
+                        .group_by(table.c.asset_id)
+                    ).all()
+
+                results[label] = {
+                    "insert_rows_per_sec": bench["insert_rate"][label],
+                    "series_week_ms": _median_ms(series_week),
+                    "month_aggregate_ms": _median_ms(month_aggregate),
+                }
+
+        print(f"\n📊 price_data partitioning benchmark ({bench['rows']} rows, {BENCHMARK_ASSETS} assets, 1h):")
+        print(f"   {'':<12} {'insert rows/s':>14} {'1-week series ms':>17} {'1-month agg ms':>15}")
+        for label, result in results.items():
+            print(f"   {label:<12} {result['insert_rows_per_sec']:>14.0f} "
+                  f"{result['series_week_ms']:>17.2f} {result['month_aggregate_ms']:>15.2f}")
+
+        for result in results.values():
+            assert result["insert_rows_per_sec"] > 0
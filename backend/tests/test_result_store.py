@@ -0,0 +1,53 @@
+# File: backend/tests/test_result_store.py
+# Event-driven invalidation of cached results (L1 only, Redis disabled)
+
+import asyncio
+
+import pytest
+
+from app.core.result_store import (
+    DASHBOARD_NAMESPACE, DASHBOARD_SUMMARY_PREFIX, MODEL_UPDATED, NEW_CANDLE, SharedResultStore
+)
+
+SUMMARY_KEY = f"{DASHBOARD_SUMMARY_PREFIX}:BTC_ETH_ANON"
+
+
+@pytest.fixture
+def store():
+    store = SharedResultStore(redis_url=None, redis_enabled=False)
+    store.register_dependency(
+        DASHBOARD_NAMESPACE, [MODEL_UPDATED, NEW_CANDLE], shared_prefixes=[DASHBOARD_SUMMARY_PREFIX]
+    )
+    return store
+
+
+def _cache(store, *keys):
+    async def fill():
+        for key in keys:
+            await store.set(DASHBOARD_NAMESPACE, key, {"key": key}, 60)
+    asyncio.run(fill())
+
+
+def _cached(store, key) -> bool:
+    return asyncio.run(store.get(DASHBOARD_NAMESPACE, key)) is not None
+
+
+class TestEventInvalidation:
+
+    @pytest.mark.parametrize("event", [MODEL_UPDATED, NEW_CANDLE])
+    def test_symbol_event_drops_that_symbol_and_the_summaries(self, store, event):
+        _cache(store, "BTC:crypto_ultra:ANON", "ETH:crypto_ultra:ANON", SUMMARY_KEY)
+
+        asyncio.run(store.publish_event(event, "btc"))
+
+        assert not _cached(store, "BTC:crypto_ultra:ANON")
+        assert not _cached(store, SUMMARY_KEY)
+        assert _cached(store, "ETH:crypto_ultra:ANON")
+
+    def test_event_for_all_symbols_clears_the_namespace(self, store):
+        _cache(store, "BTC:crypto_ultra:ANON", SUMMARY_KEY)
+
+        asyncio.run(store.publish_event(NEW_CANDLE))
+
+        assert not _cached(store, "BTC:crypto_ultra:ANON")
+        assert not _cached(store, SUMMARY_KEY)
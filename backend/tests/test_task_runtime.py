@@ -0,0 +1,113 @@
+# File: backend/tests/test_task_runtime.py
+# Worker async runtime: one long-lived loop per worker thread, closed at shutdown
+
+import asyncio
+import threading
+
+import pytest
+
+from app.tasks import task_handler
+from app.tasks.task_handler import WorkerAsyncRuntime
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def _run_in_thread(runtime, runs: int = 1) -> list:
+    """Loops seen by ``runs`` consecutive tasks on a fresh thread"""
+    loops = []
+    thread = threading.Thread(target=lambda: loops.extend(runtime.run(_current_loop()) for _ in range(runs)))
+    thread.start()
+    thread.join()
+    return loops
+
+
+@pytest.fixture
+def runtime():
+    # No default hook: it would close the app's shared clients and async
+    # engine for every test that runs afterwards
+    runtime = WorkerAsyncRuntime(shutdown_hooks=[])
+    yield runtime
+    runtime.shutdown()
+
+
+class TestWorkerAsyncRuntime:
+
+    def test_loop_is_reused_between_tasks(self, runtime):
+        first = runtime.run(_current_loop())
+        second = runtime.run(_current_loop())
+
+        assert first is second
+        assert first is runtime.get_loop()
+        assert not first.is_closed()
+
+    def test_loop_bound_client_survives_between_tasks(self, runtime):
+        # Stands in for an httpx client or pooled connection bound to a loop
+        client = {}
+
+        async def use_client():
+            if 'queue' not in client:
+                client['queue'] = asyncio.Queue()
+            await client['queue'].put(1)
+            return client['queue'].qsize()
+
+        assert [runtime.run(use_client()) for _ in range(3)] == [1, 2, 3]
+
+    def test_each_thread_reuses_its_own_loop(self, runtime):
+        first_thread = _run_in_thread(runtime, runs=3)
+        second_thread = _run_in_thread(runtime, runs=3)
+
+        assert len(set(map(id, first_thread))) == 1
+        assert len(set(map(id, second_thread))) == 1
+        assert first_thread[0] is not second_thread[0]
+        assert runtime.run(_current_loop()) not in (first_thread[0], second_thread[0])
+
+    def test_nested_run_reenters_the_running_loop(self, runtime):
+        async def outer():
+            loop = asyncio.get_running_loop()
+            inner_loop = runtime.run(_current_loop())
+            return loop, inner_loop, runtime.run(asyncio.sleep(0, result="inner"))
+
+        loop, inner_loop, result = runtime.run(outer())
+
+        assert inner_loop is loop
+        assert loop is runtime.get_loop()
+        assert result == "inner"
+
+    def test_default_hooks_close_the_shared_clients(self):
+        assert task_handler._close_shared_clients in WorkerAsyncRuntime()._shutdown_hooks
+
+    def test_shutdown_runs_hooks_and_closes_every_loop(self):
+        runtime = WorkerAsyncRuntime(shutdown_hooks=[])
+        closed = []
+
+        async def close_client():
+            closed.append(asyncio.get_running_loop())
+
+        runtime.register_shutdown_hook(close_client)
+        # Registering the same hook twice doesn't run it twice
+        runtime.register_shutdown_hook(close_client)
+        loop = runtime.get_loop()
+        other_loops = _run_in_thread(runtime) + _run_in_thread(runtime)
+        leftover = loop.create_task(asyncio.sleep(3600))
+
+        runtime.shutdown()
+
+        assert closed == [loop]
+        assert leftover.cancelled()
+        assert loop.is_closed()
+        assert all(other.is_closed() for other in other_loops)
+
+        # A task after shutdown starts a fresh loop
+        assert runtime.run(_current_loop()) is not loop
+        runtime.shutdown()
+
+    def test_shutdown_unsets_the_closed_loop(self):
+        runtime = WorkerAsyncRuntime(shutdown_hooks=[])
+        loop = runtime.get_loop()
+
+        runtime.shutdown()
+
+        # Plain asyncio.run on this thread still works afterwards
+        assert asyncio.run(_current_loop()) is not loop